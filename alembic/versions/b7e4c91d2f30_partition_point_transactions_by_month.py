@@ -0,0 +1,179 @@
+"""partition point_transactions by month
+
+Revision ID: b7e4c91d2f30
+Revises: 8782370332f4
+Create Date: 2026-10-19 09:12:44.318204
+
+Rebuilds point_transactions as a RANGE (created_at) partitioned table with
+one partition per calendar month plus a DEFAULT partition, and adds the
+tables used by compaction:
+
+- point_transaction_summaries: per-member monthly totals of compacted partitions
+- lesson_point_awards: lesson deduplication history, independent of the log
+
+The partition key has to be part of every unique constraint, so the primary
+key becomes (id, created_at).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4c91d2f30"
+down_revision: str | None = "8782370332f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    _rename_table_and_constraints("point_transactions", "point_transactions_unpartitioned")
+    op.drop_constraint(
+        "point_transactions_member_points_id_fkey",
+        "point_transactions_unpartitioned",
+        type_="foreignkey",
+    )
+
+    op.create_table(
+        "point_transactions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("member_points_id", sa.UUID(), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column("source", sa.String(30), nullable=False),
+        sa.Column("source_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["member_points_id"], ["member_points.id"]),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "ix_point_transactions_member_created",
+        "point_transactions",
+        ["member_points_id", sa.text("created_at DESC")],
+    )
+    op.execute("CREATE TABLE point_transactions_default PARTITION OF point_transactions DEFAULT")
+
+    # Monthly partitions from the oldest existing row up to two months ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start timestamptz;
+            last_month timestamptz := date_trunc('month', now() AT TIME ZONE 'UTC')
+                AT TIME ZONE 'UTC' + interval '2 months';
+        BEGIN
+            SELECT COALESCE(
+                date_trunc('month', min(created_at) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+                date_trunc('month', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+            )
+            INTO month_start
+            FROM point_transactions_unpartitioned;
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF point_transactions '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'point_transactions_' || to_char(month_start AT TIME ZONE 'UTC', 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END
+        $$
+    """)
+
+    op.execute("""
+        INSERT INTO point_transactions
+            (id, member_points_id, points, source, source_id, created_at)
+        SELECT id, member_points_id, points, source, source_id, created_at
+        FROM point_transactions_unpartitioned
+    """)
+
+    op.create_table(
+        "point_transaction_summaries",
+        sa.Column("member_points_id", sa.UUID(), nullable=False),
+        sa.Column("period_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("source", sa.String(30), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["member_points_id"], ["member_points.id"]),
+        sa.PrimaryKeyConstraint("member_points_id", "period_start", "source"),
+    )
+
+    op.create_table(
+        "lesson_point_awards",
+        sa.Column("member_points_id", sa.UUID(), nullable=False),
+        sa.Column("lesson_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["member_points_id"], ["member_points.id"]),
+        sa.PrimaryKeyConstraint("member_points_id", "lesson_id"),
+    )
+    op.execute("""
+        INSERT INTO lesson_point_awards (member_points_id, lesson_id, created_at)
+        SELECT member_points_id, source_id, min(created_at)
+        FROM point_transactions_unpartitioned
+        WHERE source = 'lesson_completed' AND points > 0
+        GROUP BY member_points_id, source_id
+    """)
+
+    op.drop_table("point_transactions_unpartitioned")
+
+
+def downgrade() -> None:
+    # Compacted history only survives as monthly summaries and is not restored
+    op.drop_table("lesson_point_awards")
+    op.drop_table("point_transaction_summaries")
+
+    # Partitions inherit the parent's constraint names, so the foreign key is
+    # dropped rather than renamed to free its name for the new table
+    op.drop_constraint(
+        "point_transactions_member_points_id_fkey", "point_transactions", type_="foreignkey"
+    )
+    _rename_table_and_constraints("point_transactions", "point_transactions_partitioned")
+    op.create_table(
+        "point_transactions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("member_points_id", sa.UUID(), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column("source", sa.String(30), nullable=False),
+        sa.Column("source_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["member_points_id"], ["member_points.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("""
+        INSERT INTO point_transactions
+            (id, member_points_id, points, source, source_id, created_at)
+        SELECT id, member_points_id, points, source, source_id, created_at
+        FROM point_transactions_partitioned
+    """)
+    # Dropping the parent drops every partition
+    op.drop_table("point_transactions_partitioned")
+    op.create_index(
+        "ix_point_transactions_member_created",
+        "point_transactions",
+        ["member_points_id", sa.text("created_at DESC")],
+    )
+
+
+def _rename_table_and_constraints(old: str, new: str) -> None:
+    """Rename a point_transactions table so its constraint names can be reused."""
+    op.rename_table(old, new)
+    op.execute(f"ALTER TABLE {new} RENAME CONSTRAINT {old}_pkey TO {new}_pkey")
+    op.execute(f"ALTER INDEX ix_{old}_member_created RENAME TO ix_{new}_member_created")
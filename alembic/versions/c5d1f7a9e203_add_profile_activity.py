@@ -0,0 +1,67 @@
+"""add profile activity
+
+Revision ID: c5d1f7a9e203
+Revises: a7c3e9d2b481
+Create Date: 2026-10-19 20:12:37.514086
+
+Profile stats and the profile activity feed read per-(user, community)
+contribution counters and an activity index kept current from community
+events. Populate both after upgrading:
+
+    python -m src.identity.infrastructure.persistence.profile_activity_repository rebuild
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d1f7a9e203"
+down_revision: str | None = "a7c3e9d2b481"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "profile_contributions",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("community_id", sa.UUID(), nullable=False),
+        sa.Column("post_count", sa.Integer(), nullable=False),
+        sa.Column("comment_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "community_id"),
+    )
+    op.create_table(
+        "profile_activity",
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("ref_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("community_id", sa.UUID(), nullable=False),
+        sa.Column("post_id", sa.UUID(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=True),
+        sa.Column("preview", sa.String(length=280), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("kind", "ref_id"),
+    )
+    op.create_index(
+        "idx_profile_activity_user_created",
+        "profile_activity",
+        ["user_id", "created_at", "ref_id"],
+    )
+    op.create_index("idx_profile_activity_post_id", "profile_activity", ["post_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_profile_activity_post_id", table_name="profile_activity")
+    op.drop_index("idx_profile_activity_user_created", table_name="profile_activity")
+    op.drop_table("profile_activity")
+    op.drop_table("profile_contributions")
@@ -0,0 +1,39 @@
+"""add id to point_transactions member index
+
+Revision ID: d3a8f1c6b925
+Revises: b7e4c91d2f30
+Create Date: 2026-10-19 11:02:17.904512
+
+Point history pages are ordered by (created_at DESC, id DESC). Including id
+in the member index lets each page be read straight off the index instead of
+sorting the member's whole history.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a8f1c6b925"
+down_revision: str | None = "b7e4c91d2f30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_point_transactions_member_created", table_name="point_transactions")
+    op.create_index(
+        "ix_point_transactions_member_created",
+        "point_transactions",
+        ["member_points_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_point_transactions_member_created", table_name="point_transactions")
+    op.create_index(
+        "ix_point_transactions_member_created",
+        "point_transactions",
+        ["member_points_id", sa.text("created_at DESC")],
+    )
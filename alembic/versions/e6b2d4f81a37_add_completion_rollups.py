@@ -0,0 +1,83 @@
+"""add completion rollups
+
+Revision ID: e6b2d4f81a37
+Revises: d3a8f1c6b925
+Create Date: 2026-10-19 15:40:12.318207
+
+Course analytics are read from rollups maintained by progress event handlers
+instead of aggregating progress and lesson_completions on every request:
+
+- lesson_completion_rollups: members who have completed each lesson
+- course_completion_rollups: members who started / completed each course
+- course_completion_daily_rollups: lesson completions per course and UTC day
+
+The tables start empty. Populate them once after upgrading with
+``python -m src.classroom.infrastructure.persistence.completion_analytics_repository rebuild``.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b2d4f81a37"
+down_revision: str | None = "d3a8f1c6b925"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lesson_completion_rollups",
+        sa.Column("lesson_id", sa.UUID(), nullable=False),
+        sa.Column("course_id", sa.UUID(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["lesson_id"], ["lessons.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["course_id"], ["courses.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("lesson_id"),
+    )
+    op.create_index(
+        op.f("ix_lesson_completion_rollups_course_id"),
+        "lesson_completion_rollups",
+        ["course_id"],
+    )
+
+    op.create_table(
+        "course_completion_rollups",
+        sa.Column("course_id", sa.UUID(), nullable=False),
+        sa.Column("started_count", sa.Integer(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["course_id"], ["courses.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("course_id"),
+    )
+
+    op.create_table(
+        "course_completion_daily_rollups",
+        sa.Column("course_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("completions", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["course_id"], ["courses.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("course_id", "day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("course_completion_daily_rollups")
+    op.drop_table("course_completion_rollups")
+    op.drop_index(
+        op.f("ix_lesson_completion_rollups_course_id"), table_name="lesson_completion_rollups"
+    )
+    op.drop_table("lesson_completion_rollups")
@@ -0,0 +1,38 @@
+"""index token purge columns
+
+Revision ID: e8b2d4f6a019
+Revises: c5d1f7a9e203
+Create Date: 2026-10-19 21:40:12.318204
+
+The expired token purge selects batches of verification tokens by expires_at
+and reset tokens by expires_at or used_at. Without these indexes each batch
+scans the whole table.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b2d4f6a019"
+down_revision: str | None = "c5d1f7a9e203"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_verification_tokens_expires_at", "verification_tokens", ["expires_at"])
+    op.create_index("idx_reset_tokens_expires_at", "reset_tokens", ["expires_at"])
+    op.create_index(
+        "idx_reset_tokens_used",
+        "reset_tokens",
+        ["used_at"],
+        postgresql_where=sa.text("used_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_reset_tokens_used", table_name="reset_tokens")
+    op.drop_index("idx_reset_tokens_expires_at", table_name="reset_tokens")
+    op.drop_index("idx_verification_tokens_expires_at", table_name="verification_tokens")
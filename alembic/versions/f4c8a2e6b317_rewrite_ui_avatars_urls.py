@@ -0,0 +1,70 @@
+"""rewrite ui-avatars urls
+
+Revision ID: f4c8a2e6b317
+Revises: e8b2d4f6a019
+Create Date: 2026-10-19 22:05:48.770931
+
+Default avatars used to be ui-avatars.com URLs, so every render of a
+profile picture went to a third party. Profiles that still store one are
+moved to the self-hosted initials avatar for the same initials, on the
+configured API_PUBLIC_URL.
+
+The URL scheme below is frozen at render version 1; later rendering changes
+are picked up by the avatar endpoint redirecting old URLs.
+"""
+
+import hashlib
+from collections.abc import Sequence
+from urllib.parse import parse_qs, quote, urlsplit
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "f4c8a2e6b317"
+down_revision: str | None = "e8b2d4f6a019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+UI_AVATARS_PREFIX = "https://ui-avatars.com/"
+BATCH_SIZE = 1000
+
+
+def _self_hosted_url(ui_avatars_url: str) -> str:
+    name = parse_qs(urlsplit(ui_avatars_url).query).get("name", [""])[0]
+    initials = "".join(c for c in name.upper() if c.isalnum())[:2] or "?"
+    digest = hashlib.sha256(f"1\x1f128\x1f{initials}".encode()).hexdigest()[:16]
+    base_url = settings.api_public_url.rstrip("/")
+    return f"{base_url}/api/v1/avatars/{digest}/{quote(initials, safe='')}.svg"
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    profiles = sa.table(
+        "profiles", sa.column("user_id", sa.UUID()), sa.column("avatar_url", sa.String())
+    )
+    rows = connection.execute(
+        sa.select(profiles.c.user_id, profiles.c.avatar_url).where(
+            profiles.c.avatar_url.startswith(UI_AVATARS_PREFIX)
+        )
+    ).fetchall()
+    update = (
+        sa.update(profiles)
+        .where(profiles.c.user_id == sa.bindparam("profile_user_id"))
+        .values(avatar_url=sa.bindparam("new_url"))
+    )
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(
+            update,
+            [
+                {"profile_user_id": row.user_id, "new_url": _self_hosted_url(row.avatar_url)}
+                for row in rows[start : start + BATCH_SIZE]
+            ],
+        )
+
+
+def downgrade() -> None:
+    # Nothing to restore: the self-hosted avatars render the same initials
+    pass
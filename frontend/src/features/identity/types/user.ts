@@ -55,6 +55,7 @@ export interface StatsResponse {
 export interface ActivityItem {
   id: string;
   type: string;
+  title: string | null;
   content: string;
   created_at: string;
 }
@@ -62,6 +63,8 @@ export interface ActivityItem {
 export interface ActivityResponse {
   items: ActivityItem[];
   total_count: number;
+  cursor: string | null;
+  has_more: boolean;
 }
 
 export interface ActivityChartResponse {
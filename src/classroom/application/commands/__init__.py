@@ -6,6 +6,7 @@ from src.classroom.application.commands.create_course import CreateCourseCommand
 from src.classroom.application.commands.delete_course import DeleteCourseCommand
 from src.classroom.application.commands.delete_lesson import DeleteLessonCommand
 from src.classroom.application.commands.delete_module import DeleteModuleCommand
+from src.classroom.application.commands.import_course import ImportCourseCommand
 from src.classroom.application.commands.mark_lesson_complete import MarkLessonCompleteCommand
 from src.classroom.application.commands.reorder_lessons import ReorderLessonsCommand
 from src.classroom.application.commands.reorder_modules import ReorderModulesCommand
@@ -22,6 +23,7 @@ __all__ = [
     "DeleteCourseCommand",
     "DeleteLessonCommand",
     "DeleteModuleCommand",
+    "ImportCourseCommand",
     "MarkLessonCompleteCommand",
     "ReorderLessonsCommand",
     "ReorderModulesCommand",
@@ -0,0 +1,13 @@
+"""Import course command."""
+
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class ImportCourseCommand:
+    """Command to import a course, its modules and lessons from an NDJSON stream."""
+
+    instructor_id: UUID
+    chunks: AsyncIterable[bytes]
@@ -0,0 +1 @@
+"""Event handlers for classroom read models."""
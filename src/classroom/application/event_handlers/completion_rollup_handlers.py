@@ -0,0 +1,72 @@
+"""Keep completion rollups current from progress events.
+
+Each handler applies one increment or decrement in its own session. A failed
+update is logged and leaves the rollups behind progress until the next
+rebuild (see completion_analytics_repository).
+"""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC
+
+import structlog
+
+from src.classroom.domain.events.progress_events import (
+    CourseCompleted,
+    LessonCompleted,
+    LessonUncompleted,
+    ProgressStarted,
+)
+from src.classroom.domain.repositories import ICompletionAnalyticsRepository
+from src.classroom.infrastructure.persistence.completion_analytics_repository import (
+    SqlAlchemyCompletionAnalyticsRepository,
+)
+
+logger = structlog.get_logger()
+
+
+async def _apply(
+    event_name: str,
+    update: Callable[[ICompletionAnalyticsRepository], Awaitable[None]],
+) -> None:
+    from src.identity.interface.api.dependencies import get_database
+
+    db = get_database()
+    session = db._session_factory()  # noqa: SLF001
+    try:
+        await update(SqlAlchemyCompletionAnalyticsRepository(session))
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        logger.exception("classroom.completion_rollup_failed", event_type=event_name)
+    finally:
+        await session.close()
+
+
+async def handle_progress_started(event: ProgressStarted) -> None:
+    """Count a member starting a course."""
+    await _apply(event.event_type, lambda repo: repo.record_course_started(event.course_id))
+
+
+async def handle_lesson_completed(event: LessonCompleted) -> None:
+    """Count a lesson completion on the day it was recorded, as rebuild() does."""
+    day = event.completed_at.astimezone(UTC).date()
+    await _apply(
+        event.event_type,
+        lambda repo: repo.record_lesson_completed(event.course_id, event.lesson_id, day),
+    )
+
+
+async def handle_lesson_uncompleted(event: LessonUncompleted) -> None:
+    """Take back the removed completion, and the course completion it was part of."""
+    day = event.completed_at.astimezone(UTC).date()
+    await _apply(
+        event.event_type,
+        lambda repo: repo.record_lesson_uncompleted(
+            event.course_id, event.lesson_id, day, event.course_was_completed
+        ),
+    )
+
+
+async def handle_course_completed(event: CourseCompleted) -> None:
+    """Count a member completing a course."""
+    await _apply(event.event_type, lambda repo: repo.record_course_completed(event.course_id))
@@ -6,13 +6,25 @@ from src.classroom.application.handlers.create_course_handler import CreateCours
 from src.classroom.application.handlers.delete_course_handler import DeleteCourseHandler
 from src.classroom.application.handlers.delete_lesson_handler import DeleteLessonHandler
 from src.classroom.application.handlers.delete_module_handler import DeleteModuleHandler
+from src.classroom.application.handlers.get_course_analytics_handler import (
+    CourseAnalyticsResult,
+    GetCourseAnalyticsHandler,
+    LessonFunnelStep,
+)
 from src.classroom.application.handlers.get_course_details_handler import GetCourseDetailsHandler
 from src.classroom.application.handlers.get_course_list_handler import GetCourseListHandler
-from src.classroom.application.handlers.get_lesson_handler import GetLessonHandler
+from src.classroom.application.handlers.get_lesson_handler import (
+    GetLessonHandler,
+    LessonWithContext,
+)
 from src.classroom.application.handlers.get_next_incomplete_lesson_handler import (
     GetNextIncompleteLessonHandler,
 )
 from src.classroom.application.handlers.get_progress_handler import GetProgressHandler
+from src.classroom.application.handlers.import_course_handler import (
+    CourseImportResult,
+    ImportCourseHandler,
+)
 from src.classroom.application.handlers.mark_lesson_complete_handler import (
     MarkLessonCompleteHandler,
 )
@@ -27,15 +39,21 @@ from src.classroom.application.handlers.update_module_handler import UpdateModul
 __all__ = [
     "AddLessonHandler",
     "AddModuleHandler",
+    "CourseAnalyticsResult",
+    "CourseImportResult",
     "CreateCourseHandler",
     "DeleteCourseHandler",
     "DeleteLessonHandler",
     "DeleteModuleHandler",
+    "GetCourseAnalyticsHandler",
     "GetCourseDetailsHandler",
     "GetCourseListHandler",
     "GetLessonHandler",
     "GetNextIncompleteLessonHandler",
     "GetProgressHandler",
+    "ImportCourseHandler",
+    "LessonFunnelStep",
+    "LessonWithContext",
     "MarkLessonCompleteHandler",
     "ReorderLessonsHandler",
     "ReorderModulesHandler",
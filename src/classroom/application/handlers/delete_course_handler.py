@@ -3,6 +3,7 @@
 import structlog
 
 from src.classroom.application.commands import DeleteCourseCommand
+from src.classroom.domain.events import CourseDeleted
 from src.classroom.domain.exceptions import CourseNotFoundError
 from src.classroom.domain.repositories import ICourseRepository
 from src.classroom.domain.value_objects import CourseId
@@ -28,7 +29,6 @@ class DeleteCourseHandler:
 
         Raises:
             CourseNotFoundError: If course doesn't exist
-            CourseAlreadyDeletedError: If already deleted
         """
         logger.info(
             "delete_course_attempt",
@@ -39,17 +39,12 @@ class DeleteCourseHandler:
         course_id = CourseId(command.course_id)
         deleter_id = UserId(command.deleter_id)
 
-        # Get the course
-        course = await self._course_repository.get_by_id(course_id)
-        if course is None:
+        # Soft delete in place; an already deleted course counts as not found
+        if not await self._course_repository.delete_course(course_id):
             logger.warning("delete_course_not_found", course_id=str(course_id))
             raise CourseNotFoundError(str(course_id))
 
-        # Soft delete
-        course.delete(deleter_id)
-        await self._course_repository.save(course)
-
         # Publish domain events
-        await event_bus.publish_all(course.clear_events())
+        await event_bus.publish(CourseDeleted(course_id=course_id, deleted_by=deleter_id))
 
         logger.info("delete_course_success", course_id=str(course_id))
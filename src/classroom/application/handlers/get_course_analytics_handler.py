@@ -0,0 +1,95 @@
+"""Get course analytics query handler."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from src.classroom.application.queries import GetCourseAnalyticsQuery
+from src.classroom.domain.exceptions import CourseNotFoundError
+from src.classroom.domain.repositories import (
+    CourseCompletionRollup,
+    DailyCompletionCount,
+    ICompletionAnalyticsRepository,
+    ICourseRepository,
+)
+from src.classroom.domain.value_objects import CourseId, LessonId
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class LessonFunnelStep:
+    """Completions of one lesson, relative to members who started the course."""
+
+    lesson_id: LessonId
+    lesson_title: str
+    module_title: str
+    completed_count: int
+    completion_rate: float
+
+
+@dataclass(frozen=True)
+class CourseAnalyticsResult:
+    """Completion analytics for a course."""
+
+    rollup: CourseCompletionRollup
+    completion_rate: float
+    funnel: list[LessonFunnelStep]
+    daily_completions: list[DailyCompletionCount]
+
+
+def _rate(count: int, started: int) -> float:
+    return round(count / started, 4) if started else 0.0
+
+
+class GetCourseAnalyticsHandler:
+    """Handler for reading course completion analytics from rollups."""
+
+    def __init__(
+        self,
+        course_repository: ICourseRepository,
+        analytics_repository: ICompletionAnalyticsRepository,
+    ) -> None:
+        """Initialize with dependencies."""
+        self._course_repository = course_repository
+        self._analytics_repository = analytics_repository
+
+    async def handle(self, query: GetCourseAnalyticsQuery) -> CourseAnalyticsResult:
+        """
+        Handle get course analytics query.
+
+        The funnel lists the course's current lessons in reading order.
+
+        Raises:
+            CourseNotFoundError: If course doesn't exist
+        """
+        course_id = CourseId(query.course_id)
+
+        outline = await self._course_repository.get_outline(course_id, include_deleted=True)
+        if outline is None:
+            logger.warning("get_course_analytics_not_found", course_id=str(course_id))
+            raise CourseNotFoundError(str(course_id))
+
+        rollup = await self._analytics_repository.get_course_rollup(course_id)
+        lesson_counts = await self._analytics_repository.get_lesson_completion_counts(course_id)
+        since = datetime.now(UTC).date() - timedelta(days=query.days - 1)
+        daily = await self._analytics_repository.get_daily_completions(course_id, since)
+
+        funnel = [
+            LessonFunnelStep(
+                lesson_id=lesson.id,
+                lesson_title=lesson.title.value,
+                module_title=module.title.value,
+                completed_count=lesson_counts.get(lesson.id, 0),
+                completion_rate=_rate(lesson_counts.get(lesson.id, 0), rollup.started_count),
+            )
+            for module in outline.modules
+            for lesson in module.lessons
+        ]
+        return CourseAnalyticsResult(
+            rollup=rollup,
+            completion_rate=_rate(rollup.completed_count, rollup.started_count),
+            funnel=funnel,
+            daily_completions=daily,
+        )
@@ -3,8 +3,7 @@
 import structlog
 
 from src.classroom.application.queries import GetCourseListQuery
-from src.classroom.domain.entities import Course
-from src.classroom.domain.repositories import ICourseRepository
+from src.classroom.domain.repositories import CourseSummary, ICourseRepository
 
 logger = structlog.get_logger()
 
@@ -16,7 +15,7 @@ class GetCourseListHandler:
         """Initialize with dependencies."""
         self._course_repository = course_repository
 
-    async def handle(self, query: GetCourseListQuery) -> list[Course]:
+    async def handle(self, query: GetCourseListQuery) -> list[CourseSummary]:
         """
         Handle course list query.
 
@@ -24,14 +23,14 @@ class GetCourseListHandler:
             query: The get course list query
 
         Returns:
-            List of courses
+            Course summaries with module and lesson counts (no lesson content)
         """
         logger.info(
             "get_course_list_attempt",
             requester_id=str(query.requester_id),
         )
 
-        courses = await self._course_repository.list_all(
+        courses = await self._course_repository.list_summaries(
             include_deleted=query.include_deleted,
             limit=query.limit,
             offset=query.offset,
@@ -4,10 +4,14 @@ from dataclasses import dataclass
 
 import structlog
 
+from src.classroom.application.last_accessed_buffer import (
+    LastAccessedBuffer,
+    last_accessed_buffer,
+)
 from src.classroom.application.queries.get_lesson import GetLessonQuery
 from src.classroom.domain.entities.lesson import Lesson
 from src.classroom.domain.exceptions import LessonNotFoundError
-from src.classroom.domain.repositories.course_repository import ICourseRepository
+from src.classroom.domain.repositories.course_repository import ICourseRepository, LessonOutline
 from src.classroom.domain.repositories.progress_repository import IProgressRepository
 from src.classroom.domain.value_objects.lesson_id import LessonId
 from src.identity.domain.value_objects import UserId
@@ -17,9 +21,9 @@ logger = structlog.get_logger()
 
 @dataclass
 class LessonWithContext:
-    """Lesson with navigation and completion context."""
+    """Lesson structure with navigation and completion context; no content body."""
 
-    lesson: Lesson
+    lesson: LessonOutline
     is_complete: bool
     next_lesson_id: LessonId | None
     prev_lesson_id: LessonId | None
@@ -29,23 +33,30 @@ class LessonWithContext:
 
 
 class GetLessonHandler:
-    """Handler for getting a lesson with context."""
+    """Handler for getting a lesson with context.
+
+    ``handle`` works from the cached course outline alone. The content body is
+    loaded separately with ``load_lesson``, so callers that can answer from a
+    cached or conditional response never read it.
+    """
 
     def __init__(
         self,
         course_repository: ICourseRepository,
         progress_repository: IProgressRepository,
+        last_accessed: LastAccessedBuffer = last_accessed_buffer,
     ) -> None:
         self._course_repository = course_repository
         self._progress_repository = progress_repository
+        self._last_accessed = last_accessed
 
     async def handle(self, query: GetLessonQuery) -> LessonWithContext:
         """Get a lesson with navigation and completion context."""
         user_id = UserId(query.user_id)
         lesson_id = LessonId(value=query.lesson_id)
 
-        # Find course containing this lesson
-        course = await self._course_repository.get_course_by_lesson_id(lesson_id)
+        # Navigation only needs the course outline; content is fetched for this lesson alone
+        course = await self._course_repository.get_outline_by_lesson_id(lesson_id)
         if course is None:
             raise LessonNotFoundError(str(query.lesson_id))
 
@@ -54,24 +65,23 @@ class GetLessonHandler:
         if module is None:
             raise LessonNotFoundError(str(query.lesson_id))
 
-        lesson = module.get_lesson_by_id(lesson_id)
-        if lesson is None or lesson.is_deleted:
+        lesson_outline = course.get_lesson(lesson_id)
+        if lesson_outline is None or lesson_outline.is_deleted:
             raise LessonNotFoundError(str(query.lesson_id))
 
         # Get completion status
         progress = await self._progress_repository.get_by_user_and_course(user_id, course.id)
         is_complete = progress.is_lesson_completed(lesson_id) if progress else False
 
-        # Update last accessed
+        # Reads stay read-only: the last-accessed position is written behind
         if progress is not None:
-            progress.update_last_accessed(lesson_id)
-            await self._progress_repository.save(progress)
+            self._last_accessed.record(user_id, course.id, lesson_id)
 
-        # Calculate prev/next navigation
-        prev_id, next_id = self._get_navigation(course, module, lesson)
+        # Prev/next navigation is precomputed on the outline
+        prev_id, next_id = course.navigation(lesson_id)
 
         return LessonWithContext(
-            lesson=lesson,
+            lesson=lesson_outline,
             is_complete=is_complete,
             next_lesson_id=next_id,
             prev_lesson_id=prev_id,
@@ -80,32 +90,9 @@ class GetLessonHandler:
             course_title=course.title.value,
         )
 
-    def _get_navigation(
-        self, course: object, current_module: object, current_lesson: Lesson
-    ) -> tuple[LessonId | None, LessonId | None]:
-        """Calculate previous and next lesson IDs across modules."""
-        # Build a flat ordered list of all lessons across all modules
-        from src.classroom.domain.entities.course import Course
-        from src.classroom.domain.entities.module import Module
-
-        assert isinstance(course, Course)
-        assert isinstance(current_module, Module)
-
-        all_lessons: list[Lesson] = []
-        for mod in course.modules:
-            all_lessons.extend(mod.lessons)
-
-        # Find current lesson index
-        current_idx = None
-        for i, ls in enumerate(all_lessons):
-            if ls.id == current_lesson.id:
-                current_idx = i
-                break
-
-        if current_idx is None:
-            return None, None
-
-        prev_id = all_lessons[current_idx - 1].id if current_idx > 0 else None
-        next_id = all_lessons[current_idx + 1].id if current_idx < len(all_lessons) - 1 else None
-
-        return prev_id, next_id
+    async def load_lesson(self, lesson_id: LessonId) -> Lesson:
+        """Load a lesson with its content body."""
+        lesson = await self._course_repository.get_lesson(lesson_id)
+        if lesson is None:
+            raise LessonNotFoundError(str(lesson_id))
+        return lesson
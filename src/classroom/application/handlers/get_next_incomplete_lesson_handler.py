@@ -6,7 +6,10 @@ from src.classroom.application.queries.get_next_incomplete_lesson import (
     GetNextIncompleteLessonQuery,
 )
 from src.classroom.domain.exceptions import CourseNotFoundError
-from src.classroom.domain.repositories.course_repository import ICourseRepository
+from src.classroom.domain.repositories.course_repository import (
+    CourseOutline,
+    ICourseRepository,
+)
 from src.classroom.domain.repositories.progress_repository import IProgressRepository
 from src.classroom.domain.value_objects.course_id import CourseId
 from src.classroom.domain.value_objects.lesson_id import LessonId
@@ -36,7 +39,7 @@ class GetNextIncompleteLessonHandler:
         user_id = UserId(query.user_id)
         course_id = CourseId(value=query.course_id)
 
-        course = await self._course_repository.get_by_id(course_id)
+        course = await self._course_repository.get_outline(course_id)
         if course is None:
             raise CourseNotFoundError(str(query.course_id))
 
@@ -46,22 +49,14 @@ class GetNextIncompleteLessonHandler:
             return self._get_first_lesson(course)
 
         # Find next incomplete
-        completed_ids = progress.get_completed_lesson_ids()
-        from src.classroom.domain.entities.course import Course
-
-        assert isinstance(course, Course)
-        for module in course.modules:
-            for lesson in module.lessons:
-                if lesson.id not in completed_ids:
-                    return lesson.id
+        next_incomplete = course.next_incomplete_lesson_id(progress.get_completed_lesson_ids())
+        if next_incomplete is not None:
+            return next_incomplete
 
         # All complete — return last lesson
         return self._get_last_lesson(course)
 
-    def _get_first_lesson(self, course: object) -> LessonId | None:
-        from src.classroom.domain.entities.course import Course
-
-        assert isinstance(course, Course)
+    def _get_first_lesson(self, course: CourseOutline) -> LessonId | None:
         modules = course.modules
         if modules:
             lessons = modules[0].lessons
@@ -69,10 +64,7 @@ class GetNextIncompleteLessonHandler:
                 return lessons[0].id
         return None
 
-    def _get_last_lesson(self, course: object) -> LessonId | None:
-        from src.classroom.domain.entities.course import Course
-
-        assert isinstance(course, Course)
+    def _get_last_lesson(self, course: CourseOutline) -> LessonId | None:
         modules = course.modules
         if modules:
             lessons = modules[-1].lessons
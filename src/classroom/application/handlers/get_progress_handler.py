@@ -9,7 +9,6 @@ from src.classroom.domain.exceptions import CourseNotFoundError, ProgressNotFoun
 from src.classroom.domain.repositories.course_repository import ICourseRepository
 from src.classroom.domain.repositories.progress_repository import IProgressRepository
 from src.classroom.domain.value_objects.course_id import CourseId
-from src.classroom.domain.value_objects.lesson_id import LessonId
 from src.identity.domain.value_objects import UserId
 
 logger = structlog.get_logger()
@@ -45,7 +44,7 @@ class GetProgressHandler:
         course_id = CourseId(value=query.course_id)
 
         # Verify course exists (include deleted for progress retention)
-        course = await self._course_repository.get_by_id_include_deleted(course_id)
+        course = await self._course_repository.get_outline(course_id, include_deleted=True)
         if course is None:
             raise CourseNotFoundError(str(query.course_id))
 
@@ -59,7 +58,7 @@ class GetProgressHandler:
         completed_ids = progress.get_completed_lesson_ids()
 
         # Find next incomplete
-        next_incomplete = self._find_next_incomplete(course, completed_ids)
+        next_incomplete = course.next_incomplete_lesson_id(completed_ids)
 
         return ProgressResult(
             user_id=str(query.user_id),
@@ -72,16 +71,3 @@ class GetProgressHandler:
                 str(progress.last_accessed_lesson_id) if progress.last_accessed_lesson_id else None
             ),
         )
-
-    def _find_next_incomplete(
-        self, course: object, completed_ids: set[LessonId]
-    ) -> LessonId | None:
-        """Find first incomplete lesson by position order."""
-        from src.classroom.domain.entities.course import Course
-
-        assert isinstance(course, Course)
-        for module in course.modules:
-            for lesson in module.lessons:
-                if lesson.id not in completed_ids:
-                    return lesson.id
-        return None
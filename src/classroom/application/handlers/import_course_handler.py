@@ -0,0 +1,245 @@
+"""Import course handler.
+
+A course document is newline-delimited JSON, one record per line:
+
+    {"type": "course", "title": "...", "description": "...", "cover_image_url": "...",
+     "estimated_duration": "..."}
+    {"type": "module", "title": "...", "description": "..."}
+    {"type": "lesson", "title": "...", "content_type": "text", "content": "..."}
+
+The course record comes first and each lesson belongs to the module before
+it. Lines are validated as they arrive with the same value objects and entity
+rules as the single-item endpoints, so the raw document is never held in
+memory. Every invalid line is reported; if there are any, nothing is written.
+Otherwise the course is inserted with multi-row inserts.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from src.classroom.application.commands import ImportCourseCommand
+from src.classroom.domain.entities import Course
+from src.classroom.domain.entities.lesson import Lesson
+from src.classroom.domain.entities.module import Module
+from src.classroom.domain.exceptions import ClassroomDomainError, InvalidCourseImportError
+from src.classroom.domain.repositories import ICourseRepository
+from src.classroom.domain.value_objects import (
+    CourseDescription,
+    CourseId,
+    CourseTitle,
+    CoverImageUrl,
+    EstimatedDuration,
+    LessonTitle,
+    ModuleDescription,
+    ModuleTitle,
+)
+from src.classroom.domain.value_objects.content_type import ContentType
+from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure import event_bus
+
+logger = structlog.get_logger()
+
+# Lesson content is capped at 50,000 characters; this leaves room for JSON escaping
+MAX_LINE_BYTES = 1024 * 1024
+# Stop reading once this many errors have been found
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass(frozen=True)
+class CourseImportResult:
+    """Outcome of a successful import."""
+
+    course_id: CourseId
+    module_count: int
+    lesson_count: int
+
+
+class _RecordError(Exception):
+    """A record is malformed independently of domain rules."""
+
+
+class ImportCourseHandler:
+    """Handler for importing a whole course in one transaction."""
+
+    def __init__(self, course_repository: ICourseRepository) -> None:
+        """Initialize with dependencies."""
+        self._course_repository = course_repository
+
+    async def handle(self, command: ImportCourseCommand) -> CourseImportResult:
+        """
+        Handle a course import.
+
+        Raises:
+            InvalidCourseImportError: With (line, message) pairs for every invalid line
+        """
+        logger.info("import_course_attempt", instructor_id=str(command.instructor_id))
+
+        builder = _CourseBuilder(UserId(command.instructor_id))
+        errors: list[tuple[int, str]] = []
+        line_number = 0
+        async for line in _iter_lines(command.chunks):
+            line_number += 1
+            try:
+                if line is None:
+                    raise _RecordError(f"Line is longer than {MAX_LINE_BYTES} bytes")
+                if line.strip():
+                    # HTML sanitizing is CPU-bound; keep it off the event loop
+                    await asyncio.to_thread(builder.add, _parse_record(line))
+            except (_RecordError, ClassroomDomainError) as e:
+                errors.append((line_number, str(e)))
+                if len(errors) >= MAX_REPORTED_ERRORS:
+                    break
+
+        if not errors and not builder.seen_course:
+            errors.append((1, "Document has no course record"))
+        course = builder.course
+        if errors or course is None:
+            logger.warning("import_course_invalid", errors=len(errors), lines=line_number)
+            raise InvalidCourseImportError(errors)
+
+        await self._course_repository.insert_course(course)
+        await event_bus.publish_all(course.clear_events())
+
+        result = CourseImportResult(
+            course_id=course.id,
+            module_count=course.module_count,
+            lesson_count=course.lesson_count,
+        )
+        logger.info(
+            "import_course_success",
+            course_id=str(course.id),
+            modules=result.module_count,
+            lessons=result.lesson_count,
+        )
+        return result
+
+
+class _CourseBuilder:
+    """Builds the Course aggregate one record at a time.
+
+    After an invalid record the rest of the document is still validated, against
+    standalone entities, so that every error is reported in one pass.
+    """
+
+    def __init__(self, instructor_id: UserId) -> None:
+        self._instructor_id = instructor_id
+        self.course: Course | None = None
+        self.seen_course = False
+        self._module: Module | None = None
+        self._seen_module = False
+        self._module_count = 0
+
+    def add(self, record: dict[str, Any]) -> None:
+        record_type = record.get("type")
+        if record_type == "course":
+            self._add_course(record)
+        elif record_type == "module":
+            self._add_module(record)
+        elif record_type == "lesson":
+            self._add_lesson(record)
+        else:
+            raise _RecordError('"type" must be one of "course", "module", "lesson"')
+
+    def _add_course(self, record: dict[str, Any]) -> None:
+        if self.seen_course:
+            raise _RecordError("Only one course record is allowed")
+        self.seen_course = True
+
+        description = _optional_field(record, "description")
+        cover_image_url = _optional_field(record, "cover_image_url")
+        estimated_duration = _optional_field(record, "estimated_duration")
+        self.course = Course.create(
+            instructor_id=self._instructor_id,
+            title=CourseTitle(_field(record, "title")),
+            description=CourseDescription(description) if description else None,
+            cover_image_url=CoverImageUrl(cover_image_url) if cover_image_url else None,
+            estimated_duration=EstimatedDuration(estimated_duration)
+            if estimated_duration
+            else None,
+        )
+
+    def _add_module(self, record: dict[str, Any]) -> None:
+        if not self.seen_course:
+            raise _RecordError("The course record must come first")
+        self._seen_module = True
+        # Lessons of an invalid module are validated without a module
+        self._module = None
+
+        description = _optional_field(record, "description")
+        title = ModuleTitle(_field(record, "title"))
+        module_description = ModuleDescription(description) if description else None
+        if self.course is not None:
+            self._module = self.course.add_module(title=title, description=module_description)
+        else:
+            self._module_count += 1
+            self._module = Module.create(
+                title=title, description=module_description, position=self._module_count
+            )
+
+    def _add_lesson(self, record: dict[str, Any]) -> None:
+        if not self._seen_module:
+            raise _RecordError("A lesson must follow a module record")
+
+        title = LessonTitle(_field(record, "title"))
+        content_type = ContentType.from_string(_field(record, "content_type"))
+        content = _field(record, "content")
+        if self._module is not None:
+            self._module.add_lesson(title=title, content_type=content_type, content=content)
+        else:
+            Lesson.create(title=title, content_type=content_type, content=content, position=1)
+
+
+def _parse_record(line: bytes) -> dict[str, Any]:
+    """Decode one NDJSON line into a record object."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise _RecordError(f"Invalid JSON: {e}") from None
+    if not isinstance(record, dict):
+        raise _RecordError("Each line must be a JSON object")
+    return record
+
+
+def _field(record: dict[str, Any], name: str) -> str:
+    """A required string field."""
+    value = _optional_field(record, name)
+    if value is None:
+        raise _RecordError(f'"{name}" is required')
+    return value
+
+
+def _optional_field(record: dict[str, Any], name: str) -> str | None:
+    """An optional string field."""
+    value = record.get(name)
+    if value is not None and not isinstance(value, str):
+        raise _RecordError(f'"{name}" must be a string')
+    return value
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes | None]:
+    """Split a byte stream into lines; an over-long line is yielded as None and skipped."""
+    buffer = bytearray()
+    oversized = False
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while (newline := buffer.find(b"\n")) != -1:
+            line = bytes(buffer[:newline])
+            del buffer[: newline + 1]
+            if oversized:
+                oversized = False
+                yield None
+            else:
+                yield line
+        if len(buffer) > MAX_LINE_BYTES:
+            # Keep consuming without holding the line; report it once it ends
+            buffer.clear()
+            oversized = True
+    if oversized:
+        yield None
+    elif buffer:
+        yield bytes(buffer)
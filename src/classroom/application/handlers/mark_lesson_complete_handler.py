@@ -4,7 +4,7 @@ import structlog
 
 from src.classroom.application.commands.mark_lesson_complete import MarkLessonCompleteCommand
 from src.classroom.domain.entities.progress import Progress
-from src.classroom.domain.exceptions import LessonNotFoundError
+from src.classroom.domain.exceptions import LessonAlreadyCompletedError, LessonNotFoundError
 from src.classroom.domain.repositories.course_repository import ICourseRepository
 from src.classroom.domain.repositories.progress_repository import IProgressRepository
 from src.classroom.domain.value_objects.lesson_id import LessonId
@@ -36,28 +36,38 @@ class MarkLessonCompleteHandler:
         user_id = UserId(command.user_id)
         lesson_id = LessonId(value=command.lesson_id)
 
-        # Find the course that owns this lesson
-        course = await self._course_repository.get_course_by_lesson_id(lesson_id)
+        # Validate against the cached outline; lesson content is never loaded
+        course = await self._course_repository.get_outline_by_lesson_id(lesson_id)
         if course is None:
             raise LessonNotFoundError(str(command.lesson_id))
+        lesson = course.get_lesson(lesson_id)
+        if lesson is None or lesson.is_deleted:
+            raise LessonNotFoundError(str(command.lesson_id))
 
         course_id = course.id
+        total_lessons = course.lesson_count
 
-        # Get or create progress (auto-start)
-        progress = await self._progress_repository.get_by_user_and_course(user_id, course_id)
-        if progress is None:
+        # Common case: insert-if-absent against existing progress in one statement
+        change = await self._progress_repository.add_completion(user_id, course_id, lesson_id)
+        if change.progress_exists:
+            if not change.changed or change.completed_at is None:
+                raise LessonAlreadyCompletedError(str(lesson_id))
+            completed_count = change.completed_count
+            events = Progress.lesson_completion_events(
+                user_id, course_id, lesson_id, change.completed_at, completed_count, total_lessons
+            )
+        else:
+            # First completion in this course auto-starts it
             progress = Progress.start_course(user_id=user_id, course_id=course_id)
+            progress.mark_lesson_complete(lesson_id, total_lessons)
+            await self._progress_repository.save(progress)
+            completed_count = progress.completed_count
+            events = progress.clear_events()
 
-        # Mark complete
-        total_lessons = course.lesson_count
-        progress.mark_lesson_complete(lesson_id, total_lessons)
-        progress.update_last_accessed(lesson_id)
-
-        await self._progress_repository.save(progress)
-        await event_bus.publish_all(progress.clear_events())
+        await event_bus.publish_all(events)
 
         logger.info(
             "mark_lesson_complete_success",
             lesson_id=str(lesson_id),
-            completed_count=progress.completed_count,
+            completed_count=completed_count,
         )
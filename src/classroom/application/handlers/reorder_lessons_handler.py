@@ -3,10 +3,9 @@
 import structlog
 
 from src.classroom.application.commands import ReorderLessonsCommand
-from src.classroom.domain.exceptions import ModuleNotFoundError
+from src.classroom.domain.exceptions import InvalidPositionError, ModuleNotFoundError
 from src.classroom.domain.repositories import ICourseRepository
 from src.classroom.domain.value_objects import LessonId, ModuleId
-from src.shared.infrastructure import event_bus
 
 logger = structlog.get_logger()
 
@@ -23,18 +22,16 @@ class ReorderLessonsHandler:
         logger.info("reorder_lessons_attempt", module_id=str(command.module_id))
 
         module_id = ModuleId(command.module_id)
-        course = await self._course_repository.get_course_by_module_id(module_id)
-        if course is None:
-            raise ModuleNotFoundError(str(module_id))
-
-        module = course.get_module_by_id(module_id)
-        if module is None or module.is_deleted:
+        outline = await self._course_repository.get_outline_by_module_id(module_id)
+        if outline is None or all(module.id != module_id for module in outline.modules):
             raise ModuleNotFoundError(str(module_id))
 
         lesson_ids = [LessonId(lid) for lid in command.lesson_ids]
-        module.reorder_lessons(lesson_ids)
+        if len(lesson_ids) != len(set(lesson_ids)):
+            raise InvalidPositionError("Duplicate position in reorder request")
 
-        await self._course_repository.save(course)
-        await event_bus.publish_all(course.clear_events())
+        # Checked against the module's current lessons by the reorder statement itself
+        if not await self._course_repository.reorder_lessons(outline.id, module_id, lesson_ids):
+            raise InvalidPositionError("Must include all active lessons in reorder")
 
         logger.info("reorder_lessons_success", module_id=str(module_id))
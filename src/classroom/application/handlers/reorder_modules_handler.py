@@ -3,10 +3,9 @@
 import structlog
 
 from src.classroom.application.commands import ReorderModulesCommand
-from src.classroom.domain.exceptions import CourseNotFoundError
+from src.classroom.domain.exceptions import CourseNotFoundError, InvalidPositionError
 from src.classroom.domain.repositories import ICourseRepository
 from src.classroom.domain.value_objects import CourseId, ModuleId
-from src.shared.infrastructure import event_bus
 
 logger = structlog.get_logger()
 
@@ -23,14 +22,16 @@ class ReorderModulesHandler:
         logger.info("reorder_modules_attempt", course_id=str(command.course_id))
 
         course_id = CourseId(command.course_id)
-        course = await self._course_repository.get_by_id(course_id)
-        if course is None:
+        outline = await self._course_repository.get_outline(course_id)
+        if outline is None:
             raise CourseNotFoundError(str(course_id))
 
         module_ids = [ModuleId(mid) for mid in command.module_ids]
-        course.reorder_modules(module_ids)
+        if len(module_ids) != len(set(module_ids)):
+            raise InvalidPositionError("Duplicate position in reorder request")
 
-        await self._course_repository.save(course)
-        await event_bus.publish_all(course.clear_events())
+        # Checked against the course's current modules by the reorder statement itself
+        if not await self._course_repository.reorder_modules(course_id, module_ids):
+            raise InvalidPositionError("Must include all active modules in reorder")
 
         logger.info("reorder_modules_success", course_id=str(course_id))
@@ -42,7 +42,7 @@ class StartCourseHandler:
         course_id = CourseId(value=command.course_id)
 
         # Verify course exists
-        course = await self._course_repository.get_by_id(course_id)
+        course = await self._course_repository.get_outline(course_id)
         if course is None:
             raise CourseNotFoundError(str(command.course_id))
 
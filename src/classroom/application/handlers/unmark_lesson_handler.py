@@ -3,11 +3,17 @@
 import structlog
 
 from src.classroom.application.commands.unmark_lesson import UnmarkLessonCommand
-from src.classroom.domain.exceptions import LessonNotFoundError, ProgressNotFoundError
+from src.classroom.domain.entities.progress import Progress
+from src.classroom.domain.exceptions import (
+    LessonNotCompletedError,
+    LessonNotFoundError,
+    ProgressNotFoundError,
+)
 from src.classroom.domain.repositories.course_repository import ICourseRepository
 from src.classroom.domain.repositories.progress_repository import IProgressRepository
 from src.classroom.domain.value_objects.lesson_id import LessonId
 from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure import event_bus
 
 logger = structlog.get_logger()
 
@@ -34,21 +40,31 @@ class UnmarkLessonHandler:
         user_id = UserId(command.user_id)
         lesson_id = LessonId(value=command.lesson_id)
 
-        # Find the course
-        course = await self._course_repository.get_course_by_lesson_id(lesson_id)
+        # Find the course from the cached outline
+        course = await self._course_repository.get_outline_by_lesson_id(lesson_id)
         if course is None:
             raise LessonNotFoundError(str(command.lesson_id))
 
-        # Get progress
-        progress = await self._progress_repository.get_by_user_and_course(user_id, course.id)
-        if progress is None:
+        # Delete-returning: one statement, no completions loaded
+        change = await self._progress_repository.remove_completion(user_id, course.id, lesson_id)
+        if not change.progress_exists:
             raise ProgressNotFoundError(str(command.user_id), str(course.id))
+        if not change.changed or change.completed_at is None:
+            raise LessonNotCompletedError(str(lesson_id))
 
-        progress.unmark_lesson(lesson_id)
-        await self._progress_repository.save(progress)
+        await event_bus.publish_all(
+            Progress.lesson_uncompletion_events(
+                user_id,
+                course.id,
+                lesson_id,
+                change.completed_at,
+                change.completed_count,
+                course.lesson_count,
+            )
+        )
 
         logger.info(
             "unmark_lesson_success",
             lesson_id=str(lesson_id),
-            completed_count=progress.completed_count,
+            completed_count=change.completed_count,
         )
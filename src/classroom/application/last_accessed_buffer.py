@@ -0,0 +1,167 @@
+"""Write-behind buffer for "last accessed lesson" updates.
+
+Opening a lesson records it as the member's last accessed lesson in that
+course. Writing that through on every page view turns a read into a write
+transaction, so LastAccessedBuffer keeps only the latest access per
+(user, course) in memory and a background loop flushes the buffer every
+``flush_interval_seconds`` as one bulk UPDATE.
+
+Consistency:
+- Last-accessed values may lag reads by up to one flush interval.
+- The bulk update never replaces a more recent access already stored (for
+  example one written synchronously when a lesson is marked complete).
+- A failed flush puts its entries back unless a newer access for the same
+  key arrived meanwhile; they are retried on the next flush.
+- close() stops the loop and flushes what is pending; the application calls
+  it on shutdown. A crash loses at most one interval of access positions,
+  which are advisory.
+- Until start() is called (e.g. in tests without the app lifespan) nothing is
+  written; the buffer keeps at most ``max_pending`` entries, evicting the
+  least recently touched.
+
+The buffer writes through IProgressRepository.bulk_update_last_accessed on a
+repository scope supplied by the composition root, one transaction per flush.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime
+
+import structlog
+
+from src.classroom.domain.repositories.progress_repository import (
+    IProgressRepository,
+    LastAccessedUpdate,
+)
+from src.classroom.domain.value_objects.course_id import CourseId
+from src.classroom.domain.value_objects.lesson_id import LessonId
+from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+# Opens a progress repository whose writes commit when the scope exits
+ProgressRepositoryScope = Callable[[], AbstractAsyncContextManager[IProgressRepository]]
+
+_Key = tuple[UserId, CourseId]
+
+
+class LastAccessedBuffer:
+    """Coalesces last-accessed updates and flushes them periodically."""
+
+    def __init__(
+        self,
+        open_repository: ProgressRepositoryScope | None = None,
+        flush_interval_seconds: float = 2.0,
+        max_pending: int = 10_000,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._open_repository = open_repository
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending = max_pending
+        self._metrics = registry
+        self._pending: dict[_Key, LastAccessedUpdate] = {}
+        self._loop_task: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        registry.register_gauge("classroom_last_accessed_pending", lambda: len(self._pending))
+
+    def configure(
+        self,
+        flush_interval_seconds: float,
+        max_pending: int,
+        open_repository: ProgressRepositoryScope,
+    ) -> None:
+        """Apply runtime settings; takes effect on the next start()."""
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending = max_pending
+        self._open_repository = open_repository
+
+    @property
+    def pending_count(self) -> int:
+        """Number of (user, course) pairs waiting to be written."""
+        return len(self._pending)
+
+    def record(
+        self,
+        user_id: UserId,
+        course_id: CourseId,
+        lesson_id: LessonId,
+        accessed_at: datetime | None = None,
+    ) -> None:
+        """Buffer an access; a later access to the same course replaces it."""
+        key = (user_id, course_id)
+        update = LastAccessedUpdate(
+            user_id=user_id,
+            course_id=course_id,
+            lesson_id=lesson_id,
+            accessed_at=accessed_at or datetime.now(UTC),
+        )
+        # Re-insert so dict order tracks recency for eviction
+        self._pending.pop(key, None)
+        self._pending[key] = update
+        self._metrics.increment("classroom_last_accessed_recorded_total")
+
+        if len(self._pending) >= self._max_pending:
+            if self._loop_task is not None:
+                self._start_flush()
+            else:
+                del self._pending[next(iter(self._pending))]
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if (
+            self._loop_task is None
+            and self._open_repository is not None
+            and self._flush_interval_seconds > 0
+        ):
+            self._loop_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def flush(self) -> None:
+        """Write everything pending now."""
+        if self._open_repository is None:
+            return
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        self._metrics.increment("classroom_last_accessed_flushes_total")
+        try:
+            async with self._open_repository() as repository:
+                written = await repository.bulk_update_last_accessed(list(batch.values()))
+        except Exception:
+            self._metrics.increment("classroom_last_accessed_flush_failures_total")
+            logger.exception("classroom.last_accessed_flush_failed", updates=len(batch))
+            for key, update in batch.items():
+                newer = self._pending.get(key)
+                if newer is None or newer.accessed_at < update.accessed_at:
+                    self._pending[key] = update
+            return
+        self._metrics.increment("classroom_last_accessed_rows_written_total", written)
+
+    async def close(self) -> None:
+        """Stop the flush loop and write what is pending."""
+        if self._loop_task is None:
+            return
+        self._loop_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._loop_task
+        self._loop_task = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self.flush()
+
+    def _start_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+
+# Lesson reads record accesses here instead of writing progress rows
+last_accessed_buffer = LastAccessedBuffer()
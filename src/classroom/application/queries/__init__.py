@@ -1,5 +1,6 @@
 """Classroom application queries."""
 
+from src.classroom.application.queries.get_course_analytics import GetCourseAnalyticsQuery
 from src.classroom.application.queries.get_course_details import GetCourseDetailsQuery
 from src.classroom.application.queries.get_course_list import GetCourseListQuery
 from src.classroom.application.queries.get_lesson import GetLessonQuery
@@ -9,6 +10,7 @@ from src.classroom.application.queries.get_next_incomplete_lesson import (
 from src.classroom.application.queries.get_progress import GetProgressQuery
 
 __all__ = [
+    "GetCourseAnalyticsQuery",
     "GetCourseDetailsQuery",
     "GetCourseListQuery",
     "GetLessonQuery",
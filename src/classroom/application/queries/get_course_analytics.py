@@ -0,0 +1,12 @@
+"""Get course analytics query."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class GetCourseAnalyticsQuery:
+    """Query for a course's completion funnel and daily completions."""
+
+    course_id: UUID
+    days: int = 30
@@ -8,6 +8,7 @@ from src.classroom.domain.entities.lesson_completion import LessonCompletion
 from src.classroom.domain.events.progress_events import (
     CourseCompleted,
     LessonCompleted,
+    LessonUncompleted,
     ProgressStarted,
 )
 from src.classroom.domain.exceptions import (
@@ -21,6 +22,13 @@ from src.identity.domain.value_objects import UserId
 from src.shared.domain import DomainEvent
 
 
+def calculate_completion_percentage(completed: int, total_lessons: int) -> int:
+    """Integer completion percentage 0-100 for a number of completed lessons."""
+    if total_lessons == 0:
+        return 0
+    return min(round(completed / total_lessons * 100), 100)
+
+
 @dataclass
 class Progress:
     """Progress aggregate root.
@@ -73,31 +81,97 @@ class Progress:
         self._update_last_accessed(lesson_id)
         self._update_timestamp()
 
-        self._add_event(
+        for event in self.lesson_completion_events(
+            self.user_id,
+            self.course_id,
+            lesson_id,
+            completion.completed_at,
+            len(self._completions),
+            total_lessons,
+        ):
+            self._add_event(event)
+
+    @staticmethod
+    def lesson_completion_events(
+        user_id: UserId,
+        course_id: CourseId,
+        lesson_id: LessonId,
+        completed_at: datetime,
+        completed_count: int,
+        total_lessons: int,
+    ) -> list[DomainEvent]:
+        """Events for a lesson that just became complete.
+
+        Args:
+            completed_at: When the completion was recorded.
+            completed_count: Completions after this one was added.
+            total_lessons: Total non-deleted lessons in the course.
+        """
+        events: list[DomainEvent] = [
             LessonCompleted(
-                user_id=self.user_id,
-                course_id=self.course_id,
+                user_id=user_id,
+                course_id=course_id,
                 lesson_id=lesson_id,
+                completed_at=completed_at,
             )
-        )
-
+        ]
         # Check for course completion
-        if len(self._completions) >= total_lessons and total_lessons > 0:
-            self._add_event(
-                CourseCompleted(
-                    user_id=self.user_id,
-                    course_id=self.course_id,
-                )
-            )
+        if completed_count >= total_lessons and total_lessons > 0:
+            events.append(CourseCompleted(user_id=user_id, course_id=course_id))
+        return events
 
-    def unmark_lesson(self, lesson_id: LessonId) -> None:
-        """Remove completion for a lesson."""
-        if not self.is_lesson_completed(lesson_id):
+    def unmark_lesson(self, lesson_id: LessonId, total_lessons: int = 0) -> None:
+        """Remove completion for a lesson.
+
+        Args:
+            lesson_id: The lesson to un-mark.
+            total_lessons: Total non-deleted lessons in the course (to tell whether
+                the course had been completed).
+        """
+        removed = next((c for c in self._completions if c.lesson_id == lesson_id), None)
+        if removed is None:
             raise LessonNotCompletedError(str(lesson_id))
 
+        completed_before = len(self._completions)
         self._completions = [c for c in self._completions if c.lesson_id != lesson_id]
         self._update_timestamp()
 
+        for event in self.lesson_uncompletion_events(
+            self.user_id,
+            self.course_id,
+            lesson_id,
+            removed.completed_at,
+            completed_before - 1,
+            total_lessons,
+        ):
+            self._add_event(event)
+
+    @staticmethod
+    def lesson_uncompletion_events(
+        user_id: UserId,
+        course_id: CourseId,
+        lesson_id: LessonId,
+        completed_at: datetime,
+        completed_count: int,
+        total_lessons: int,
+    ) -> list[DomainEvent]:
+        """Events for a lesson completion that was just removed.
+
+        Args:
+            completed_at: When the removed completion had been recorded.
+            completed_count: Completions after this one was removed.
+            total_lessons: Total non-deleted lessons in the course.
+        """
+        return [
+            LessonUncompleted(
+                user_id=user_id,
+                course_id=course_id,
+                lesson_id=lesson_id,
+                completed_at=completed_at,
+                course_was_completed=total_lessons > 0 and completed_count + 1 >= total_lessons,
+            )
+        ]
+
     def is_lesson_completed(self, lesson_id: LessonId) -> bool:
         """Check if a specific lesson has been completed."""
         return any(c.lesson_id == lesson_id for c in self._completions)
@@ -111,10 +185,7 @@ class Progress:
         Returns:
             Integer percentage 0-100.
         """
-        if total_lessons == 0:
-            return 0
-        completed = len(self._completions)
-        return min(round(completed / total_lessons * 100), 100)
+        return calculate_completion_percentage(len(self._completions), total_lessons)
 
     def get_completed_lesson_ids(self) -> set[LessonId]:
         """Get set of completed lesson IDs."""
@@ -4,6 +4,7 @@ from src.classroom.domain.events.course_events import CourseCreated, CourseDelet
 from src.classroom.domain.events.progress_events import (
     CourseCompleted,
     LessonCompleted,
+    LessonUncompleted,
     ProgressStarted,
 )
 
@@ -12,5 +13,6 @@ __all__ = [
     "CourseCreated",
     "CourseDeleted",
     "LessonCompleted",
+    "LessonUncompleted",
     "ProgressStarted",
 ]
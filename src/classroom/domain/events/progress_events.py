@@ -1,6 +1,8 @@
 """Progress domain events."""
 
+from collections.abc import Hashable
 from dataclasses import dataclass
+from datetime import datetime
 
 from src.classroom.domain.value_objects.course_id import CourseId
 from src.classroom.domain.value_objects.lesson_id import LessonId
@@ -15,14 +17,46 @@ class ProgressStarted(DomainEvent):
     user_id: UserId
     course_id: CourseId
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return (self.user_id, self.course_id)
+
 
 @dataclass(frozen=True, kw_only=True)
 class LessonCompleted(DomainEvent):
-    """Event published when a member marks a lesson as complete."""
+    """Event published when a member marks a lesson as complete.
+
+    ``completed_at`` is the timestamp stored on the completion.
+    """
 
     user_id: UserId
     course_id: CourseId
     lesson_id: LessonId
+    completed_at: datetime
+
+    @property
+    def aggregate_id(self) -> Hashable:
+        return (self.user_id, self.course_id)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LessonUncompleted(DomainEvent):
+    """Event published when a member removes a lesson completion.
+
+    ``completed_at`` is when the removed completion had been recorded;
+    ``course_was_completed`` tells whether the member had completed the course
+    before this removal.
+    """
+
+    user_id: UserId
+    course_id: CourseId
+    lesson_id: LessonId
+    completed_at: datetime
+    course_was_completed: bool
+
+    @property
+    def aggregate_id(self) -> Hashable:
+        return (self.user_id, self.course_id)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -31,3 +65,7 @@ class CourseCompleted(DomainEvent):
 
     user_id: UserId
     course_id: CourseId
+
+    @property
+    def aggregate_id(self) -> Hashable:
+        return (self.user_id, self.course_id)
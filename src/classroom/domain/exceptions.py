@@ -193,6 +193,15 @@ class InvalidPositionError(ClassroomDomainError):
         super().__init__(reason)
 
 
+# Import errors
+class InvalidCourseImportError(ClassroomDomainError):
+    """Raised when records in a course import document are invalid."""
+
+    def __init__(self, errors: list[tuple[int, str]]) -> None:
+        super().__init__(f"Course import has {len(errors)} invalid record(s)")
+        self.errors = errors
+
+
 # Progress errors
 class ProgressNotFoundError(ClassroomDomainError):
     """Raised when progress cannot be found for a user and course."""
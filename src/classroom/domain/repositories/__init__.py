@@ -1,7 +1,27 @@
 """Classroom domain repository interfaces."""
 
-from src.classroom.domain.repositories.course_repository import ICourseRepository
+from src.classroom.domain.repositories.completion_analytics_repository import (
+    CourseCompletionRollup,
+    DailyCompletionCount,
+    ICompletionAnalyticsRepository,
+    RollupRebuildResult,
+)
+from src.classroom.domain.repositories.course_repository import (
+    CourseOutline,
+    CourseSummary,
+    ICourseRepository,
+    LessonOutline,
+    ModuleOutline,
+)
 
 __all__ = [
+    "CourseCompletionRollup",
+    "CourseOutline",
+    "CourseSummary",
+    "DailyCompletionCount",
+    "ICompletionAnalyticsRepository",
     "ICourseRepository",
+    "LessonOutline",
+    "ModuleOutline",
+    "RollupRebuildResult",
 ]
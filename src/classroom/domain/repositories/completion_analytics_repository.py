@@ -0,0 +1,93 @@
+"""Completion analytics repository interface.
+
+Course and lesson completion figures for admin dashboards are read from
+rollups rather than from progress rows. The rollups are maintained
+incrementally from progress events and can be rebuilt from the source tables.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+
+from src.classroom.domain.value_objects.course_id import CourseId
+from src.classroom.domain.value_objects.lesson_id import LessonId
+
+
+@dataclass(frozen=True)
+class CourseCompletionRollup:
+    """Members who started and who completed a course."""
+
+    course_id: CourseId
+    started_count: int
+    completed_count: int
+
+
+@dataclass(frozen=True)
+class DailyCompletionCount:
+    """Lesson completions in a course recorded on one (UTC) day."""
+
+    day: date
+    completions: int
+
+
+@dataclass(frozen=True)
+class RollupRebuildResult:
+    """Row counts written by a rollup rebuild."""
+
+    courses: int
+    lessons: int
+    days: int
+
+
+class ICompletionAnalyticsRepository(ABC):
+    """Interface for completion rollup maintenance and reads."""
+
+    @abstractmethod
+    async def record_course_started(self, course_id: CourseId) -> None:
+        """Count a member starting a course."""
+        ...
+
+    @abstractmethod
+    async def record_course_completed(self, course_id: CourseId) -> None:
+        """Count a member completing a course."""
+        ...
+
+    @abstractmethod
+    async def record_lesson_completed(
+        self, course_id: CourseId, lesson_id: LessonId, day: date
+    ) -> None:
+        """Count a lesson completion recorded on ``day``."""
+        ...
+
+    @abstractmethod
+    async def record_lesson_uncompleted(
+        self,
+        course_id: CourseId,
+        lesson_id: LessonId,
+        completed_on: date,
+        course_was_completed: bool,
+    ) -> None:
+        """Take back a lesson completion that had been recorded on ``completed_on``."""
+        ...
+
+    @abstractmethod
+    async def get_course_rollup(self, course_id: CourseId) -> CourseCompletionRollup:
+        """Started and completed counts for a course (zeros if none)."""
+        ...
+
+    @abstractmethod
+    async def get_lesson_completion_counts(self, course_id: CourseId) -> dict[LessonId, int]:
+        """Current completion count per lesson of a course."""
+        ...
+
+    @abstractmethod
+    async def get_daily_completions(
+        self, course_id: CourseId, since: date
+    ) -> list[DailyCompletionCount]:
+        """Completions per day from ``since`` onwards, oldest first; days without any are omitted."""
+        ...
+
+    @abstractmethod
+    async def rebuild(self) -> RollupRebuildResult:
+        """Recompute every rollup from progress and lesson_completions."""
+        ...
@@ -1,9 +1,166 @@
 """Course repository interface."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
 
 from src.classroom.domain.entities import Course
-from src.classroom.domain.value_objects import CourseId, LessonId, ModuleId
+from src.classroom.domain.entities.lesson import Lesson
+from src.classroom.domain.value_objects import (
+    ContentType,
+    CourseDescription,
+    CourseId,
+    CourseTitle,
+    CoverImageUrl,
+    EstimatedDuration,
+    LessonId,
+    LessonTitle,
+    ModuleId,
+    ModuleTitle,
+)
+from src.identity.domain.value_objects import UserId
+
+
+@dataclass(frozen=True)
+class CourseSummary:
+    """Read model for course listings: course fields plus structure counts, no content."""
+
+    id: CourseId
+    instructor_id: UserId
+    title: CourseTitle
+    description: CourseDescription | None
+    cover_image_url: CoverImageUrl | None
+    estimated_duration: EstimatedDuration | None
+    module_count: int
+    lesson_count: int
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class LessonOutline:
+    """Lesson structure without its content body."""
+
+    id: LessonId
+    title: LessonTitle
+    content_type: ContentType
+    position: int
+    is_deleted: bool
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class ModuleOutline:
+    """Module structure with its lesson outlines (including deleted ones)."""
+
+    id: ModuleId
+    title: ModuleTitle
+    position: int
+    is_deleted: bool
+    all_lessons: tuple[LessonOutline, ...]
+
+    @property
+    def lessons(self) -> list[LessonOutline]:
+        """Non-deleted lessons sorted by position."""
+        return sorted(
+            [ls for ls in self.all_lessons if not ls.is_deleted],
+            key=lambda ls: ls.position,
+        )
+
+    @property
+    def lesson_count(self) -> int:
+        """Count of non-deleted lessons."""
+        return len([ls for ls in self.all_lessons if not ls.is_deleted])
+
+    def get_lesson_by_id(self, lesson_id: LessonId) -> LessonOutline | None:
+        """Get a lesson by ID (including deleted)."""
+        for lesson in self.all_lessons:
+            if lesson.id == lesson_id:
+                return lesson
+        return None
+
+
+@dataclass(frozen=True)
+class CourseOutline:
+    """Read-only course structure for navigation and progress: no lesson content.
+
+    Mirrors the ordering and deleted-filtering rules of the Course aggregate.
+    Reading order, prev/next links and the lesson-to-module map are computed
+    once at construction, so navigation lookups are O(1). Instances are
+    immutable and shared as-is by caches.
+    """
+
+    id: CourseId
+    title: CourseTitle
+    is_deleted: bool
+    all_modules: tuple[ModuleOutline, ...]
+    _modules: tuple[ModuleOutline, ...] = field(init=False, repr=False, compare=False)
+    _lesson_ids: tuple[LessonId, ...] = field(init=False, repr=False, compare=False)
+    _navigation: dict[LessonId, tuple[LessonId | None, LessonId | None]] = field(
+        init=False, repr=False, compare=False
+    )
+    _lessons: dict[LessonId, tuple[ModuleOutline, LessonOutline]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        modules = tuple(
+            sorted([m for m in self.all_modules if not m.is_deleted], key=lambda m: m.position)
+        )
+        lesson_ids = tuple(ls.id for m in modules for ls in m.lessons)
+        navigation = {
+            lesson_id: (
+                lesson_ids[i - 1] if i > 0 else None,
+                lesson_ids[i + 1] if i < len(lesson_ids) - 1 else None,
+            )
+            for i, lesson_id in enumerate(lesson_ids)
+        }
+        lessons = {ls.id: (m, ls) for m in self.all_modules for ls in m.all_lessons}
+        object.__setattr__(self, "_modules", modules)
+        object.__setattr__(self, "_lesson_ids", lesson_ids)
+        object.__setattr__(self, "_navigation", navigation)
+        object.__setattr__(self, "_lessons", lessons)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "CourseOutline":
+        """Immutable: copies are the same object."""
+        return self
+
+    @property
+    def modules(self) -> list[ModuleOutline]:
+        """Non-deleted modules sorted by position."""
+        return list(self._modules)
+
+    @property
+    def lesson_count(self) -> int:
+        """Count of non-deleted lessons across all non-deleted modules."""
+        return len(self._lesson_ids)
+
+    def find_module_for_lesson(self, lesson_id: LessonId) -> ModuleOutline | None:
+        """Find the module that contains a given lesson (including deleted)."""
+        found = self._lessons.get(lesson_id)
+        return found[0] if found else None
+
+    def get_lesson(self, lesson_id: LessonId) -> LessonOutline | None:
+        """Get a lesson by ID (including deleted)."""
+        found = self._lessons.get(lesson_id)
+        return found[1] if found else None
+
+    def ordered_lesson_ids(self) -> list[LessonId]:
+        """Non-deleted lesson IDs in reading order across non-deleted modules."""
+        return list(self._lesson_ids)
+
+    def navigation(self, lesson_id: LessonId) -> tuple[LessonId | None, LessonId | None]:
+        """Previous and next lesson IDs; (None, None) for lessons not in reading order."""
+        return self._navigation.get(lesson_id, (None, None))
+
+    def next_incomplete_lesson_id(self, completed_ids: set[LessonId]) -> LessonId | None:
+        """First lesson in reading order that is not in ``completed_ids``."""
+        for lesson_id in self._lesson_ids:
+            if lesson_id not in completed_ids:
+                return lesson_id
+        return None
 
 
 class ICourseRepository(ABC):
@@ -14,6 +171,11 @@ class ICourseRepository(ABC):
         """Save a course (create or update)."""
         ...
 
+    @abstractmethod
+    async def insert_course(self, course: Course) -> None:
+        """Insert a new course with its modules and lessons using multi-row inserts."""
+        ...
+
     @abstractmethod
     async def get_by_id(self, course_id: CourseId) -> Course | None:
         """Get a course by ID (excluding deleted)."""
@@ -34,6 +196,70 @@ class ICourseRepository(ABC):
         """List all courses."""
         ...
 
+    @abstractmethod
+    async def list_summaries(
+        self,
+        include_deleted: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[CourseSummary]:
+        """List course summaries with non-deleted module and lesson counts."""
+        ...
+
+    @abstractmethod
+    async def get_outline(
+        self, course_id: CourseId, include_deleted: bool = False
+    ) -> CourseOutline | None:
+        """Get a course's module and lesson structure without loading lesson content."""
+        ...
+
+    @abstractmethod
+    async def get_outline_by_lesson_id(self, lesson_id: LessonId) -> CourseOutline | None:
+        """Get the outline of the course containing a lesson (excluding deleted courses)."""
+        ...
+
+    @abstractmethod
+    async def get_outline_by_module_id(self, module_id: ModuleId) -> CourseOutline | None:
+        """Get the outline of the course containing a module (excluding deleted courses)."""
+        ...
+
+    @abstractmethod
+    async def reorder_modules(self, course_id: CourseId, module_ids: list[ModuleId]) -> bool:
+        """
+        Set module positions to the order of ``module_ids`` in one statement.
+
+        Nothing is written unless ``module_ids`` is exactly the course's set of
+        non-deleted modules; returns whether the new order was applied.
+        """
+        ...
+
+    @abstractmethod
+    async def reorder_lessons(
+        self, course_id: CourseId, module_id: ModuleId, lesson_ids: list[LessonId]
+    ) -> bool:
+        """
+        Set lesson positions to the order of ``lesson_ids`` in one statement.
+
+        Nothing is written unless ``lesson_ids`` is exactly the module's set of
+        non-deleted lessons; returns whether the new order was applied.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_module(self, course_id: CourseId, module_id: ModuleId) -> None:
+        """Soft delete a module with its lessons and close the gap in module positions."""
+        ...
+
+    @abstractmethod
+    async def delete_course(self, course_id: CourseId) -> bool:
+        """Soft delete a non-deleted course; returns False if there was none."""
+        ...
+
+    @abstractmethod
+    async def get_lesson(self, lesson_id: LessonId) -> Lesson | None:
+        """Get a single lesson, with its content, by ID (including deleted)."""
+        ...
+
     @abstractmethod
     async def get_course_by_module_id(self, module_id: ModuleId) -> Course | None:
         """Get the course that contains a specific module (excluding deleted courses)."""
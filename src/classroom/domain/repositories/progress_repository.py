@@ -1,13 +1,55 @@
 """Progress repository interface."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
 
-from src.classroom.domain.entities.progress import Progress
+from src.classroom.domain.entities.progress import Progress, calculate_completion_percentage
 from src.classroom.domain.value_objects.course_id import CourseId
+from src.classroom.domain.value_objects.lesson_id import LessonId
 from src.classroom.domain.value_objects.progress_id import ProgressId
 from src.identity.domain.value_objects import UserId
 
 
+@dataclass(frozen=True)
+class CourseProgressSummary:
+    """Read model of one member's progress in a course, without the completion rows."""
+
+    course_id: CourseId
+    completed_count: int
+    last_accessed_lesson_id: LessonId | None
+
+    def completion_percentage(self, total_lessons: int) -> int:
+        """Integer percentage 0-100, matching Progress.calculate_completion_percentage."""
+        return calculate_completion_percentage(self.completed_count, total_lessons)
+
+
+@dataclass(frozen=True)
+class LastAccessedUpdate:
+    """A deferred "last accessed lesson" write for one member's course progress."""
+
+    user_id: UserId
+    course_id: CourseId
+    lesson_id: LessonId
+    accessed_at: datetime
+
+
+@dataclass(frozen=True)
+class CompletionChange:
+    """Outcome of a single-statement completion write.
+
+    ``progress_exists`` is False when the member has no progress for the course
+    (nothing was written). ``changed`` tells whether a row was actually inserted
+    or deleted; ``completed_count`` is the count after the write and
+    ``completed_at`` the timestamp of the inserted or deleted completion.
+    """
+
+    progress_exists: bool
+    changed: bool
+    completed_count: int
+    completed_at: datetime | None = None
+
+
 class IProgressRepository(ABC):
     """Interface for Progress persistence operations."""
 
@@ -30,3 +72,32 @@ class IProgressRepository(ABC):
     async def list_by_user(self, user_id: UserId) -> list[Progress]:
         """Get all progress records for a user."""
         ...
+
+    @abstractmethod
+    async def get_summaries_for_user(
+        self, user_id: UserId, course_ids: list[CourseId]
+    ) -> dict[CourseId, CourseProgressSummary]:
+        """Get progress summaries for the courses a user has started, keyed by course."""
+        ...
+
+    @abstractmethod
+    async def bulk_update_last_accessed(self, updates: list[LastAccessedUpdate]) -> int:
+        """Apply last-accessed updates to existing progress rows; returns rows updated.
+
+        An update never overwrites a more recent access already stored.
+        """
+        ...
+
+    @abstractmethod
+    async def add_completion(
+        self, user_id: UserId, course_id: CourseId, lesson_id: LessonId
+    ) -> CompletionChange:
+        """Insert a lesson completion if absent and mark the lesson as last accessed."""
+        ...
+
+    @abstractmethod
+    async def remove_completion(
+        self, user_id: UserId, course_id: CourseId, lesson_id: LessonId
+    ) -> CompletionChange:
+        """Delete a lesson completion if present."""
+        ...
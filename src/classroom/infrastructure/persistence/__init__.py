@@ -1,9 +1,16 @@
 """Classroom infrastructure persistence layer."""
 
+from src.classroom.infrastructure.persistence.cached_repositories import CachedCourseRepository
+from src.classroom.infrastructure.persistence.completion_analytics_repository import (
+    SqlAlchemyCompletionAnalyticsRepository,
+)
 from src.classroom.infrastructure.persistence.course_repository import SqlAlchemyCourseRepository
 from src.classroom.infrastructure.persistence.models import (
+    CourseCompletionDailyRollupModel,
+    CourseCompletionRollupModel,
     CourseModel,
     LessonCompletionModel,
+    LessonCompletionRollupModel,
     LessonModel,
     ModuleModel,
     ProgressModel,
@@ -13,11 +20,16 @@ from src.classroom.infrastructure.persistence.progress_repository import (
 )
 
 __all__ = [
+    "CachedCourseRepository",
+    "CourseCompletionDailyRollupModel",
+    "CourseCompletionRollupModel",
     "CourseModel",
     "LessonCompletionModel",
+    "LessonCompletionRollupModel",
     "LessonModel",
     "ModuleModel",
     "ProgressModel",
+    "SqlAlchemyCompletionAnalyticsRepository",
     "SqlAlchemyCourseRepository",
     "SqlAlchemyProgressRepository",
 ]
@@ -0,0 +1,195 @@
+"""Read-through cached decorator for course outlines.
+
+Every lesson page, completion toggle and "continue" lookup needs the course
+structure (reading order, prev/next links, counts) but not lesson content.
+The structure only changes when a course, module or lesson is written through
+``ICourseRepository.save`` or one of its set-based writes (reorders and
+deletes). Outlines are cached per course in the reference data cache; every
+write drops the course's outline on commit so the next read rebuilds it. After a write, the wrapper
+bypasses the cache for the rest of its session.
+
+Outlines are immutable and shared between requests without copying.
+"""
+
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.classroom.domain.entities import Course
+from src.classroom.domain.entities.lesson import Lesson
+from src.classroom.domain.repositories import CourseOutline, CourseSummary, ICourseRepository
+from src.classroom.domain.value_objects import CourseId, LessonId, ModuleId
+from src.shared.infrastructure.reference_cache import ReferenceDataCache, reference_cache
+
+COURSE_OUTLINE_NAMESPACE = "classroom.course_outline"
+LESSON_COURSE_NAMESPACE = "classroom.lesson_course"
+MODULE_COURSE_NAMESPACE = "classroom.module_course"
+
+
+class CachedCourseRepository(ICourseRepository):
+    """ICourseRepository decorator that caches course outlines."""
+
+    def __init__(
+        self,
+        inner: ICourseRepository,
+        session: AsyncSession | None = None,
+        cache: ReferenceDataCache = reference_cache,
+    ) -> None:
+        """Initialize with the wrapped repository."""
+        self._inner = inner
+        self._session = session
+        self._cache = cache
+        self._dirty = False
+
+    async def save(self, course: Course) -> None:
+        """Save a course and invalidate its outline."""
+        await self._inner.save(course)
+        await self._written(course.id)
+
+    async def insert_course(self, course: Course) -> None:
+        """Insert an imported course; marks the session as written."""
+        await self._inner.insert_course(course)
+        await self._written(course.id)
+
+    async def get_outline(
+        self, course_id: CourseId, include_deleted: bool = False
+    ) -> CourseOutline | None:
+        """Get a course outline, served from the cache when possible."""
+        if self._dirty:
+            return await self._inner.get_outline(course_id, include_deleted=include_deleted)
+        # One entry per course, deleted or not; filter on the way out
+        outline = await self._cache.get_or_load(
+            COURSE_OUTLINE_NAMESPACE,
+            str(course_id.value),
+            lambda: self._inner.get_outline(course_id, include_deleted=True),
+        )
+        if outline is None or (outline.is_deleted and not include_deleted):
+            return None
+        return outline
+
+    async def get_outline_by_lesson_id(self, lesson_id: LessonId) -> CourseOutline | None:
+        """Get the outline of the course containing a lesson, via a cached lesson-to-course map."""
+        if self._dirty:
+            return await self._inner.get_outline_by_lesson_id(lesson_id)
+        return await self._get_outline_via(
+            LESSON_COURSE_NAMESPACE,
+            str(lesson_id.value),
+            lambda: self._inner.get_outline_by_lesson_id(lesson_id),
+        )
+
+    async def get_outline_by_module_id(self, module_id: ModuleId) -> CourseOutline | None:
+        """Get the outline of the course containing a module, via a cached module-to-course map."""
+        if self._dirty:
+            return await self._inner.get_outline_by_module_id(module_id)
+        return await self._get_outline_via(
+            MODULE_COURSE_NAMESPACE,
+            str(module_id.value),
+            lambda: self._inner.get_outline_by_module_id(module_id),
+        )
+
+    async def _get_outline_via(
+        self,
+        namespace: str,
+        key: str,
+        load: Callable[[], Awaitable[CourseOutline | None]],
+    ) -> CourseOutline | None:
+        """Resolve a child ID to its course through ``namespace``, then read the outline."""
+        loaded: list[CourseOutline] = []
+
+        async def _load_course_id() -> CourseId | None:
+            outline = await load()
+            if outline is None:
+                return None
+            loaded.append(outline)
+            return outline.id
+
+        # Lessons and modules never move between courses, so the mapping only needs the TTL
+        course_id = await self._cache.get_or_load(namespace, key, _load_course_id)
+        if course_id is None:
+            return None
+
+        async def _load_outline() -> CourseOutline | None:
+            if loaded:
+                return loaded[0]
+            return await self._inner.get_outline(course_id, include_deleted=True)
+
+        outline = await self._cache.get_or_load(
+            COURSE_OUTLINE_NAMESPACE, str(course_id.value), _load_outline
+        )
+        if outline is None or outline.is_deleted:
+            return None
+        return outline
+
+    async def reorder_modules(self, course_id: CourseId, module_ids: list[ModuleId]) -> bool:
+        """Reorder modules and invalidate the course outline."""
+        applied = await self._inner.reorder_modules(course_id, module_ids)
+        await self._written(course_id)
+        return applied
+
+    async def reorder_lessons(
+        self, course_id: CourseId, module_id: ModuleId, lesson_ids: list[LessonId]
+    ) -> bool:
+        """Reorder lessons and invalidate the course outline."""
+        applied = await self._inner.reorder_lessons(course_id, module_id, lesson_ids)
+        await self._written(course_id)
+        return applied
+
+    async def delete_module(self, course_id: CourseId, module_id: ModuleId) -> None:
+        """Delete a module and invalidate the course outline."""
+        await self._inner.delete_module(course_id, module_id)
+        await self._written(course_id)
+
+    async def delete_course(self, course_id: CourseId) -> bool:
+        """Delete a course and invalidate its outline."""
+        deleted = await self._inner.delete_course(course_id)
+        await self._written(course_id)
+        return deleted
+
+    async def _written(self, course_id: CourseId) -> None:
+        """Bypass the cache for this session and drop the outline once the write commits."""
+        self._dirty = True
+        await self._cache.invalidate_on_commit(
+            self._session, COURSE_OUTLINE_NAMESPACE, str(course_id.value)
+        )
+
+    async def get_by_id(self, course_id: CourseId) -> Course | None:
+        """Get a course by ID (excluding deleted)."""
+        return await self._inner.get_by_id(course_id)
+
+    async def get_by_id_include_deleted(self, course_id: CourseId) -> Course | None:
+        """Get a course by ID including deleted courses."""
+        return await self._inner.get_by_id_include_deleted(course_id)
+
+    async def list_all(
+        self,
+        include_deleted: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[Course]:
+        """List all courses."""
+        return await self._inner.list_all(
+            include_deleted=include_deleted, limit=limit, offset=offset
+        )
+
+    async def list_summaries(
+        self,
+        include_deleted: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[CourseSummary]:
+        """List course summaries."""
+        return await self._inner.list_summaries(
+            include_deleted=include_deleted, limit=limit, offset=offset
+        )
+
+    async def get_lesson(self, lesson_id: LessonId) -> Lesson | None:
+        """Get a single lesson with its content."""
+        return await self._inner.get_lesson(lesson_id)
+
+    async def get_course_by_module_id(self, module_id: ModuleId) -> Course | None:
+        """Get the course that contains a specific module."""
+        return await self._inner.get_course_by_module_id(module_id)
+
+    async def get_course_by_lesson_id(self, lesson_id: LessonId) -> Course | None:
+        """Get the course that contains a specific lesson."""
+        return await self._inner.get_course_by_lesson_id(lesson_id)
@@ -0,0 +1,305 @@
+"""Completion rollups for course analytics.
+
+The rollups are maintained incrementally by the classroom progress event
+handlers, one upsert per event. Counts can drift from progress when an event
+handler fails or when lessons are added or deleted after members completed a
+course; rebuild() recomputes every rollup from progress and lesson_completions
+in one transaction.
+
+Run after deploying the tables, and periodically to reconcile drift:
+
+    python -m src.classroom.infrastructure.persistence.completion_analytics_repository rebuild
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+import structlog
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    SQLColumnExpression,
+    and_,
+    cast,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.classroom.domain.repositories.completion_analytics_repository import (
+    CourseCompletionRollup,
+    DailyCompletionCount,
+    ICompletionAnalyticsRepository,
+    RollupRebuildResult,
+)
+from src.classroom.domain.value_objects.course_id import CourseId
+from src.classroom.domain.value_objects.lesson_id import LessonId
+from src.classroom.infrastructure.persistence.models import (
+    CourseCompletionDailyRollupModel,
+    CourseCompletionRollupModel,
+    LessonCompletionModel,
+    LessonCompletionRollupModel,
+    LessonModel,
+    ModuleModel,
+    ProgressModel,
+)
+
+logger = structlog.get_logger()
+
+
+def _decrement(current: SQLColumnExpression[int]) -> ColumnElement[int]:
+    """Subtract one without going below zero."""
+    return func.greatest(current - 1, 0)
+
+
+class SqlAlchemyCompletionAnalyticsRepository(ICompletionAnalyticsRepository):
+    """SQLAlchemy implementation of ICompletionAnalyticsRepository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def record_course_started(self, course_id: CourseId) -> None:
+        """Count a member starting a course."""
+        await self._bump_course(course_id, started=1, completed=0)
+
+    async def record_course_completed(self, course_id: CourseId) -> None:
+        """Count a member completing a course."""
+        await self._bump_course(course_id, started=0, completed=1)
+
+    async def record_lesson_completed(
+        self, course_id: CourseId, lesson_id: LessonId, day: date
+    ) -> None:
+        """Count a lesson completion recorded on ``day``."""
+        lesson_stmt = pg_insert(LessonCompletionRollupModel).values(
+            lesson_id=lesson_id.value, course_id=course_id.value, completed_count=1
+        )
+        await self._session.execute(
+            lesson_stmt.on_conflict_do_update(
+                index_elements=[LessonCompletionRollupModel.lesson_id],
+                set_={
+                    "completed_count": LessonCompletionRollupModel.completed_count + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        day_stmt = pg_insert(CourseCompletionDailyRollupModel).values(
+            course_id=course_id.value, day=day, completions=1
+        )
+        await self._session.execute(
+            day_stmt.on_conflict_do_update(
+                index_elements=[
+                    CourseCompletionDailyRollupModel.course_id,
+                    CourseCompletionDailyRollupModel.day,
+                ],
+                set_={"completions": CourseCompletionDailyRollupModel.completions + 1},
+            )
+        )
+
+    async def record_lesson_uncompleted(
+        self,
+        course_id: CourseId,
+        lesson_id: LessonId,
+        completed_on: date,
+        course_was_completed: bool,
+    ) -> None:
+        """Take back a lesson completion that had been recorded on ``completed_on``."""
+        await self._session.execute(
+            update(LessonCompletionRollupModel)
+            .where(LessonCompletionRollupModel.lesson_id == lesson_id.value)
+            .values(
+                completed_count=_decrement(LessonCompletionRollupModel.completed_count),
+                updated_at=func.now(),
+            )
+        )
+        await self._session.execute(
+            update(CourseCompletionDailyRollupModel)
+            .where(
+                CourseCompletionDailyRollupModel.course_id == course_id.value,
+                CourseCompletionDailyRollupModel.day == completed_on,
+            )
+            .values(completions=_decrement(CourseCompletionDailyRollupModel.completions))
+        )
+        if course_was_completed:
+            await self._session.execute(
+                update(CourseCompletionRollupModel)
+                .where(CourseCompletionRollupModel.course_id == course_id.value)
+                .values(
+                    completed_count=_decrement(CourseCompletionRollupModel.completed_count),
+                    updated_at=func.now(),
+                )
+            )
+
+    async def get_course_rollup(self, course_id: CourseId) -> CourseCompletionRollup:
+        """Started and completed counts for a course (zeros if none)."""
+        result = await self._session.execute(
+            select(
+                CourseCompletionRollupModel.started_count,
+                CourseCompletionRollupModel.completed_count,
+            ).where(CourseCompletionRollupModel.course_id == course_id.value)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return CourseCompletionRollup(course_id=course_id, started_count=0, completed_count=0)
+        return CourseCompletionRollup(
+            course_id=course_id,
+            started_count=row.started_count,
+            completed_count=row.completed_count,
+        )
+
+    async def get_lesson_completion_counts(self, course_id: CourseId) -> dict[LessonId, int]:
+        """Current completion count per lesson of a course."""
+        result = await self._session.execute(
+            select(
+                LessonCompletionRollupModel.lesson_id,
+                LessonCompletionRollupModel.completed_count,
+            ).where(LessonCompletionRollupModel.course_id == course_id.value)
+        )
+        return {LessonId(row.lesson_id): row.completed_count for row in result}
+
+    async def get_daily_completions(
+        self, course_id: CourseId, since: date
+    ) -> list[DailyCompletionCount]:
+        """Completions per day from ``since`` onwards, oldest first; days without any are omitted."""
+        result = await self._session.execute(
+            select(
+                CourseCompletionDailyRollupModel.day,
+                CourseCompletionDailyRollupModel.completions,
+            )
+            .where(
+                CourseCompletionDailyRollupModel.course_id == course_id.value,
+                CourseCompletionDailyRollupModel.day >= since,
+                CourseCompletionDailyRollupModel.completions > 0,
+            )
+            .order_by(CourseCompletionDailyRollupModel.day)
+        )
+        return [DailyCompletionCount(day=row.day, completions=row.completions) for row in result]
+
+    async def rebuild(self) -> RollupRebuildResult:
+        """Recompute every rollup from progress and lesson_completions.
+
+        A course counts as completed for a member once they have completed
+        every one of its non-deleted lessons.
+        """
+        await self._session.execute(delete(LessonCompletionRollupModel))
+        await self._session.execute(delete(CourseCompletionRollupModel))
+        await self._session.execute(delete(CourseCompletionDailyRollupModel))
+
+        lesson_course = (
+            select(LessonModel.id.label("lesson_id"), ModuleModel.course_id)
+            .join(ModuleModel, LessonModel.module_id == ModuleModel.id)
+            .subquery("lesson_course")
+        )
+
+        lessons = await self._session.execute(
+            insert(LessonCompletionRollupModel).from_select(
+                ["lesson_id", "course_id", "completed_count"],
+                select(
+                    LessonCompletionModel.lesson_id,
+                    lesson_course.c.course_id,
+                    func.count(),
+                )
+                .join(lesson_course, lesson_course.c.lesson_id == LessonCompletionModel.lesson_id)
+                .group_by(LessonCompletionModel.lesson_id, lesson_course.c.course_id),
+            )
+        )
+
+        completed_on = cast(func.timezone("UTC", LessonCompletionModel.completed_at), Date)
+        days = await self._session.execute(
+            insert(CourseCompletionDailyRollupModel).from_select(
+                ["course_id", "day", "completions"],
+                select(ProgressModel.course_id, completed_on, func.count())
+                .join(LessonCompletionModel, LessonCompletionModel.progress_id == ProgressModel.id)
+                .group_by(ProgressModel.course_id, completed_on),
+            )
+        )
+
+        live_lessons = (
+            select(ModuleModel.course_id, func.count().label("total"))
+            .join(LessonModel, LessonModel.module_id == ModuleModel.id)
+            .where(ModuleModel.is_deleted.is_(False), LessonModel.is_deleted.is_(False))
+            .group_by(ModuleModel.course_id)
+            .subquery("live_lessons")
+        )
+        live_completions = (
+            select(LessonCompletionModel.progress_id, func.count().label("done"))
+            .join(LessonModel, LessonModel.id == LessonCompletionModel.lesson_id)
+            .join(ModuleModel, ModuleModel.id == LessonModel.module_id)
+            .where(ModuleModel.is_deleted.is_(False), LessonModel.is_deleted.is_(False))
+            .group_by(LessonCompletionModel.progress_id)
+            .subquery("live_completions")
+        )
+        is_completed = and_(
+            live_lessons.c.total > 0,
+            func.coalesce(live_completions.c.done, 0) >= live_lessons.c.total,
+        )
+        courses = await self._session.execute(
+            insert(CourseCompletionRollupModel).from_select(
+                ["course_id", "started_count", "completed_count"],
+                select(
+                    ProgressModel.course_id,
+                    func.count(),
+                    func.count().filter(is_completed),
+                )
+                .outerjoin(live_lessons, live_lessons.c.course_id == ProgressModel.course_id)
+                .outerjoin(live_completions, live_completions.c.progress_id == ProgressModel.id)
+                .group_by(ProgressModel.course_id),
+            )
+        )
+
+        rebuilt = RollupRebuildResult(
+            courses=courses.rowcount,  # type: ignore[attr-defined]
+            lessons=lessons.rowcount,  # type: ignore[attr-defined]
+            days=days.rowcount,  # type: ignore[attr-defined]
+        )
+        logger.info(
+            "completion_rollups_rebuilt",
+            courses=rebuilt.courses,
+            lessons=rebuilt.lessons,
+            days=rebuilt.days,
+        )
+        return rebuilt
+
+    async def _bump_course(self, course_id: CourseId, *, started: int, completed: int) -> None:
+        stmt = pg_insert(CourseCompletionRollupModel).values(
+            course_id=course_id.value, started_count=started, completed_count=completed
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[CourseCompletionRollupModel.course_id],
+                set_={
+                    "started_count": CourseCompletionRollupModel.started_count
+                    + stmt.excluded.started_count,
+                    "completed_count": CourseCompletionRollupModel.completed_count
+                    + stmt.excluded.completed_count,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+
+async def _rebuild() -> None:
+    from src.identity.interface.api.dependencies import get_database
+
+    database = get_database()
+    try:
+        async with database.session() as session:
+            # rebuild() logs what it rebuilt
+            await SqlAlchemyCompletionAnalyticsRepository(session).rebuild()
+    finally:
+        await database.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+    asyncio.run(_rebuild())
+
+
+if __name__ == "__main__":
+    main()
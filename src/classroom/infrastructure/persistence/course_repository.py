@@ -1,15 +1,25 @@
 """SQLAlchemy implementation of course repository."""
 
+from datetime import UTC, datetime
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Integer, Select, and_, any_, exists, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from src.classroom.domain.entities import Course
 from src.classroom.domain.entities.lesson import Lesson
 from src.classroom.domain.entities.module import Module
-from src.classroom.domain.repositories import ICourseRepository
+from src.classroom.domain.repositories import (
+    CourseOutline,
+    CourseSummary,
+    ICourseRepository,
+    LessonOutline,
+    ModuleOutline,
+)
 from src.classroom.domain.value_objects import (
     CourseDescription,
     CourseId,
@@ -72,6 +82,21 @@ class SqlAlchemyCourseRepository(ICourseRepository):
 
         await self._session.flush()
 
+    async def insert_course(self, course: Course) -> None:
+        """Insert a new course with one INSERT per table, batched into multi-row VALUES."""
+        await self._session.execute(insert(CourseModel), [self._course_row(course)])
+        module_rows = [self._module_row(module, course.id.value) for module in course.all_modules]
+        lesson_rows = [
+            self._lesson_row(lesson, module.id.value)
+            for module in course.all_modules
+            for lesson in module.all_lessons
+        ]
+        # ORM bulk inserts use insertmanyvalues: one statement per batch of rows
+        if module_rows:
+            await self._session.execute(insert(ModuleModel), module_rows)
+        if lesson_rows:
+            await self._session.execute(insert(LessonModel), lesson_rows)
+
     def _sync_modules(self, course_model: CourseModel, course: Course) -> None:
         """Synchronize module models with domain entity modules."""
         existing_modules = {m.id: m for m in course_model.modules}
@@ -166,6 +191,338 @@ class SqlAlchemyCourseRepository(ICourseRepository):
 
         return [self._to_entity(model) for model in course_models]
 
+    async def list_summaries(
+        self,
+        include_deleted: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[CourseSummary]:
+        """List course summaries; counts come from aggregates, lessons are never loaded."""
+        module_count = (
+            select(func.count(ModuleModel.id))
+            .where(
+                ModuleModel.course_id == CourseModel.id,
+                ModuleModel.is_deleted == False,  # noqa: E712
+            )
+            .correlate(CourseModel)
+            .scalar_subquery()
+        )
+        lesson_count = (
+            select(func.count(LessonModel.id))
+            .join(ModuleModel, LessonModel.module_id == ModuleModel.id)
+            .where(
+                ModuleModel.course_id == CourseModel.id,
+                ModuleModel.is_deleted == False,  # noqa: E712
+                LessonModel.is_deleted == False,  # noqa: E712
+            )
+            .correlate(CourseModel)
+            .scalar_subquery()
+        )
+        query = select(
+            CourseModel.id,
+            CourseModel.instructor_id,
+            CourseModel.title,
+            CourseModel.description,
+            CourseModel.cover_image_url,
+            CourseModel.estimated_duration,
+            CourseModel.is_deleted,
+            CourseModel.created_at,
+            CourseModel.updated_at,
+            module_count.label("module_count"),
+            lesson_count.label("lesson_count"),
+        )
+
+        if not include_deleted:
+            query = query.where(CourseModel.is_deleted == False)  # noqa: E712
+
+        query = query.order_by(CourseModel.created_at.desc()).limit(limit).offset(offset)
+
+        result = await self._session.execute(query)
+        return [
+            CourseSummary(
+                id=CourseId(value=row.id),
+                instructor_id=UserId(value=row.instructor_id),
+                title=CourseTitle(row.title),
+                description=CourseDescription(row.description) if row.description else None,
+                cover_image_url=CoverImageUrl(row.cover_image_url) if row.cover_image_url else None,
+                estimated_duration=(
+                    EstimatedDuration(row.estimated_duration) if row.estimated_duration else None
+                ),
+                module_count=row.module_count,
+                lesson_count=row.lesson_count,
+                is_deleted=row.is_deleted,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in result
+        ]
+
+    async def get_outline(
+        self, course_id: CourseId, include_deleted: bool = False
+    ) -> CourseOutline | None:
+        """Get a course outline in one query; lesson content is never selected."""
+        query = self._build_outline_query().where(CourseModel.id == course_id.value)
+        if not include_deleted:
+            query = query.where(CourseModel.is_deleted == False)  # noqa: E712
+        return await self._load_outline(query)
+
+    async def get_outline_by_lesson_id(self, lesson_id: LessonId) -> CourseOutline | None:
+        """Get the outline of the course that contains a specific lesson."""
+        owning_course_id = (
+            select(ModuleModel.course_id)
+            .join(LessonModel, LessonModel.module_id == ModuleModel.id)
+            .where(LessonModel.id == lesson_id.value)
+            .scalar_subquery()
+        )
+        return await self._load_outline(
+            self._build_outline_query().where(
+                CourseModel.id == owning_course_id,
+                CourseModel.is_deleted == False,  # noqa: E712
+            )
+        )
+
+    async def get_outline_by_module_id(self, module_id: ModuleId) -> CourseOutline | None:
+        """Get the outline of the course that contains a specific module."""
+        owning_course_id = (
+            select(ModuleModel.course_id).where(ModuleModel.id == module_id.value).scalar_subquery()
+        )
+        return await self._load_outline(
+            self._build_outline_query().where(
+                CourseModel.id == owning_course_id,
+                CourseModel.is_deleted == False,  # noqa: E712
+            )
+        )
+
+    async def reorder_modules(self, course_id: CourseId, module_ids: list[ModuleId]) -> bool:
+        """Reposition modules with one UPDATE ... FROM unnest(ids, positions)."""
+        return await self._reposition(
+            ModuleModel,
+            [module_id.value for module_id in module_ids],
+            parent_column="course_id",
+            parent_id=course_id.value,
+            touched=CourseModel,
+        )
+
+    async def reorder_lessons(
+        self,
+        course_id: CourseId,  # noqa: ARG002 - keys cache invalidation in decorators
+        module_id: ModuleId,
+        lesson_ids: list[LessonId],
+    ) -> bool:
+        """Reposition lessons with one UPDATE ... FROM unnest(ids, positions)."""
+        return await self._reposition(
+            LessonModel,
+            [lesson_id.value for lesson_id in lesson_ids],
+            parent_column="module_id",
+            parent_id=module_id.value,
+            touched=ModuleModel,
+        )
+
+    async def _reposition(
+        self,
+        model: type[ModuleModel] | type[LessonModel],
+        ids: list[UUID],
+        parent_column: str,
+        parent_id: UUID,
+        touched: type[CourseModel] | type[ModuleModel],
+    ) -> bool:
+        """Apply a full ordering of a parent's non-deleted children in one statement.
+
+        The guard is evaluated in the database against the same snapshot the
+        UPDATE sees: the children must number ``len(ids)`` and all appear in
+        ``ids``, which also rules out duplicates. If it fails nothing is written.
+        The parent's updated_at is bumped only when positions were written.
+        """
+        id_array = literal(ids, ARRAY(PgUUID(as_uuid=True)))
+        ordering = (
+            func.unnest(id_array, literal(list(range(1, len(ids) + 1)), ARRAY(Integer)))
+            .table_valued("id", "position")
+            .render_derived(name="ordering")
+        )
+
+        sibling = aliased(model)
+        is_full_ordering = (
+            select(
+                and_(
+                    func.count() == len(ids),
+                    func.coalesce(func.bool_and(sibling.id == any_(id_array)), True),
+                )
+            )
+            .where(getattr(sibling, parent_column) == parent_id, sibling.is_deleted == False)  # noqa: E712
+            .scalar_subquery()
+        )
+        moved = (
+            update(model)
+            .where(
+                model.id == ordering.c.id,
+                getattr(model, parent_column) == parent_id,
+                model.is_deleted == False,  # noqa: E712
+                is_full_ordering,
+            )
+            .values(position=ordering.c.position)
+            .returning(model.id)
+            .cte("moved")
+        )
+        touched_parent = (
+            update(touched)
+            .where(touched.id == parent_id, exists(select(moved.c.id)))
+            .values(updated_at=datetime.now(UTC))
+            .cte("touched_parent")
+        )
+        applied = await self._session.scalar(
+            select(is_full_ordering.label("applied")).add_cte(moved, touched_parent)
+        )
+        self._expire_structure()
+        return bool(applied)
+
+    async def delete_module(self, course_id: CourseId, module_id: ModuleId) -> None:
+        """Soft delete a module, cascade to its lessons and renumber the rest, in one statement."""
+        now = datetime.now(UTC)
+        deleted_module = (
+            update(ModuleModel)
+            .where(ModuleModel.id == module_id.value, ModuleModel.course_id == course_id.value)
+            .values(is_deleted=True, deleted_at=now, updated_at=now)
+            .returning(ModuleModel.id)
+            .cte("deleted_module")
+        )
+        deleted_lessons = (
+            update(LessonModel)
+            .where(
+                LessonModel.module_id.in_(select(deleted_module.c.id)),
+                LessonModel.is_deleted == False,  # noqa: E712
+            )
+            .values(is_deleted=True, deleted_at=now, updated_at=now)
+            .cte("deleted_lessons")
+        )
+        ranked = (
+            select(
+                ModuleModel.id,
+                func.row_number()
+                .over(order_by=(ModuleModel.position, ModuleModel.id))
+                .label("position"),
+            )
+            .where(
+                ModuleModel.course_id == course_id.value,
+                ModuleModel.is_deleted == False,  # noqa: E712
+                ModuleModel.id != module_id.value,
+            )
+            .subquery("ranked")
+        )
+        # A row may only be updated once per statement; the deleted module is not ranked
+        renumbered = (
+            update(ModuleModel)
+            .where(
+                ModuleModel.id == ranked.c.id,
+                ModuleModel.position != ranked.c.position,
+                exists(select(deleted_module.c.id)),
+            )
+            .values(position=ranked.c.position)
+            .cte("renumbered_modules")
+        )
+        await self._session.execute(
+            update(CourseModel)
+            .where(CourseModel.id == course_id.value, exists(select(deleted_module.c.id)))
+            .values(updated_at=now)
+            .add_cte(deleted_module, deleted_lessons, renumbered)
+            .execution_options(synchronize_session=False)
+        )
+        self._expire_structure()
+
+    async def delete_course(self, course_id: CourseId) -> bool:
+        """Soft delete a course in one UPDATE; modules and lessons are left as they are."""
+        now = datetime.now(UTC)
+        deleted_id = await self._session.scalar(
+            update(CourseModel)
+            .where(CourseModel.id == course_id.value, CourseModel.is_deleted == False)  # noqa: E712
+            .values(is_deleted=True, deleted_at=now, updated_at=now)
+            .returning(CourseModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        self._expire_structure()
+        return deleted_id is not None
+
+    def _expire_structure(self) -> None:
+        """Expire the columns set-based writes change on instances this session holds.
+
+        Those statements bypass the unit of work; expiring makes the next query
+        refresh the values instead of serving the stale ones from the identity map.
+        """
+        for instance in list(self._session.identity_map.values()):
+            if isinstance(instance, CourseModel):
+                self._session.expire(instance, ["is_deleted", "deleted_at", "updated_at"])
+            elif isinstance(instance, ModuleModel | LessonModel):
+                self._session.expire(
+                    instance, ["position", "is_deleted", "deleted_at", "updated_at"]
+                )
+
+    async def get_lesson(self, lesson_id: LessonId) -> Lesson | None:
+        """Get a single lesson with its content."""
+        lesson_model = await self._session.get(LessonModel, lesson_id.value)
+        return self._lesson_to_entity(lesson_model) if lesson_model else None
+
+    def _build_outline_query(self) -> Select[Any]:
+        """Course, module and lesson structure columns; one row per lesson."""
+        return (
+            select(CourseModel.id)
+            .add_columns(
+                CourseModel.title,
+                CourseModel.is_deleted,
+                ModuleModel.id.label("module_id"),
+                ModuleModel.title.label("module_title"),
+                ModuleModel.position.label("module_position"),
+                ModuleModel.is_deleted.label("module_is_deleted"),
+                LessonModel.id.label("lesson_id"),
+                LessonModel.title.label("lesson_title"),
+                LessonModel.content_type,
+                LessonModel.position.label("lesson_position"),
+                LessonModel.is_deleted.label("lesson_is_deleted"),
+                LessonModel.updated_at.label("lesson_updated_at"),
+            )
+            .outerjoin(ModuleModel, ModuleModel.course_id == CourseModel.id)
+            .outerjoin(LessonModel, LessonModel.module_id == ModuleModel.id)
+            .order_by(ModuleModel.position, LessonModel.position)
+        )
+
+    async def _load_outline(self, query: Select[Any]) -> CourseOutline | None:
+        """Fold flat outline rows into a CourseOutline."""
+        rows = (await self._session.execute(query)).all()
+        if not rows:
+            return None
+
+        modules: dict[Any, tuple[Any, list[LessonOutline]]] = {}
+        for row in rows:
+            if row.module_id is None:
+                continue
+            _, lessons = modules.setdefault(row.module_id, (row, []))
+            if row.lesson_id is not None:
+                lessons.append(
+                    LessonOutline(
+                        id=LessonId(value=row.lesson_id),
+                        title=LessonTitle(row.lesson_title),
+                        content_type=ContentType(row.content_type),
+                        position=row.lesson_position,
+                        is_deleted=row.lesson_is_deleted,
+                        updated_at=row.lesson_updated_at,
+                    )
+                )
+
+        first = rows[0]
+        return CourseOutline(
+            id=CourseId(value=first.id),
+            title=CourseTitle(first.title),
+            is_deleted=first.is_deleted,
+            all_modules=tuple(
+                ModuleOutline(
+                    id=ModuleId(value=module_row.module_id),
+                    title=ModuleTitle(module_row.module_title),
+                    position=module_row.module_position,
+                    is_deleted=module_row.module_is_deleted,
+                    all_lessons=tuple(lessons),
+                )
+                for module_row, lessons in modules.values()
+            ),
+        )
+
     async def get_course_by_module_id(self, module_id: ModuleId) -> Course | None:
         """Get the course that contains a specific module."""
         result = await self._session.execute(
@@ -294,6 +651,52 @@ class SqlAlchemyCourseRepository(ICourseRepository):
 
         return module_model
 
+    def _course_row(self, course: Course) -> dict[str, Any]:
+        """Column values for a bulk course insert."""
+        return {
+            "id": course.id.value,
+            "instructor_id": course.instructor_id.value,
+            "title": course.title.value,
+            "description": course.description.value if course.description else None,
+            "cover_image_url": course.cover_image_url.value if course.cover_image_url else None,
+            "estimated_duration": (
+                course.estimated_duration.value if course.estimated_duration else None
+            ),
+            "is_deleted": course.is_deleted,
+            "deleted_at": course.deleted_at,
+            "created_at": course.created_at,
+            "updated_at": course.updated_at,
+        }
+
+    def _module_row(self, module: Module, course_id: UUID) -> dict[str, Any]:
+        """Column values for a bulk module insert."""
+        return {
+            "id": module.id.value,
+            "course_id": course_id,
+            "title": module.title.value,
+            "description": module.description.value if module.description else None,
+            "position": module.position,
+            "is_deleted": module.is_deleted,
+            "deleted_at": module.deleted_at,
+            "created_at": module.created_at,
+            "updated_at": module.updated_at,
+        }
+
+    def _lesson_row(self, lesson: Lesson, module_id: UUID) -> dict[str, Any]:
+        """Column values for a bulk lesson insert."""
+        return {
+            "id": lesson.id.value,
+            "module_id": module_id,
+            "title": lesson.title.value,
+            "content_type": lesson.content_type.value,
+            "content": lesson.content,
+            "position": lesson.position,
+            "is_deleted": lesson.is_deleted,
+            "deleted_at": lesson.deleted_at,
+            "created_at": lesson.created_at,
+            "updated_at": lesson.updated_at,
+        }
+
     def _lesson_to_model(self, lesson: Lesson, module_id: object) -> LessonModel:
         """Convert lesson domain entity to SQLAlchemy model."""
         return LessonModel(
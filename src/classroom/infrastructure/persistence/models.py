@@ -1,10 +1,11 @@
 """SQLAlchemy models for Classroom context."""
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 from sqlalchemy import (
     Boolean,
+    Date,
     DateTime,
     ForeignKey,
     Index,
@@ -318,3 +319,82 @@ class LessonCompletionModel(Base):
         UniqueConstraint("progress_id", "lesson_id", name="uq_completion_progress_lesson"),
         Index("idx_completion_progress", "progress_id", "lesson_id"),
     )
+
+
+class LessonCompletionRollupModel(Base):
+    """Current number of members who have completed each lesson.
+
+    Maintained from progress events; rebuilt from lesson_completions.
+    """
+
+    __tablename__ = "lesson_completion_rollups"
+
+    lesson_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey("lessons.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    course_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    completed_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+class CourseCompletionRollupModel(Base):
+    """Members who started and who completed each course."""
+
+    __tablename__ = "course_completion_rollups"
+
+    course_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    started_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    completed_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+class CourseCompletionDailyRollupModel(Base):
+    """Lesson completions per course and UTC day."""
+
+    __tablename__ = "course_completion_daily_rollups"
+
+    course_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+    )
+    completions: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
@@ -1,12 +1,23 @@
 """SQLAlchemy implementation of progress repository."""
 
-from sqlalchemy import select
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import CTE, DateTime, column, delete, func, literal, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.util import identity_key
 
 from src.classroom.domain.entities.lesson_completion import LessonCompletion
 from src.classroom.domain.entities.progress import Progress
-from src.classroom.domain.repositories.progress_repository import IProgressRepository
+from src.classroom.domain.repositories.progress_repository import (
+    CompletionChange,
+    CourseProgressSummary,
+    IProgressRepository,
+    LastAccessedUpdate,
+)
 from src.classroom.domain.value_objects.course_id import CourseId
 from src.classroom.domain.value_objects.lesson_id import LessonId
 from src.classroom.domain.value_objects.progress_id import ProgressId
@@ -16,6 +27,9 @@ from src.classroom.infrastructure.persistence.models import (
 )
 from src.identity.domain.value_objects import UserId
 
+# Four bind parameters per row; stays well below the driver's parameter limit
+LAST_ACCESSED_CHUNK_SIZE = 1000
+
 
 class SqlAlchemyProgressRepository(IProgressRepository):
     """SQLAlchemy implementation of IProgressRepository."""
@@ -95,6 +109,169 @@ class SqlAlchemyProgressRepository(IProgressRepository):
         )
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def get_summaries_for_user(
+        self, user_id: UserId, course_ids: list[CourseId]
+    ) -> dict[CourseId, CourseProgressSummary]:
+        """One grouped query: completion counts and last-accessed lesson per course."""
+        if not course_ids:
+            return {}
+        result = await self._session.execute(
+            select(
+                ProgressModel.course_id,
+                ProgressModel.last_accessed_lesson_id,
+                func.count(LessonCompletionModel.id).label("completed_count"),
+            )
+            .outerjoin(LessonCompletionModel, LessonCompletionModel.progress_id == ProgressModel.id)
+            .where(
+                ProgressModel.user_id == user_id.value,
+                ProgressModel.course_id.in_([c.value for c in course_ids]),
+            )
+            .group_by(ProgressModel.id)
+        )
+        return {
+            CourseId(value=row.course_id): CourseProgressSummary(
+                course_id=CourseId(value=row.course_id),
+                completed_count=row.completed_count,
+                last_accessed_lesson_id=(
+                    LessonId(value=row.last_accessed_lesson_id)
+                    if row.last_accessed_lesson_id
+                    else None
+                ),
+            )
+            for row in result
+        }
+
+    async def bulk_update_last_accessed(self, updates: list[LastAccessedUpdate]) -> int:
+        """UPDATE progress ... FROM (VALUES ...), in chunks, skipping older accesses."""
+        # Consistent row order keeps concurrent flushers from deadlocking
+        ordered = sorted(updates, key=lambda u: (u.user_id.value, u.course_id.value))
+        updated = 0
+        for start in range(0, len(ordered), LAST_ACCESSED_CHUNK_SIZE):
+            chunk = ordered[start : start + LAST_ACCESSED_CHUNK_SIZE]
+            incoming = values(
+                column("user_id", PgUUID(as_uuid=True)),
+                column("course_id", PgUUID(as_uuid=True)),
+                column("lesson_id", PgUUID(as_uuid=True)),
+                column("accessed_at", DateTime(timezone=True)),
+                name="incoming",
+            ).data(
+                [
+                    (u.user_id.value, u.course_id.value, u.lesson_id.value, u.accessed_at)
+                    for u in chunk
+                ]
+            )
+            result = await self._session.execute(
+                update(ProgressModel)
+                .where(
+                    ProgressModel.user_id == incoming.c.user_id,
+                    ProgressModel.course_id == incoming.c.course_id,
+                    or_(
+                        ProgressModel.last_accessed_at.is_(None),
+                        ProgressModel.last_accessed_at < incoming.c.accessed_at,
+                    ),
+                )
+                .values(
+                    last_accessed_lesson_id=incoming.c.lesson_id,
+                    last_accessed_at=incoming.c.accessed_at,
+                    updated_at=incoming.c.accessed_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount  # type: ignore[attr-defined]
+        return updated
+
+    async def add_completion(
+        self, user_id: UserId, course_id: CourseId, lesson_id: LessonId
+    ) -> CompletionChange:
+        """One round trip: touch progress, INSERT ... ON CONFLICT DO NOTHING, count."""
+        now = datetime.now(UTC)
+        progress = (
+            update(ProgressModel)
+            .where(
+                ProgressModel.user_id == user_id.value,
+                ProgressModel.course_id == course_id.value,
+            )
+            .values(last_accessed_lesson_id=lesson_id.value, last_accessed_at=now, updated_at=now)
+            .returning(ProgressModel.id)
+            .cte("touched_progress")
+        )
+        inserted = (
+            pg_insert(LessonCompletionModel)
+            .from_select(
+                ["id", "progress_id", "lesson_id", "completed_at"],
+                select(
+                    literal(uuid4(), PgUUID(as_uuid=True)),
+                    progress.c.id,
+                    literal(lesson_id.value, PgUUID(as_uuid=True)),
+                    literal(now, DateTime(timezone=True)),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["progress_id", "lesson_id"])
+            .returning(LessonCompletionModel.id, LessonCompletionModel.completed_at)
+            .cte("inserted_completion")
+        )
+        return await self._completion_change(progress, inserted, sign=1)
+
+    async def remove_completion(
+        self, user_id: UserId, course_id: CourseId, lesson_id: LessonId
+    ) -> CompletionChange:
+        """One round trip: touch progress, DELETE ... RETURNING, count."""
+        progress = (
+            update(ProgressModel)
+            .where(
+                ProgressModel.user_id == user_id.value,
+                ProgressModel.course_id == course_id.value,
+            )
+            .values(updated_at=datetime.now(UTC))
+            .returning(ProgressModel.id)
+            .cte("touched_progress")
+        )
+        deleted = (
+            delete(LessonCompletionModel)
+            .where(
+                LessonCompletionModel.progress_id.in_(select(progress.c.id)),
+                LessonCompletionModel.lesson_id == lesson_id.value,
+            )
+            .returning(LessonCompletionModel.id, LessonCompletionModel.completed_at)
+            .cte("deleted_completion")
+        )
+        return await self._completion_change(progress, deleted, sign=-1)
+
+    async def _completion_change(self, progress: CTE, changed: CTE, sign: int) -> CompletionChange:
+        """Run the data-modifying CTEs and summarize what they did.
+
+        All parts of the statement see the same snapshot, so the completion
+        count excludes the row the CTE inserted or deleted; ``sign`` adjusts it.
+        """
+        row = (
+            await self._session.execute(
+                select(
+                    select(progress.c.id).scalar_subquery().label("progress_id"),
+                    select(func.count()).select_from(changed).scalar_subquery().label("changed"),
+                    select(func.max(changed.c.completed_at))
+                    .scalar_subquery()
+                    .label("completed_at"),
+                    select(func.count(LessonCompletionModel.id))
+                    .where(LessonCompletionModel.progress_id.in_(select(progress.c.id)))
+                    .scalar_subquery()
+                    .label("completed_before"),
+                )
+            )
+        ).one()
+        if row.progress_id is None:
+            return CompletionChange(progress_exists=False, changed=False, completed_count=0)
+
+        # The statement bypassed the ORM; don't let this session serve a stale progress
+        cached = self._session.identity_map.get(identity_key(ProgressModel, row.progress_id))
+        if cached is not None:
+            self._session.expire(cached)
+        return CompletionChange(
+            progress_exists=True,
+            changed=row.changed > 0,
+            completed_count=row.completed_before + sign * row.changed,
+            completed_at=row.completed_at,
+        )
+
     def _to_entity(self, model: ProgressModel) -> Progress:
         completions = [
             LessonCompletion(
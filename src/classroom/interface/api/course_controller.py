@@ -4,21 +4,29 @@ from typing import Annotated
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse
 
 from src.classroom.application.commands import (
     CreateCourseCommand,
     DeleteCourseCommand,
+    ImportCourseCommand,
     UpdateCourseCommand,
 )
 from src.classroom.application.handlers import (
     CreateCourseHandler,
     DeleteCourseHandler,
+    GetCourseAnalyticsHandler,
     GetCourseDetailsHandler,
     GetCourseListHandler,
+    ImportCourseHandler,
     UpdateCourseHandler,
 )
-from src.classroom.application.queries import GetCourseDetailsQuery, GetCourseListQuery
+from src.classroom.application.queries import (
+    GetCourseAnalyticsQuery,
+    GetCourseDetailsQuery,
+    GetCourseListQuery,
+)
 from src.classroom.domain.exceptions import (
     ClassroomDomainError,
     CourseAlreadyDeletedError,
@@ -27,6 +35,7 @@ from src.classroom.domain.exceptions import (
     CourseTitleRequiredError,
     CourseTitleTooLongError,
     CourseTitleTooShortError,
+    InvalidCourseImportError,
     InvalidCoverImageUrlError,
 )
 from src.classroom.infrastructure.persistence import SqlAlchemyProgressRepository
@@ -34,27 +43,45 @@ from src.classroom.interface.api.dependencies import (
     AdminVerifiedDep,
     CurrentUserIdDep,
     ProgressRepositoryDep,
+    get_course_analytics_handler,
     get_course_details_handler,
     get_course_list_handler,
     get_create_course_handler,
     get_delete_course_handler,
+    get_import_course_handler,
     get_update_course_handler,
 )
 from src.classroom.interface.api.schemas import (
+    CourseAccessSummary,
+    CourseAnalyticsResponse,
     CourseDetailResponse,
     CourseListResponse,
     CourseResponse,
     CreateCourseRequest,
     CreateCourseResponse,
+    DailyCompletionsResponse,
     ErrorResponse,
+    ImportCourseResponse,
+    ImportErrorItem,
+    ImportErrorResponse,
     LessonDetailResponse,
+    LessonFunnelResponse,
     MessageResponse,
     ModuleDetailResponse,
     ProgressSummary,
     UpdateCourseRequest,
 )
+from src.gamification.application.queries.check_course_access_batch import (
+    CheckCourseAccessBatchHandler,
+    CheckCourseAccessBatchQuery,
+)
+from src.gamification.interface.api.dependencies import (
+    get_check_course_access_batch_handler,
+    get_default_community_id,
+)
 from src.identity.domain.value_objects import UserId
 from src.identity.infrastructure.services import limiter
+from src.identity.interface.api.dependencies import SessionDep
 
 logger = structlog.get_logger()
 
@@ -116,6 +143,54 @@ async def create_course(
         ) from e
 
 
+@router.post(
+    "/import",
+    response_model=ImportCourseResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Not authorized"},
+        422: {"model": ImportErrorResponse, "description": "Invalid records, by line"},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+@limiter.limit("5/minute")
+async def import_course(
+    request: Request,
+    current_user_id: AdminVerifiedDep,
+    handler: Annotated[ImportCourseHandler, Depends(get_import_course_handler)],
+) -> ImportCourseResponse | JSONResponse:
+    """
+    Import a course with its modules and lessons from newline-delimited JSON.
+
+    The body is read as a stream. Nothing is written unless every line is valid.
+    """
+    try:
+        result = await handler.handle(
+            ImportCourseCommand(instructor_id=current_user_id, chunks=request.stream())
+        )
+    except InvalidCourseImportError as e:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=ImportErrorResponse(
+                detail=str(e),
+                errors=[ImportErrorItem(line=line, message=message) for line, message in e.errors],
+            ).model_dump(),
+        )
+
+    logger.info("import_course_api_success", course_id=str(result.course_id))
+    return ImportCourseResponse(
+        id=result.course_id.value,
+        module_count=result.module_count,
+        lesson_count=result.lesson_count,
+    )
+
+
 @router.get(
     "",
     response_model=CourseListResponse,
@@ -127,17 +202,58 @@ async def list_courses(
     current_user_id: CurrentUserIdDep,
     handler: Annotated[GetCourseListHandler, Depends(get_course_list_handler)],
     progress_repo: ProgressRepositoryDep,
+    session: SessionDep,
+    access_handler: Annotated[
+        CheckCourseAccessBatchHandler, Depends(get_check_course_access_batch_handler)
+    ],
+    include_access: Annotated[
+        bool, Query(description="Include level-gated access for each course")
+    ] = False,
 ) -> CourseListResponse:
     """List all courses."""
     try:
         query = GetCourseListQuery(requester_id=current_user_id)
         courses = await handler.handle(query)
 
-        user_id = UserId(current_user_id)
+        access: dict[UUID, CourseAccessSummary] = {}
+        if include_access and courses:
+            community_id = await get_default_community_id(session)
+            results = await access_handler.handle(
+                CheckCourseAccessBatchQuery(
+                    community_id=community_id,
+                    user_id=current_user_id,
+                    course_ids=[c.id.value for c in courses],
+                )
+            )
+            access = {
+                course_id: CourseAccessSummary(
+                    has_access=r.has_access,
+                    minimum_level=r.minimum_level,
+                    minimum_level_name=r.minimum_level_name,
+                    current_level=r.current_level,
+                )
+                for course_id, r in results.items()
+            }
+
+        progress_by_course = await progress_repo.get_summaries_for_user(
+            UserId(current_user_id), [c.id for c in courses]
+        )
         course_responses = []
         for c in courses:
-            progress_summary = await _build_progress_summary(
-                progress_repo, user_id, c.id, c.lesson_count
+            course_progress = progress_by_course.get(c.id)
+            progress_summary = (
+                ProgressSummary(
+                    started=True,
+                    completion_percentage=course_progress.completion_percentage(c.lesson_count),
+                    last_accessed_lesson_id=(
+                        course_progress.last_accessed_lesson_id.value
+                        if course_progress.last_accessed_lesson_id
+                        else None
+                    ),
+                    next_incomplete_lesson_id=None,
+                )
+                if course_progress
+                else None
             )
             course_responses.append(
                 CourseResponse(
@@ -152,6 +268,7 @@ async def list_courses(
                     module_count=c.module_count,
                     lesson_count=c.lesson_count,
                     progress=progress_summary,
+                    access=access.get(c.id.value),
                     created_at=c.created_at,
                     updated_at=c.updated_at,
                 )
@@ -257,6 +374,52 @@ async def get_course(
         ) from e
 
 
+@router.get(
+    "/{course_id}/analytics",
+    response_model=CourseAnalyticsResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Not authorized"},
+        404: {"model": ErrorResponse, "description": "Course not found"},
+    },
+)
+async def get_course_analytics(
+    course_id: UUID,
+    _admin_id: AdminVerifiedDep,
+    handler: Annotated[GetCourseAnalyticsHandler, Depends(get_course_analytics_handler)],
+    days: Annotated[int, Query(ge=1, le=365, description="Days of daily completions")] = 30,
+) -> CourseAnalyticsResponse:
+    """Get the completion funnel and daily completions of a course."""
+    try:
+        result = await handler.handle(GetCourseAnalyticsQuery(course_id=course_id, days=days))
+    except CourseNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+
+    return CourseAnalyticsResponse(
+        course_id=course_id,
+        started_count=result.rollup.started_count,
+        completed_count=result.rollup.completed_count,
+        completion_rate=result.completion_rate,
+        funnel=[
+            LessonFunnelResponse(
+                lesson_id=step.lesson_id.value,
+                lesson_title=step.lesson_title,
+                module_title=step.module_title,
+                completed_count=step.completed_count,
+                completion_rate=step.completion_rate,
+            )
+            for step in result.funnel
+        ],
+        daily_completions=[
+            DailyCompletionsResponse(day=d.day, completions=d.completions)
+            for d in result.daily_completions
+        ],
+    )
+
+
 @router.patch(
     "/{course_id}",
     response_model=MessageResponse,
@@ -1,5 +1,7 @@
 """FastAPI dependencies for Classroom context."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
 from uuid import UUID
 
@@ -14,11 +16,13 @@ from src.classroom.application.handlers import (
     DeleteCourseHandler,
     DeleteLessonHandler,
     DeleteModuleHandler,
+    GetCourseAnalyticsHandler,
     GetCourseDetailsHandler,
     GetCourseListHandler,
     GetLessonHandler,
     GetNextIncompleteLessonHandler,
     GetProgressHandler,
+    ImportCourseHandler,
     MarkLessonCompleteHandler,
     ReorderLessonsHandler,
     ReorderModulesHandler,
@@ -28,27 +32,28 @@ from src.classroom.application.handlers import (
     UpdateLessonHandler,
     UpdateModuleHandler,
 )
+from src.classroom.domain.repositories.progress_repository import IProgressRepository
 from src.classroom.infrastructure.persistence import (
+    CachedCourseRepository,
+    SqlAlchemyCompletionAnalyticsRepository,
     SqlAlchemyCourseRepository,
     SqlAlchemyProgressRepository,
 )
-from src.config import settings
-from src.identity.infrastructure.services import JWTService
 
 # Import shared database dependencies from identity
-from src.identity.interface.api.dependencies import SessionDep
+from src.identity.interface.api.dependencies import SessionDep, get_database, verify_access_token
 
 # ============================================================================
 # Repository Dependencies
 # ============================================================================
 
 
-def get_course_repository(session: SessionDep) -> SqlAlchemyCourseRepository:
-    """Get course repository."""
-    return SqlAlchemyCourseRepository(session)
+def get_course_repository(session: SessionDep) -> CachedCourseRepository:
+    """Get course repository (outlines served from the reference cache)."""
+    return CachedCourseRepository(SqlAlchemyCourseRepository(session), session=session)
 
 
-CourseRepositoryDep = Annotated[SqlAlchemyCourseRepository, Depends(get_course_repository)]
+CourseRepositoryDep = Annotated[CachedCourseRepository, Depends(get_course_repository)]
 
 
 def get_progress_repository(session: SessionDep) -> SqlAlchemyProgressRepository:
@@ -56,9 +61,28 @@ def get_progress_repository(session: SessionDep) -> SqlAlchemyProgressRepository
     return SqlAlchemyProgressRepository(session)
 
 
+@asynccontextmanager
+async def open_progress_repository() -> AsyncIterator[IProgressRepository]:
+    """Progress repository on its own session, committed on exit (background writers)."""
+    async with get_database().session() as session:
+        yield SqlAlchemyProgressRepository(session)
+
+
 ProgressRepositoryDep = Annotated[SqlAlchemyProgressRepository, Depends(get_progress_repository)]
 
 
+def get_completion_analytics_repository(
+    session: SessionDep,
+) -> SqlAlchemyCompletionAnalyticsRepository:
+    """Get completion analytics repository."""
+    return SqlAlchemyCompletionAnalyticsRepository(session)
+
+
+CompletionAnalyticsRepositoryDep = Annotated[
+    SqlAlchemyCompletionAnalyticsRepository, Depends(get_completion_analytics_repository)
+]
+
+
 # ============================================================================
 # Handler Dependencies
 # ============================================================================
@@ -69,6 +93,11 @@ def get_create_course_handler(course_repo: CourseRepositoryDep) -> CreateCourseH
     return CreateCourseHandler(course_repository=course_repo)
 
 
+def get_import_course_handler(course_repo: CourseRepositoryDep) -> ImportCourseHandler:
+    """Get import course handler."""
+    return ImportCourseHandler(course_repository=course_repo)
+
+
 def get_update_course_handler(course_repo: CourseRepositoryDep) -> UpdateCourseHandler:
     """Get update course handler."""
     return UpdateCourseHandler(course_repository=course_repo)
@@ -89,6 +118,17 @@ def get_course_details_handler(course_repo: CourseRepositoryDep) -> GetCourseDet
     return GetCourseDetailsHandler(course_repository=course_repo)
 
 
+def get_course_analytics_handler(
+    course_repo: CourseRepositoryDep,
+    analytics_repo: CompletionAnalyticsRepositoryDep,
+) -> GetCourseAnalyticsHandler:
+    """Get course analytics handler."""
+    return GetCourseAnalyticsHandler(
+        course_repository=course_repo,
+        analytics_repository=analytics_repo,
+    )
+
+
 # Module handlers
 
 
@@ -142,17 +182,6 @@ def get_reorder_lessons_handler(course_repo: CourseRepositoryDep) -> ReorderLess
 security = HTTPBearer(auto_error=False)
 
 
-def get_token_generator() -> JWTService:
-    """Get JWT service instance."""
-    return JWTService(
-        secret_key=settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
-        access_token_expire_minutes=settings.jwt_access_token_expire_minutes,
-        refresh_token_expire_days=settings.jwt_refresh_token_expire_days,
-        refresh_token_remember_me_days=settings.jwt_refresh_token_remember_me_days,
-    )
-
-
 async def get_current_user_id(
     _request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)] = None,
@@ -165,8 +194,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token_generator = get_token_generator()
-    user_id = token_generator.validate_access_token(credentials.credentials)
+    user_id = verify_access_token(credentials.credentials)
 
     if user_id is None:
         raise HTTPException(
@@ -175,7 +203,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user_id.value
+    return user_id
 
 
 CurrentUserIdDep = Annotated[UUID, Depends(get_current_user_id)]
@@ -188,18 +216,31 @@ async def require_admin(
     """Verify the current user has admin role in the community.
 
     Raises 403 if the user is not an admin.
-    Returns the user_id for downstream use.
+    Returns the user_id for downstream use. The answer comes from the
+    membership cache, so repeat checks cost no query.
     """
+    from src.community.domain.value_objects import MemberRole
+    from src.community.infrastructure.persistence.membership_cache import (
+        ANY_COMMUNITY,
+        Membership,
+        memberships,
+    )
     from src.community.infrastructure.persistence.models import CommunityMemberModel
 
-    result = await session.execute(
-        select(CommunityMemberModel.role).where(
-            CommunityMemberModel.user_id == current_user_id,
-            CommunityMemberModel.role == "ADMIN",
-            CommunityMemberModel.is_active.is_(True),
+    async def _load() -> Membership | None:
+        result = await session.execute(
+            select(CommunityMemberModel.joined_at)
+            .where(
+                CommunityMemberModel.user_id == current_user_id,
+                CommunityMemberModel.role == MemberRole.ADMIN.value,
+                CommunityMemberModel.is_active.is_(True),
+            )
+            .limit(1)
         )
-    )
-    if result.scalar_one_or_none() is None:
+        joined_at = result.scalar_one_or_none()
+        return Membership(MemberRole.ADMIN, joined_at) if joined_at is not None else None
+
+    if await memberships.get(session, current_user_id, ANY_COMMUNITY, _load) is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to perform this action",
@@ -4,7 +4,7 @@ from typing import Annotated
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from src.classroom.application.commands import (
     MarkLessonCompleteCommand,
@@ -15,6 +15,7 @@ from src.classroom.application.handlers import (
     GetLessonHandler,
     GetNextIncompleteLessonHandler,
     GetProgressHandler,
+    LessonWithContext,
     MarkLessonCompleteHandler,
     StartCourseHandler,
     UnmarkLessonHandler,
@@ -50,6 +51,13 @@ from src.classroom.interface.api.schemas import (
     ProgressDetailResponse,
     StartCourseResponse,
 )
+from src.shared.infrastructure.compressed_response_cache import (
+    IDENTITY,
+    compressed_response_cache,
+    etag_matches,
+    make_etag,
+    negotiate_encoding,
+)
 
 logger = structlog.get_logger()
 
@@ -61,39 +69,85 @@ router = APIRouter(tags=["Classroom Progress"])
 # ============================================================================
 
 
+def _lesson_etag(result: LessonWithContext) -> str:
+    """ETag over every field of the lesson representation; content is versioned by updated_at."""
+    lesson = result.lesson
+    return make_etag(
+        lesson.id,
+        lesson.updated_at.isoformat(),
+        lesson.title.value,
+        lesson.content_type.value,
+        lesson.position,
+        result.is_complete,
+        result.prev_lesson_id,
+        result.next_lesson_id,
+        result.module_title,
+        result.course_id,
+        result.course_title,
+    )
+
+
 @router.get(
     "/lessons/{lesson_id}",
     response_model=LessonContextResponse,
     responses={
+        304: {"description": "Not modified"},
         401: {"model": ErrorResponse, "description": "Not authenticated"},
         404: {"model": ErrorResponse, "description": "Lesson not found"},
     },
 )
 async def get_lesson(
     lesson_id: UUID,
+    request: Request,
     current_user_id: CurrentUserIdDep,
     handler: Annotated[GetLessonHandler, Depends(get_get_lesson_handler)],
-) -> LessonContextResponse:
-    """Get a lesson with content, navigation context, and completion status."""
+) -> Response:
+    """Get a lesson with content, navigation context, and completion status.
+
+    Responses carry a strong ETag and honour If-None-Match. Bodies are
+    serialized and compressed once per ETag and served from the response cache.
+    """
     try:
         query = GetLessonQuery(lesson_id=lesson_id, user_id=current_user_id)
         result = await handler.handle(query)
 
-        return LessonContextResponse(
-            id=result.lesson.id.value,
-            title=result.lesson.title.value,
-            content_type=result.lesson.content_type.value,
-            content=result.lesson.content,
-            position=result.lesson.position,
-            is_complete=result.is_complete,
-            next_lesson_id=result.next_lesson_id.value if result.next_lesson_id else None,
-            prev_lesson_id=result.prev_lesson_id.value if result.prev_lesson_id else None,
-            module_title=result.module_title,
-            course_id=UUID(result.course_id),
-            course_title=result.course_title,
-            created_at=result.lesson.created_at,
-            updated_at=result.lesson.updated_at,
+        etag = _lesson_etag(result)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "Accept-Encoding, Authorization",
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        async def _render() -> bytes:
+            lesson = await handler.load_lesson(result.lesson.id)
+            return (
+                LessonContextResponse(
+                    id=lesson.id.value,
+                    title=lesson.title.value,
+                    content_type=lesson.content_type.value,
+                    content=lesson.content,
+                    position=lesson.position,
+                    is_complete=result.is_complete,
+                    next_lesson_id=result.next_lesson_id.value if result.next_lesson_id else None,
+                    prev_lesson_id=result.prev_lesson_id.value if result.prev_lesson_id else None,
+                    module_title=result.module_title,
+                    course_id=UUID(result.course_id),
+                    course_title=result.course_title,
+                    created_at=lesson.created_at,
+                    updated_at=lesson.updated_at,
+                )
+                .model_dump_json()
+                .encode()
+            )
+
+        body, encoding = await compressed_response_cache.get_or_build(
+            etag, negotiate_encoding(request.headers.get("accept-encoding")), _render
         )
+        if encoding != IDENTITY:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
 
     except LessonNotFoundError as e:
         raise HTTPException(
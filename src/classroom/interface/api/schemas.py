@@ -1,6 +1,6 @@
 """Pydantic schemas for Classroom API."""
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -75,6 +75,28 @@ class CreateCourseResponse(BaseModel):
     id: UUID
 
 
+class ImportCourseResponse(BaseModel):
+    """Response for a successful course import."""
+
+    id: UUID
+    module_count: int
+    lesson_count: int
+
+
+class ImportErrorItem(BaseModel):
+    """An invalid line in a course import document."""
+
+    line: int
+    message: str
+
+
+class ImportErrorResponse(BaseModel):
+    """Response for a rejected course import."""
+
+    detail: str
+    errors: list[ImportErrorItem]
+
+
 class CreateModuleResponse(BaseModel):
     """Response for successful module creation."""
 
@@ -154,6 +176,15 @@ class ProgressSummary(BaseModel):
     next_incomplete_lesson_id: UUID | None = None
 
 
+class CourseAccessSummary(BaseModel):
+    """Level-gated access embedded in course responses."""
+
+    has_access: bool = True
+    minimum_level: int | None = None
+    minimum_level_name: str | None = None
+    current_level: int = 1
+
+
 class CourseResponse(BaseModel):
     """Course response."""
 
@@ -168,6 +199,7 @@ class CourseResponse(BaseModel):
     module_count: int = 0
     lesson_count: int = 0
     progress: ProgressSummary | None = None
+    access: CourseAccessSummary | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -247,6 +279,34 @@ class NextLessonResponse(BaseModel):
     lesson_id: UUID | None = None
 
 
+class LessonFunnelResponse(BaseModel):
+    """Completions of one lesson in the course funnel."""
+
+    lesson_id: UUID
+    lesson_title: str
+    module_title: str
+    completed_count: int
+    completion_rate: float
+
+
+class DailyCompletionsResponse(BaseModel):
+    """Lesson completions recorded on one UTC day."""
+
+    day: date
+    completions: int
+
+
+class CourseAnalyticsResponse(BaseModel):
+    """Completion analytics for a course."""
+
+    course_id: UUID
+    started_count: int
+    completed_count: int
+    completion_rate: float
+    funnel: list[LessonFunnelResponse]
+    daily_completions: list[DailyCompletionsResponse]
+
+
 class ErrorResponse(BaseModel):
     """Error response."""
 
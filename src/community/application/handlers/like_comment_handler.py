@@ -91,6 +91,7 @@ class LikeCommentHandler:
                 CommentLiked(
                     reaction_id=reaction.id,
                     comment_id=comment_id,
+                    post_id=comment.post_id,
                     community_id=community_id,
                     user_id=user_id,
                     author_id=comment.author_id,
@@ -78,6 +78,7 @@ class UnlikeCommentHandler:
             [
                 CommentUnliked(
                     comment_id=CommentId(command.comment_id),
+                    post_id=comment.post_id if comment else None,
                     community_id=community_id,
                     user_id=user_id,
                     author_id=author_id,
@@ -110,7 +110,14 @@ class Comment:
             self.content = content
             self.edited_at = datetime.now(UTC)
             self._update_timestamp()
-            self._add_event(CommentEdited(comment_id=self.id, editor_id=editor_id))
+            self._add_event(
+                CommentEdited(
+                    comment_id=self.id,
+                    post_id=self.post_id,
+                    editor_id=editor_id,
+                    content=str(self.content),
+                )
+            )
 
     def delete(
         self,
@@ -147,7 +154,9 @@ class Comment:
             self.is_deleted = True
 
         self._update_timestamp()
-        self._add_event(CommentDeleted(comment_id=self.id, deleted_by=deleter_id))
+        self._add_event(
+            CommentDeleted(comment_id=self.id, post_id=self.post_id, deleted_by=deleter_id)
+        )
 
     @property
     def is_edited(self) -> bool:
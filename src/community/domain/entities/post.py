@@ -177,7 +177,13 @@ class Post:
             self.edited_at = datetime.now(UTC)
             self._update_timestamp()
             self._add_event(
-                PostEdited(post_id=self.id, editor_id=editor_id, changed_fields=changed_fields)
+                PostEdited(
+                    post_id=self.id,
+                    editor_id=editor_id,
+                    changed_fields=changed_fields,
+                    title=str(self.title),
+                    content=str(self.content),
+                )
             )
 
         return changed_fields
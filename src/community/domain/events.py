@@ -1,5 +1,6 @@
 """Community domain events."""
 
+from collections.abc import Hashable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
@@ -31,20 +32,30 @@ class PostCreated(DomainEvent):
     def event_type(self) -> str:
         return "PostCreated"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostEdited(DomainEvent):
-    """Event published when a post is edited."""
+    """Event published when a post is edited; carries the title and content after the edit."""
 
     post_id: PostId
     editor_id: UserId
     changed_fields: list[str]
+    title: str
+    content: str
     timestamp: datetime = datetime.now(UTC)
 
     @property
     def event_type(self) -> str:
         return "PostEdited"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostDeleted(DomainEvent):
@@ -58,6 +69,10 @@ class PostDeleted(DomainEvent):
     def event_type(self) -> str:
         return "PostDeleted"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostPinned(DomainEvent):
@@ -71,6 +86,10 @@ class PostPinned(DomainEvent):
     def event_type(self) -> str:
         return "PostPinned"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostUnpinned(DomainEvent):
@@ -84,6 +103,10 @@ class PostUnpinned(DomainEvent):
     def event_type(self) -> str:
         return "PostUnpinned"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostLocked(DomainEvent):
@@ -97,6 +120,10 @@ class PostLocked(DomainEvent):
     def event_type(self) -> str:
         return "PostLocked"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostUnlocked(DomainEvent):
@@ -110,6 +137,10 @@ class PostUnlocked(DomainEvent):
     def event_type(self) -> str:
         return "PostUnlocked"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class CategoryCreated(DomainEvent):
@@ -126,6 +157,10 @@ class CategoryCreated(DomainEvent):
     def event_type(self) -> str:
         return "CategoryCreated"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.category_id
+
 
 @dataclass(frozen=True)
 class CategoryUpdated(DomainEvent):
@@ -140,6 +175,10 @@ class CategoryUpdated(DomainEvent):
     def event_type(self) -> str:
         return "CategoryUpdated"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.category_id
+
 
 @dataclass(frozen=True)
 class CategoryDeleted(DomainEvent):
@@ -153,6 +192,10 @@ class CategoryDeleted(DomainEvent):
     def event_type(self) -> str:
         return "CategoryDeleted"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.category_id
+
 
 @dataclass(frozen=True)
 class CommentAdded(DomainEvent):
@@ -170,25 +213,36 @@ class CommentAdded(DomainEvent):
     def event_type(self) -> str:
         return "CommentAdded"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class CommentEdited(DomainEvent):
-    """Event published when a comment is edited."""
+    """Event published when a comment is edited; carries the content after the edit."""
 
     comment_id: CommentId
+    post_id: PostId
     editor_id: UserId
+    content: str
     timestamp: datetime = datetime.now(UTC)
 
     @property
     def event_type(self) -> str:
         return "CommentEdited"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class CommentDeleted(DomainEvent):
     """Event published when a comment is deleted."""
 
     comment_id: CommentId
+    post_id: PostId
     deleted_by: UserId
     timestamp: datetime = datetime.now(UTC)
 
@@ -196,6 +250,10 @@ class CommentDeleted(DomainEvent):
     def event_type(self) -> str:
         return "CommentDeleted"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostLiked(DomainEvent):
@@ -212,6 +270,10 @@ class PostLiked(DomainEvent):
     def event_type(self) -> str:
         return "PostLiked"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class PostUnliked(DomainEvent):
@@ -227,6 +289,10 @@ class PostUnliked(DomainEvent):
     def event_type(self) -> str:
         return "PostUnliked"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class CommentLiked(DomainEvent):
@@ -234,6 +300,7 @@ class CommentLiked(DomainEvent):
 
     reaction_id: ReactionId
     comment_id: CommentId
+    post_id: PostId
     community_id: CommunityId
     user_id: UserId
     author_id: UserId  # content author (for gamification)
@@ -243,12 +310,17 @@ class CommentLiked(DomainEvent):
     def event_type(self) -> str:
         return "CommentLiked"
 
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id
+
 
 @dataclass(frozen=True)
 class CommentUnliked(DomainEvent):
     """Event published when a comment is unliked."""
 
     comment_id: CommentId
+    post_id: PostId | None  # None when the comment is already gone
     community_id: CommunityId
     user_id: UserId
     author_id: UserId  # content author (for gamification)
@@ -257,3 +329,7 @@ class CommentUnliked(DomainEvent):
     @property
     def event_type(self) -> str:
         return "CommentUnliked"
+
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.post_id if self.post_id is not None else self.comment_id
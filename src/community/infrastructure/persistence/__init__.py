@@ -1,5 +1,9 @@
 """Community infrastructure persistence layer."""
 
+from src.community.infrastructure.persistence.cached_repositories import (
+    CachedCategoryRepository,
+    CachedMemberRepository,
+)
 from src.community.infrastructure.persistence.category_repository import (
     SqlAlchemyCategoryRepository,
 )
@@ -9,6 +13,11 @@ from src.community.infrastructure.persistence.comment_repository import (
 from src.community.infrastructure.persistence.member_repository import (
     SqlAlchemyMemberRepository,
 )
+from src.community.infrastructure.persistence.membership_cache import (
+    Membership,
+    MembershipCache,
+    memberships,
+)
 from src.community.infrastructure.persistence.models import (
     CategoryModel,
     CommentModel,
@@ -26,10 +35,14 @@ from src.community.infrastructure.persistence.search_repository import (
 )
 
 __all__ = [
+    "CachedCategoryRepository",
+    "CachedMemberRepository",
     "CategoryModel",
     "CommentModel",
     "CommunityMemberModel",
     "CommunityModel",
+    "Membership",
+    "MembershipCache",
     "PostModel",
     "ReactionModel",
     "SqlAlchemyCategoryRepository",
@@ -38,4 +51,5 @@ __all__ = [
     "SqlAlchemyPostRepository",
     "SqlAlchemyReactionRepository",
     "SqlAlchemySearchRepository",
+    "memberships",
 ]
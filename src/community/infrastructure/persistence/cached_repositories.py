@@ -0,0 +1,182 @@
+"""Read-through cached decorators for community reference data.
+
+The category list of a community is read whenever a post is created without
+an explicit category and whenever the sidebar is rendered, but it only changes
+through the admin category commands. Writes invalidate the community's list on
+commit; after a write, the wrapper bypasses the cache for the rest of its session.
+
+Membership lookups back every authorization check and are served from the
+membership cache; joins and role changes invalidate it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.community.domain.entities import Category, CommunityMember
+from src.community.domain.repositories import ICategoryRepository, IMemberRepository
+from src.community.domain.value_objects import CategoryId, CommunityId
+from src.community.infrastructure.persistence.membership_cache import (
+    Membership,
+    MembershipCache,
+    memberships,
+)
+from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure.reference_cache import ReferenceDataCache, reference_cache
+
+if TYPE_CHECKING:
+    from src.community.application.dtos.member_directory_entry import MemberDirectoryEntry
+
+CATEGORY_LIST_NAMESPACE = "community.categories"
+
+
+class CachedCategoryRepository(ICategoryRepository):
+    """ICategoryRepository decorator that caches per-community category lists."""
+
+    def __init__(
+        self,
+        inner: ICategoryRepository,
+        session: AsyncSession | None = None,
+        cache: ReferenceDataCache = reference_cache,
+    ) -> None:
+        """Initialize with the wrapped repository."""
+        self._inner = inner
+        self._session = session
+        self._cache = cache
+        self._dirty = False
+
+    async def save(self, category: Category) -> None:
+        """Save a category and invalidate its community's list."""
+        await self._inner.save(category)
+        self._dirty = True
+        await self._cache.invalidate_on_commit(
+            self._session, CATEGORY_LIST_NAMESPACE, str(category.community_id.value)
+        )
+
+    async def get_by_id(self, category_id: CategoryId) -> Category | None:
+        """Get a category by ID."""
+        return await self._inner.get_by_id(category_id)
+
+    async def get_by_name(self, community_id: CommunityId, name: str) -> Category | None:
+        """Get a category by name within a community."""
+        return await self._inner.get_by_name(community_id, name)
+
+    async def get_by_slug(self, community_id: CommunityId, slug: str) -> Category | None:
+        """Get a category by slug within a community."""
+        return await self._inner.get_by_slug(community_id, slug)
+
+    async def list_by_community(self, community_id: CommunityId) -> list[Category]:
+        """List all categories in a community, served from the cache."""
+        if self._dirty:
+            return await self._inner.list_by_community(community_id)
+        return await self._cache.get_or_load(
+            CATEGORY_LIST_NAMESPACE,
+            str(community_id.value),
+            lambda: self._inner.list_by_community(community_id),
+        )
+
+    async def exists_by_name(self, community_id: CommunityId, name: str) -> bool:
+        """Check if a category with the given name exists."""
+        return await self._inner.exists_by_name(community_id, name)
+
+    async def delete(self, category_id: CategoryId) -> None:
+        """Delete a category and invalidate all cached lists."""
+        await self._inner.delete(category_id)
+        self._dirty = True
+        # The owning community is not known here; deletes are rare enough
+        # that dropping the whole namespace is fine.
+        await self._cache.invalidate_on_commit(self._session, CATEGORY_LIST_NAMESPACE)
+
+
+class CachedMemberRepository(IMemberRepository):
+    """IMemberRepository decorator that serves membership lookups from the membership cache."""
+
+    def __init__(
+        self,
+        inner: IMemberRepository,
+        session: AsyncSession,
+        cache: MembershipCache = memberships,
+    ) -> None:
+        """Initialize with the wrapped repository and its session."""
+        self._inner = inner
+        self._session = session
+        self._cache = cache
+
+    async def save(self, member: CommunityMember) -> None:
+        """Save a member and invalidate their cached membership."""
+        await self._inner.save(member)
+        self._cache.invalidate_on_commit(
+            self._session, member.user_id.value, member.community_id.value
+        )
+
+    async def get_by_user_and_community(
+        self,
+        user_id: UserId,
+        community_id: CommunityId,
+    ) -> CommunityMember | None:
+        """Get an active member, served from the membership cache."""
+
+        async def _load() -> Membership | None:
+            member = await self._inner.get_by_user_and_community(user_id, community_id)
+            if member is None:
+                return None
+            return Membership(role=member.role, joined_at=member.joined_at)
+
+        membership = await self._cache.get(self._session, user_id.value, community_id.value, _load)
+        if membership is None:
+            return None
+        # A fresh entity per call: callers may mutate what they get
+        return CommunityMember(
+            id=user_id,
+            user_id=user_id,
+            community_id=community_id,
+            role=membership.role,
+            joined_at=membership.joined_at,
+        )
+
+    async def exists(
+        self,
+        user_id: UserId,
+        community_id: CommunityId,
+    ) -> bool:
+        """Check if a user is an active member, served from the membership cache."""
+        return await self.get_by_user_and_community(user_id, community_id) is not None
+
+    async def list_by_community(
+        self,
+        community_id: CommunityId,
+    ) -> list[CommunityMember]:
+        """List all active members in a community."""
+        return await self._inner.list_by_community(community_id)
+
+    async def delete(
+        self,
+        user_id: UserId,
+        community_id: CommunityId,
+    ) -> None:
+        """Delete a member and invalidate their cached membership."""
+        await self._inner.delete(user_id, community_id)
+        self._cache.invalidate_on_commit(self._session, user_id.value, community_id.value)
+
+    async def list_directory(
+        self,
+        community_id: CommunityId,
+        sort: str = "most_recent",
+        limit: int = 20,
+        offset: int = 0,
+        search: str | None = None,
+        role: str | None = None,
+    ) -> list[MemberDirectoryEntry]:
+        """List community members with profile data."""
+        return await self._inner.list_directory(community_id, sort, limit, offset, search, role)
+
+    async def count_directory(
+        self,
+        community_id: CommunityId,
+        search: str | None = None,
+        role: str | None = None,
+    ) -> int:
+        """Count active members in a community."""
+        return await self._inner.count_directory(community_id, search, role)
@@ -0,0 +1,171 @@
+"""Cache of community memberships for authorization checks.
+
+Nearly every community, classroom and gamification request starts by
+checking that the user is an active member of the community, or an admin.
+The answer per (user, community), the role of an active membership or none,
+is cached in two tiers:
+
+- Per transaction, in the session's ``info``: a request never looks up the
+  same membership twice. The memo is dropped when the transaction ends.
+- Per process, in a bounded LRU whose entries live ``ttl_seconds``. The TTL
+  is kept short because it is also how other processes' membership changes
+  become visible here.
+
+Non-memberships are cached too, so a non-member browsing the feed costs one
+lookup per TTL. Writes go through CachedMemberRepository, which drops the
+entry here immediately and again once the write commits; until then, the
+writing session reads memberships uncached so it sees its own changes.
+
+Entries under ``ANY_COMMUNITY`` answer "is this user an admin anywhere" for
+classroom, which has no community in its URLs. Any change to one of a user's
+memberships drops it.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.community.domain.value_objects import MemberRole
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+REQUEST_MEMO_KEY = "membership_cache_memo"
+DIRTY_SESSION_KEY = "membership_cache_dirty"
+ANY_COMMUNITY: UUID | None = None
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_TTL_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class Membership:
+    """An active membership: what authorization checks need."""
+
+    role: MemberRole
+    joined_at: datetime
+
+
+_Key = tuple[UUID, UUID | None]
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class _Entry:
+    membership: Membership | None
+    expires_at: float
+
+
+class MembershipCache:
+    """Request-scoped memo in front of a short-TTL, per-process LRU."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._registry = registry
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._epoch = 0
+        registry.register_gauge("membership_cache_entries", lambda: len(self._entries))
+
+    def configure(self, max_entries: int, ttl_seconds: float) -> None:
+        """Apply runtime settings, evicting if the bound shrank."""
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._evict()
+
+    async def get(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        community_id: UUID | None,
+        load: Callable[[], Awaitable[Membership | None]],
+    ) -> Membership | None:
+        """The user's active membership, or None; ``load`` runs on a miss in both tiers."""
+        key = (user_id, community_id)
+        memo = self._memo(session)
+        memoized = memo.get(key, _MISSING)
+        if memoized is not _MISSING:
+            self._registry.increment("membership_cache_hits_total", tier="request")
+            return memoized  # type: ignore[return-value]
+
+        dirty = session.sync_session.info.get(DIRTY_SESSION_KEY, False)
+        entry = None if dirty else self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self._registry.increment("membership_cache_hits_total", tier="process")
+            memo[key] = entry.membership
+            return entry.membership
+
+        self._registry.increment("membership_cache_misses_total")
+        epoch = self._epoch
+        membership = await load()
+        memo[key] = membership
+        if not dirty and self._epoch == epoch:
+            self._entries[key] = _Entry(membership, time.monotonic() + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            self._evict()
+        return membership
+
+    def invalidate(self, user_id: UUID, community_id: UUID) -> None:
+        """Drop a membership, and the user's any-community entry, from the process tier."""
+        self._epoch += 1
+        self._entries.pop((user_id, community_id), None)
+        self._entries.pop((user_id, ANY_COMMUNITY), None)
+
+    def invalidate_on_commit(
+        self, session: AsyncSession, user_id: UUID, community_id: UUID
+    ) -> None:
+        """Invalidate now and once ``session`` commits; read uncached until then."""
+        self.invalidate(user_id, community_id)
+        sync_session = session.sync_session
+        sync_session.info[DIRTY_SESSION_KEY] = True
+        memo = sync_session.info.get(REQUEST_MEMO_KEY)
+        if memo is not None:
+            memo.pop((user_id, community_id), None)
+            memo.pop((user_id, ANY_COMMUNITY), None)
+
+        def _after_commit(_session: Any) -> None:
+            sync_session.info.pop(DIRTY_SESSION_KEY, None)
+            self.invalidate(user_id, community_id)
+
+        def _after_rollback(_session: Any) -> None:
+            sync_session.info.pop(DIRTY_SESSION_KEY, None)
+
+        event.listen(sync_session, "after_commit", _after_commit, once=True)
+        event.listen(sync_session, "after_soft_rollback", _after_rollback, once=True)
+
+    def reset(self) -> None:
+        """Drop all entries. Used in tests."""
+        self._epoch += 1
+        self._entries.clear()
+
+    def _memo(self, session: AsyncSession) -> dict[_Key, Membership | None]:
+        sync_session = session.sync_session
+        memo: dict[_Key, Membership | None] | None = sync_session.info.get(REQUEST_MEMO_KEY)
+        if memo is None:
+            memo = sync_session.info[REQUEST_MEMO_KEY] = {}
+
+            def _forget(_session: Any, *_args: Any) -> None:
+                sync_session.info.pop(REQUEST_MEMO_KEY, None)
+
+            # Memberships read in one transaction say nothing about the next
+            event.listen(sync_session, "after_transaction_end", _forget, once=True)
+        return memo
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+# Global membership cache
+memberships = MembershipCache()
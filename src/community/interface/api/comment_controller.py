@@ -5,7 +5,6 @@ from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
 
 from src.community.application.commands import (
     AddCommentCommand,
@@ -54,7 +53,7 @@ from src.community.interface.api.schemas import (
     ErrorResponse,
     LikeResponse,
 )
-from src.identity.infrastructure.persistence.models import ProfileModel
+from src.identity.infrastructure.persistence import user_snapshots
 
 logger = structlog.get_logger()
 
@@ -151,24 +150,20 @@ async def get_post_comments(
     comments_with_likes = await handler.handle(query)
 
     # Fetch author profiles
-    author_ids = [
-        cwl.comment.author_id.value for cwl in comments_with_likes if cwl.comment.author_id
-    ]
-    profiles_map: dict[UUID, ProfileModel] = {}
-    if author_ids:
-        profiles_result = await session.execute(
-            select(ProfileModel).where(ProfileModel.user_id.in_(author_ids))
-        )
-        profiles_map = {p.user_id: p for p in profiles_result.scalars().all()}
+    authors = await user_snapshots.get_many(
+        session,
+        (cwl.comment.author_id.value for cwl in comments_with_likes if cwl.comment.author_id),
+    )
 
     responses = []
     for cwl in comments_with_likes:
         author = None
         if cwl.comment.author_id:
-            profile = profiles_map.get(cwl.comment.author_id.value)
+            author_snapshot = authors.get(cwl.comment.author_id.value)
+            profile = author_snapshot.profile if author_snapshot else None
             if profile:
                 author = AuthorResponse(
-                    id=profile.user_id,
+                    id=cwl.comment.author_id.value,
                     display_name=profile.display_name or "Unknown",
                     avatar_url=profile.avatar_url,
                 )
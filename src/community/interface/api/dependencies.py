@@ -31,7 +31,10 @@ from src.community.application.handlers import (
     UpdateCategoryHandler,
     UpdatePostHandler,
 )
+from src.community.domain.repositories import IMemberRepository
 from src.community.infrastructure.persistence import (
+    CachedCategoryRepository,
+    CachedMemberRepository,
     SqlAlchemyCategoryRepository,
     SqlAlchemyCommentRepository,
     SqlAlchemyMemberRepository,
@@ -40,12 +43,11 @@ from src.community.infrastructure.persistence import (
     SqlAlchemySearchRepository,
 )
 from src.community.infrastructure.services import InMemoryRateLimiter
-from src.config import settings
-from src.identity.infrastructure.services import JWTService
 
 # Import shared database dependencies from identity
 # (reusing the same database instance)
 from src.identity.interface.api.dependencies import SessionDep as SessionDep
+from src.identity.interface.api.dependencies import verify_access_token
 
 # ============================================================================
 # Repository Dependencies
@@ -57,14 +59,14 @@ def get_post_repository(session: SessionDep) -> SqlAlchemyPostRepository:
     return SqlAlchemyPostRepository(session)
 
 
-def get_category_repository(session: SessionDep) -> SqlAlchemyCategoryRepository:
-    """Get category repository."""
-    return SqlAlchemyCategoryRepository(session)
+def get_category_repository(session: SessionDep) -> CachedCategoryRepository:
+    """Get category repository (category lists are served from the reference cache)."""
+    return CachedCategoryRepository(SqlAlchemyCategoryRepository(session), session=session)
 
 
-def get_member_repository(session: SessionDep) -> SqlAlchemyMemberRepository:
-    """Get member repository."""
-    return SqlAlchemyMemberRepository(session)
+def get_member_repository(session: SessionDep) -> IMemberRepository:
+    """Get member repository (membership lookups are served from the membership cache)."""
+    return CachedMemberRepository(SqlAlchemyMemberRepository(session), session=session)
 
 
 def get_comment_repository(session: SessionDep) -> SqlAlchemyCommentRepository:
@@ -78,8 +80,8 @@ def get_reaction_repository(session: SessionDep) -> SqlAlchemyReactionRepository
 
 
 PostRepositoryDep = Annotated[SqlAlchemyPostRepository, Depends(get_post_repository)]
-CategoryRepositoryDep = Annotated[SqlAlchemyCategoryRepository, Depends(get_category_repository)]
-MemberRepositoryDep = Annotated[SqlAlchemyMemberRepository, Depends(get_member_repository)]
+CategoryRepositoryDep = Annotated[CachedCategoryRepository, Depends(get_category_repository)]
+MemberRepositoryDep = Annotated[IMemberRepository, Depends(get_member_repository)]
 CommentRepositoryDep = Annotated[SqlAlchemyCommentRepository, Depends(get_comment_repository)]
 ReactionRepositoryDep = Annotated[SqlAlchemyReactionRepository, Depends(get_reaction_repository)]
 
@@ -386,17 +388,6 @@ def get_get_feed_handler(
 security = HTTPBearer(auto_error=False)
 
 
-def get_token_generator() -> JWTService:
-    """Get JWT service instance."""
-    return JWTService(
-        secret_key=settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
-        access_token_expire_minutes=settings.jwt_access_token_expire_minutes,
-        refresh_token_expire_days=settings.jwt_refresh_token_expire_days,
-        refresh_token_remember_me_days=settings.jwt_refresh_token_remember_me_days,
-    )
-
-
 async def get_current_user_id(
     _request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)] = None,
@@ -413,8 +404,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token_generator = get_token_generator()
-    user_id = token_generator.validate_access_token(credentials.credentials)
+    user_id = verify_access_token(credentials.credentials)
 
     if user_id is None:
         raise HTTPException(
@@ -423,7 +413,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user_id.value
+    return user_id
 
 
 CurrentUserIdDep = Annotated[UUID, Depends(get_current_user_id)]
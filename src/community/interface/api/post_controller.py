@@ -79,7 +79,7 @@ from src.community.interface.api.schemas import (
     UpdatePostRequest,
 )
 from src.identity.domain.value_objects import UserId
-from src.identity.infrastructure.persistence.models import ProfileModel
+from src.identity.infrastructure.persistence import user_snapshots
 
 logger = structlog.get_logger()
 
@@ -168,11 +168,9 @@ async def get_feed(
         )
 
         # Fetch author profiles for all posts
-        author_ids = [post.author_id.value for post in feed_result.posts]
-        profiles_result = await session.execute(
-            select(ProfileModel).where(ProfileModel.user_id.in_(author_ids))
+        authors = await user_snapshots.get_many(
+            session, (post.author_id.value for post in feed_result.posts)
         )
-        profiles_map = {p.user_id: p for p in profiles_result.scalars().all()}
 
         # Check which posts current user has liked
         user_id = UserId(value=current_user_id)
@@ -185,10 +183,11 @@ async def get_feed(
         # Convert domain entities to response models with author info
         post_responses = []
         for post in feed_result.posts:
-            author_profile = profiles_map.get(post.author_id.value)
+            author_snapshot = authors.get(post.author_id.value)
+            author_profile = author_snapshot.profile if author_snapshot else None
             if author_profile:
                 author = AuthorResponse(
-                    id=author_profile.user_id,
+                    id=post.author_id.value,
                     display_name=author_profile.display_name or "Unknown",
                     avatar_url=author_profile.avatar_url,
                 )
@@ -334,14 +333,12 @@ async def get_post(
         post = await handler.handle(query)
 
         # Fetch author profile
-        author_profile_result = await session.execute(
-            select(ProfileModel).where(ProfileModel.user_id == post.author_id.value)
-        )
-        author_profile = author_profile_result.scalar_one_or_none()
+        author_snapshot = await user_snapshots.get(session, post.author_id.value)
+        author_profile = author_snapshot.profile if author_snapshot else None
 
         if author_profile:
             author = AuthorResponse(
-                id=author_profile.user_id,
+                id=post.author_id.value,
                 display_name=author_profile.display_name or "Unknown",
                 avatar_url=author_profile.avatar_url,
             )
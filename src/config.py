@@ -25,6 +25,16 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    # Shared connection pool: size, wait for a free connection, socket timeouts, idle ping
+    redis_max_connections: int = 50
+    redis_pool_timeout_seconds: float = 2.0
+    redis_socket_timeout_seconds: float = 2.0
+    redis_connect_timeout_seconds: float = 2.0
+    redis_health_check_interval_seconds: int = 30
+    # Local Bloom filter of blacklisted refresh tokens, kept current over pub/sub
+    token_blacklist_filter_enabled: bool = True
+    token_blacklist_filter_capacity: int = 1_000_000
+    token_blacklist_filter_rebuild_seconds: float = 3600.0
 
     # JWT
     jwt_secret_key: str = "jwt-secret-key-change-in-production"
@@ -32,6 +42,8 @@ class Settings(BaseSettings):
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
     jwt_refresh_token_remember_me_days: int = 30
+    # Verified access tokens kept in memory so repeat requests skip the signature check
+    access_token_cache_max_entries: int = 10_000
 
     # Email (Resend HTTP API)
     resend_api_key: str = ""
@@ -42,16 +54,76 @@ class Settings(BaseSettings):
     smtp_host: str = ""
     smtp_port: int = 1025
 
+    # Email outbox sender: batch size, idle poll, retry backoff, dead-letter threshold
+    email_outbox_batch_size: int = 50
+    email_outbox_poll_seconds: float = 2.0
+    email_outbox_max_attempts: int = 8
+    email_outbox_backoff_base_seconds: float = 30.0
+    email_outbox_backoff_max_seconds: float = 3600.0
+    email_outbox_retention_days: int = 7
+
+    # Verification and reset tokens: Redis keys with native expiry instead of SQL rows
+    email_tokens_redis_enabled: bool = False
+    # Batched purge of dead rows from the SQL token tables
+    token_purge_enabled: bool = True
+    token_purge_interval_seconds: float = 3600.0
+    token_purge_batch_size: int = 1000
+
     # Frontend URL (for email links)
     frontend_url: str = "http://localhost:5173"
 
+    # Public origin of this API, for absolute URLs stored with data (avatars)
+    api_public_url: str = "http://localhost:8000"
+
     # Database pool
     db_pool_size: int = 5
     db_max_overflow: int = 10
 
+    # Password hashing: Argon2 worker threads and how many calls may wait for one
+    password_hash_workers: int = 4
+    password_hash_max_waiting: int = 64
+
     # Rate Limiting
     rate_limit_enabled: bool = True
 
+    # Bearer token required by /metrics; the endpoint is not served when empty
+    metrics_token: str = ""
+
+    # Reference data cache (level configs, categories, course requirements)
+    reference_cache_ttl_seconds: float = 300.0
+    reference_cache_redis_coherence: bool = False
+
+    # User and profile snapshots: in-process LRU, shared through Redis when enabled
+    user_cache_max_entries: int = 10_000
+    user_cache_local_ttl_seconds: float = 30.0
+    user_cache_redis_ttl_seconds: float = 300.0
+    user_cache_redis_enabled: bool = True
+
+    # Community memberships for authorization: per-request memo, short-TTL per-process LRU
+    membership_cache_max_entries: int = 50_000
+    membership_cache_ttl_seconds: float = 10.0
+
+    # Domain events: "background" (bounded queues, one worker each, ordered per
+    # aggregate, dispatched after commit) or "inline". Handlers running past the
+    # timeout are moved off their worker, not cancelled.
+    event_bus_mode: str = "background"
+    event_bus_queue_size: int = 1000
+    event_bus_workers: int = 8
+    event_bus_handler_timeout_seconds: float = 10.0
+    event_bus_enqueue_timeout_seconds: float = 0.5
+    event_bus_drain_timeout_seconds: float = 10.0
+
+    # Gamification point writes: buffer window (0 disables batching) and batch cap
+    gamification_batch_window_ms: float = 5.0
+    gamification_batch_max_size: int = 500
+
+    # Lesson "last accessed" write-behind: flush interval and buffer cap
+    classroom_last_accessed_flush_seconds: float = 2.0
+    classroom_last_accessed_max_pending: int = 10_000
+
+    # Serialized, precompressed response bodies (lesson content) kept in memory
+    response_cache_max_bytes: int = 32 * 1024 * 1024
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
@@ -0,0 +1,113 @@
+"""Apply a batch of point awards and deductions."""
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import structlog
+
+from src.gamification.application.commands.award_points import AwardPointsCommand
+from src.gamification.application.commands.deduct_points import DeductPointsCommand
+from src.gamification.domain.entities.level_configuration import LevelConfiguration
+from src.gamification.domain.entities.member_points import MemberPoints
+from src.gamification.domain.exceptions import DuplicateLessonCompletionError
+from src.gamification.domain.repositories import ILevelConfigRepository, IMemberPointsRepository
+from src.shared.domain.base_event import DomainEvent
+
+logger = structlog.get_logger()
+
+PointCommand = AwardPointsCommand | DeductPointsCommand
+
+
+@dataclass(frozen=True)
+class ApplyPointBatchCommand:
+    """Point changes to apply together, in arrival order."""
+
+    commands: list[PointCommand] = field(default_factory=list)
+
+
+class ApplyPointBatchHandler:
+    """Handler for applying a batch of point changes.
+
+    Changes are coalesced per (community, user): each member is loaded and
+    saved once, but every change still goes through MemberPoints, so each
+    produces its own transaction row and domain events (including level-ups).
+    Events are returned rather than published so the caller can publish them
+    once the batch has been committed.
+    """
+
+    def __init__(
+        self,
+        member_points_repo: IMemberPointsRepository,
+        level_config_repo: ILevelConfigRepository,
+    ) -> None:
+        self._member_points_repo = member_points_repo
+        self._level_config_repo = level_config_repo
+
+    async def handle(self, command: ApplyPointBatchCommand) -> list[DomainEvent]:
+        members: dict[tuple[UUID, UUID], list[PointCommand]] = {}
+        for change in command.commands:
+            members.setdefault((change.community_id, change.user_id), []).append(change)
+
+        configs: dict[UUID, LevelConfiguration] = {}
+        events: list[DomainEvent] = []
+        for (community_id, user_id), changes in members.items():
+            config = await self._get_level_config(community_id, changes, configs)
+            mp = await self._member_points_repo.get_by_community_and_user(community_id, user_id)
+
+            for change in changes:
+                if isinstance(change, DeductPointsCommand):
+                    if mp is None:
+                        logger.info(
+                            "deduct_points_skip_no_member",
+                            user_id=str(user_id),
+                            community_id=str(community_id),
+                        )
+                        continue
+                    mp.deduct_points(
+                        source=change.source, source_id=change.source_id, level_config=config
+                    )
+                    continue
+
+                if mp is None:
+                    mp = MemberPoints.create(community_id=community_id, user_id=user_id)
+                try:
+                    mp.award_points(
+                        source=change.source, source_id=change.source_id, level_config=config
+                    )
+                except DuplicateLessonCompletionError:
+                    logger.info(
+                        "award_points_skip_duplicate_lesson",
+                        user_id=str(user_id),
+                        lesson_id=str(change.source_id),
+                    )
+
+            if mp is None:
+                continue
+            await self._member_points_repo.save(mp)
+            events.extend(mp.clear_events())
+
+            logger.info(
+                "point_batch_applied",
+                user_id=str(user_id),
+                community_id=str(community_id),
+                changes=len(changes),
+                new_total=mp.total_points,
+            )
+        return events
+
+    async def _get_level_config(
+        self,
+        community_id: UUID,
+        changes: list[PointCommand],
+        configs: dict[UUID, LevelConfiguration],
+    ) -> LevelConfiguration:
+        config = configs.get(community_id)
+        if config is None:
+            config = await self._level_config_repo.get_by_community(community_id)
+            if config is None:
+                config = LevelConfiguration.create_default(community_id)
+                # Lazy init on first award, as AwardPointsHandler does
+                if any(isinstance(change, AwardPointsCommand) for change in changes):
+                    await self._level_config_repo.save(config)
+            configs[community_id] = config
+        return config
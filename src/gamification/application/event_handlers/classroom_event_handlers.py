@@ -11,6 +11,9 @@ from src.gamification.application.commands.award_points import (
     AwardPointsHandler,
 )
 from src.gamification.domain.value_objects.point_source import PointSource
+from src.gamification.infrastructure.persistence.cached_repositories import (
+    CachedLevelConfigRepository,
+)
 from src.gamification.infrastructure.persistence.level_config_repository import (
     SqlAlchemyLevelConfigRepository,
 )
@@ -58,7 +61,9 @@ async def handle_lesson_completed(event: LessonCompleted) -> None:
     session = db._session_factory()  # noqa: SLF001
     try:
         mp_repo = SqlAlchemyMemberPointsRepository(session)
-        lc_repo = SqlAlchemyLevelConfigRepository(session)
+        lc_repo = CachedLevelConfigRepository(
+            SqlAlchemyLevelConfigRepository(session), session=session
+        )
         handler = AwardPointsHandler(member_points_repo=mp_repo, level_config_repo=lc_repo)
         await handler.handle(
             AwardPointsCommand(
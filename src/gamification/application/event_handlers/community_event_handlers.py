@@ -10,61 +10,68 @@ from src.community.domain.events import (
     PostLiked,
     PostUnliked,
 )
-from src.gamification.application.commands.award_points import (
-    AwardPointsCommand,
-    AwardPointsHandler,
-)
-from src.gamification.application.commands.deduct_points import (
-    DeductPointsCommand,
-    DeductPointsHandler,
+from src.gamification.application.commands.apply_point_batch import (
+    ApplyPointBatchCommand,
+    ApplyPointBatchHandler,
+    PointCommand,
 )
+from src.gamification.application.commands.award_points import AwardPointsCommand
+from src.gamification.application.commands.deduct_points import DeductPointsCommand
+from src.gamification.application.event_handlers.point_batch_writer import PointBatchWriter
 from src.gamification.domain.value_objects.point_source import PointSource
+from src.gamification.infrastructure.persistence.cached_repositories import (
+    CachedLevelConfigRepository,
+)
 from src.gamification.infrastructure.persistence.level_config_repository import (
     SqlAlchemyLevelConfigRepository,
 )
 from src.gamification.infrastructure.persistence.member_points_repository import (
     SqlAlchemyMemberPointsRepository,
 )
+from src.shared.infrastructure import event_bus
 
 logger = structlog.get_logger()
 
 
-async def _run_award(command: AwardPointsCommand) -> None:
-    """Run award handler with a properly managed session."""
+async def _apply_point_batch(commands: list[PointCommand]) -> None:
+    """Apply a batch of point changes in one transaction, then publish its events."""
     from src.identity.interface.api.dependencies import get_database
 
     db = get_database()
     session = db._session_factory()  # noqa: SLF001
     try:
         mp_repo = SqlAlchemyMemberPointsRepository(session)
-        lc_repo = SqlAlchemyLevelConfigRepository(session)
-        handler = AwardPointsHandler(member_points_repo=mp_repo, level_config_repo=lc_repo)
-        await handler.handle(command)
+        lc_repo = CachedLevelConfigRepository(
+            SqlAlchemyLevelConfigRepository(session), session=session
+        )
+        handler = ApplyPointBatchHandler(member_points_repo=mp_repo, level_config_repo=lc_repo)
+        events = await handler.handle(ApplyPointBatchCommand(commands=commands))
         await session.commit()
     except Exception:
         await session.rollback()
-        logger.exception("gamification.award_points_failed", command=str(command))
+        raise
     finally:
         await session.close()
 
-
-async def _run_deduct(command: DeductPointsCommand) -> None:
-    """Run deduct handler with a properly managed session."""
-    from src.identity.interface.api.dependencies import get_database
-
-    db = get_database()
-    session = db._session_factory()  # noqa: SLF001
+    # Already committed: a failing subscriber must not make the batch look failed
     try:
-        mp_repo = SqlAlchemyMemberPointsRepository(session)
-        lc_repo = SqlAlchemyLevelConfigRepository(session)
-        handler = DeductPointsHandler(member_points_repo=mp_repo, level_config_repo=lc_repo)
-        await handler.handle(command)
-        await session.commit()
+        await event_bus.publish_all(events)
     except Exception:
-        await session.rollback()
-        logger.exception("gamification.deduct_points_failed", command=str(command))
-    finally:
-        await session.close()
+        logger.exception("gamification.point_batch_events_failed", events=len(events))
+
+
+# Engagement events funnel through one writer so bursts on the same member coalesce
+point_batch_writer = PointBatchWriter(_apply_point_batch)
+
+
+async def _run_award(command: AwardPointsCommand) -> None:
+    """Queue a point award and wait for its batch to be applied."""
+    await point_batch_writer.submit(command)
+
+
+async def _run_deduct(command: DeductPointsCommand) -> None:
+    """Queue a point deduction and wait for its batch to be applied."""
+    await point_batch_writer.submit(command)
 
 
 async def handle_post_created(event: PostCreated) -> None:
@@ -0,0 +1,146 @@
+"""Micro-batching ingestion stage for point changes.
+
+Engagement events arrive in bursts (a viral post gets hundreds of likes within
+seconds), and applying each one in its own transaction serializes them all on
+the author's member_points row. PointBatchWriter buffers changes for a few
+milliseconds and hands the whole buffer to a single apply call, which
+coalesces it per (community, user) in one transaction.
+
+Delivery guarantees:
+- By default submit() returns only after the batch containing the change has
+  been committed (or has failed and been logged), so inline event handlers
+  keep their previous completion semantics and callers never observe
+  unapplied points.
+- A detached writer (what the background event bus uses) returns from
+  submit() once the change is buffered. Bus workers handle one aggregate's
+  events one after another, so waiting there would give every like on a viral
+  post its own window and commit; detached, they all share a batch.
+- Batches are applied one at a time, in the order they were started, so a
+  like and a later unlike are never applied the other way round.
+- A failing batch is retried one member at a time, so a single bad change
+  does not drop the rest of the batch.
+- close() stops buffering, flushes whatever is pending and waits for in-flight
+  batches; the application calls it on shutdown. Changes submitted after
+  close() are applied immediately without batching.
+- Buffered changes live only in memory. If the process crashes, changes
+  buffered in the current window (at most window_seconds old) are lost, the
+  same changes a crash would lose mid-transaction without batching. For a
+  waiting writer nothing is lost once submit() has returned; a detached
+  writer loses what is still buffered or being applied.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+import structlog
+
+from src.gamification.application.commands.apply_point_batch import PointCommand
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+ApplyBatch = Callable[[list[PointCommand]], Awaitable[None]]
+
+
+class PointBatchWriter:
+    """Buffers point changes and applies them in small batches."""
+
+    def __init__(
+        self,
+        apply_batch: ApplyBatch,
+        window_seconds: float = 0.005,
+        max_batch_size: int = 500,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._apply_batch = apply_batch
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._metrics = registry
+        self._pending: list[tuple[PointCommand, asyncio.Future[None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        self._apply_lock = asyncio.Lock()
+        self._detached = False
+        self._closed = False
+
+    def configure(self, window_seconds: float, max_batch_size: int, detached: bool = False) -> None:
+        """Apply runtime settings and (re)open the writer."""
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._detached = detached
+        self._closed = False
+
+    async def submit(self, command: PointCommand) -> None:
+        """Queue a change and wait until its batch has been applied, unless detached."""
+        if self._closed or self._window_seconds <= 0:
+            await self._apply([command])
+            return
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.append((command, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_seconds, self._start_flush)
+        if self._detached:
+            return
+        # Shielded: a cancelled caller must not cancel the batch it joined
+        await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Flush pending changes and wait for in-flight batches."""
+        self._closed = True
+        if self._pending:
+            self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[PointCommand, asyncio.Future[None]]]) -> None:
+        try:
+            await self._apply([command for command, _ in batch])
+        finally:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _apply(self, commands: list[PointCommand]) -> None:
+        async with self._apply_lock:
+            await self._apply_in_order(commands)
+
+    async def _apply_in_order(self, commands: list[PointCommand]) -> None:
+        self._metrics.increment("gamification_point_batches_total")
+        self._metrics.increment("gamification_point_changes_total", len(commands))
+        try:
+            await self._apply_batch(commands)
+            return
+        except Exception:
+            self._metrics.increment("gamification_point_batch_failures_total")
+            logger.exception("gamification.point_batch_failed", changes=len(commands))
+
+        members: dict[tuple[UUID, UUID], list[PointCommand]] = {}
+        for command in commands:
+            members.setdefault((command.community_id, command.user_id), []).append(command)
+        if len(members) == 1:
+            return
+        for member_commands in members.values():
+            try:
+                await self._apply_batch(member_commands)
+            except Exception:
+                logger.exception(
+                    "gamification.point_batch_member_failed",
+                    community_id=str(member_commands[0].community_id),
+                    user_id=str(member_commands[0].user_id),
+                )
@@ -0,0 +1,78 @@
+"""CheckCourseAccessBatch query and handler.
+
+Evaluates level-gated access for many courses at once (e.g. a course
+catalogue with lock badges): one requirements query, one member-level
+lookup and, only if any course is gated, one level-config read.
+"""
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.gamification.application.queries.check_course_access import CourseAccessResult
+from src.gamification.domain.entities.level_configuration import LevelConfiguration
+from src.gamification.domain.repositories import (
+    ICourseLevelRequirementRepository,
+    ILevelConfigRepository,
+    IMemberPointsRepository,
+)
+
+
+@dataclass(frozen=True)
+class CheckCourseAccessBatchQuery:
+    community_id: UUID
+    user_id: UUID
+    course_ids: list[UUID] = field(default_factory=list)
+
+
+class CheckCourseAccessBatchHandler:
+    def __init__(
+        self,
+        course_req_repo: ICourseLevelRequirementRepository,
+        member_points_repo: IMemberPointsRepository,
+        level_config_repo: ILevelConfigRepository,
+    ) -> None:
+        self._course_req_repo = course_req_repo
+        self._member_points_repo = member_points_repo
+        self._level_config_repo = level_config_repo
+
+    async def handle(self, query: CheckCourseAccessBatchQuery) -> dict[UUID, CourseAccessResult]:
+        """Return access results keyed by course ID (one per requested course)."""
+        if not query.course_ids:
+            return {}
+
+        level = await self._member_points_repo.get_current_level(query.community_id, query.user_id)
+        current_level = level if level is not None else 1
+
+        requirements = await self._course_req_repo.list_by_community_and_courses(
+            query.community_id, list(dict.fromkeys(query.course_ids))
+        )
+        minimum_levels = {req.course_id: req.minimum_level for req in requirements}
+
+        config: LevelConfiguration | None = None
+        if minimum_levels:
+            config = await self._level_config_repo.get_by_community(query.community_id)
+            if config is None:
+                config = LevelConfiguration.create_default(query.community_id)
+
+        results: dict[UUID, CourseAccessResult] = {}
+        for course_id in query.course_ids:
+            minimum_level = minimum_levels.get(course_id)
+            if minimum_level is None or config is None:
+                # No level requirement — accessible to all
+                results[course_id] = CourseAccessResult(
+                    course_id=course_id,
+                    has_access=True,
+                    minimum_level=None,
+                    minimum_level_name=None,
+                    current_level=current_level,
+                )
+                continue
+
+            results[course_id] = CourseAccessResult(
+                course_id=course_id,
+                has_access=current_level >= minimum_level,
+                minimum_level=minimum_level,
+                minimum_level_name=config.name_for_level(minimum_level),
+                current_level=current_level,
+            )
+        return results
@@ -0,0 +1,73 @@
+"""GetPointHistory query and handler."""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.gamification.domain.repositories import IMemberPointsRepository
+from src.gamification.domain.repositories.member_points_repository import (
+    PointHistoryCursor,
+    PointHistoryEntry,
+)
+
+
+@dataclass(frozen=True)
+class GetPointHistoryQuery:
+    community_id: UUID
+    user_id: UUID
+    limit: int = 20
+    cursor: str | None = None
+
+
+@dataclass
+class PointHistoryResult:
+    entries: list[PointHistoryEntry]
+    cursor: str | None
+    has_more: bool
+
+
+class GetPointHistoryHandler:
+    def __init__(self, member_points_repo: IMemberPointsRepository) -> None:
+        self._member_points_repo = member_points_repo
+
+    async def handle(self, query: GetPointHistoryQuery) -> PointHistoryResult:
+        # One extra row tells us whether another page exists
+        entries = await self._member_points_repo.list_point_history(
+            query.community_id,
+            query.user_id,
+            limit=query.limit + 1,
+            before=decode_cursor(query.cursor),
+        )
+        has_more = len(entries) > query.limit
+        entries = entries[: query.limit]
+        next_cursor = encode_cursor(entries[-1]) if has_more else None
+        return PointHistoryResult(entries=entries, cursor=next_cursor, has_more=has_more)
+
+
+def encode_cursor(entry: PointHistoryEntry) -> str:
+    """Opaque cursor pointing just past an entry."""
+    payload = {"created_at": _as_utc(entry.created_at).isoformat(), "id": str(entry.id)}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> PointHistoryCursor | None:
+    """Decode a cursor; a malformed cursor restarts from the newest entry."""
+    if cursor is None:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return PointHistoryCursor(
+            created_at=_as_utc(datetime.fromisoformat(data["created_at"])), id=UUID(data["id"])
+        )
+    except (KeyError, TypeError, ValueError):
+        # binascii, JSON and unicode decoding errors are all ValueErrors
+        return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Cursor timestamps are always UTC-aware; a naive value is taken as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
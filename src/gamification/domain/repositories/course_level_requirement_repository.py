@@ -19,6 +19,12 @@ class ICourseLevelRequirementRepository(ABC):
     ) -> CourseLevelRequirement | None:
         """Get requirement by community and course."""
 
+    @abstractmethod
+    async def list_by_community_and_courses(
+        self, community_id: UUID, course_ids: list[UUID]
+    ) -> list[CourseLevelRequirement]:
+        """Get the requirements of several courses in one query (courses without one are omitted)."""
+
     @abstractmethod
     async def delete(self, community_id: UUID, course_id: UUID) -> None:
         """Delete a course level requirement."""
@@ -2,10 +2,12 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from src.gamification.domain.entities.member_points import MemberPoints
 from src.gamification.domain.value_objects.leaderboard_period import LeaderboardPeriod
+from src.gamification.domain.value_objects.point_source import PointSource
 
 
 @dataclass(frozen=True)
@@ -28,6 +30,25 @@ class LeaderboardResult:
     your_rank: LeaderboardEntry | None
 
 
+@dataclass(frozen=True)
+class PointHistoryEntry:
+    """A single persisted point transaction, as shown in a member's history."""
+
+    id: UUID
+    points: int
+    source: PointSource
+    source_id: UUID
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class PointHistoryCursor:
+    """Keyset position in a point history: entries strictly older than this."""
+
+    created_at: datetime
+    id: UUID
+
+
 class IMemberPointsRepository(ABC):
     """Interface for MemberPoints persistence."""
 
@@ -39,6 +60,9 @@ class IMemberPointsRepository(ABC):
         self, community_id: UUID, user_id: UUID
     ) -> MemberPoints | None: ...
 
+    @abstractmethod
+    async def get_current_level(self, community_id: UUID, user_id: UUID) -> int | None: ...
+
     @abstractmethod
     async def list_by_community(self, community_id: UUID) -> list[MemberPoints]: ...
 
@@ -57,3 +81,12 @@ class IMemberPointsRepository(ABC):
         community_id: UUID,
         limit: int,
     ) -> list[LeaderboardEntry]: ...
+
+    @abstractmethod
+    async def list_point_history(
+        self,
+        community_id: UUID,
+        user_id: UUID,
+        limit: int,
+        before: PointHistoryCursor | None = None,
+    ) -> list[PointHistoryEntry]: ...
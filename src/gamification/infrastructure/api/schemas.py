@@ -97,3 +97,21 @@ class LeaderboardWidgetResponse(BaseModel):
 
     entries: list[LeaderboardEntrySchema]
     last_updated: datetime
+
+
+class PointHistoryEntrySchema(BaseModel):
+    """A single point change in a member's history."""
+
+    id: UUID
+    points: int
+    source: str
+    source_id: UUID
+    created_at: datetime
+
+
+class PointHistoryResponse(BaseModel):
+    """Response for GET /community/points/history (newest first)."""
+
+    items: list[PointHistoryEntrySchema]
+    cursor: str | None
+    has_more: bool
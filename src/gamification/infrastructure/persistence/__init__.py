@@ -1,5 +1,9 @@
 """Gamification persistence implementations."""
 
+from src.gamification.infrastructure.persistence.cached_repositories import (
+    CachedCourseLevelRequirementRepository,
+    CachedLevelConfigRepository,
+)
 from src.gamification.infrastructure.persistence.level_config_repository import (
     SqlAlchemyLevelConfigRepository,
 )
@@ -7,4 +11,9 @@ from src.gamification.infrastructure.persistence.member_points_repository import
     SqlAlchemyMemberPointsRepository,
 )
 
-__all__ = ["SqlAlchemyLevelConfigRepository", "SqlAlchemyMemberPointsRepository"]
+__all__ = [
+    "CachedCourseLevelRequirementRepository",
+    "CachedLevelConfigRepository",
+    "SqlAlchemyLevelConfigRepository",
+    "SqlAlchemyMemberPointsRepository",
+]
@@ -0,0 +1,104 @@
+"""Read-through cached decorators for gamification reference data.
+
+Level configurations and course level requirements are read on every point
+award and access check but only change through admin commands. Writes go
+through the wrapped repository and invalidate the cache entry on commit.
+After a write, the wrapper bypasses the cache for the rest of its session so
+uncommitted state is never published to other requests.
+"""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.gamification.domain.entities.course_level_requirement import CourseLevelRequirement
+from src.gamification.domain.entities.level_configuration import LevelConfiguration
+from src.gamification.domain.repositories import (
+    ICourseLevelRequirementRepository,
+    ILevelConfigRepository,
+)
+from src.shared.infrastructure.reference_cache import ReferenceDataCache, reference_cache
+
+LEVEL_CONFIG_NAMESPACE = "gamification.level_config"
+COURSE_REQUIREMENT_NAMESPACE = "gamification.course_level_requirement"
+
+
+class CachedLevelConfigRepository(ILevelConfigRepository):
+    """ILevelConfigRepository decorator backed by the reference data cache."""
+
+    def __init__(
+        self,
+        inner: ILevelConfigRepository,
+        session: AsyncSession | None = None,
+        cache: ReferenceDataCache = reference_cache,
+    ) -> None:
+        self._inner = inner
+        self._session = session
+        self._cache = cache
+        self._dirty = False
+
+    async def get_by_community(self, community_id: UUID) -> LevelConfiguration | None:
+        if self._dirty:
+            return await self._inner.get_by_community(community_id)
+        return await self._cache.get_or_load(
+            LEVEL_CONFIG_NAMESPACE,
+            str(community_id),
+            lambda: self._inner.get_by_community(community_id),
+        )
+
+    async def save(self, config: LevelConfiguration) -> None:
+        await self._inner.save(config)
+        self._dirty = True
+        await self._cache.invalidate_on_commit(
+            self._session, LEVEL_CONFIG_NAMESPACE, str(config.community_id)
+        )
+
+
+class CachedCourseLevelRequirementRepository(ICourseLevelRequirementRepository):
+    """ICourseLevelRequirementRepository decorator backed by the reference data cache."""
+
+    def __init__(
+        self,
+        inner: ICourseLevelRequirementRepository,
+        session: AsyncSession | None = None,
+        cache: ReferenceDataCache = reference_cache,
+    ) -> None:
+        self._inner = inner
+        self._session = session
+        self._cache = cache
+        self._dirty = False
+
+    async def save(self, requirement: CourseLevelRequirement) -> None:
+        await self._inner.save(requirement)
+        await self._invalidate(requirement.community_id, requirement.course_id)
+
+    async def get_by_community_and_course(
+        self, community_id: UUID, course_id: UUID
+    ) -> CourseLevelRequirement | None:
+        if self._dirty:
+            return await self._inner.get_by_community_and_course(community_id, course_id)
+        return await self._cache.get_or_load(
+            COURSE_REQUIREMENT_NAMESPACE,
+            _requirement_key(community_id, course_id),
+            lambda: self._inner.get_by_community_and_course(community_id, course_id),
+        )
+
+    async def list_by_community_and_courses(
+        self, community_id: UUID, course_ids: list[UUID]
+    ) -> list[CourseLevelRequirement]:
+        # Batch reads are already a single query; serve them uncached
+        return await self._inner.list_by_community_and_courses(community_id, course_ids)
+
+    async def delete(self, community_id: UUID, course_id: UUID) -> None:
+        await self._inner.delete(community_id, course_id)
+        await self._invalidate(community_id, course_id)
+
+    async def _invalidate(self, community_id: UUID, course_id: UUID) -> None:
+        self._dirty = True
+        await self._cache.invalidate_on_commit(
+            self._session, COURSE_REQUIREMENT_NAMESPACE, _requirement_key(community_id, course_id)
+        )
+
+
+def _requirement_key(community_id: UUID, course_id: UUID) -> str:
+    return f"{community_id}:{course_id}"
@@ -47,6 +47,18 @@ class SqlAlchemyCourseLevelRequirementRepository(ICourseLevelRequirementReposito
             return None
         return self._to_entity(model)
 
+    async def list_by_community_and_courses(
+        self, community_id: UUID, course_ids: list[UUID]
+    ) -> list[CourseLevelRequirement]:
+        if not course_ids:
+            return []
+        stmt = select(CourseLevelRequirementModel).where(
+            CourseLevelRequirementModel.community_id == community_id,
+            CourseLevelRequirementModel.course_id.in_(course_ids),
+        )
+        result = await self._session.execute(stmt)
+        return [self._to_entity(m) for m in result.scalars().all()]
+
     async def delete(self, community_id: UUID, course_id: UUID) -> None:
         stmt = select(CourseLevelRequirementModel).where(
             CourseLevelRequirementModel.community_id == community_id,
@@ -5,107 +5,199 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, text
+from sqlalchemy import select, text, tuple_
 from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.gamification.domain.entities.member_points import MemberPoints
 from src.gamification.domain.repositories.member_points_repository import (
     IMemberPointsRepository,
     LeaderboardEntry,
     LeaderboardResult,
+    PointHistoryCursor,
+    PointHistoryEntry,
 )
 from src.gamification.domain.value_objects.leaderboard_period import LeaderboardPeriod
 from src.gamification.domain.value_objects.point_source import PointSource
 from src.gamification.domain.value_objects.point_transaction import PointTransaction
 from src.gamification.infrastructure.persistence.models import (
+    LessonPointAwardModel,
     MemberPointsModel,
     PointTransactionModel,
 )
 
+_SOURCES_BY_NAME: dict[str, PointSource] = {ps.source_name: ps for ps in PointSource}
+
 
 class SqlAlchemyMemberPointsRepository(IMemberPointsRepository):
-    """SQLAlchemy implementation of IMemberPointsRepository."""
+    """SQLAlchemy implementation of IMemberPointsRepository.
+
+    point_transactions is a partitioned, append-only log, so aggregates are
+    loaded without it: only the lesson award history needed for lesson
+    deduplication is read back (from lesson_point_awards). Saving appends the
+    transactions recorded since the aggregate was loaded.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        # Number of transactions already persisted, per aggregate loaded or saved here
+        self._persisted_counts: dict[UUID, int] = {}
 
     async def save(self, member_points: MemberPoints) -> None:
         existing = await self._session.get(MemberPointsModel, member_points.id)
 
         if existing is None:
-            model = MemberPointsModel(
-                id=member_points.id,
-                community_id=member_points.community_id,
-                user_id=member_points.user_id,
-                total_points=member_points.total_points,
-                current_level=member_points.current_level,
-            )
-            # Add transactions
-            for txn in member_points.transactions:
-                model.transactions.append(
-                    PointTransactionModel(
-                        points=txn.points,
-                        source=txn.source.source_name,
-                        source_id=txn.source_id,
-                        created_at=txn.created_at,
-                    )
+            self._session.add(
+                MemberPointsModel(
+                    id=member_points.id,
+                    community_id=member_points.community_id,
+                    user_id=member_points.user_id,
+                    total_points=member_points.total_points,
+                    current_level=member_points.current_level,
                 )
-            self._session.add(model)
+            )
+            # Lesson awards reference the row without an ORM relationship
+            await self._session.flush()
         else:
             existing.total_points = member_points.total_points
             existing.current_level = member_points.current_level
-            # Add only NEW transactions (those not yet persisted)
-            existing_txn_count = len(existing.transactions)
-            for txn in member_points.transactions[existing_txn_count:]:
-                existing.transactions.append(
-                    PointTransactionModel(
-                        points=txn.points,
-                        source=txn.source.source_name,
-                        source_id=txn.source_id,
+
+        # Add only NEW transactions (those not yet persisted)
+        persisted = self._persisted_counts.get(member_points.id, 0)
+        for txn in member_points.transactions[persisted:]:
+            self._session.add(
+                PointTransactionModel(
+                    member_points_id=member_points.id,
+                    points=txn.points,
+                    source=txn.source.source_name,
+                    source_id=txn.source_id,
+                    created_at=txn.created_at,
+                )
+            )
+            if txn.source == PointSource.LESSON_COMPLETED and txn.points > 0:
+                self._session.add(
+                    LessonPointAwardModel(
+                        member_points_id=member_points.id,
+                        lesson_id=txn.source_id,
                         created_at=txn.created_at,
                     )
                 )
+        self._persisted_counts[member_points.id] = len(member_points.transactions)
 
         await self._session.flush()
 
     async def get_by_community_and_user(
         self, community_id: UUID, user_id: UUID
     ) -> MemberPoints | None:
-        stmt = (
-            select(MemberPointsModel)
-            .where(
-                MemberPointsModel.community_id == community_id,
-                MemberPointsModel.user_id == user_id,
-            )
-            .options(selectinload(MemberPointsModel.transactions))
+        stmt = select(MemberPointsModel).where(
+            MemberPointsModel.community_id == community_id,
+            MemberPointsModel.user_id == user_id,
         )
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         if model is None:
             return None
-        return self._to_entity(model)
+        awards = await self._load_lesson_awards([model.id])
+        return self._to_entity(model, awards.get(model.id, []))
+
+    async def get_current_level(self, community_id: UUID, user_id: UUID) -> int | None:
+        stmt = select(MemberPointsModel.current_level).where(
+            MemberPointsModel.community_id == community_id,
+            MemberPointsModel.user_id == user_id,
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def list_by_community(self, community_id: UUID) -> list[MemberPoints]:
+        stmt = select(MemberPointsModel).where(MemberPointsModel.community_id == community_id)
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        awards = await self._load_lesson_awards([m.id for m in models])
+        return [self._to_entity(m, awards.get(m.id, [])) for m in models]
+
+    async def list_point_history(
+        self,
+        community_id: UUID,
+        user_id: UUID,
+        limit: int,
+        before: PointHistoryCursor | None = None,
+    ) -> list[PointHistoryEntry]:
+        """List a member's transactions newest first, starting after a keyset cursor.
+
+        Reads ix_point_transactions_member_created (member, created_at, id) in
+        order, so each page costs O(limit) regardless of how long the history
+        is. Compacted
+        months are no longer in point_transactions and end the history.
+        """
+        # A scalar member lookup (rather than a join) lets the planner merge the
+        # per-partition index scans in order and stop after `limit` rows
+        member_points_id = (
+            select(MemberPointsModel.id)
+            .where(
+                MemberPointsModel.community_id == community_id,
+                MemberPointsModel.user_id == user_id,
+            )
+            .scalar_subquery()
+        )
         stmt = (
-            select(MemberPointsModel)
-            .where(MemberPointsModel.community_id == community_id)
-            .options(selectinload(MemberPointsModel.transactions))
+            select(
+                PointTransactionModel.id,
+                PointTransactionModel.points,
+                PointTransactionModel.source,
+                PointTransactionModel.source_id,
+                PointTransactionModel.created_at,
+            )
+            .where(PointTransactionModel.member_points_id == member_points_id)
+            .order_by(PointTransactionModel.created_at.desc(), PointTransactionModel.id.desc())
+            .limit(limit)
         )
+        if before is not None:
+            stmt = stmt.where(
+                # The plain created_at bound gives the index range and partition pruning
+                PointTransactionModel.created_at <= before.created_at,
+                tuple_(PointTransactionModel.created_at, PointTransactionModel.id)
+                < tuple_(before.created_at, before.id),
+            )
         result = await self._session.execute(stmt)
-        return [self._to_entity(m) for m in result.scalars().all()]
-
-    def _to_entity(self, model: MemberPointsModel) -> MemberPoints:
-        transactions = [
-            PointTransaction(
-                points=t.points,
-                source=self._source_name_to_enum(t.source),
-                source_id=t.source_id,
-                created_at=t.created_at,
+        return [
+            PointHistoryEntry(
+                id=row.id,
+                points=row.points,
+                source=self._source_name_to_enum(row.source),
+                source_id=row.source_id,
+                created_at=row.created_at,
             )
-            for t in model.transactions
+            for row in result
         ]
+
+    async def _load_lesson_awards(
+        self, member_points_ids: list[UUID]
+    ) -> dict[UUID, list[PointTransaction]]:
+        """Load lesson awards as transactions, keyed by member_points ID."""
+        if not member_points_ids:
+            return {}
+        stmt = (
+            select(LessonPointAwardModel)
+            .where(LessonPointAwardModel.member_points_id.in_(member_points_ids))
+            .order_by(LessonPointAwardModel.created_at)
+        )
+        result = await self._session.execute(stmt)
+        awards: dict[UUID, list[PointTransaction]] = {}
+        for award in result.scalars().all():
+            awards.setdefault(award.member_points_id, []).append(
+                PointTransaction(
+                    points=PointSource.LESSON_COMPLETED.points,
+                    source=PointSource.LESSON_COMPLETED,
+                    source_id=award.lesson_id,
+                    created_at=award.created_at,
+                )
+            )
+        return awards
+
+    def _to_entity(
+        self, model: MemberPointsModel, transactions: list[PointTransaction]
+    ) -> MemberPoints:
+        self._persisted_counts[model.id] = len(transactions)
         return MemberPoints(
             id=model.id,
             community_id=model.community_id,
@@ -138,6 +230,8 @@ class SqlAlchemyMemberPointsRepository(IMemberPointsRepository):
         assert period.interval_hours is not None
         cutoff = datetime.now(UTC) - timedelta(hours=period.interval_hours)
 
+        # The created_at predicate lets the planner prune point_transactions
+        # partitions outside the window
         sql = text("""
             WITH period_points AS (
                 SELECT
@@ -229,6 +323,8 @@ class SqlAlchemyMemberPointsRepository(IMemberPointsRepository):
         """Get a compact 30-day leaderboard widget (top N, no your_rank)."""
         cutoff = datetime.now(UTC) - timedelta(hours=LeaderboardPeriod.THIRTY_DAY.interval_hours)  # type: ignore[arg-type]
 
+        # The created_at predicate lets the planner prune point_transactions
+        # partitions outside the window
         sql = text("""
             WITH period_points AS (
                 SELECT
@@ -318,7 +414,7 @@ class SqlAlchemyMemberPointsRepository(IMemberPointsRepository):
     @staticmethod
     def _source_name_to_enum(source_name: str) -> PointSource:
         """Map source_name string to PointSource enum."""
-        for ps in PointSource:
-            if ps.source_name == source_name:
-                return ps
-        raise ValueError(f"Unknown point source: {source_name}")
+        try:
+            return _SOURCES_BY_NAME[source_name]
+        except KeyError:
+            raise ValueError(f"Unknown point source: {source_name}") from None
@@ -5,6 +5,7 @@ from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
+    DDL,
     DateTime,
     ForeignKey,
     Index,
@@ -12,6 +13,7 @@ from sqlalchemy import (
     SmallInteger,
     String,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
@@ -52,7 +54,13 @@ class MemberPointsModel(Base):
 
 
 class PointTransactionModel(Base):
-    """Append-only audit log of point changes."""
+    """Append-only audit log of point changes.
+
+    Range-partitioned by month on created_at (see
+    point_transaction_partitions.py). The partition key must be part of the
+    primary key, and queries should filter on created_at so the planner can
+    prune partitions.
+    """
 
     __tablename__ = "point_transactions"
 
@@ -64,13 +72,69 @@ class PointTransactionModel(Base):
     source: Mapped[str] = mapped_column(String(30), nullable=False)
     source_id: Mapped[UUID] = mapped_column(PgUUID(as_uuid=True), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        default=lambda: datetime.now(UTC),
     )
 
     member_points: Mapped["MemberPointsModel"] = relationship(back_populates="transactions")
 
     __table_args__ = (
-        Index("ix_point_transactions_member_created", "member_points_id", created_at.desc()),
+        # id breaks created_at ties so point history can keyset-paginate off the index
+        Index(
+            "ix_point_transactions_member_created",
+            "member_points_id",
+            created_at.desc(),
+            id.desc(),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+# A partitioned table rejects rows without a matching partition. The default
+# partition catches everything until monthly partitions are created, so
+# metadata.create_all() (tests, fresh dev databases) yields a usable table.
+event.listen(
+    PointTransactionModel.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]
+        "CREATE TABLE IF NOT EXISTS point_transactions_default "
+        "PARTITION OF point_transactions DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+class PointTransactionSummaryModel(Base):
+    """Per-member monthly totals folded from compacted point_transactions partitions."""
+
+    __tablename__ = "point_transaction_summaries"
+
+    member_points_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True), ForeignKey("member_points.id"), primary_key=True
+    )
+    period_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    source: Mapped[str] = mapped_column(String(30), primary_key=True)
+    points: Mapped[int] = mapped_column(Integer, nullable=False)
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class LessonPointAwardModel(Base):
+    """One row per lesson a member was awarded points for.
+
+    Lesson deduplication used to scan the member's whole transaction history.
+    This table keeps that invariant after old transaction partitions have
+    been compacted away.
+    """
+
+    __tablename__ = "lesson_point_awards"
+
+    member_points_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True), ForeignKey("member_points.id"), primary_key=True
+    )
+    lesson_id: Mapped[UUID] = mapped_column(PgUUID(as_uuid=True), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
     )
 
 
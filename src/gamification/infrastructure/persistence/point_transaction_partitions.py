@@ -0,0 +1,249 @@
+"""Monthly partition maintenance and compaction for point_transactions.
+
+point_transactions is range-partitioned by calendar month (UTC) on
+created_at, with a DEFAULT partition catching rows outside any monthly range.
+
+- ensure_partitions() creates upcoming monthly partitions, moving rows that
+  already landed in the DEFAULT partition into the new partition.
+- compact() folds months that lie entirely outside the longest leaderboard
+  window into point_transaction_summaries and drops their partitions, so
+  leaderboard queries and vacuum only ever touch recent history.
+
+Run periodically (e.g. daily from cron):
+
+    python -m src.gamification.infrastructure.persistence.point_transaction_partitions ensure
+    python -m src.gamification.infrastructure.persistence.point_transaction_partitions compact
+"""
+
+import argparse
+import asyncio
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.gamification.domain.value_objects.leaderboard_period import LeaderboardPeriod
+
+logger = structlog.get_logger()
+
+PARENT_TABLE = "point_transactions"
+DEFAULT_PARTITION = "point_transactions_default"
+
+# Extra slack past the longest leaderboard window before a month is compacted
+COMPACTION_MARGIN = timedelta(days=7)
+
+_BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+# Folding more rows into an existing summary adds to it
+_MERGE_SUMMARY = """
+    ON CONFLICT (member_points_id, period_start, source) DO UPDATE SET
+        points = point_transaction_summaries.points + EXCLUDED.points,
+        transaction_count = point_transaction_summaries.transaction_count
+            + EXCLUDED.transaction_count
+"""
+
+
+@dataclass(frozen=True)
+class MonthlyPartition:
+    """An attached monthly partition and its [start, end) range."""
+
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_start(moment: datetime) -> datetime:
+    """Return the first instant (UTC) of the month containing moment."""
+    moment = moment.astimezone(UTC)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(start: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months."""
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(start: datetime) -> str:
+    """Name of the partition holding the month that begins at start."""
+    return f"{PARENT_TABLE}_{start:%Y_%m}"
+
+
+def longest_leaderboard_window() -> timedelta:
+    """The widest time-windowed leaderboard period."""
+    return timedelta(
+        hours=max(p.interval_hours for p in LeaderboardPeriod if p.interval_hours is not None)
+    )
+
+
+def compaction_cutoff(now: datetime, margin: timedelta = COMPACTION_MARGIN) -> datetime:
+    """Months ending at or before this instant are safe to compact."""
+    return month_start(now - longest_leaderboard_window() - margin)
+
+
+class PointTransactionPartitionManager:
+    """Creates, lists and compacts point_transactions partitions."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_partitions(self) -> list[MonthlyPartition]:
+        """Return the attached monthly partitions, oldest first."""
+        result = await self._session.execute(
+            text("""
+                SELECT child.relname AS name,
+                       pg_get_expr(child.relpartbound, child.oid) AS bound
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = :parent
+            """),
+            {"parent": PARENT_TABLE},
+        )
+        partitions: list[MonthlyPartition] = []
+        for row in result:
+            match = _BOUND_PATTERN.search(row.bound)
+            if match is None:
+                continue  # DEFAULT partition
+            partitions.append(
+                MonthlyPartition(
+                    name=row.name,
+                    start=datetime.fromisoformat(match.group(1)),
+                    end=datetime.fromisoformat(match.group(2)),
+                )
+            )
+        return sorted(partitions, key=lambda p: p.start)
+
+    async def ensure_partitions(
+        self, months_ahead: int = 2, now: datetime | None = None
+    ) -> list[str]:
+        """Create monthly partitions from the current month through months_ahead.
+
+        Returns the names of the partitions created.
+        """
+        current = month_start(now or datetime.now(UTC))
+        existing = {p.start for p in await self.list_partitions()}
+        created: list[str] = []
+        for offset in range(months_ahead + 1):
+            start = add_months(current, offset)
+            if start in existing:
+                continue
+            await self._create_partition(start)
+            created.append(partition_name(start))
+        if created:
+            logger.info("point_transaction_partitions_created", partitions=created)
+        return created
+
+    async def _create_partition(self, start: datetime) -> None:
+        # Postgres refuses to attach a range the DEFAULT partition has rows
+        # for, so those rows are moved into the new table before attaching.
+        name = partition_name(start)
+        bounds = {"start": start, "end": add_months(start, 1)}
+        await self._session.execute(
+            text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)")
+        )
+        await self._session.execute(
+            text(f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE created_at >= :start AND created_at < :end
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+            """),
+            bounds,
+        )
+        await self._session.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{bounds['start'].isoformat()}') "
+                f"TO ('{bounds['end'].isoformat()}')"
+            )
+        )
+
+    async def compact(self, now: datetime | None = None) -> list[str]:
+        """Fold months older than the leaderboard windows into summaries.
+
+        Each eligible monthly partition is aggregated into
+        point_transaction_summaries (per member, month and source) and then
+        detached and dropped. Stray rows of the same age in the DEFAULT
+        partition are folded the same way. Returns the dropped partition names.
+        """
+        cutoff = compaction_cutoff(now or datetime.now(UTC))
+        compacted: list[str] = []
+        for partition in await self.list_partitions():
+            if partition.end > cutoff:
+                continue
+            await self._session.execute(
+                text(f"""
+                    INSERT INTO point_transaction_summaries
+                        (member_points_id, period_start, source, points, transaction_count)
+                    SELECT member_points_id, :period_start, source, SUM(points), COUNT(*)
+                    FROM {partition.name}
+                    GROUP BY member_points_id, source
+                    {_MERGE_SUMMARY}
+                """),
+                {"period_start": partition.start},
+            )
+            await self._session.execute(
+                text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}")
+            )
+            await self._session.execute(text(f"DROP TABLE {partition.name}"))
+            compacted.append(partition.name)
+
+        await self._session.execute(
+            text(f"""
+                WITH folded AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE created_at < :cutoff
+                    RETURNING member_points_id, source, points, created_at
+                )
+                INSERT INTO point_transaction_summaries
+                    (member_points_id, period_start, source, points, transaction_count)
+                SELECT member_points_id,
+                       date_trunc('month', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+                       source, SUM(points), COUNT(*)
+                FROM folded
+                GROUP BY 1, 2, 3
+                {_MERGE_SUMMARY}
+            """),
+            {"cutoff": cutoff},
+        )
+        if compacted:
+            logger.info(
+                "point_transaction_partitions_compacted",
+                partitions=compacted,
+                cutoff=cutoff.isoformat(),
+            )
+        return compacted
+
+
+async def _run(command: str, months_ahead: int) -> None:
+    from src.identity.interface.api.dependencies import get_database
+
+    database = get_database()
+    try:
+        async with database.session() as session:
+            manager = PointTransactionPartitionManager(session)
+            if command == "ensure":
+                names = await manager.ensure_partitions(months_ahead=months_ahead)
+            else:
+                names = await manager.compact()
+        logger.info("point_transaction_partitions_command_done", command=command, partitions=names)
+    finally:
+        await database.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("command", choices=["ensure", "compact"])
+    parser.add_argument("--months-ahead", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(_run(args.command, args.months_ahead))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 """FastAPI dependencies for Gamification context."""
 
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
 
+from src.community.infrastructure.persistence.models import CommunityModel
 from src.gamification.application.commands.award_points import AwardPointsHandler
 from src.gamification.application.commands.deduct_points import DeductPointsHandler
 from src.gamification.application.commands.set_course_level_requirement import (
@@ -11,10 +14,18 @@ from src.gamification.application.commands.set_course_level_requirement import (
 )
 from src.gamification.application.commands.update_level_config import UpdateLevelConfigHandler
 from src.gamification.application.queries.check_course_access import CheckCourseAccessHandler
+from src.gamification.application.queries.check_course_access_batch import (
+    CheckCourseAccessBatchHandler,
+)
 from src.gamification.application.queries.get_leaderboard_widget import GetLeaderboardWidgetHandler
 from src.gamification.application.queries.get_leaderboards import GetLeaderboardsHandler
 from src.gamification.application.queries.get_level_definitions import GetLevelDefinitionsHandler
 from src.gamification.application.queries.get_member_level import GetMemberLevelHandler
+from src.gamification.application.queries.get_point_history import GetPointHistoryHandler
+from src.gamification.infrastructure.persistence.cached_repositories import (
+    CachedCourseLevelRequirementRepository,
+    CachedLevelConfigRepository,
+)
 from src.gamification.infrastructure.persistence.course_level_requirement_repository import (
     SqlAlchemyCourseLevelRequirementRepository,
 )
@@ -27,26 +38,43 @@ from src.gamification.infrastructure.persistence.member_points_repository import
 from src.identity.interface.api.dependencies import SessionDep
 
 
+async def get_default_community_id(session: SessionDep) -> UUID:
+    """Get the default community ID (first community by creation date)."""
+    result = await session.execute(
+        select(CommunityModel.id).order_by(CommunityModel.created_at).limit(1)
+    )
+    community_id = result.scalar_one_or_none()
+    if community_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="No community found",
+        )
+    return community_id
+
+
+DefaultCommunityIdDep = Annotated[UUID, Depends(get_default_community_id)]
+
+
 def get_member_points_repo(session: SessionDep) -> SqlAlchemyMemberPointsRepository:
     """Get member points repository."""
     return SqlAlchemyMemberPointsRepository(session)
 
 
-def get_level_config_repo(session: SessionDep) -> SqlAlchemyLevelConfigRepository:
-    """Get level config repository."""
-    return SqlAlchemyLevelConfigRepository(session)
+def get_level_config_repo(session: SessionDep) -> CachedLevelConfigRepository:
+    """Get level config repository (served from the reference cache)."""
+    return CachedLevelConfigRepository(SqlAlchemyLevelConfigRepository(session), session=session)
 
 
-def get_course_req_repo(session: SessionDep) -> SqlAlchemyCourseLevelRequirementRepository:
-    """Get course level requirement repository."""
-    return SqlAlchemyCourseLevelRequirementRepository(session)
+def get_course_req_repo(session: SessionDep) -> CachedCourseLevelRequirementRepository:
+    """Get course level requirement repository (served from the reference cache)."""
+    return CachedCourseLevelRequirementRepository(
+        SqlAlchemyCourseLevelRequirementRepository(session), session=session
+    )
 
 
 MemberPointsRepoDep = Annotated[SqlAlchemyMemberPointsRepository, Depends(get_member_points_repo)]
-LevelConfigRepoDep = Annotated[SqlAlchemyLevelConfigRepository, Depends(get_level_config_repo)]
-CourseReqRepoDep = Annotated[
-    SqlAlchemyCourseLevelRequirementRepository, Depends(get_course_req_repo)
-]
+LevelConfigRepoDep = Annotated[CachedLevelConfigRepository, Depends(get_level_config_repo)]
+CourseReqRepoDep = Annotated[CachedCourseLevelRequirementRepository, Depends(get_course_req_repo)]
 
 
 def get_get_member_level_handler(
@@ -84,6 +112,17 @@ def get_check_course_access_handler(
     )
 
 
+def get_check_course_access_batch_handler(
+    cr_repo: CourseReqRepoDep,
+    mp_repo: MemberPointsRepoDep,
+    lc_repo: LevelConfigRepoDep,
+) -> CheckCourseAccessBatchHandler:
+    """Get batch course access query handler."""
+    return CheckCourseAccessBatchHandler(
+        course_req_repo=cr_repo, member_points_repo=mp_repo, level_config_repo=lc_repo
+    )
+
+
 def get_set_course_level_requirement_handler(
     cr_repo: CourseReqRepoDep,
     mp_repo: MemberPointsRepoDep,
@@ -109,6 +148,13 @@ def get_get_leaderboard_widget_handler(
     return GetLeaderboardWidgetHandler(member_points_repo=mp_repo)
 
 
+def get_get_point_history_handler(
+    mp_repo: MemberPointsRepoDep,
+) -> GetPointHistoryHandler:
+    """Get point history query handler."""
+    return GetPointHistoryHandler(member_points_repo=mp_repo)
+
+
 def get_award_handler(
     mp_repo: MemberPointsRepoDep,
     lc_repo: LevelConfigRepoDep,
@@ -4,16 +4,13 @@ from typing import Annotated, Any
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from src.community.domain.repositories import IMemberRepository
 from src.community.domain.value_objects import CommunityId, MemberRole
-from src.community.infrastructure.persistence import SqlAlchemyMemberRepository
-from src.community.infrastructure.persistence.models import CommunityModel
 from src.community.interface.api.dependencies import (
     CurrentUserIdDep,
     MemberRepositoryDep,
-    SessionDep,
 )
 from src.gamification.application.commands.set_course_level_requirement import (
     SetCourseLevelRequirementCommand,
@@ -45,6 +42,11 @@ from src.gamification.application.queries.get_member_level import (
     GetMemberLevelHandler,
     GetMemberLevelQuery,
 )
+from src.gamification.application.queries.get_point_history import (
+    GetPointHistoryHandler,
+    GetPointHistoryQuery,
+    PointHistoryResult,
+)
 from src.gamification.domain.exceptions import (
     GamificationDomainError,
     InvalidLevelNameError,
@@ -59,15 +61,19 @@ from src.gamification.infrastructure.api.schemas import (
     LevelDefinitionSchema,
     LevelDefinitionsResponse,
     MemberLevelResponse,
+    PointHistoryEntrySchema,
+    PointHistoryResponse,
     SetCourseLevelRequirementRequest,
     UpdateLevelConfigRequest,
 )
 from src.gamification.interface.api.dependencies import (
+    DefaultCommunityIdDep,
     get_check_course_access_handler,
     get_get_leaderboard_widget_handler,
     get_get_leaderboards_handler,
     get_get_level_definitions_handler,
     get_get_member_level_handler,
+    get_get_point_history_handler,
     get_set_course_level_requirement_handler,
     get_update_level_config_handler,
 )
@@ -81,25 +87,8 @@ router = APIRouter(prefix="/communities", tags=["Gamification"])
 default_router = APIRouter(prefix="/community", tags=["Gamification"])
 
 
-async def _get_default_community_id(session: SessionDep) -> UUID:
-    """Get the default community ID (first community by creation date)."""
-    result = await session.execute(
-        select(CommunityModel.id).order_by(CommunityModel.created_at).limit(1)
-    )
-    community_id = result.scalar_one_or_none()
-    if community_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="No community found",
-        )
-    return community_id
-
-
-DefaultCommunityIdDep = Annotated[UUID, Depends(_get_default_community_id)]
-
-
 async def _require_admin(
-    member_repo: SqlAlchemyMemberRepository,
+    member_repo: IMemberRepository,
     community_id: UUID,
     user_id: UUID,
 ) -> None:
@@ -375,7 +364,7 @@ def _map_period(period_result: LeaderboardPeriodResult) -> LeaderboardPeriodSche
 
 
 async def _require_membership(
-    member_repo: SqlAlchemyMemberRepository,
+    member_repo: IMemberRepository,
     community_id: UUID,
     user_id: UUID,
 ) -> None:
@@ -499,3 +488,67 @@ async def get_leaderboard_widget_default(
         entries=_map_widget(result.entries),
         last_updated=result.last_updated,
     )
+
+
+# ============================================================================
+# Point History
+# ============================================================================
+
+
+def _map_point_history(result: PointHistoryResult) -> PointHistoryResponse:
+    return PointHistoryResponse(
+        items=[
+            PointHistoryEntrySchema(
+                id=e.id,
+                points=e.points,
+                source=e.source.source_name,
+                source_id=e.source_id,
+                created_at=e.created_at,
+            )
+            for e in result.entries
+        ],
+        cursor=result.cursor,
+        has_more=result.has_more,
+    )
+
+
+@router.get(
+    "/{community_id}/points/history",
+    response_model=PointHistoryResponse,
+)
+async def get_point_history(
+    community_id: UUID,
+    current_user_id: CurrentUserIdDep,
+    handler: Annotated[GetPointHistoryHandler, Depends(get_get_point_history_handler)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: str | None = None,
+) -> PointHistoryResponse:
+    """Get the current user's point transactions, newest first."""
+    query = GetPointHistoryQuery(
+        community_id=community_id,
+        user_id=current_user_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    return _map_point_history(await handler.handle(query))
+
+
+@default_router.get(
+    "/points/history",
+    response_model=PointHistoryResponse,
+)
+async def get_point_history_default(
+    community_id: DefaultCommunityIdDep,
+    current_user_id: CurrentUserIdDep,
+    handler: Annotated[GetPointHistoryHandler, Depends(get_get_point_history_handler)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: str | None = None,
+) -> PointHistoryResponse:
+    """Get the current user's point transactions, newest first (auto-resolves community)."""
+    query = GetPointHistoryQuery(
+        community_id=community_id,
+        user_id=current_user_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    return _map_point_history(await handler.handle(query))
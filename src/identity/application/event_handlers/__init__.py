@@ -0,0 +1 @@
+"""Event handlers for identity read models."""
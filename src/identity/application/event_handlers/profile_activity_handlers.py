@@ -0,0 +1,99 @@
+"""Keep profile contribution counters and the activity index current.
+
+Each handler applies one community event in its own session. A failed update
+is logged and leaves profile stats behind until the next rebuild (see
+profile_activity_repository).
+"""
+
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+from src.community.domain.events import (
+    CommentAdded,
+    CommentDeleted,
+    CommentEdited,
+    PostCreated,
+    PostDeleted,
+    PostEdited,
+)
+from src.identity.domain.repositories import IProfileActivityRepository
+from src.identity.infrastructure.persistence.profile_activity_repository import (
+    SqlAlchemyProfileActivityRepository,
+)
+
+logger = structlog.get_logger()
+
+
+async def _apply(
+    event_name: str,
+    update: Callable[[IProfileActivityRepository], Awaitable[None]],
+) -> None:
+    from src.identity.interface.api.dependencies import get_database
+
+    db = get_database()
+    session = db._session_factory()  # noqa: SLF001
+    try:
+        await update(SqlAlchemyProfileActivityRepository(session))
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        logger.exception("identity.profile_activity_update_failed", event_type=event_name)
+    finally:
+        await session.close()
+
+
+async def handle_post_created(event: PostCreated) -> None:
+    """Index and count a new post."""
+    await _apply(
+        event.event_type,
+        lambda repo: repo.record_post(
+            post_id=event.post_id.value,
+            community_id=event.community_id.value,
+            author_id=event.author_id,
+            title=event.title,
+            content=event.content,
+            created_at=event.occurred_at,
+        ),
+    )
+
+
+async def handle_comment_added(event: CommentAdded) -> None:
+    """Index and count a new comment."""
+    await _apply(
+        event.event_type,
+        lambda repo: repo.record_comment(
+            comment_id=event.comment_id.value,
+            post_id=event.post_id.value,
+            community_id=event.community_id.value,
+            author_id=event.author_id,
+            content=event.content,
+            created_at=event.occurred_at,
+        ),
+    )
+
+
+async def handle_post_deleted(event: PostDeleted) -> None:
+    """Drop a deleted post and the comments on it."""
+    await _apply(event.event_type, lambda repo: repo.remove_post(event.post_id.value))
+
+
+async def handle_comment_deleted(event: CommentDeleted) -> None:
+    """Drop a deleted comment."""
+    await _apply(event.event_type, lambda repo: repo.remove_comment(event.comment_id.value))
+
+
+async def handle_post_edited(event: PostEdited) -> None:
+    """Replace an edited post's title and preview with the edited values."""
+    await _apply(
+        event.event_type,
+        lambda repo: repo.update_post(event.post_id.value, event.title, event.content),
+    )
+
+
+async def handle_comment_edited(event: CommentEdited) -> None:
+    """Replace an edited comment's preview with the edited content."""
+    await _apply(
+        event.event_type,
+        lambda repo: repo.update_comment(event.comment_id.value, event.content),
+    )
@@ -55,7 +55,7 @@ class LoginHandler:
             raise InvalidCredentialsError()
 
         # Verify password
-        if not self._password_hasher.verify(command.password, user.hashed_password):
+        if not await self._password_hasher.verify(command.password, user.hashed_password):
             logger.warning("login_wrong_password", email=command.email)
             raise InvalidCredentialsError()
 
@@ -71,6 +71,11 @@ class LoginHandler:
 
         # Record login
         user.record_login()
+
+        # Upgrade hashes made with older parameters while the plaintext is at hand
+        if self._password_hasher.needs_rehash(user.hashed_password):
+            user.upgrade_password_hash(await self._password_hasher.hash(command.password))
+            logger.info("login_password_rehashed", user_id=str(user.id))
         await self._user_repository.save(user)
 
         # Publish domain events
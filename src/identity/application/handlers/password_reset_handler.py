@@ -118,8 +118,8 @@ class ResetPasswordHandler:
         # Validate password strength first
         User.validate_password_strength(command.new_password)
 
-        # Get user ID from token
-        user_id = await self._reset_token_repository.get_user_id_by_token(command.token)
+        # Use up the token; a concurrent reset with the same token gets None
+        user_id = await self._reset_token_repository.consume(command.token)
         if user_id is None:
             logger.warning("password_reset_invalid_token")
             raise InvalidTokenError()
@@ -131,15 +131,12 @@ class ResetPasswordHandler:
             raise InvalidTokenError()
 
         # Hash new password
-        hashed_password = self._password_hasher.hash(command.new_password)
+        hashed_password = await self._password_hasher.hash(command.new_password)
 
         # Reset password
         user.reset_password(hashed_password)
         await self._user_repository.save(user)
 
-        # Mark token as used
-        await self._reset_token_repository.mark_as_used(command.token)
-
         # Blacklist all refresh tokens for this user
         await self._refresh_token_repository.blacklist_all_for_user(user_id, USER_BLACKLIST_SECONDS)
 
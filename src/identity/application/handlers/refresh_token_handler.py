@@ -37,20 +37,15 @@ class RefreshTokenHandler:
         """
         logger.info("refresh_token_attempt")
 
-        # Check if token is blacklisted
-        if await self._refresh_token_repository.is_blacklisted(command.refresh_token):
-            logger.warning("refresh_token_blacklisted")
-            raise InvalidTokenError()
-
         # Validate token and get user ID
         user_id = self._token_generator.validate_refresh_token(command.refresh_token)
         if user_id is None:
             logger.warning("refresh_token_invalid")
             raise InvalidTokenError()
 
-        # Check if user's tokens are all blacklisted (password reset)
-        if await self._refresh_token_repository.is_user_blacklisted(user_id):
-            logger.warning("refresh_token_user_blacklisted", user_id=str(user_id))
+        # Check the token (rotation) and the user's tokens (password reset) in one lookup
+        if await self._refresh_token_repository.is_revoked(command.refresh_token, user_id):
+            logger.warning("refresh_token_blacklisted", user_id=str(user_id))
             raise InvalidTokenError()
 
         # Get user to verify they still exist and are active
@@ -60,7 +60,7 @@ class RegisterUserHandler:
             return None
 
         # Hash password
-        hashed_password = self._password_hasher.hash(command.password)
+        hashed_password = await self._password_hasher.hash(command.password)
 
         # Create user
         user = User.register(email=email, hashed_password=hashed_password)
@@ -1,5 +1,7 @@
 """Get profile activity query."""
 
+import base64
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
@@ -7,7 +9,7 @@ from uuid import UUID
 import structlog
 
 from src.identity.domain.exceptions import ProfileNotFoundError
-from src.identity.domain.repositories import IUserRepository
+from src.identity.domain.repositories import ActivityCursor, IProfileActivityRepository
 from src.identity.domain.value_objects import UserId
 
 logger = structlog.get_logger()
@@ -15,11 +17,12 @@ logger = structlog.get_logger()
 
 @dataclass(frozen=True)
 class ActivityItem:
-    """Single activity item (placeholder for Community feature)."""
+    """Single activity item: one of the user's posts or comments."""
 
     id: str
-    type: str  # "post", "comment", "like", etc.
-    content: str
+    type: str  # "post" or "comment"
+    title: str | None  # Posts only
+    content: str  # Preview of the content
     created_at: datetime
 
 
@@ -29,6 +32,8 @@ class ProfileActivity:
 
     items: list[ActivityItem]
     total_count: int
+    cursor: str | None
+    has_more: bool
 
 
 @dataclass(frozen=True)
@@ -37,34 +42,76 @@ class GetProfileActivityQuery:
 
     user_id: UUID
     limit: int = 20
-    offset: int = 0
+    cursor: str | None = None
 
 
 class GetProfileActivityHandler:
     """Handler for getting user profile activity."""
 
-    def __init__(self, user_repository: IUserRepository) -> None:
+    def __init__(self, activity_repository: IProfileActivityRepository) -> None:
         """Initialize with dependencies."""
-        self._user_repository = user_repository
+        self._activity_repository = activity_repository
 
     async def handle(self, query: GetProfileActivityQuery) -> ProfileActivity:
         """
-        Handle getting user profile activity.
+        Handle getting user profile activity, newest first.
 
-        Raises ProfileNotFoundError if user doesn't exist.
+        Pages are keyset-based: the returned cursor points after the last
+        item, so deep pages cost the same as the first one.
 
-        NOTE: Returns empty activity until Community feature is implemented.
+        Raises ProfileNotFoundError if user doesn't exist.
         """
         logger.debug("get_profile_activity", user_id=str(query.user_id))
 
-        # Verify user exists
         user_id = UserId(value=query.user_id)
-        user = await self._user_repository.get_by_id(user_id)
+        summary = await self._activity_repository.get_summary(user_id)
 
-        if user is None:
+        if summary is None:
             logger.error("get_profile_activity_user_not_found", user_id=str(query.user_id))
             raise ProfileNotFoundError(str(query.user_id))
 
-        # TODO: Once Community feature exists, query posts, comments, likes
-        # For now, return empty activity
-        return ProfileActivity(items=[], total_count=0)
+        limit = max(1, min(query.limit, 100))
+        entries = await self._activity_repository.list_activity(
+            user_id, limit + 1, after=_decode_cursor(query.cursor)
+        )
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+
+        next_cursor: str | None = None
+        if has_more:
+            last = entries[-1]
+            next_cursor = base64.b64encode(
+                json.dumps(
+                    {"created_at": last.created_at.isoformat(), "ref_id": str(last.ref_id)}
+                ).encode()
+            ).decode()
+
+        return ProfileActivity(
+            items=[
+                ActivityItem(
+                    id=str(entry.ref_id),
+                    type=entry.kind,
+                    title=entry.title,
+                    content=entry.preview,
+                    created_at=entry.created_at,
+                )
+                for entry in entries
+            ],
+            total_count=summary.contribution_count,
+            cursor=next_cursor,
+            has_more=has_more,
+        )
+
+
+def _decode_cursor(cursor: str | None) -> ActivityCursor | None:
+    """Decode a cursor from a previous page; an invalid one starts from the top."""
+    if cursor is None:
+        return None
+    try:
+        data = json.loads(base64.b64decode(cursor).decode())
+        return ActivityCursor(
+            created_at=datetime.fromisoformat(data["created_at"]),
+            ref_id=UUID(data["ref_id"]),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
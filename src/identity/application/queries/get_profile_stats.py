@@ -7,7 +7,7 @@ from uuid import UUID
 import structlog
 
 from src.identity.domain.exceptions import ProfileNotFoundError
-from src.identity.domain.repositories import IUserRepository
+from src.identity.domain.repositories import IProfileActivityRepository
 from src.identity.domain.value_objects import UserId
 
 logger = structlog.get_logger()
@@ -39,30 +39,28 @@ class GetProfileStatsQuery:
 class GetProfileStatsHandler:
     """Handler for getting user profile statistics."""
 
-    def __init__(self, user_repository: IUserRepository) -> None:
+    def __init__(self, activity_repository: IProfileActivityRepository) -> None:
         """Initialize with dependencies."""
-        self._user_repository = user_repository
+        self._activity_repository = activity_repository
 
     async def handle(self, query: GetProfileStatsQuery) -> ProfileStats:
         """
         Handle getting user profile statistics.
 
-        Raises ProfileNotFoundError if user doesn't exist.
+        Contributions are the user's live posts and comments across all
+        communities, read from precomputed counters.
 
-        NOTE: Returns zero contributions until Community feature is implemented.
+        Raises ProfileNotFoundError if user doesn't exist.
         """
         logger.debug("get_profile_stats", user_id=str(query.user_id))
 
-        user_id = UserId(value=query.user_id)
-        user = await self._user_repository.get_by_id(user_id)
+        summary = await self._activity_repository.get_summary(UserId(value=query.user_id))
 
-        if user is None:
+        if summary is None:
             logger.error("get_profile_stats_user_not_found", user_id=str(query.user_id))
             raise ProfileNotFoundError(str(query.user_id))
 
-        # TODO: Once Community feature exists, count posts, comments, likes
-        # For now, return zero contributions
         return ProfileStats(
-            contribution_count=0,
-            joined_at=user.created_at,
+            contribution_count=summary.contribution_count,
+            joined_at=summary.joined_at,
         )
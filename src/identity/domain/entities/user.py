@@ -162,6 +162,16 @@ class User:
         self._update_timestamp()
         self._add_event(PasswordReset(user_id=self.id, email=self.email))
 
+    def upgrade_password_hash(self, new_hashed_password: HashedPassword) -> None:
+        """
+        Replace the stored hash with one of the same password made with current parameters.
+
+        Args:
+            new_hashed_password: The re-hashed password
+        """
+        self.hashed_password = new_hashed_password
+        self._update_timestamp()
+
     def complete_profile(
         self,
         display_name: DisplayName,
@@ -151,6 +151,18 @@ class RateLimitExceededError(IdentityDomainError):
         self.retry_after = retry_after
 
 
+class ServiceBusyError(IdentityDomainError):
+    """Raised when a bounded resource (e.g. password hashing) is saturated."""
+
+    def __init__(self, retry_after: int | None = None) -> None:
+        """Initialize with optional retry-after seconds."""
+        super().__init__(
+            message="The service is busy. Please try again shortly.",
+            code="service_busy",
+        )
+        self.retry_after = retry_after
+
+
 class InvalidLocationError(IdentityDomainError):
     """Raised when a location value is invalid."""
 
@@ -1,5 +1,12 @@
 """Identity domain repository interfaces."""
 
+from src.identity.domain.repositories.profile_activity_repository import (
+    ActivityCursor,
+    ActivityEntry,
+    ActivityRebuildResult,
+    ContributionSummary,
+    IProfileActivityRepository,
+)
 from src.identity.domain.repositories.refresh_token_repository import (
     IRefreshTokenRepository,
 )
@@ -10,6 +17,11 @@ from src.identity.domain.repositories.verification_token_repository import (
 )
 
 __all__ = [
+    "ActivityCursor",
+    "ActivityEntry",
+    "ActivityRebuildResult",
+    "ContributionSummary",
+    "IProfileActivityRepository",
     "IRefreshTokenRepository",
     "IResetTokenRepository",
     "IUserRepository",
@@ -0,0 +1,127 @@
+"""Profile activity repository interface.
+
+Profile stats and the activity feed are read from two read models kept
+current from community events: per-(community, user) contribution counters
+and an activity index with one row per live post or comment. Both can be
+rebuilt from the community tables.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.identity.domain.value_objects import UserId
+
+POST = "post"
+COMMENT = "comment"
+
+
+@dataclass(frozen=True)
+class ContributionSummary:
+    """A user's join date and contribution counts across communities."""
+
+    joined_at: datetime
+    post_count: int
+    comment_count: int
+
+    @property
+    def contribution_count(self) -> int:
+        """Posts plus comments."""
+        return self.post_count + self.comment_count
+
+
+@dataclass(frozen=True)
+class ActivityEntry:
+    """One post or comment in a user's activity feed."""
+
+    kind: str  # POST or COMMENT
+    ref_id: UUID
+    post_id: UUID
+    community_id: UUID
+    title: str | None
+    preview: str
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class ActivityCursor:
+    """Keyset position: entries strictly older than this one come next."""
+
+    created_at: datetime
+    ref_id: UUID
+
+
+@dataclass(frozen=True)
+class ActivityRebuildResult:
+    """Row counts written by a rebuild."""
+
+    counters: int
+    entries: int
+
+
+class IProfileActivityRepository(ABC):
+    """Interface for contribution counters and the activity index."""
+
+    @abstractmethod
+    async def record_post(
+        self,
+        post_id: UUID,
+        community_id: UUID,
+        author_id: UserId,
+        title: str,
+        content: str,
+        created_at: datetime,
+    ) -> None:
+        """Index a new post and count it; recording the same post twice is a no-op."""
+        ...
+
+    @abstractmethod
+    async def record_comment(
+        self,
+        comment_id: UUID,
+        post_id: UUID,
+        community_id: UUID,
+        author_id: UserId,
+        content: str,
+        created_at: datetime,
+    ) -> None:
+        """Index a new comment and count it; recording the same comment twice is a no-op."""
+        ...
+
+    @abstractmethod
+    async def remove_post(self, post_id: UUID) -> None:
+        """Drop a deleted post and the comments on it, and uncount them."""
+        ...
+
+    @abstractmethod
+    async def remove_comment(self, comment_id: UUID) -> None:
+        """Drop a deleted comment and uncount it."""
+        ...
+
+    @abstractmethod
+    async def update_post(self, post_id: UUID, title: str, content: str) -> None:
+        """Replace an edited post's title and preview."""
+        ...
+
+    @abstractmethod
+    async def update_comment(self, comment_id: UUID, content: str) -> None:
+        """Replace an edited comment's preview."""
+        ...
+
+    @abstractmethod
+    async def get_summary(self, user_id: UserId) -> ContributionSummary | None:
+        """Join date and contribution counts, or None if the user does not exist."""
+        ...
+
+    @abstractmethod
+    async def list_activity(
+        self, user_id: UserId, limit: int, after: ActivityCursor | None = None
+    ) -> list[ActivityEntry]:
+        """Up to ``limit`` entries, newest first, strictly after ``after``."""
+        ...
+
+    @abstractmethod
+    async def rebuild(self) -> ActivityRebuildResult:
+        """Recompute counters and the activity index from posts and comments."""
+        ...
@@ -70,3 +70,17 @@ class IRefreshTokenRepository(ABC):
             True if all tokens blacklisted, False otherwise
         """
         ...
+
+    @abstractmethod
+    async def is_revoked(self, token: str, user_id: UserId) -> bool:
+        """
+        Check the token blacklist and the user blacklist together.
+
+        Args:
+            token: The refresh token to check
+            user_id: The user the token belongs to
+
+        Returns:
+            True if the token or all of the user's tokens are blacklisted
+        """
+        ...
@@ -47,6 +47,22 @@ class IResetTokenRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def consume(self, token: str) -> UserId | None:
+        """
+        Use up a token in one atomic step.
+
+        Of any number of concurrent calls with the same token, at most one
+        gets the user ID.
+
+        Args:
+            token: The token to consume
+
+        Returns:
+            UserId if the token was valid, None if invalid, expired, or already used
+        """
+        ...
+
     @abstractmethod
     async def mark_as_used(self, token: str) -> None:
         """
@@ -68,9 +84,12 @@ class IResetTokenRepository(ABC):
         ...
 
     @abstractmethod
-    async def delete_expired(self) -> int:
+    async def delete_expired(self, limit: int | None = None) -> int:
         """
-        Delete all expired tokens.
+        Delete expired and used tokens.
+
+        Args:
+            limit: Delete at most this many, for purging in batches
 
         Returns:
             Number of tokens deleted
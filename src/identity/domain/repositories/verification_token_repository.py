@@ -68,9 +68,12 @@ class IVerificationTokenRepository(ABC):
         ...
 
     @abstractmethod
-    async def delete_expired(self) -> int:
+    async def delete_expired(self, limit: int | None = None) -> int:
         """
-        Delete all expired tokens.
+        Delete expired tokens.
+
+        Args:
+            limit: Delete at most this many, for purging in batches
 
         Returns:
             Number of tokens deleted
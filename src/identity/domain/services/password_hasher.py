@@ -9,11 +9,12 @@ class IPasswordHasher(ABC):
     """
     Interface for password hashing operations.
 
-    Implementations should use Argon2id (memory-hard, GPU-resistant).
+    Implementations should use Argon2id (memory-hard, GPU-resistant). Hashing
+    is deliberately slow, so implementations must not block the event loop.
     """
 
     @abstractmethod
-    def hash(self, password: str) -> HashedPassword:
+    async def hash(self, password: str) -> HashedPassword:
         """
         Hash a plaintext password.
 
@@ -26,7 +27,7 @@ class IPasswordHasher(ABC):
         ...
 
     @abstractmethod
-    def verify(self, password: str, hashed: HashedPassword) -> bool:
+    async def verify(self, password: str, hashed: HashedPassword) -> bool:
         """
         Verify a password against a hash.
 
@@ -40,3 +41,16 @@ class IPasswordHasher(ABC):
             True if the password matches, False otherwise
         """
         ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed: HashedPassword) -> bool:
+        """
+        Check whether a hash was made with other parameters than the current ones.
+
+        Args:
+            hashed: A stored password hash
+
+        Returns:
+            True if the password should be re-hashed at the next opportunity
+        """
+        ...
@@ -1,31 +1,69 @@
 """Identity infrastructure persistence layer."""
 
+from src.identity.infrastructure.persistence.cached_repositories import CachedUserRepository
+from src.identity.infrastructure.persistence.email_outbox_repository import (
+    SqlAlchemyEmailOutboxRepository,
+)
 from src.identity.infrastructure.persistence.models import (
+    EmailOutboxModel,
+    ProfileActivityModel,
+    ProfileContributionModel,
     ProfileModel,
     ResetTokenModel,
     UserModel,
     VerificationTokenModel,
 )
+from src.identity.infrastructure.persistence.profile_activity_repository import (
+    SqlAlchemyProfileActivityRepository,
+)
+from src.identity.infrastructure.persistence.redis_token_repositories import (
+    RedisResetTokenRepository,
+    RedisVerificationTokenRepository,
+)
 from src.identity.infrastructure.persistence.refresh_token_repository import (
     RedisRefreshTokenRepository,
 )
 from src.identity.infrastructure.persistence.reset_token_repository import (
     SqlAlchemyResetTokenRepository,
 )
+from src.identity.infrastructure.persistence.token_blacklist_filter import (
+    TokenBlacklistFilter,
+    token_blacklist_filter,
+)
 from src.identity.infrastructure.persistence.user_repository import (
     SqlAlchemyUserRepository,
 )
+from src.identity.infrastructure.persistence.user_snapshot_cache import (
+    ProfileSnapshot,
+    UserSnapshot,
+    UserSnapshotCache,
+    user_snapshots,
+)
 from src.identity.infrastructure.persistence.verification_token_repository import (
     SqlAlchemyVerificationTokenRepository,
 )
 
 __all__ = [
+    "CachedUserRepository",
+    "EmailOutboxModel",
+    "ProfileActivityModel",
+    "ProfileContributionModel",
     "ProfileModel",
+    "ProfileSnapshot",
     "RedisRefreshTokenRepository",
+    "RedisResetTokenRepository",
+    "RedisVerificationTokenRepository",
     "ResetTokenModel",
+    "SqlAlchemyEmailOutboxRepository",
+    "SqlAlchemyProfileActivityRepository",
     "SqlAlchemyResetTokenRepository",
     "SqlAlchemyUserRepository",
     "SqlAlchemyVerificationTokenRepository",
+    "TokenBlacklistFilter",
     "UserModel",
+    "UserSnapshot",
+    "UserSnapshotCache",
     "VerificationTokenModel",
+    "token_blacklist_filter",
+    "user_snapshots",
 ]
@@ -0,0 +1,54 @@
+"""Cache-invalidating decorators for identity repositories.
+
+User and profile reads are served by the user snapshot cache. Every write of
+the User aggregate goes through this decorator, so profile completion and
+updates, email verification, password resets and deletions all invalidate
+the user's snapshot once their transaction commits.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.identity.domain.entities import User
+from src.identity.domain.repositories import IUserRepository
+from src.identity.domain.value_objects import EmailAddress, UserId
+from src.identity.infrastructure.persistence.user_snapshot_cache import (
+    UserSnapshotCache,
+    user_snapshots,
+)
+
+
+class CachedUserRepository(IUserRepository):
+    """IUserRepository decorator that invalidates cached user snapshots on writes."""
+
+    def __init__(
+        self,
+        inner: IUserRepository,
+        session: AsyncSession,
+        cache: UserSnapshotCache = user_snapshots,
+    ) -> None:
+        """Initialize with the wrapped repository and its session."""
+        self._inner = inner
+        self._session = session
+        self._cache = cache
+
+    async def save(self, user: User) -> None:
+        """Save a user and invalidate their snapshot."""
+        await self._inner.save(user)
+        self._cache.invalidate_on_commit(self._session, user.id.value)
+
+    async def get_by_id(self, user_id: UserId) -> User | None:
+        """Get a user by ID."""
+        return await self._inner.get_by_id(user_id)
+
+    async def get_by_email(self, email: EmailAddress) -> User | None:
+        """Get a user by email address."""
+        return await self._inner.get_by_email(email)
+
+    async def exists_by_email(self, email: EmailAddress) -> bool:
+        """Check if a user exists with the given email."""
+        return await self._inner.exists_by_email(email)
+
+    async def delete(self, user_id: UserId) -> None:
+        """Delete a user and invalidate their snapshot."""
+        await self._inner.delete(user_id)
+        self._cache.invalidate_on_commit(self._session, user_id.value)
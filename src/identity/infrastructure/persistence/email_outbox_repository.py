@@ -0,0 +1,125 @@
+"""SQLAlchemy implementation of the email outbox.
+
+Emails are added in the transaction of the request that caused them and
+delivered later by EmailOutboxSender. Senders claim due rows with
+``FOR UPDATE SKIP LOCKED`` and push their next attempt out by a lease, so
+several processes can send concurrently without sending a row twice, and a
+sender that dies mid-batch only delays its rows until the lease runs out.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.identity.infrastructure.persistence.models import EmailOutboxModel
+
+PENDING = "pending"
+SENT = "sent"
+DEAD = "dead"
+
+
+@dataclass(frozen=True)
+class OutboxEmail:
+    """A claimed outbox row; ``attempts`` includes the current one."""
+
+    id: UUID
+    attempts: int
+    recipient: str
+    subject: str
+    html: str
+
+
+class SqlAlchemyEmailOutboxRepository:
+    """Email outbox backed by the email_outbox table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize with database session."""
+        self._session = session
+
+    async def add(self, recipient: str, subject: str, html: str) -> None:
+        """Queue an email for delivery when the session commits."""
+        await self._session.execute(
+            insert(EmailOutboxModel).values(
+                id=uuid4(),
+                recipient=recipient,
+                subject=subject,
+                html=html,
+                status=PENDING,
+                attempts=0,
+            )
+        )
+
+    async def claim_due(self, limit: int, lease: timedelta) -> list[OutboxEmail]:
+        """Claim up to ``limit`` due emails, oldest first, for ``lease``."""
+        due = (
+            select(EmailOutboxModel.id)
+            .where(
+                EmailOutboxModel.status == PENDING,
+                EmailOutboxModel.next_attempt_at <= func.now(),
+            )
+            .order_by(EmailOutboxModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(due.scalar_subquery()))
+            .values(
+                attempts=EmailOutboxModel.attempts + 1,
+                next_attempt_at=func.now() + lease,
+            )
+            .returning(
+                EmailOutboxModel.id,
+                EmailOutboxModel.attempts,
+                EmailOutboxModel.recipient,
+                EmailOutboxModel.subject,
+                EmailOutboxModel.html,
+            )
+        )
+        return [
+            OutboxEmail(
+                id=row.id,
+                attempts=row.attempts,
+                recipient=row.recipient,
+                subject=row.subject,
+                html=row.html,
+            )
+            for row in result
+        ]
+
+    async def mark_sent(self, ids: list[UUID]) -> None:
+        """Record successful delivery."""
+        if not ids:
+            return
+        await self._session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(ids))
+            .values(status=SENT, sent_at=func.now(), last_error=None)
+        )
+
+    async def mark_failed(self, email_id: UUID, error: str, retry_at: datetime | None) -> None:
+        """Record a failed attempt; without ``retry_at`` the email is dead-lettered."""
+        await self._session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id == email_id)
+            .values(
+                status=PENDING if retry_at is not None else DEAD,
+                next_attempt_at=retry_at
+                if retry_at is not None
+                else EmailOutboxModel.next_attempt_at,
+                last_error=error[:2000],
+            )
+        )
+
+    async def delete_sent_before(self, cutoff: datetime) -> int:
+        """Delete delivered emails older than ``cutoff``; dead ones are kept for inspection."""
+        result = await self._session.execute(
+            delete(EmailOutboxModel).where(
+                EmailOutboxModel.status == SENT,
+                EmailOutboxModel.sent_at < cutoff,
+            )
+        )
+        return result.rowcount  # type: ignore[attr-defined, no-any-return]
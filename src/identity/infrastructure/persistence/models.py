@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -186,6 +186,8 @@ class VerificationTokenModel(Base):
     __table_args__ = (
         Index("idx_verification_tokens_token", "token"),
         Index("idx_verification_tokens_user_id", "user_id"),
+        # Batched purge of expired tokens
+        Index("idx_verification_tokens_expires_at", "expires_at"),
     )
 
 
@@ -232,4 +234,147 @@ class ResetTokenModel(Base):
     __table_args__ = (
         Index("idx_reset_tokens_token", "token"),
         Index("idx_reset_tokens_user_id", "user_id"),
+        # Batched purge of expired or used tokens
+        Index("idx_reset_tokens_expires_at", "expires_at"),
+        Index("idx_reset_tokens_used", "used_at", postgresql_where=text("used_at IS NOT NULL")),
+    )
+
+
+class EmailOutboxModel(Base):
+    """SQLAlchemy model for outgoing emails waiting to be delivered."""
+
+    __tablename__ = "email_outbox"
+
+    id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        primary_key=True,
+    )
+    recipient: Mapped[str] = mapped_column(
+        String(254),
+        nullable=False,
+    )
+    subject: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    html: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+    # pending -> sent, or dead once max attempts are used up
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="pending",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index(
+            "idx_email_outbox_due",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+
+class ProfileContributionModel(Base):
+    """Posts and comments a user has in one community (read model for profile stats)."""
+
+    __tablename__ = "profile_contributions"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    community_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        primary_key=True,
+    )
+    post_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    comment_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+class ProfileActivityModel(Base):
+    """One live post or comment in a user's activity feed (read model)."""
+
+    __tablename__ = "profile_activity"
+
+    # "post" or "comment"
+    kind: Mapped[str] = mapped_column(
+        String(20),
+        primary_key=True,
+    )
+    ref_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        primary_key=True,
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    community_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        nullable=False,
+    )
+    # The post itself, or the post a comment belongs to
+    post_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        nullable=False,
+    )
+    title: Mapped[str | None] = mapped_column(
+        String(200),
+        nullable=True,
+    )
+    preview: Mapped[str] = mapped_column(
+        String(280),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_profile_activity_user_created", "user_id", "created_at", "ref_id"),
+        Index("idx_profile_activity_post_id", "post_id"),
     )
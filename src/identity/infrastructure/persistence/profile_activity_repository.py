@@ -0,0 +1,304 @@
+"""Contribution counters and the activity index behind profile pages.
+
+Both read models are maintained incrementally by the profile activity event
+handlers, one statement pair per community event, so a profile page costs
+two indexed reads however much the user has posted:
+
+- profile_contributions: posts and comments per (user, community); the
+  primary key leads with user_id, so a user's totals are one index range.
+- profile_activity: one row per live post or comment with its title and a
+  short preview, paged newest first by keyset over
+  (user_id, created_at, ref_id).
+
+Deleting a post drops the comments on it from the feed too. Counts drift
+when an event handler fails; rebuild() recomputes both tables from posts and
+comments in one transaction. Run after deploying the tables, and
+periodically to reconcile drift:
+
+    python -m src.identity.infrastructure.persistence.profile_activity_repository rebuild
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from datetime import datetime
+from uuid import UUID
+
+import structlog
+from sqlalchemy import ColumnElement, delete, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.identity.domain.repositories.profile_activity_repository import (
+    COMMENT,
+    POST,
+    ActivityCursor,
+    ActivityEntry,
+    ActivityRebuildResult,
+    ContributionSummary,
+    IProfileActivityRepository,
+)
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.persistence.models import (
+    ProfileActivityModel,
+    ProfileContributionModel,
+    UserModel,
+)
+
+logger = structlog.get_logger()
+
+PREVIEW_LENGTH = 280
+
+# Same normalization as preview(), for rows rebuilt in SQL
+_SQL_PREVIEW = f"left(regexp_replace(btrim({{column}}), '\\s+', ' ', 'g'), {PREVIEW_LENGTH})"
+
+_REBUILD_ACTIVITY = text(f"""
+    INSERT INTO profile_activity
+        (kind, ref_id, user_id, community_id, post_id, title, preview, created_at)
+    SELECT :post_kind, p.id, p.author_id, p.community_id, p.id, p.title,
+           {_SQL_PREVIEW.format(column="p.content")}, p.created_at
+    FROM posts p
+    WHERE NOT p.is_deleted AND p.author_id IS NOT NULL
+    UNION ALL
+    SELECT :comment_kind, c.id, c.author_id, p.community_id, p.id, NULL,
+           {_SQL_PREVIEW.format(column="c.content")}, c.created_at
+    FROM comments c
+    JOIN posts p ON p.id = c.post_id
+    WHERE NOT c.is_deleted AND NOT p.is_deleted AND c.author_id IS NOT NULL
+""")
+
+_REBUILD_COUNTERS = text("""
+    INSERT INTO profile_contributions (user_id, community_id, post_count, comment_count)
+    SELECT user_id, community_id,
+           count(*) FILTER (WHERE kind = :post_kind),
+           count(*) FILTER (WHERE kind = :comment_kind)
+    FROM profile_activity
+    GROUP BY user_id, community_id
+""")
+
+
+def preview(content: str) -> str:
+    """Collapse whitespace and cut to the preview length."""
+    return " ".join(content.split())[:PREVIEW_LENGTH]
+
+
+class SqlAlchemyProfileActivityRepository(IProfileActivityRepository):
+    """SQLAlchemy implementation of IProfileActivityRepository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize with database session."""
+        self._session = session
+
+    async def record_post(
+        self,
+        post_id: UUID,
+        community_id: UUID,
+        author_id: UserId,
+        title: str,
+        content: str,
+        created_at: datetime,
+    ) -> None:
+        """Index a new post and count it; recording the same post twice is a no-op."""
+        await self._record(
+            POST, post_id, post_id, community_id, author_id, title, content, created_at
+        )
+
+    async def record_comment(
+        self,
+        comment_id: UUID,
+        post_id: UUID,
+        community_id: UUID,
+        author_id: UserId,
+        content: str,
+        created_at: datetime,
+    ) -> None:
+        """Index a new comment and count it; recording the same comment twice is a no-op."""
+        await self._record(
+            COMMENT, comment_id, post_id, community_id, author_id, None, content, created_at
+        )
+
+    async def remove_post(self, post_id: UUID) -> None:
+        """Drop a deleted post and the comments on it, and uncount them."""
+        await self._remove(ProfileActivityModel.post_id == post_id)
+
+    async def remove_comment(self, comment_id: UUID) -> None:
+        """Drop a deleted comment and uncount it."""
+        await self._remove(
+            ProfileActivityModel.kind == COMMENT, ProfileActivityModel.ref_id == comment_id
+        )
+
+    async def update_post(self, post_id: UUID, title: str, content: str) -> None:
+        """Replace an edited post's title and preview with the values from the edit."""
+        await self._session.execute(
+            update(ProfileActivityModel)
+            .where(ProfileActivityModel.kind == POST, ProfileActivityModel.ref_id == post_id)
+            .values(title=title, preview=preview(content))
+        )
+
+    async def update_comment(self, comment_id: UUID, content: str) -> None:
+        """Replace an edited comment's preview with the content from the edit."""
+        await self._session.execute(
+            update(ProfileActivityModel)
+            .where(ProfileActivityModel.kind == COMMENT, ProfileActivityModel.ref_id == comment_id)
+            .values(preview=preview(content))
+        )
+
+    async def get_summary(self, user_id: UserId) -> ContributionSummary | None:
+        """Join date and contribution counts, or None if the user does not exist."""
+        result = await self._session.execute(
+            select(
+                UserModel.created_at,
+                func.coalesce(func.sum(ProfileContributionModel.post_count), 0),
+                func.coalesce(func.sum(ProfileContributionModel.comment_count), 0),
+            )
+            .outerjoin(ProfileContributionModel, ProfileContributionModel.user_id == UserModel.id)
+            .where(UserModel.id == user_id.value)
+            .group_by(UserModel.id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        joined_at, post_count, comment_count = row
+        return ContributionSummary(
+            joined_at=joined_at, post_count=int(post_count), comment_count=int(comment_count)
+        )
+
+    async def list_activity(
+        self, user_id: UserId, limit: int, after: ActivityCursor | None = None
+    ) -> list[ActivityEntry]:
+        """Up to ``limit`` entries, newest first, strictly after ``after``."""
+        query = select(ProfileActivityModel).where(ProfileActivityModel.user_id == user_id.value)
+        if after is not None:
+            query = query.where(
+                tuple_(ProfileActivityModel.created_at, ProfileActivityModel.ref_id)
+                < tuple_(after.created_at, after.ref_id)
+            )
+        result = await self._session.execute(
+            query.order_by(
+                ProfileActivityModel.created_at.desc(), ProfileActivityModel.ref_id.desc()
+            ).limit(limit)
+        )
+        return [
+            ActivityEntry(
+                kind=model.kind,
+                ref_id=model.ref_id,
+                post_id=model.post_id,
+                community_id=model.community_id,
+                title=model.title,
+                preview=model.preview,
+                created_at=model.created_at,
+            )
+            for model in result.scalars()
+        ]
+
+    async def rebuild(self) -> ActivityRebuildResult:
+        """Recompute counters and the activity index from posts and comments."""
+        kinds = {"post_kind": POST, "comment_kind": COMMENT}
+        await self._session.execute(delete(ProfileContributionModel))
+        await self._session.execute(delete(ProfileActivityModel))
+        entries = await self._session.execute(_REBUILD_ACTIVITY, kinds)
+        counters = await self._session.execute(_REBUILD_COUNTERS, kinds)
+
+        rebuilt = ActivityRebuildResult(
+            counters=counters.rowcount,  # type: ignore[attr-defined]
+            entries=entries.rowcount,  # type: ignore[attr-defined]
+        )
+        logger.info("profile_activity_rebuilt", counters=rebuilt.counters, entries=rebuilt.entries)
+        return rebuilt
+
+    async def _record(
+        self,
+        kind: str,
+        ref_id: UUID,
+        post_id: UUID,
+        community_id: UUID,
+        author_id: UserId,
+        title: str | None,
+        content: str,
+        created_at: datetime,
+    ) -> None:
+        inserted = await self._session.execute(
+            pg_insert(ProfileActivityModel)
+            .values(
+                kind=kind,
+                ref_id=ref_id,
+                user_id=author_id.value,
+                community_id=community_id,
+                post_id=post_id,
+                title=title,
+                preview=preview(content),
+                created_at=created_at,
+            )
+            .on_conflict_do_nothing()
+            .returning(ProfileActivityModel.ref_id)
+        )
+        if inserted.first() is None:
+            return
+
+        posts, comments = (1, 0) if kind == POST else (0, 1)
+        stmt = pg_insert(ProfileContributionModel).values(
+            user_id=author_id.value,
+            community_id=community_id,
+            post_count=posts,
+            comment_count=comments,
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    ProfileContributionModel.user_id,
+                    ProfileContributionModel.community_id,
+                ],
+                set_={
+                    "post_count": ProfileContributionModel.post_count + stmt.excluded.post_count,
+                    "comment_count": ProfileContributionModel.comment_count
+                    + stmt.excluded.comment_count,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    async def _remove(self, *conditions: ColumnElement[bool]) -> None:
+        removed = await self._session.execute(
+            delete(ProfileActivityModel)
+            .where(*conditions)
+            .returning(
+                ProfileActivityModel.user_id,
+                ProfileActivityModel.community_id,
+                ProfileActivityModel.kind,
+            )
+        )
+        counts = Counter((row.user_id, row.community_id, row.kind) for row in removed)
+        for (user_id, community_id, kind), count in counts.items():
+            column = "post_count" if kind == POST else "comment_count"
+            current = getattr(ProfileContributionModel, column)
+            await self._session.execute(
+                update(ProfileContributionModel)
+                .where(
+                    ProfileContributionModel.user_id == user_id,
+                    ProfileContributionModel.community_id == community_id,
+                )
+                .values({column: func.greatest(current - count, 0), "updated_at": func.now()})
+            )
+
+
+async def _rebuild() -> None:
+    from src.identity.interface.api.dependencies import get_database
+
+    database = get_database()
+    try:
+        async with database.session() as session:
+            # rebuild() logs what it rebuilt
+            await SqlAlchemyProfileActivityRepository(session).rebuild()
+    finally:
+        await database.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+    asyncio.run(_rebuild())
+
+
+if __name__ == "__main__":
+    main()
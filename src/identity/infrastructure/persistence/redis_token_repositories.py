@@ -0,0 +1,150 @@
+"""Redis implementations of the verification and reset token repositories.
+
+Verification and password reset tokens live for hours and are read once or
+twice, so instead of rows that linger until purged they can be Redis keys
+that expire on their own:
+
+- ``<prefix>token:<digest>`` holds the user ID for a token; ``<prefix>user:<id>``
+  holds the digest of the user's current token, so issuing a new token (or
+  deleting a user's tokens) can drop the old one. Both expire with the token.
+- Keys are SHA-256 digests of the tokens; a Redis dump yields no usable link.
+- Issuing a token swaps both keys in one Lua script, so concurrent issues for
+  the same user leave exactly one live token.
+- Reset tokens are consumed with GETDEL: of concurrent resets with the same
+  token, exactly one gets the user.
+
+Token writes are not part of the request's database transaction. A token
+issued by a request that then rolls back is never mailed and expires unused.
+"""
+
+import hashlib
+import math
+from datetime import UTC, datetime
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.identity.domain.repositories import IResetTokenRepository, IVerificationTokenRepository
+from src.identity.domain.value_objects import UserId
+
+VERIFICATION_KEY_PREFIX = "verification_token:"
+RESET_KEY_PREFIX = "reset_token:"
+
+# KEYS: user key, new token key. ARGV: token key prefix, user ID, new digest, TTL.
+# Drops the user's previous token and, for a positive TTL, stores the new one.
+_SWAP_TOKEN_SCRIPT = """
+local previous = redis.call('GET', KEYS[1])
+if previous then
+    redis.call('DEL', ARGV[1] .. previous)
+end
+if tonumber(ARGV[4]) > 0 then
+    redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[4])
+    redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[4])
+else
+    redis.call('DEL', KEYS[1])
+end
+return previous
+"""
+
+
+def _digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class _RedisTokenStore:
+    """One live token per user, expiring natively."""
+
+    def __init__(self, redis: Redis, prefix: str) -> None:  # type: ignore[type-arg]
+        self._redis = redis
+        self._prefix = prefix
+        self._swap_token = redis.register_script(_SWAP_TOKEN_SCRIPT)
+
+    def _token_key(self, digest: str) -> str:
+        return f"{self._prefix}token:{digest}"
+
+    def _user_key(self, user_id: UserId) -> str:
+        return f"{self._prefix}user:{user_id.value}"
+
+    async def save(self, user_id: UserId, token: str, expires_at: datetime) -> None:
+        ttl = math.ceil((expires_at - datetime.now(UTC)).total_seconds())
+        digest = _digest(token)
+        await self._swap_token(
+            keys=[self._user_key(user_id), self._token_key(digest)],
+            args=[self._token_key(""), str(user_id.value), digest, ttl],
+        )
+
+    async def get(self, token: str) -> UserId | None:
+        value = await self._redis.get(self._token_key(_digest(token)))
+        return UserId(value=UUID(value.decode())) if value is not None else None
+
+    async def take(self, token: str) -> UserId | None:
+        value = await self._redis.getdel(self._token_key(_digest(token)))
+        return UserId(value=UUID(value.decode())) if value is not None else None
+
+    async def delete_token(self, token: str) -> None:
+        await self._redis.delete(self._token_key(_digest(token)))
+
+    async def delete_user(self, user_id: UserId) -> None:
+        digest = await self._redis.getdel(self._user_key(user_id))
+        if digest is not None:
+            await self._redis.delete(self._token_key(digest.decode()))
+
+
+class RedisVerificationTokenRepository(IVerificationTokenRepository):
+    """Redis implementation of IVerificationTokenRepository."""
+
+    def __init__(self, redis: Redis) -> None:  # type: ignore[type-arg]
+        """Initialize with Redis client."""
+        self._store = _RedisTokenStore(redis, VERIFICATION_KEY_PREFIX)
+
+    async def save(self, user_id: UserId, token: str, expires_at: datetime) -> None:
+        """Save a verification token (replaces existing)."""
+        await self._store.save(user_id, token, expires_at)
+
+    async def get_user_id_by_token(self, token: str) -> UserId | None:
+        """Get the user ID associated with a valid, non-expired token."""
+        return await self._store.get(token)
+
+    async def delete_by_user_id(self, user_id: UserId) -> None:
+        """Delete all tokens for a user."""
+        await self._store.delete_user(user_id)
+
+    async def delete_by_token(self, token: str) -> None:
+        """Delete a specific token."""
+        await self._store.delete_token(token)
+
+    async def delete_expired(self, limit: int | None = None) -> int:  # noqa: ARG002
+        """Nothing to do: Redis expires tokens itself."""
+        return 0
+
+
+class RedisResetTokenRepository(IResetTokenRepository):
+    """Redis implementation of IResetTokenRepository."""
+
+    def __init__(self, redis: Redis) -> None:  # type: ignore[type-arg]
+        """Initialize with Redis client."""
+        self._store = _RedisTokenStore(redis, RESET_KEY_PREFIX)
+
+    async def save(self, user_id: UserId, token: str, expires_at: datetime) -> None:
+        """Save a reset token (replaces existing)."""
+        await self._store.save(user_id, token, expires_at)
+
+    async def get_user_id_by_token(self, token: str) -> UserId | None:
+        """Get user ID for valid, non-expired, unused token."""
+        return await self._store.get(token)
+
+    async def consume(self, token: str) -> UserId | None:
+        """Delete a valid token and return its user, atomically (GETDEL)."""
+        return await self._store.take(token)
+
+    async def mark_as_used(self, token: str) -> None:
+        """Mark a token as used; a used token is simply gone."""
+        await self._store.delete_token(token)
+
+    async def delete_by_user_id(self, user_id: UserId) -> None:
+        """Delete all reset tokens for a user."""
+        await self._store.delete_user(user_id)
+
+    async def delete_expired(self, limit: int | None = None) -> int:  # noqa: ARG002
+        """Nothing to do: Redis expires tokens itself."""
+        return 0
@@ -1,28 +1,60 @@
 """Redis implementation of refresh token blacklist repository."""
 
+import time
+
 from redis.asyncio import Redis
 
 from src.identity.domain.repositories import IRefreshTokenRepository
 from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.persistence.token_blacklist_filter import (
+    BLACKLIST_CHANNEL,
+    TOKEN_KEY_PREFIX,
+    USER_KEY_PREFIX,
+    TokenBlacklistFilter,
+    token_blacklist_filter,
+    token_message,
+    user_message,
+)
+from src.identity.infrastructure.services.access_token_cache import VerifiedAccessTokenCache
+from src.shared.infrastructure.metrics import metrics
 
 
 class RedisRefreshTokenRepository(IRefreshTokenRepository):
-    """Redis implementation of IRefreshTokenRepository for token blacklist."""
+    """Redis implementation of IRefreshTokenRepository for token blacklist.
+
+    Lookups first ask the local TokenBlacklistFilter; only tokens and users it
+    cannot rule out cost a Redis round trip. When given an access token cache,
+    blacklisting a user also revokes their cached access tokens in it.
+    """
 
-    TOKEN_PREFIX = "token_blacklist:"
-    USER_PREFIX = "user_blacklist:"
+    TOKEN_PREFIX = TOKEN_KEY_PREFIX
+    USER_PREFIX = USER_KEY_PREFIX
 
-    def __init__(self, redis: Redis) -> None:  # type: ignore[type-arg]
+    def __init__(
+        self,
+        redis: Redis,  # type: ignore[type-arg]
+        blacklist_filter: TokenBlacklistFilter = token_blacklist_filter,
+        access_token_cache: VerifiedAccessTokenCache | None = None,
+    ) -> None:
         """Initialize with Redis client."""
         self._redis = redis
+        self._filter = blacklist_filter
+        self._access_token_cache = access_token_cache
 
     async def blacklist(self, token: str, expires_in_seconds: int) -> None:
         """Add a refresh token to the blacklist."""
         key = f"{self.TOKEN_PREFIX}{token}"
-        await self._redis.setex(key, expires_in_seconds, "1")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, expires_in_seconds, "1")
+            pipe.publish(BLACKLIST_CHANNEL, token_message(token))
+            await pipe.execute()
+        self._filter.add_token(token)
 
     async def is_blacklisted(self, token: str) -> bool:
         """Check if a token is blacklisted."""
+        if not self._filter.might_contain_token(token):
+            metrics.increment("token_blacklist_filter_skips_total")
+            return False
         key = f"{self.TOKEN_PREFIX}{token}"
         return await self._redis.exists(key) > 0
 
@@ -31,11 +63,37 @@ class RedisRefreshTokenRepository(IRefreshTokenRepository):
         user_id: UserId,
         expires_in_seconds: int,
     ) -> None:
-        """Blacklist all refresh tokens for a user."""
+        """Blacklist all refresh tokens for a user.
+
+        The value is the blacklisting time. Access tokens issued before it are
+        also rejected by the verified-token cache of every process.
+        """
+        revoked_at = int(time.time())
         key = f"{self.USER_PREFIX}{user_id.value}"
-        await self._redis.setex(key, expires_in_seconds, "1")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, expires_in_seconds, str(revoked_at))
+            pipe.publish(BLACKLIST_CHANNEL, user_message(user_id, revoked_at, expires_in_seconds))
+            await pipe.execute()
+        self._filter.add_user(user_id)
+        if self._access_token_cache is not None:
+            self._access_token_cache.revoke_user(user_id, revoked_at, expires_in_seconds)
 
     async def is_user_blacklisted(self, user_id: UserId) -> bool:
         """Check if all tokens for a user are blacklisted."""
+        if not self._filter.might_contain_user(user_id):
+            metrics.increment("token_blacklist_filter_skips_total")
+            return False
         key = f"{self.USER_PREFIX}{user_id.value}"
         return await self._redis.exists(key) > 0
+
+    async def is_revoked(self, token: str, user_id: UserId) -> bool:
+        """Check the token and user blacklists in at most one round trip."""
+        keys = []
+        if self._filter.might_contain_token(token):
+            keys.append(f"{self.TOKEN_PREFIX}{token}")
+        if self._filter.might_contain_user(user_id):
+            keys.append(f"{self.USER_PREFIX}{user_id.value}")
+        if not keys:
+            metrics.increment("token_blacklist_filter_skips_total")
+            return False
+        return await self._redis.exists(*keys) > 0
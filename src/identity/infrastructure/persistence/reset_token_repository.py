@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.identity.domain.repositories import IResetTokenRepository
@@ -57,6 +57,26 @@ class SqlAlchemyResetTokenRepository(IResetTokenRepository):
 
         return UserId(value=user_id)
 
+    async def consume(self, token: str) -> UserId | None:
+        """Mark a valid token used and return its user, in one statement."""
+        now = datetime.now(UTC)
+        result = await self._session.execute(
+            update(ResetTokenModel)
+            .where(
+                ResetTokenModel.token == token,
+                ResetTokenModel.expires_at > now,
+                ResetTokenModel.used_at.is_(None),
+            )
+            .values(used_at=now)
+            .returning(ResetTokenModel.user_id)
+        )
+        user_id = result.scalar_one_or_none()
+
+        if user_id is None:
+            return None
+
+        return UserId(value=user_id)
+
     async def mark_as_used(self, token: str) -> None:
         """Mark a token as used."""
         now = datetime.now(UTC)
@@ -72,12 +92,22 @@ class SqlAlchemyResetTokenRepository(IResetTokenRepository):
         )
         await self._session.flush()
 
-    async def delete_expired(self) -> int:
-        """Delete all expired tokens."""
+    async def delete_expired(self, limit: int | None = None) -> int:
+        """Delete expired and used tokens, at most ``limit`` of them.
+
+        Rows another transaction holds are skipped, so concurrent purges
+        split the work instead of queueing behind each other.
+        """
         now = datetime.now(UTC)
+        dead = (
+            select(ResetTokenModel.id)
+            .where(or_(ResetTokenModel.expires_at <= now, ResetTokenModel.used_at.is_not(None)))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
         result = await self._session.execute(
             delete(ResetTokenModel)
-            .where(ResetTokenModel.expires_at <= now)
+            .where(ResetTokenModel.id.in_(dead.scalar_subquery()))
             .returning(ResetTokenModel.id)
         )
         deleted = result.fetchall()
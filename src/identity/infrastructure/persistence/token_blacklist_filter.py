@@ -0,0 +1,209 @@
+"""Local negative-lookup filter for the refresh token blacklist.
+
+Almost every refresh token presented was never blacklisted, so asking Redis
+on every refresh is mostly wasted round trips. TokenBlacklistFilter mirrors
+the blacklist in an in-process Bloom filter:
+
+- On start it subscribes to ``BLACKLIST_CHANNEL`` and then loads every
+  blacklisted token and user with SCAN, so no blacklisting that happens during
+  the load is missed. Each process publishes what it blacklists on that
+  channel (in the same pipeline as the write) and every process adds it.
+- The filter is rebuilt from Redis every ``rebuild_interval_seconds`` to shed
+  expired entries and keep the false-positive rate down.
+- Until the first load finishes, and whenever the subscription is lost, the
+  filter is not ready and every lookup goes to Redis.
+
+A blacklisting reaches other processes as fast as pub/sub delivers it, which
+leaves a window of a few milliseconds in which a rotated refresh token could
+be reused on another process.
+
+User blacklist messages carry the revocation time, so other processes also
+revoke the user's cached access tokens.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import time
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.services.access_token_cache import verified_access_tokens
+from src.shared.infrastructure.bloom_filter import BloomFilter
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+TOKEN_KEY_PREFIX = "token_blacklist:"
+USER_KEY_PREFIX = "user_blacklist:"
+BLACKLIST_CHANNEL = "token_blacklist:events"
+
+DEFAULT_CAPACITY = 1_000_000
+DEFAULT_REBUILD_INTERVAL_SECONDS = 3600.0
+MAX_RETRY_DELAY_SECONDS = 60.0
+_SCAN_BATCH = 1000
+
+
+def token_message(token: str) -> bytes:
+    """Pub/sub payload announcing a blacklisted refresh token."""
+    return b"token:" + _token_digest(token).hex().encode()
+
+
+def user_message(user_id: UserId, revoked_at: int, expires_in_seconds: int) -> bytes:
+    """Pub/sub payload announcing that all of a user's tokens were blacklisted."""
+    return f"user:{user_id.value}:{revoked_at}:{expires_in_seconds}".encode()
+
+
+def _token_digest(token: str | bytes) -> bytes:
+    return hashlib.sha256(token.encode() if isinstance(token, str) else token).digest()
+
+
+def _token_member(digest: bytes) -> bytes:
+    return b"t:" + digest
+
+
+def _user_member(user_id: str) -> bytes:
+    return b"u:" + user_id.encode()
+
+
+class TokenBlacklistFilter:
+    """In-process Bloom filter of blacklisted refresh tokens and users."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        rebuild_interval_seconds: float = DEFAULT_REBUILD_INTERVAL_SECONDS,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._capacity = capacity
+        self._rebuild_interval_seconds = rebuild_interval_seconds
+        self._registry = registry
+        self._filter = BloomFilter(capacity)
+        self._ready = False
+        self._task: asyncio.Task[None] | None = None
+        registry.register_gauge("token_blacklist_filter_ready", lambda: int(self._ready))
+        registry.register_gauge("token_blacklist_filter_items", lambda: self._filter.count)
+
+    def configure(self, capacity: int, rebuild_interval_seconds: float) -> None:
+        """Apply runtime settings; takes effect on the next start()."""
+        self._capacity = capacity
+        self._rebuild_interval_seconds = rebuild_interval_seconds
+
+    @property
+    def ready(self) -> bool:
+        """Whether negative answers can be trusted."""
+        return self._ready
+
+    def might_contain_token(self, token: str) -> bool:
+        """False only if the token is definitely not blacklisted."""
+        return not self._ready or _token_member(_token_digest(token)) in self._filter
+
+    def might_contain_user(self, user_id: UserId) -> bool:
+        """False only if the user is definitely not blacklisted."""
+        return not self._ready or _user_member(str(user_id.value)) in self._filter
+
+    def add_token(self, token: str) -> None:
+        """Record a token blacklisted by this process."""
+        self._filter.add(_token_member(_token_digest(token)))
+
+    def add_user(self, user_id: UserId) -> None:
+        """Record a user blacklisted by this process."""
+        self._filter.add(_user_member(str(user_id.value)))
+
+    def start(self, redis: Redis) -> None:  # type: ignore[type-arg]
+        """Start loading the filter and following the blacklist channel."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(redis))
+
+    async def close(self) -> None:
+        """Stop following the channel; lookups go to Redis afterwards."""
+        self._ready = False
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self, redis: Redis) -> None:  # type: ignore[type-arg]
+        delay = 1.0
+        while True:
+            try:
+                await self._follow(redis)
+            except (RedisError, OSError):
+                # Back off from a dead Redis; reconnect quickly after a blip
+                delay = 1.0 if self._ready else min(delay * 2, MAX_RETRY_DELAY_SECONDS)
+                self._ready = False
+                self._registry.increment("token_blacklist_filter_failures_total")
+                logger.warning("token_blacklist_filter_disconnected", retry_in=delay)
+                await asyncio.sleep(delay)
+
+    async def _follow(self, redis: Redis) -> None:  # type: ignore[type-arg]
+        async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(BLACKLIST_CHANNEL)
+            await self._rebuild(redis)
+            rebuild_at = time.monotonic() + self._rebuild_interval_seconds
+            while True:
+                message = await pubsub.get_message(timeout=1.0)
+                if message is not None:
+                    try:
+                        self._apply(message["data"])
+                    except ValueError:
+                        logger.warning("token_blacklist_filter_bad_message")
+                if time.monotonic() >= rebuild_at:
+                    await self._rebuild(redis)
+                    rebuild_at = time.monotonic() + self._rebuild_interval_seconds
+
+    async def _rebuild(self, redis: Redis) -> None:  # type: ignore[type-arg]
+        """Load a fresh filter from the blacklist keys and swap it in."""
+        fresh = BloomFilter(self._capacity)
+        async for key in redis.scan_iter(match=f"{TOKEN_KEY_PREFIX}*", count=_SCAN_BATCH):
+            fresh.add(_token_member(_token_digest(key[len(TOKEN_KEY_PREFIX) :])))
+
+        user_keys = [
+            key async for key in redis.scan_iter(match=f"{USER_KEY_PREFIX}*", count=_SCAN_BATCH)
+        ]
+        for start in range(0, len(user_keys), _SCAN_BATCH):
+            batch = user_keys[start : start + _SCAN_BATCH]
+            # Revocation time and remaining TTL of every key in one round trip
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.get(key)
+                    pipe.ttl(key)
+                replies = await pipe.execute()
+            for key, value, ttl in zip(batch, replies[::2], replies[1::2], strict=True):
+                user_id = key[len(USER_KEY_PREFIX) :].decode()
+                fresh.add(_user_member(user_id))
+                if value is not None:
+                    self._revoke_access_tokens(user_id, value.decode(), str(max(ttl, 0)))
+
+        self._filter = fresh
+        self._ready = True
+        self._registry.increment("token_blacklist_filter_rebuilds_total")
+        logger.info("token_blacklist_filter_rebuilt", items=fresh.count)
+
+    def _apply(self, data: bytes) -> None:
+        """Add a blacklisting announced by any process."""
+        kind, _, rest = data.decode().partition(":")
+        if kind == "token":
+            self._filter.add(_token_member(bytes.fromhex(rest)))
+        elif kind == "user":
+            user_id, _, revocation = rest.partition(":")
+            revoked_at, _, expires_in_seconds = revocation.partition(":")
+            self._filter.add(_user_member(user_id))
+            self._revoke_access_tokens(user_id, revoked_at, expires_in_seconds)
+
+    def _revoke_access_tokens(self, user_id: str, revoked_at: str, expires_in_seconds: str) -> None:
+        try:
+            verified_access_tokens.revoke_user(
+                UserId.from_string(user_id), int(revoked_at), int(expires_in_seconds)
+            )
+        except ValueError:
+            logger.warning("token_blacklist_filter_bad_user_entry", user_id=user_id)
+
+
+# Global filter instance
+token_blacklist_filter = TokenBlacklistFilter()
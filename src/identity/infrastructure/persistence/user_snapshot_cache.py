@@ -0,0 +1,389 @@
+"""Two-tier cache of read-only user and profile snapshots.
+
+The current user is loaded on every request that needs more than the user ID,
+and feed, post and comment renders look up the same authors over and over.
+This cache serves those reads from snapshots instead of the users and
+profiles tables:
+
+- An in-process LRU holds up to ``max_entries`` snapshots for
+  ``local_ttl_seconds``.
+- With Redis configured, snapshots are shared between processes for
+  ``redis_ttl_seconds``. Local misses are fetched with one MGET, and what
+  neither tier has is loaded from the database in one query.
+- ``get_many`` is the bulk entry point; every cross-context author lookup
+  should go through it rather than query profiles itself.
+
+Snapshots never contain credentials, only what is safe to render.
+
+Invalidation: writers call ``invalidate_on_commit``. The local entry is
+dropped immediately, and once the session commits it is dropped again, its
+Redis copy is deleted and the user ID is appended to an invalidation log in
+Redis. Other processes read the log at most once per
+``sync_interval_seconds`` and drop the listed users. A load that started
+before a local invalidation is never stored locally, and one that started
+before any process published an invalidation is never stored in Redis: the
+invalidation sequence is read with the MGET, before the load, and the SETEX
+only runs (in one script) if it has not moved since. A session that has
+written a user bypasses the cache until it commits, so uncommitted data is
+never cached.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.identity.infrastructure.persistence.models import UserModel
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+SNAPSHOT_KEY_PREFIX = "user_snapshot:"
+INVALIDATION_LOG_KEY = "user_snapshot:invalidations"
+INVALIDATION_SEQUENCE_KEY = "user_snapshot:invalidations:seq"
+# Processes that fall further behind than this drop their whole local tier
+INVALIDATION_LOG_SIZE = 10_000
+# Marks a session that wrote users and has not committed yet
+DIRTY_SESSION_KEY = "user_snapshot_cache_dirty"
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_LOCAL_TTL_SECONDS = 30.0
+DEFAULT_REDIS_TTL_SECONDS = 300.0
+DEFAULT_SYNC_INTERVAL_SECONDS = 1.0
+
+# KEYS: sequence key, then snapshot keys. ARGV: sequence seen before the load, TTL,
+# then snapshots. Stores nothing if an invalidation was published since the load.
+_STORE_IF_UNCHANGED_SCRIPT = """
+if (redis.call('GET', KEYS[1]) or '') ~= ARGV[1] then
+    return 0
+end
+for i = 2, #KEYS do
+    redis.call('SETEX', KEYS[i], ARGV[2], ARGV[i + 1])
+end
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """The renderable part of a user's profile."""
+
+    display_name: str | None
+    avatar_url: str | None
+    bio: str | None
+    is_complete: bool
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Read-only view of a user and their profile."""
+
+    id: UUID
+    email: str
+    is_verified: bool
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    profile: ProfileSnapshot | None
+
+    @classmethod
+    def from_model(cls, model: UserModel) -> "UserSnapshot":
+        """Build a snapshot from a user row with its profile loaded."""
+        profile = None
+        if model.profile is not None:
+            profile = ProfileSnapshot(
+                display_name=model.profile.display_name,
+                avatar_url=model.profile.avatar_url,
+                bio=model.profile.bio,
+                is_complete=model.profile.is_complete,
+            )
+        return cls(
+            id=model.id,
+            email=model.email,
+            is_verified=model.is_verified,
+            is_active=model.is_active,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            profile=profile,
+        )
+
+    def to_json(self) -> str:
+        """Serialize for the Redis tier."""
+        data = asdict(self)
+        data["id"] = str(self.id)
+        data["created_at"] = self.created_at.isoformat()
+        data["updated_at"] = self.updated_at.isoformat()
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "UserSnapshot":
+        """Deserialize a snapshot written by ``to_json``."""
+        data = json.loads(raw)
+        profile = data["profile"]
+        return cls(
+            id=UUID(data["id"]),
+            email=data["email"],
+            is_verified=data["is_verified"],
+            is_active=data["is_active"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            profile=ProfileSnapshot(**profile) if profile is not None else None,
+        )
+
+
+class UserSnapshotCache:
+    """In-process LRU of user snapshots, backed by an optional Redis tier."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        local_ttl_seconds: float = DEFAULT_LOCAL_TTL_SECONDS,
+        redis_ttl_seconds: float = DEFAULT_REDIS_TTL_SECONDS,
+        sync_interval_seconds: float = DEFAULT_SYNC_INTERVAL_SECONDS,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._max_entries = max_entries
+        self._local_ttl_seconds = local_ttl_seconds
+        self._redis_ttl_seconds = redis_ttl_seconds
+        self._sync_interval_seconds = sync_interval_seconds
+        self._metrics = registry
+        self._redis: Redis | None = None  # type: ignore[type-arg]
+        self._store_if_unchanged: AsyncScript | None = None
+        self._entries: OrderedDict[UUID, tuple[UserSnapshot, float]] = OrderedDict()
+        # Bumped by every local invalidation; loads that straddle a bump are not stored
+        self._epoch = 0
+        self._seen_sequence: int | None = None
+        self._last_sync = float("-inf")
+        self._pending_tasks: set[asyncio.Task[None]] = set()
+        registry.register_gauge("user_snapshot_cache_entries", lambda: len(self._entries))
+
+    def configure(
+        self,
+        max_entries: int | None = None,
+        local_ttl_seconds: float | None = None,
+        redis_ttl_seconds: float | None = None,
+        redis: Redis | None = None,  # type: ignore[type-arg]
+    ) -> None:
+        """Apply runtime settings and attach (or detach) the Redis tier."""
+        if max_entries is not None:
+            self._max_entries = max_entries
+        if local_ttl_seconds is not None:
+            self._local_ttl_seconds = local_ttl_seconds
+        if redis_ttl_seconds is not None:
+            self._redis_ttl_seconds = redis_ttl_seconds
+        self._redis = redis
+        self._store_if_unchanged = (
+            redis.register_script(_STORE_IF_UNCHANGED_SCRIPT) if redis is not None else None
+        )
+        self.reset()
+
+    async def get(self, session: AsyncSession, user_id: UUID) -> UserSnapshot | None:
+        """Snapshot of one user, or None if the user does not exist."""
+        return (await self.get_many(session, [user_id])).get(user_id)
+
+    async def get_many(
+        self, session: AsyncSession, user_ids: Iterable[UUID]
+    ) -> dict[UUID, UserSnapshot]:
+        """Snapshots of the given users that exist, keyed by user ID."""
+        wanted = list(dict.fromkeys(user_ids))
+        if not wanted:
+            return {}
+        if session.sync_session.info.get(DIRTY_SESSION_KEY):
+            # This session wrote users; read its own uncommitted state uncached
+            return {s.id: s for s in await self._load(session, wanted)}
+
+        await self._sync_remote()
+        epoch = self._epoch
+        found: dict[UUID, UserSnapshot] = {}
+        missing: list[UUID] = []
+        now = time.monotonic()
+        for user_id in wanted:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(user_id)
+                found[user_id] = entry[0]
+            else:
+                missing.append(user_id)
+        self._metrics.increment("user_snapshot_cache_local_hits_total", len(found))
+        if not missing:
+            return found
+
+        fetched, sequence = await self._fetch_remote(missing)
+        self._metrics.increment("user_snapshot_cache_redis_hits_total", len(fetched))
+        missing = [user_id for user_id in missing if user_id not in fetched]
+
+        if missing:
+            self._metrics.increment("user_snapshot_cache_misses_total", len(missing))
+            loaded = await self._load(session, missing)
+            if sequence is not None:
+                await self._store_remote(loaded, sequence)
+            fetched.update((snapshot.id, snapshot) for snapshot in loaded)
+
+        if self._epoch == epoch:
+            for snapshot in fetched.values():
+                self._store_local(snapshot)
+        found.update(fetched)
+        return found
+
+    def invalidate_local(self, user_id: UUID) -> None:
+        """Drop a user from this process's tier."""
+        self._epoch += 1
+        self._entries.pop(user_id, None)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop a user from both tiers and tell other processes."""
+        self.invalidate_local(user_id)
+        self._metrics.increment("user_snapshot_cache_invalidations_total")
+        await self._publish_invalidation(user_id)
+
+    def invalidate_on_commit(self, session: AsyncSession, user_id: UUID) -> None:
+        """Invalidate locally now, and everywhere once ``session`` commits."""
+        self.invalidate_local(user_id)
+        sync_session = session.sync_session
+        sync_session.info[DIRTY_SESSION_KEY] = True
+
+        def _after_commit(_session: Any) -> None:
+            sync_session.info.pop(DIRTY_SESSION_KEY, None)
+            task = asyncio.get_running_loop().create_task(self.invalidate(user_id))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+
+        def _after_rollback(_session: Any) -> None:
+            sync_session.info.pop(DIRTY_SESSION_KEY, None)
+
+        event.listen(sync_session, "after_commit", _after_commit, once=True)
+        event.listen(sync_session, "after_soft_rollback", _after_rollback, once=True)
+
+    def reset(self) -> None:
+        """Drop all local entries. Used in tests and on reconfiguration."""
+        self._epoch += 1
+        self._entries.clear()
+        self._seen_sequence = None
+        self._last_sync = float("-inf")
+
+    async def _load(self, session: AsyncSession, user_ids: list[UUID]) -> list[UserSnapshot]:
+        result = await session.execute(
+            select(UserModel)
+            .options(selectinload(UserModel.profile))
+            .where(UserModel.id.in_(user_ids))
+        )
+        return [UserSnapshot.from_model(model) for model in result.scalars()]
+
+    def _store_local(self, snapshot: UserSnapshot) -> None:
+        self._entries[snapshot.id] = (snapshot, time.monotonic() + self._local_ttl_seconds)
+        self._entries.move_to_end(snapshot.id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._metrics.increment("user_snapshot_cache_evictions_total")
+
+    async def _fetch_remote(
+        self, user_ids: list[UUID]
+    ) -> tuple[dict[UUID, UserSnapshot], bytes | None]:
+        """Shared snapshots, and the invalidation sequence (b"" if unset) read with them.
+
+        The sequence is None when there is no Redis tier or it failed, and
+        then loaded snapshots are not stored remotely.
+        """
+        if self._redis is None:
+            return {}, None
+        try:
+            sequence, *values = await self._redis.mget(
+                [INVALIDATION_SEQUENCE_KEY, *(SNAPSHOT_KEY_PREFIX + str(u) for u in user_ids)]
+            )
+        except RedisError:
+            logger.warning("user_snapshot_cache_fetch_failed", users=len(user_ids))
+            return {}, None
+
+        fetched: dict[UUID, UserSnapshot] = {}
+        for user_id, raw in zip(user_ids, values, strict=True):
+            if raw is None:
+                continue
+            try:
+                fetched[user_id] = UserSnapshot.from_json(raw)
+            except (ValueError, KeyError, TypeError):
+                logger.warning("user_snapshot_cache_bad_entry", user_id=str(user_id))
+        return fetched, sequence if sequence is not None else b""
+
+    async def _store_remote(self, snapshots: list[UserSnapshot], sequence: bytes) -> None:
+        """Share loaded snapshots, unless an invalidation was published since ``sequence``."""
+        if self._store_if_unchanged is None or not snapshots:
+            return
+        ttl = max(1, int(self._redis_ttl_seconds))
+        try:
+            stored = await self._store_if_unchanged(
+                keys=[
+                    INVALIDATION_SEQUENCE_KEY,
+                    *(SNAPSHOT_KEY_PREFIX + str(snapshot.id) for snapshot in snapshots),
+                ],
+                args=[sequence, ttl, *(snapshot.to_json() for snapshot in snapshots)],
+            )
+        except RedisError:
+            logger.warning("user_snapshot_cache_store_failed", users=len(snapshots))
+            return
+        if not stored:
+            self._metrics.increment("user_snapshot_cache_stale_stores_skipped_total")
+
+    async def _publish_invalidation(self, user_id: UUID) -> None:
+        if self._redis is None:
+            return
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(SNAPSHOT_KEY_PREFIX + str(user_id))
+                pipe.incr(INVALIDATION_SEQUENCE_KEY)
+                _, sequence = await pipe.execute()
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.zadd(INVALIDATION_LOG_KEY, {str(user_id): sequence})
+                pipe.zremrangebyrank(INVALIDATION_LOG_KEY, 0, -(INVALIDATION_LOG_SIZE + 1))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("user_snapshot_cache_publish_failed", user_id=str(user_id))
+
+    async def _sync_remote(self) -> None:
+        """Drop users that other processes invalidated since the last sync."""
+        if self._redis is None:
+            return
+        now = time.monotonic()
+        if now - self._last_sync < self._sync_interval_seconds:
+            return
+        self._last_sync = now
+
+        try:
+            if self._seen_sequence is None:
+                raw = await self._redis.get(INVALIDATION_SEQUENCE_KEY)
+                self._seen_sequence = int(raw) if raw is not None else 0
+                return
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.zcard(INVALIDATION_LOG_KEY)
+                pipe.zrange(INVALIDATION_LOG_KEY, 0, 0, withscores=True)
+                pipe.zrangebyscore(
+                    INVALIDATION_LOG_KEY, f"({self._seen_sequence}", "+inf", withscores=True
+                )
+                size, oldest, changed = await pipe.execute()
+        except RedisError:
+            logger.warning("user_snapshot_cache_sync_failed")
+            return
+
+        if size >= INVALIDATION_LOG_SIZE and oldest and oldest[0][1] > self._seen_sequence + 1:
+            # The log was trimmed past what we have seen; start over
+            self._epoch += 1
+            self._entries.clear()
+        for member, score in changed:
+            self.invalidate_local(UUID(member.decode() if isinstance(member, bytes) else member))
+            self._seen_sequence = max(self._seen_sequence, int(score))
+
+
+# Global user snapshot cache
+user_snapshots = UserSnapshotCache()
@@ -70,12 +70,22 @@ class SqlAlchemyVerificationTokenRepository(IVerificationTokenRepository):
         )
         await self._session.flush()
 
-    async def delete_expired(self) -> int:
-        """Delete all expired tokens."""
+    async def delete_expired(self, limit: int | None = None) -> int:
+        """Delete expired tokens, at most ``limit`` of them.
+
+        Rows another transaction holds are skipped, so concurrent purges
+        split the work instead of queueing behind each other.
+        """
         now = datetime.now(UTC)
+        expired = (
+            select(VerificationTokenModel.id)
+            .where(VerificationTokenModel.expires_at <= now)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
         result = await self._session.execute(
             delete(VerificationTokenModel)
-            .where(VerificationTokenModel.expires_at <= now)
+            .where(VerificationTokenModel.id.in_(expired.scalar_subquery()))
             .returning(VerificationTokenModel.id)
         )
         deleted = result.fetchall()
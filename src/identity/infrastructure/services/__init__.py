@@ -1,11 +1,31 @@
 """Identity infrastructure services."""
 
+from src.identity.infrastructure.services.access_token_cache import (
+    VerifiedAccessTokenCache,
+    verified_access_tokens,
+)
 from src.identity.infrastructure.services.avatar_generator import (
+    AvatarRenderer,
     InitialsAvatarGenerator,
+    avatar_renderer,
+)
+from src.identity.infrastructure.services.email_outbox import (
+    EmailOutboxSender,
+    OutboxEmailService,
+    email_outbox_sender,
+)
+from src.identity.infrastructure.services.email_transport import (
+    EmailTransport,
+    ResendEmailTransport,
+    SmtpEmailTransport,
+    create_email_transport,
+)
+from src.identity.infrastructure.services.jwt_service import AccessTokenClaims, JWTService
+from src.identity.infrastructure.services.password_hasher import (
+    Argon2PasswordHasher,
+    PooledPasswordHasher,
+    password_hasher,
 )
-from src.identity.infrastructure.services.email_service import EmailService
-from src.identity.infrastructure.services.jwt_service import JWTService
-from src.identity.infrastructure.services.password_hasher import Argon2PasswordHasher
 from src.identity.infrastructure.services.rate_limiter import (
     LOGIN_LIMIT,
     PASSWORD_RESET_LIMIT,
@@ -14,16 +34,37 @@ from src.identity.infrastructure.services.rate_limiter import (
     RESEND_VERIFICATION_LIMIT,
     limiter,
 )
+from src.identity.infrastructure.services.token_purge import (
+    ExpiredTokenPurger,
+    TokenPurgeResult,
+    expired_token_purger,
+)
 
 __all__ = [
+    "AccessTokenClaims",
     "Argon2PasswordHasher",
-    "EmailService",
+    "AvatarRenderer",
+    "EmailOutboxSender",
+    "EmailTransport",
+    "ExpiredTokenPurger",
     "InitialsAvatarGenerator",
     "JWTService",
     "LOGIN_LIMIT",
     "PASSWORD_RESET_LIMIT",
+    "OutboxEmailService",
     "PROFILE_UPDATE_LIMIT",
+    "PooledPasswordHasher",
     "REGISTER_LIMIT",
     "RESEND_VERIFICATION_LIMIT",
+    "ResendEmailTransport",
+    "SmtpEmailTransport",
+    "TokenPurgeResult",
+    "VerifiedAccessTokenCache",
+    "avatar_renderer",
+    "create_email_transport",
+    "email_outbox_sender",
+    "expired_token_purger",
     "limiter",
+    "password_hasher",
+    "verified_access_tokens",
 ]
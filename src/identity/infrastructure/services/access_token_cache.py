@@ -0,0 +1,117 @@
+"""In-process cache of verified access tokens.
+
+Every authenticated request carries a bearer token that was, almost always,
+verified moments earlier by the same process. The cache maps a SHA-256 digest
+of the token to its user and expiry so that repeat requests skip the JWT
+signature check:
+
+- Entries expire at the token's ``exp`` and are evicted least-recently-used
+  beyond ``max_entries``.
+- ``revoke_user`` drops a user's entries and rejects any of their tokens
+  issued before the revocation, which is how the user-level blacklist
+  (password reset) reaches access tokens.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.services.jwt_service import AccessTokenClaims
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True)
+class _Revocation:
+    before: int
+    until: float
+
+
+class VerifiedAccessTokenCache:
+    """Bounded LRU of verified access tokens keyed by token digest."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        registry: MetricsRegistry = metrics,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_entries = max_entries
+        self._registry = registry
+        self._clock = clock
+        self._entries: OrderedDict[bytes, AccessTokenClaims] = OrderedDict()
+        self._revocations: dict[UserId, _Revocation] = {}
+        registry.register_gauge("access_token_cache_entries", lambda: len(self._entries))
+
+    def configure(self, max_entries: int) -> None:
+        """Change the size bound, evicting if it shrank."""
+        self._max_entries = max_entries
+        self._evict()
+
+    def get(self, token: str) -> UserId | None:
+        """The user of a cached, unexpired token, or None on a miss."""
+        key = _digest(token)
+        claims = self._entries.get(key)
+        if claims is not None and claims.expires_at <= self._clock():
+            del self._entries[key]
+            claims = None
+        if claims is None:
+            self._registry.increment("access_token_cache_misses_total")
+            return None
+        self._entries.move_to_end(key)
+        self._registry.increment("access_token_cache_hits_total")
+        return claims.user_id
+
+    def put(self, token: str, claims: AccessTokenClaims) -> bool:
+        """Cache a token that just passed verification.
+
+        Returns False, without caching it, if the token was revoked.
+        """
+        if self.is_revoked(claims):
+            return False
+        self._entries[_digest(token)] = claims
+        self._evict()
+        return True
+
+    def is_revoked(self, claims: AccessTokenClaims) -> bool:
+        """Whether the token was issued before its user's tokens were revoked."""
+        revocation = self._revocations.get(claims.user_id)
+        return revocation is not None and claims.issued_at < revocation.before
+
+    def revoke_user(self, user_id: UserId, revoked_at: int, expires_in_seconds: int) -> None:
+        """Drop the user's cached tokens and reject those issued before ``revoked_at``.
+
+        JWT ``iat`` has one-second resolution, so tokens issued in the same
+        second as the revocation stay valid; that lets a login straight after a
+        password reset succeed. Revocations are forgotten after
+        ``expires_in_seconds``.
+        """
+        now = self._clock()
+        self._revocations = {uid: r for uid, r in self._revocations.items() if r.until > now}
+        self._revocations[user_id] = _Revocation(
+            before=revoked_at, until=revoked_at + expires_in_seconds
+        )
+        for key in [k for k, c in self._entries.items() if c.user_id == user_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and revocations. Used in tests."""
+        self._entries.clear()
+        self._revocations.clear()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._registry.increment("access_token_cache_evictions_total")
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+# Global cache instance
+verified_access_tokens = VerifiedAccessTokenCache()
@@ -1,48 +1,131 @@
-"""Avatar generator implementation."""
+"""Self-hosted initials avatars.
+
+Default avatars are SVGs rendered in-process from a user's initials, so
+avatar requests never leave our infrastructure:
+
+- generate_from_initials() returns an absolute URL on the API's public
+  origin (the frontend may be served from another one), whose path has a
+  digest of everything that goes into the SVG. The bytes behind a URL
+  never change, so responses are served ``immutable``; changing how avatars
+  look means bumping RENDER_VERSION, which moves every avatar to a new URL.
+- The background colour is picked from a fixed palette by a hash of the
+  initials, so the same initials always render the same.
+- Rendered SVGs are kept in a bounded LRU keyed by initials.
+"""
+
+import hashlib
+from collections import OrderedDict
+from html import escape
+from urllib.parse import quote
 
 from src.identity.domain.services import IAvatarGenerator
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
 
+AVATAR_PATH = "/api/v1/avatars"
+RENDER_VERSION = 1
+AVATAR_SIZE = 128
+DEFAULT_MAX_ENTRIES = 4096
+FALLBACK_INITIALS = "?"
 
-class InitialsAvatarGenerator(IAvatarGenerator):
-    """
-    Generate avatar URLs based on initials.
+TEXT_COLOR = "#ffffff"
+# Tailwind 600 shades: all keep white text above a 4.5:1 contrast ratio
+PALETTE = (
+    "#0284c7",
+    "#2563eb",
+    "#4f46e5",
+    "#7c3aed",
+    "#c026d3",
+    "#db2777",
+    "#e11d48",
+    "#c2410c",
+    "#a16207",
+    "#15803d",
+    "#0f766e",
+    "#475569",
+)
+
+
+def clean_initials(initials: str) -> str:
+    """Uppercase, letters and digits only, at most two characters."""
+    cleaned = "".join(c for c in initials.upper() if c.isalnum())[:2]
+    return cleaned or FALLBACK_INITIALS
+
+
+def avatar_digest(initials: str) -> str:
+    """Digest of the render inputs for already-cleaned initials."""
+    inputs = f"{RENDER_VERSION}\x1f{AVATAR_SIZE}\x1f{initials}"
+    return hashlib.sha256(inputs.encode()).hexdigest()[:16]
+
+
+def avatar_path(initials: str) -> str:
+    """Canonical, content-addressed URL path of the avatar for ``initials``."""
+    cleaned = clean_initials(initials)
+    return f"{AVATAR_PATH}/{avatar_digest(cleaned)}/{quote(cleaned, safe='')}.svg"
+
+
+def background_for(initials: str) -> str:
+    """Deterministic palette colour for already-cleaned initials."""
+    index = int.from_bytes(hashlib.sha256(initials.encode()).digest()[:4], "big")
+    return PALETTE[index % len(PALETTE)]
 
-    Uses UI Avatars service for generating SVG avatars.
-    In production, could be replaced with a self-hosted solution.
-    """
+
+def render_svg(initials: str) -> bytes:
+    """Render already-cleaned initials as a square SVG."""
+    font_size = AVATAR_SIZE // 2 if len(initials) == 1 else AVATAR_SIZE * 2 // 5
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{AVATAR_SIZE}" '
+        f'height="{AVATAR_SIZE}" viewBox="0 0 {AVATAR_SIZE} {AVATAR_SIZE}">'
+        f'<rect width="100%" height="100%" fill="{background_for(initials)}"/>'
+        f'<text x="50%" y="50%" dy=".35em" text-anchor="middle" fill="{TEXT_COLOR}" '
+        f'font-family="system-ui,-apple-system,Segoe UI,Helvetica,Arial,sans-serif" '
+        f'font-size="{font_size}" font-weight="600">{escape(initials)}</text>'
+        f"</svg>"
+    ).encode()
+
+
+class AvatarRenderer:
+    """Bounded LRU of rendered avatar SVGs keyed by cleaned initials."""
 
     def __init__(
         self,
-        base_url: str = "https://ui-avatars.com/api/",
-        size: int = 128,
-        background: str = "0ea5e9",  # Primary-500 color
-        color: str = "ffffff",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        registry: MetricsRegistry = metrics,
     ) -> None:
-        """
-        Initialize avatar generator.
-
-        Args:
-            base_url: Base URL for avatar service
-            size: Avatar size in pixels
-            background: Background color (hex without #)
-            color: Text color (hex without #)
-        """
-        self._base_url = base_url
-        self._size = size
-        self._background = background
-        self._color = color
+        self._max_entries = max_entries
+        self._registry = registry
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        registry.register_gauge("avatar_render_cache_entries", lambda: len(self._entries))
+
+    def render(self, initials: str) -> bytes:
+        """The SVG for already-cleaned initials, rendered at most once while cached."""
+        svg = self._entries.get(initials)
+        if svg is not None:
+            self._entries.move_to_end(initials)
+            self._registry.increment("avatar_render_cache_hits_total")
+            return svg
+
+        self._registry.increment("avatar_render_cache_misses_total")
+        svg = render_svg(initials)
+        self._entries[initials] = svg
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return svg
+
+    def reset(self) -> None:
+        """Drop every rendered SVG (for tests)."""
+        self._entries.clear()
+
+
+avatar_renderer = AvatarRenderer()
+
+
+class InitialsAvatarGenerator(IAvatarGenerator):
+    """Generate URLs of self-hosted initials avatars."""
+
+    def __init__(self, base_url: str = "") -> None:
+        """Initialize with the public origin of the API (empty for relative URLs)."""
+        self._base_url = base_url.rstrip("/")
 
     def generate_from_initials(self, initials: str) -> str:
         """Generate an avatar URL from initials."""
-        # Ensure initials are uppercase and max 2 characters
-        clean_initials = initials.upper()[:2]
-
-        return (
-            f"{self._base_url}"
-            f"?name={clean_initials}"
-            f"&size={self._size}"
-            f"&background={self._background}"
-            f"&color={self._color}"
-            f"&bold=true"
-            f"&format=svg"
-        )
+        return f"{self._base_url}{avatar_path(initials)}"
@@ -0,0 +1,235 @@
+"""Transactional email through a database outbox.
+
+Request handlers never talk to the email provider. OutboxEmailService renders
+each email and adds it to the email_outbox table in the request's own
+transaction, so an email exists exactly when the change that caused it was
+committed. EmailOutboxSender delivers the outbox in the background:
+
+- It claims up to ``batch_size`` due emails, hands them to the transport in a
+  worker thread, and records the outcome in a second transaction.
+- A commit that queued email wakes the sender immediately; otherwise it polls
+  every ``poll_interval_seconds`` (for retries and other processes' emails).
+- Failed emails are retried with exponential backoff, from
+  ``backoff_base_seconds`` up to ``backoff_max_seconds``. After
+  ``max_attempts`` they are marked dead and kept for inspection.
+- Delivered emails are deleted after ``retention_days``.
+
+Delivery is at least once: a process that dies between sending and recording
+the outcome sends that batch again once the claim lease runs out.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.identity.domain.services import IEmailService
+from src.identity.infrastructure.persistence.email_outbox_repository import (
+    OutboxEmail,
+    SqlAlchemyEmailOutboxRepository,
+)
+from src.identity.infrastructure.services.email_templates import (
+    OutgoingEmail,
+    password_changed_email,
+    password_reset_email,
+    verification_email,
+    welcome_email,
+)
+from src.identity.infrastructure.services.email_transport import (
+    EmailTransport,
+    create_email_transport,
+)
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+OpenSession = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+# A claimed batch is retried by any sender if not settled within this time
+CLAIM_LEASE = timedelta(minutes=5)
+PURGE_INTERVAL_SECONDS = 3600.0
+
+
+class EmailOutboxSender:
+    """Background delivery of queued emails."""
+
+    def __init__(
+        self,
+        transport_factory: Callable[[], EmailTransport] = create_email_transport,
+        open_session: OpenSession | None = None,
+        batch_size: int = 50,
+        poll_interval_seconds: float = 2.0,
+        max_attempts: int = 8,
+        backoff_base_seconds: float = 30.0,
+        backoff_max_seconds: float = 3600.0,
+        retention_days: int = 7,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._transport_factory = transport_factory
+        self._open_session = open_session or _open_session
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_attempts = max_attempts
+        self._backoff_base_seconds = backoff_base_seconds
+        self._backoff_max_seconds = backoff_max_seconds
+        self._retention_days = retention_days
+        self._metrics = registry
+        self._transport: EmailTransport | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def configure(
+        self,
+        batch_size: int,
+        poll_interval_seconds: float,
+        max_attempts: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+        retention_days: int,
+    ) -> None:
+        """Apply runtime settings; takes effect on the next start()."""
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_attempts = max_attempts
+        self._backoff_base_seconds = backoff_base_seconds
+        self._backoff_max_seconds = backoff_max_seconds
+        self._retention_days = retention_days
+
+    def notify(self) -> None:
+        """Wake the sender because new email was committed."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the background delivery loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the delivery loop and close the transport; pending email stays queued."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._transport is not None:
+            await asyncio.to_thread(self._transport.close)
+            self._transport = None
+
+    async def send_due(self) -> int:
+        """Deliver one batch of due emails; returns how many were claimed."""
+        async with self._open_session() as session:
+            batch = await SqlAlchemyEmailOutboxRepository(session).claim_due(
+                self._batch_size, CLAIM_LEASE
+            )
+        if not batch:
+            return 0
+
+        if self._transport is None:
+            self._transport = self._transport_factory()
+        results = await asyncio.to_thread(
+            self._transport.send_batch,
+            [OutgoingEmail(to=e.recipient, subject=e.subject, html=e.html) for e in batch],
+        )
+
+        async with self._open_session() as session:
+            repository = SqlAlchemyEmailOutboxRepository(session)
+            await repository.mark_sent(
+                [email.id for email, error in zip(batch, results, strict=True) if error is None]
+            )
+            for email, error in zip(batch, results, strict=True):
+                if error is not None:
+                    await repository.mark_failed(email.id, error, self._retry_at(email))
+
+        sent = sum(error is None for error in results)
+        self._metrics.increment("email_outbox_sent_total", sent)
+        self._metrics.increment("email_outbox_failed_attempts_total", len(batch) - sent)
+        logger.info("email_outbox_batch_sent", claimed=len(batch), sent=sent)
+        return len(batch)
+
+    async def purge_sent(self) -> int:
+        """Delete delivered emails older than the retention period."""
+        cutoff = datetime.now(UTC) - timedelta(days=self._retention_days)
+        async with self._open_session() as session:
+            return await SqlAlchemyEmailOutboxRepository(session).delete_sent_before(cutoff)
+
+    def _retry_at(self, email: OutboxEmail) -> datetime | None:
+        """When to retry a failed email, or None to dead-letter it."""
+        if email.attempts >= self._max_attempts:
+            self._metrics.increment("email_outbox_dead_total")
+            logger.error("email_outbox_dead_letter", email_id=str(email.id), to=email.recipient)
+            return None
+        delay = min(
+            self._backoff_base_seconds * 2 ** (email.attempts - 1), self._backoff_max_seconds
+        )
+        return datetime.now(UTC) + timedelta(seconds=delay)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        purge_at = loop.time()
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.send_due()
+                if loop.time() >= purge_at:
+                    await self.purge_sent()
+                    purge_at = loop.time() + PURGE_INTERVAL_SECONDS
+            except Exception:
+                claimed = 0
+                self._metrics.increment("email_outbox_errors_total")
+                logger.exception("email_outbox_send_failed")
+            if claimed >= self._batch_size:
+                # More may be due; keep going
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval_seconds)
+
+
+class OutboxEmailService(IEmailService):
+    """IEmailService that queues emails in the request's transaction."""
+
+    def __init__(self, session: AsyncSession, sender: EmailOutboxSender | None = None) -> None:
+        """Initialize with the request's database session."""
+        self._repository = SqlAlchemyEmailOutboxRepository(session)
+        self._session = session
+        self._sender = sender or email_outbox_sender
+
+    async def send_verification_email(self, email: str, token: str) -> None:
+        """Queue an email verification email."""
+        await self._queue(verification_email(email, token))
+
+    async def send_password_reset_email(self, email: str, token: str) -> None:
+        """Queue a password reset email."""
+        await self._queue(password_reset_email(email, token))
+
+    async def send_password_changed_email(self, email: str) -> None:
+        """Queue a password changed confirmation email."""
+        await self._queue(password_changed_email(email))
+
+    async def send_welcome_email(self, email: str, display_name: str) -> None:
+        """Queue a welcome email after profile completion."""
+        await self._queue(welcome_email(email, display_name))
+
+    async def _queue(self, message: OutgoingEmail) -> None:
+        await self._repository.add(message.to, message.subject, message.html)
+        metrics.increment("email_outbox_queued_total")
+        event.listen(
+            self._session.sync_session, "after_commit", lambda _s: self._sender.notify(), once=True
+        )
+        logger.info("email_queued", email=message.to, subject=message.subject)
+
+
+@asynccontextmanager
+async def _open_session() -> AsyncIterator[AsyncSession]:
+    from src.identity.interface.api.dependencies import get_database
+
+    async with get_database().session() as session:
+        yield session
+
+
+# Global sender instance
+email_outbox_sender = EmailOutboxSender()
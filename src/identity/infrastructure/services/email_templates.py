@@ -0,0 +1,77 @@
+"""Transactional email content.
+
+Emails are rendered when they are queued, so the outbox holds exactly what
+will be delivered and the sender needs no application context.
+"""
+
+from dataclasses import dataclass
+
+from src.config import settings
+
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    """A rendered email for one recipient."""
+
+    to: str
+    subject: str
+    html: str
+
+
+def verification_email(email: str, token: str) -> OutgoingEmail:
+    """Email verification link."""
+    verification_url = f"{settings.frontend_url}/verify?token={token}"
+    return OutgoingEmail(
+        to=email,
+        subject="Verify your Koulu account",
+        html=f"""
+                <h1>Welcome to Koulu!</h1>
+                <p>Please verify your email address by clicking the link below:</p>
+                <p><a href="{verification_url}">Verify Email</a></p>
+                <p>This link will expire in 24 hours.</p>
+                <p>If you didn't create an account, you can ignore this email.</p>
+                """,
+    )
+
+
+def password_reset_email(email: str, token: str) -> OutgoingEmail:
+    """Password reset link."""
+    reset_url = f"{settings.frontend_url}/reset-password?token={token}"
+    return OutgoingEmail(
+        to=email,
+        subject="Reset your Koulu password",
+        html=f"""
+                <h1>Password Reset Request</h1>
+                <p>Click the link below to reset your password:</p>
+                <p><a href="{reset_url}">Reset Password</a></p>
+                <p>This link will expire in 1 hour.</p>
+                <p>If you didn't request a password reset, you can ignore this email.</p>
+                """,
+    )
+
+
+def password_changed_email(email: str) -> OutgoingEmail:
+    """Password changed confirmation."""
+    return OutgoingEmail(
+        to=email,
+        subject="Your Koulu password was changed",
+        html="""
+                <h1>Password Changed</h1>
+                <p>Your password was successfully changed.</p>
+                <p>If you didn't make this change, please contact support immediately.</p>
+                """,
+    )
+
+
+def welcome_email(email: str, display_name: str) -> OutgoingEmail:
+    """Welcome email after profile completion."""
+    return OutgoingEmail(
+        to=email,
+        subject="Welcome to Koulu!",
+        html=f"""
+                <h1>Welcome, {display_name}!</h1>
+                <p>Your account is all set up and ready to go.</p>
+                <p>Start exploring communities and connecting with others!</p>
+                <p><a href="{settings.frontend_url}">Go to Koulu</a></p>
+                """,
+    )
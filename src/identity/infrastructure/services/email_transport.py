@@ -0,0 +1,135 @@
+"""Email delivery transports used by the outbox sender.
+
+Both provider clients are blocking, so the sender calls them from a worker
+thread, one batch at a time:
+
+- ResendEmailTransport sends through the Resend batch API, up to 100 emails
+  per HTTP request. Resend is used over SMTP to avoid port-blocking on cloud
+  platforms.
+- SmtpEmailTransport keeps one SMTP connection open across batches and
+  reconnects when the server has dropped it. It is used for local development
+  and E2E tests with MailHog, or any SMTP sink, when ``smtp_host`` is set.
+"""
+
+import smtplib
+from abc import ABC, abstractmethod
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import resend
+import structlog
+
+from src.config import settings
+from src.identity.infrastructure.services.email_templates import OutgoingEmail
+
+logger = structlog.get_logger()
+
+RESEND_MAX_BATCH = 100
+SMTP_TIMEOUT_SECONDS = 30.0
+
+
+class EmailTransport(ABC):
+    """Delivers rendered emails. Methods block and are called from a worker thread."""
+
+    @abstractmethod
+    def send_batch(self, messages: list[OutgoingEmail]) -> list[str | None]:
+        """Deliver ``messages``; per message, None on success or the error."""
+        ...
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release connections."""
+
+
+class ResendEmailTransport(EmailTransport):
+    """Sends through the Resend HTTP batch API."""
+
+    def __init__(self) -> None:
+        """Initialize with the Resend API key."""
+        resend.api_key = settings.resend_api_key
+        self._from_email = f"{settings.mail_from_name} <{settings.mail_from}>"
+
+    def send_batch(self, messages: list[OutgoingEmail]) -> list[str | None]:
+        """Send in chunks of up to 100; a failed request fails its whole chunk."""
+        results: list[str | None] = []
+        for start in range(0, len(messages), RESEND_MAX_BATCH):
+            chunk = messages[start : start + RESEND_MAX_BATCH]
+            try:
+                resend.Batch.send(
+                    [
+                        {
+                            "from": self._from_email,
+                            "to": [message.to],
+                            "subject": message.subject,
+                            "html": message.html,
+                        }
+                        for message in chunk
+                    ]
+                )
+            except Exception as e:
+                logger.warning("resend_batch_failed", emails=len(chunk), error=str(e))
+                results.extend([str(e)] * len(chunk))
+            else:
+                results.extend([None] * len(chunk))
+        return results
+
+
+class SmtpEmailTransport(EmailTransport):
+    """Sends over a persistent SMTP connection."""
+
+    def __init__(self, host: str, port: int, timeout: float = SMTP_TIMEOUT_SECONDS) -> None:
+        """Initialize with the SMTP server address; connects on first send."""
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._from_email = f"{settings.mail_from_name} <{settings.mail_from}>"
+        self._server: smtplib.SMTP | None = None
+
+    def send_batch(self, messages: list[OutgoingEmail]) -> list[str | None]:
+        """Send one message at a time over the same connection."""
+        results: list[str | None] = []
+        for message in messages:
+            try:
+                self._send(message)
+            except (smtplib.SMTPException, OSError) as e:
+                logger.warning("smtp_send_failed", email=message.to, error=str(e))
+                if not isinstance(e, smtplib.SMTPRecipientsRefused):
+                    self.close()
+                results.append(str(e))
+            else:
+                results.append(None)
+        return results
+
+    def close(self) -> None:
+        """Quit the SMTP session if one is open."""
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+
+    def _send(self, message: OutgoingEmail) -> None:
+        msg = MIMEMultipart("alternative")
+        msg["From"] = self._from_email
+        msg["To"] = message.to
+        msg["Subject"] = message.subject
+        msg.attach(MIMEText(message.html, "html"))
+
+        try:
+            self._connection().sendmail(self._from_email, [message.to], msg.as_string())
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection; retry once on a fresh one
+            self.close()
+            self._connection().sendmail(self._from_email, [message.to], msg.as_string())
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._server is None:
+            self._server = smtplib.SMTP(self._host, self._port, timeout=self._timeout)
+        return self._server
+
+
+def create_email_transport() -> EmailTransport:
+    """SMTP when ``smtp_host`` is configured, otherwise the Resend HTTP API."""
+    if settings.smtp_host:
+        return SmtpEmailTransport(settings.smtp_host, settings.smtp_port)
+    return ResendEmailTransport()
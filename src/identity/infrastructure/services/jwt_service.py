@@ -1,6 +1,7 @@
 """JWT token service implementation."""
 
 import secrets
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 import jwt
@@ -9,6 +10,15 @@ from src.identity.domain.services import ITokenGenerator
 from src.identity.domain.value_objects import AuthTokens, UserId
 
 
+@dataclass(frozen=True)
+class AccessTokenClaims:
+    """The claims of a verified access token; times are Unix seconds."""
+
+    user_id: UserId
+    issued_at: int
+    expires_at: int
+
+
 class JWTService(ITokenGenerator):
     """
     JWT-based token generator.
@@ -99,6 +109,11 @@ class JWTService(ITokenGenerator):
 
     def validate_access_token(self, token: str) -> UserId | None:
         """Validate an access token and extract user ID."""
+        claims = self.decode_access_token(token)
+        return claims.user_id if claims is not None else None
+
+    def decode_access_token(self, token: str) -> AccessTokenClaims | None:
+        """Validate an access token and return its claims."""
         try:
             payload = jwt.decode(
                 token,
@@ -110,8 +125,12 @@ class JWTService(ITokenGenerator):
             user_id_str = payload.get("sub")
             if user_id_str is None:
                 return None
-            return UserId.from_string(user_id_str)
-        except jwt.PyJWTError:
+            return AccessTokenClaims(
+                user_id=UserId.from_string(user_id_str),
+                issued_at=int(payload.get("iat", 0)),
+                expires_at=int(payload["exp"]),
+            )
+        except (jwt.PyJWTError, KeyError):
             return None
 
     def validate_refresh_token(self, token: str) -> UserId | None:
@@ -1,15 +1,38 @@
-"""Argon2id password hasher implementation."""
+"""Argon2id password hashing.
 
+Argon2PasswordHasher is the synchronous primitive: each call burns tens of
+milliseconds of CPU. Request handlers use it through PooledPasswordHasher,
+which runs it on a dedicated thread pool (argon2-cffi releases the GIL while
+hashing) so the event loop keeps serving other requests.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+import argon2
+import structlog
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 
+from src.identity.domain.exceptions import ServiceBusyError
 from src.identity.domain.services import IPasswordHasher
 from src.identity.domain.value_objects import HashedPassword
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
 
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_WAITING = 64
 
-class Argon2PasswordHasher(IPasswordHasher):
+
+class Argon2PasswordHasher:
     """
-    Password hasher using Argon2id algorithm.
+    Synchronous password hasher using the Argon2id algorithm.
 
     Argon2id is the recommended algorithm for password hashing:
     - Memory-hard (resistant to GPU attacks)
@@ -17,9 +40,17 @@ class Argon2PasswordHasher(IPasswordHasher):
     - OWASP recommended
     """
 
-    def __init__(self) -> None:
-        """Initialize the password hasher."""
-        self._hasher = PasswordHash((Argon2Hasher(),))
+    def __init__(
+        self,
+        time_cost: int = argon2.DEFAULT_TIME_COST,
+        memory_cost: int = argon2.DEFAULT_MEMORY_COST,
+        parallelism: int = argon2.DEFAULT_PARALLELISM,
+    ) -> None:
+        """Initialize the password hasher; parameters default to argon2-cffi's."""
+        self._argon2 = Argon2Hasher(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+        self._hasher = PasswordHash((self._argon2,))
 
     def hash(self, password: str) -> HashedPassword:
         """Hash a plaintext password using Argon2id."""
@@ -37,3 +68,108 @@ class Argon2PasswordHasher(IPasswordHasher):
         except Exception:
             # Any error means invalid password
             return False
+
+    def needs_rehash(self, hashed: HashedPassword) -> bool:
+        """Whether a hash uses other Argon2 parameters than this hasher."""
+        try:
+            return self._argon2.check_needs_rehash(hashed.value)
+        except Exception:
+            return False
+
+
+class PooledPasswordHasher(IPasswordHasher):
+    """
+    Runs Argon2PasswordHasher on a dedicated thread pool.
+
+    At most ``workers`` hashes run at once and at most ``max_waiting`` more
+    wait for a worker. Beyond that, calls fail fast with ServiceBusyError
+    instead of queueing without bound. Queue time and hash time are recorded
+    as counters, alongside the operation count, so averages can be derived.
+    """
+
+    def __init__(
+        self,
+        hasher: Argon2PasswordHasher | None = None,
+        workers: int = DEFAULT_WORKERS,
+        max_waiting: int = DEFAULT_MAX_WAITING,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        """Initialize the pool; worker threads start lazily."""
+        self._hasher = hasher or Argon2PasswordHasher()
+        self._workers = workers
+        self._max_waiting = max_waiting
+        self._registry = registry
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+        registry.register_gauge("password_hash_in_flight", lambda: self._in_flight)
+
+    def configure(
+        self,
+        workers: int | None = None,
+        max_waiting: int | None = None,
+        hasher: Argon2PasswordHasher | None = None,
+    ) -> None:
+        """Adjust pool size, queue bound or hash parameters."""
+        if workers is not None and workers != self._workers:
+            self._workers = workers
+            self.close()
+        if max_waiting is not None:
+            self._max_waiting = max_waiting
+        if hasher is not None:
+            self._hasher = hasher
+
+    async def hash(self, password: str) -> HashedPassword:
+        """Hash a plaintext password off the event loop."""
+        hasher = self._hasher
+        return await self._run("hash", lambda: hasher.hash(password))
+
+    async def verify(self, password: str, hashed: HashedPassword) -> bool:
+        """Verify a password off the event loop."""
+        hasher = self._hasher
+        return await self._run("verify", lambda: hasher.verify(password, hashed))
+
+    def needs_rehash(self, hashed: HashedPassword) -> bool:
+        """Whether a hash uses outdated parameters (parses the hash; no hashing)."""
+        return self._hasher.needs_rehash(hashed)
+
+    def close(self) -> None:
+        """Shut the worker threads down; queued work still completes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self, operation: str, call: Callable[[], T]) -> T:
+        if self._in_flight >= self._workers + self._max_waiting:
+            self._registry.increment("password_hash_rejected_total", operation=operation)
+            logger.warning("password_hash_pool_saturated", in_flight=self._in_flight)
+            raise ServiceBusyError(retry_after=1)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="password-hash"
+            )
+        submitted = time.perf_counter()
+        started = submitted
+
+        def _timed() -> T:
+            nonlocal started
+            started = time.perf_counter()
+            return call()
+
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, _timed)
+        finally:
+            self._in_flight -= 1
+            finished = time.perf_counter()
+            self._registry.increment("password_hash_operations_total", operation=operation)
+            self._registry.increment(
+                "password_hash_queue_seconds_total", started - submitted, operation=operation
+            )
+            self._registry.increment(
+                "password_hash_seconds_total", finished - started, operation=operation
+            )
+
+
+# Process-wide pool shared by all requests
+password_hasher = PooledPasswordHasher()
@@ -5,14 +5,17 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from src.config import settings
+from src.shared.infrastructure.redis_client import limiter_storage_options
 
 # Create rate limiter instance
-# Uses Redis if REDIS_URL is set, otherwise in-memory
+# Uses Redis if REDIS_URL is set, otherwise in-memory. The storage client is
+# synchronous, so it has its own pool, sized and timed out like the shared one.
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["100/minute"],
     enabled=settings.rate_limit_enabled,
     storage_uri=settings.redis_url if settings.rate_limit_enabled else None,
+    storage_options=limiter_storage_options() if settings.rate_limit_enabled else {},  # type: ignore[arg-type]
 )
 
 
@@ -0,0 +1,154 @@
+"""Batched purge of dead rows from the SQL token tables.
+
+Verification and reset tokens are only useful until they expire (reset
+tokens also once used), but nothing deleted them, so verification_tokens and
+reset_tokens and their indexes kept growing. ExpiredTokenPurger deletes dead
+rows in the background:
+
+- Each batch of at most ``batch_size`` rows is deleted and committed in its
+  own transaction, so no purge holds many locks or a long transaction.
+- Batches run back to back until a table is clean, then the purger sleeps
+  ``interval_seconds``.
+- Rows locked by another transaction are skipped, so several processes can
+  run the purger without waiting on each other.
+
+Deployments that keep tokens in Redis expire them natively; the purger then
+clears out the rows left from before the switch. Run it once by hand with:
+
+    python -m src.identity.infrastructure.services.token_purge
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.identity.infrastructure.persistence.reset_token_repository import (
+    SqlAlchemyResetTokenRepository,
+)
+from src.identity.infrastructure.persistence.verification_token_repository import (
+    SqlAlchemyVerificationTokenRepository,
+)
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+OpenSession = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+@dataclass(frozen=True)
+class TokenPurgeResult:
+    """Rows deleted by one purge."""
+
+    verification_tokens: int
+    reset_tokens: int
+
+
+class ExpiredTokenPurger:
+    """Background purge of expired verification and reset token rows."""
+
+    def __init__(
+        self,
+        open_session: OpenSession | None = None,
+        batch_size: int = 1000,
+        interval_seconds: float = 3600.0,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._open_session = open_session or _open_session
+        self._batch_size = batch_size
+        self._interval_seconds = interval_seconds
+        self._metrics = registry
+        self._task: asyncio.Task[None] | None = None
+
+    def configure(self, batch_size: int, interval_seconds: float) -> None:
+        """Apply runtime settings; takes effect on the next start()."""
+        self._batch_size = batch_size
+        self._interval_seconds = interval_seconds
+
+    def start(self) -> None:
+        """Start the background purge loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the purge loop; a batch in flight is rolled back."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def purge(self) -> TokenPurgeResult:
+        """Delete every dead token row, one committed batch at a time."""
+        result = TokenPurgeResult(
+            verification_tokens=await self._purge_table(
+                "verification_tokens", SqlAlchemyVerificationTokenRepository
+            ),
+            reset_tokens=await self._purge_table("reset_tokens", SqlAlchemyResetTokenRepository),
+        )
+        logger.info(
+            "expired_tokens_purged",
+            verification_tokens=result.verification_tokens,
+            reset_tokens=result.reset_tokens,
+        )
+        return result
+
+    async def _purge_table(
+        self,
+        table: str,
+        repository: type[SqlAlchemyVerificationTokenRepository]
+        | type[SqlAlchemyResetTokenRepository],
+    ) -> int:
+        total = 0
+        while True:
+            async with self._open_session() as session:
+                deleted = await repository(session).delete_expired(limit=self._batch_size)
+            total += deleted
+            self._metrics.increment("expired_tokens_purged_total", deleted, table=table)
+            if deleted < self._batch_size:
+                return total
+            # Let request traffic in between batches
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge()
+            except Exception:
+                self._metrics.increment("expired_token_purge_errors_total")
+                logger.exception("expired_token_purge_failed")
+            await asyncio.sleep(self._interval_seconds)
+
+
+@asynccontextmanager
+async def _open_session() -> AsyncIterator[AsyncSession]:
+    from src.identity.interface.api.dependencies import get_database
+
+    async with get_database().session() as session:
+        yield session
+
+
+# Global purger instance
+expired_token_purger = ExpiredTokenPurger()
+
+
+async def _run_once() -> None:
+    from src.config import settings
+    from src.identity.interface.api.dependencies import get_database
+
+    expired_token_purger.configure(
+        batch_size=settings.token_purge_batch_size,
+        interval_seconds=settings.token_purge_interval_seconds,
+    )
+    try:
+        await expired_token_purger.purge()
+    finally:
+        await get_database().close()
+
+
+if __name__ == "__main__":
+    asyncio.run(_run_once())
@@ -0,0 +1,53 @@
+"""Avatar API endpoints."""
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import RedirectResponse, Response
+
+from src.identity.infrastructure.services.avatar_generator import (
+    avatar_digest,
+    avatar_path,
+    avatar_renderer,
+    clean_initials,
+)
+from src.shared.infrastructure.compressed_response_cache import etag_matches
+
+router = APIRouter(prefix="/avatars", tags=["Avatars"])
+
+# The URL is a digest of the SVG's render inputs, so a response never goes stale
+IMMUTABLE_HEADERS = {
+    "Cache-Control": "public, max-age=31536000, immutable",
+    "X-Content-Type-Options": "nosniff",
+    "Content-Security-Policy": "default-src 'none'; style-src 'unsafe-inline'",
+}
+
+
+@router.get(
+    "/{digest}/{initials}.svg",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/svg+xml": {}}, "description": "Avatar image"},
+        304: {"description": "Not modified"},
+        307: {"description": "Redirect to the avatar's canonical URL"},
+    },
+)
+async def get_avatar(digest: str, initials: str, request: Request) -> Response:
+    """Render an initials avatar.
+
+    Public, so it can back plain <img> tags. URLs that are not canonical,
+    such as ones minted before a rendering change, redirect to the current
+    URL for the same initials.
+    """
+    cleaned = clean_initials(initials)
+    if cleaned != initials or digest != avatar_digest(cleaned):
+        return RedirectResponse(
+            avatar_path(cleaned),
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    headers = {"ETag": f'"{digest}"', **IMMUTABLE_HEADERS}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=avatar_renderer.render(cleaned), media_type="image/svg+xml", headers=headers
+    )
@@ -23,33 +23,46 @@ from src.identity.application.handlers import (
     VerifyEmailHandler,
 )
 from src.identity.application.queries import (
-    GetCurrentUserHandler,
     GetProfileActivityHandler,
     GetProfileHandler,
     GetProfileStatsHandler,
 )
-from src.identity.domain.entities import User
+from src.identity.domain.repositories import (
+    IProfileActivityRepository,
+    IResetTokenRepository,
+    IUserRepository,
+    IVerificationTokenRepository,
+)
 from src.identity.domain.services import IEmailService
 from src.identity.infrastructure.persistence import (
+    CachedUserRepository,
     RedisRefreshTokenRepository,
+    RedisResetTokenRepository,
+    RedisVerificationTokenRepository,
+    SqlAlchemyProfileActivityRepository,
     SqlAlchemyResetTokenRepository,
     SqlAlchemyUserRepository,
     SqlAlchemyVerificationTokenRepository,
+    UserSnapshot,
+    user_snapshots,
 )
 from src.identity.infrastructure.services import (
-    Argon2PasswordHasher,
-    EmailService,
     InitialsAvatarGenerator,
     JWTService,
+    OutboxEmailService,
+    PooledPasswordHasher,
+    password_hasher,
+    verified_access_tokens,
 )
 from src.shared.infrastructure import Database
+from src.shared.infrastructure.redis_client import get_redis_client
 
 # ============================================================================
 # Database & Redis Dependencies
 # ============================================================================
 
 _database: Database | None = None
-_redis: Redis | None = None  # type: ignore[type-arg]
+_token_generator: JWTService | None = None
 
 
 def get_database() -> Database:
@@ -66,11 +79,8 @@ def get_database() -> Database:
 
 
 async def get_redis() -> Redis:  # type: ignore[type-arg]
-    """Get Redis instance (singleton)."""
-    global _redis
-    if _redis is None:
-        _redis = Redis.from_url(settings.redis_url)
-    return _redis
+    """Get the shared Redis client."""
+    return get_redis_client()
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -90,42 +100,40 @@ RedisDep = Annotated["Redis[bytes]", Depends(get_redis)]
 # ============================================================================
 
 
-def get_password_hasher() -> Argon2PasswordHasher:
-    """Get password hasher instance."""
-    return Argon2PasswordHasher()
+def get_password_hasher() -> PooledPasswordHasher:
+    """Get the shared password hashing pool."""
+    return password_hasher
 
 
 def get_token_generator() -> JWTService:
-    """Get JWT service instance."""
-    return JWTService(
-        secret_key=settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
-        access_token_expire_minutes=settings.jwt_access_token_expire_minutes,
-        refresh_token_expire_days=settings.jwt_refresh_token_expire_days,
-        refresh_token_remember_me_days=settings.jwt_refresh_token_remember_me_days,
-    )
+    """Get JWT service instance (singleton)."""
+    global _token_generator
+    if _token_generator is None:
+        _token_generator = JWTService(
+            secret_key=settings.jwt_secret_key,
+            algorithm=settings.jwt_algorithm,
+            access_token_expire_minutes=settings.jwt_access_token_expire_minutes,
+            refresh_token_expire_days=settings.jwt_refresh_token_expire_days,
+            refresh_token_remember_me_days=settings.jwt_refresh_token_remember_me_days,
+        )
+    return _token_generator
 
 
 def get_avatar_generator() -> InitialsAvatarGenerator:
     """Get avatar generator instance."""
-    return InitialsAvatarGenerator()
+    return InitialsAvatarGenerator(base_url=settings.api_public_url)
 
 
-def get_email_service() -> IEmailService:
+def get_email_service(session: SessionDep) -> IEmailService:
     """Get email service instance.
 
-    Uses SMTP (MailHog) when smtp_host is configured, otherwise Resend HTTP API.
+    Emails are queued in the request's transaction and delivered by the
+    background outbox sender.
     """
-    if settings.smtp_host:
-        from src.identity.infrastructure.services.smtp_email_service import (
-            SmtpEmailService,
-        )
-
-        return SmtpEmailService()
-    return EmailService()
+    return OutboxEmailService(session)
 
 
-PasswordHasherDep = Annotated[Argon2PasswordHasher, Depends(get_password_hasher)]
+PasswordHasherDep = Annotated[PooledPasswordHasher, Depends(get_password_hasher)]
 TokenGeneratorDep = Annotated[JWTService, Depends(get_token_generator)]
 AvatarGeneratorDep = Annotated[InitialsAvatarGenerator, Depends(get_avatar_generator)]
 EmailServiceDep = Annotated[IEmailService, Depends(get_email_service)]
@@ -136,38 +144,46 @@ EmailServiceDep = Annotated[IEmailService, Depends(get_email_service)]
 # ============================================================================
 
 
-def get_user_repository(session: SessionDep) -> SqlAlchemyUserRepository:
-    """Get user repository."""
-    return SqlAlchemyUserRepository(session)
+def get_user_repository(session: SessionDep) -> IUserRepository:
+    """Get user repository; writes invalidate cached user snapshots."""
+    return CachedUserRepository(SqlAlchemyUserRepository(session), session=session)
 
 
-def get_verification_token_repository(
-    session: SessionDep,
-) -> SqlAlchemyVerificationTokenRepository:
-    """Get verification token repository."""
+def get_verification_token_repository(session: SessionDep) -> IVerificationTokenRepository:
+    """Get verification token repository; Redis-backed when enabled."""
+    if settings.email_tokens_redis_enabled:
+        return RedisVerificationTokenRepository(get_redis_client())
     return SqlAlchemyVerificationTokenRepository(session)
 
 
-def get_reset_token_repository(session: SessionDep) -> SqlAlchemyResetTokenRepository:
-    """Get reset token repository."""
+def get_reset_token_repository(session: SessionDep) -> IResetTokenRepository:
+    """Get reset token repository; Redis-backed when enabled."""
+    if settings.email_tokens_redis_enabled:
+        return RedisResetTokenRepository(get_redis_client())
     return SqlAlchemyResetTokenRepository(session)
 
 
 def get_refresh_token_repository(redis: RedisDep) -> RedisRefreshTokenRepository:
-    """Get refresh token repository."""
-    return RedisRefreshTokenRepository(redis)
+    """Get refresh token repository; revoking a user also drops their cached access tokens."""
+    return RedisRefreshTokenRepository(redis, access_token_cache=verified_access_tokens)
 
 
-UserRepositoryDep = Annotated[SqlAlchemyUserRepository, Depends(get_user_repository)]
+def get_profile_activity_repository(session: SessionDep) -> IProfileActivityRepository:
+    """Get profile activity repository."""
+    return SqlAlchemyProfileActivityRepository(session)
+
+
+UserRepositoryDep = Annotated[IUserRepository, Depends(get_user_repository)]
 VerificationTokenRepositoryDep = Annotated[
-    SqlAlchemyVerificationTokenRepository, Depends(get_verification_token_repository)
-]
-ResetTokenRepositoryDep = Annotated[
-    SqlAlchemyResetTokenRepository, Depends(get_reset_token_repository)
+    IVerificationTokenRepository, Depends(get_verification_token_repository)
 ]
+ResetTokenRepositoryDep = Annotated[IResetTokenRepository, Depends(get_reset_token_repository)]
 RefreshTokenRepositoryDep = Annotated[
     RedisRefreshTokenRepository, Depends(get_refresh_token_repository)
 ]
+ProfileActivityRepositoryDep = Annotated[
+    IProfileActivityRepository, Depends(get_profile_activity_repository)
+]
 
 
 # ============================================================================
@@ -298,24 +314,23 @@ def get_complete_profile_handler(
     )
 
 
-def get_current_user_handler(user_repo: UserRepositoryDep) -> GetCurrentUserHandler:
-    """Get current user handler."""
-    return GetCurrentUserHandler(user_repository=user_repo)
-
-
 def get_profile_handler(user_repo: UserRepositoryDep) -> GetProfileHandler:
     """Get profile handler."""
     return GetProfileHandler(user_repository=user_repo)
 
 
-def get_profile_activity_handler(user_repo: UserRepositoryDep) -> GetProfileActivityHandler:
+def get_profile_activity_handler(
+    activity_repo: ProfileActivityRepositoryDep,
+) -> GetProfileActivityHandler:
     """Get profile activity handler."""
-    return GetProfileActivityHandler(user_repository=user_repo)
+    return GetProfileActivityHandler(activity_repository=activity_repo)
 
 
-def get_profile_stats_handler(user_repo: UserRepositoryDep) -> GetProfileStatsHandler:
+def get_profile_stats_handler(
+    activity_repo: ProfileActivityRepositoryDep,
+) -> GetProfileStatsHandler:
     """Get profile stats handler."""
-    return GetProfileStatsHandler(user_repository=user_repo)
+    return GetProfileStatsHandler(activity_repository=activity_repo)
 
 
 def get_update_profile_handler(
@@ -336,6 +351,22 @@ def get_update_profile_handler(
 security = HTTPBearer(auto_error=False)
 
 
+def verify_access_token(token: str) -> UUID | None:
+    """
+    Get the user ID of a valid access token, or None.
+
+    Tokens verified earlier are served from the in-process cache; the JWT
+    signature is only checked on a miss.
+    """
+    user_id = verified_access_tokens.get(token)
+    if user_id is None:
+        claims = get_token_generator().decode_access_token(token)
+        if claims is None or not verified_access_tokens.put(token, claims):
+            return None
+        user_id = claims.user_id
+    return user_id.value
+
+
 async def get_current_user_id(
     _request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)] = None,
@@ -352,8 +383,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token_generator = get_token_generator()
-    user_id = token_generator.validate_access_token(credentials.credentials)
+    user_id = verify_access_token(credentials.credentials)
 
     if user_id is None:
         raise HTTPException(
@@ -362,30 +392,27 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user_id.value
+    return user_id
 
 
 async def get_current_user(
     user_id: Annotated[UUID, Depends(get_current_user_id)],
-    handler: Annotated[GetCurrentUserHandler, Depends(get_current_user_handler)],
-) -> User:
+    session: SessionDep,
+) -> UserSnapshot:
     """
-    Get current authenticated user.
+    Get current authenticated user, served from the user snapshot cache.
 
     Raises HTTPException 401 if not authenticated.
     Raises HTTPException 404 if user not found.
     """
-    from src.identity.application.queries import GetCurrentUserQuery
-    from src.identity.domain.exceptions import UserNotFoundError
-
-    try:
-        return await handler.handle(GetCurrentUserQuery(user_id=user_id))
-    except UserNotFoundError as e:
+    user = await user_snapshots.get(session, user_id)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
-        ) from e
+        )
+    return user
 
 
 CurrentUserIdDep = Annotated[UUID, Depends(get_current_user_id)]
-CurrentUserDep = Annotated[User, Depends(get_current_user)]
+CurrentUserDep = Annotated[UserSnapshot, Depends(get_current_user)]
@@ -153,6 +153,7 @@ class ActivityItemResponse(BaseModel):
 
     id: str
     type: str
+    title: str | None = None
     content: str
     created_at: datetime
 
@@ -162,6 +163,8 @@ class ActivityResponse(BaseModel):
 
     items: list[ActivityItemResponse]
     total_count: int
+    cursor: str | None = None
+    has_more: bool = False
 
 
 class ActivityChartResponse(BaseModel):
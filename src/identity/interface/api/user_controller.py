@@ -65,19 +65,15 @@ async def get_current_user(
     profile = None
     if current_user.profile is not None:
         profile = ProfileResponse(
-            display_name=(
-                current_user.profile.display_name.value
-                if current_user.profile.display_name
-                else None
-            ),
+            display_name=current_user.profile.display_name,
             avatar_url=current_user.profile.avatar_url,
             bio=current_user.profile.bio,
             is_complete=current_user.profile.is_complete,
         )
 
     return UserResponse(
-        id=current_user.id.value,
-        email=current_user.email.value,
+        id=current_user.id,
+        email=current_user.email,
         is_verified=current_user.is_verified,
         is_active=current_user.is_active,
         profile=profile,
@@ -308,11 +304,11 @@ async def get_profile_activity(
     current_user_id: CurrentUserIdDep,
     handler: Annotated[GetProfileActivityHandler, Depends(get_profile_activity_handler)],
     limit: int = 20,
-    offset: int = 0,
+    cursor: str | None = None,
 ) -> ActivityResponse:
-    """Get current user's activity feed."""
+    """Get current user's posts and comments, newest first."""
     try:
-        query = GetProfileActivityQuery(user_id=current_user_id, limit=limit, offset=offset)
+        query = GetProfileActivityQuery(user_id=current_user_id, limit=limit, cursor=cursor)
         activity = await handler.handle(query)
     except ProfileNotFoundError as e:
         raise HTTPException(
@@ -325,12 +321,15 @@ async def get_profile_activity(
             ActivityItemResponse(
                 id=item.id,
                 type=item.type,
+                title=item.title,
                 content=item.content,
                 created_at=item.created_at,
             )
             for item in activity.items
         ],
         total_count=activity.total_count,
+        cursor=activity.cursor,
+        has_more=activity.has_more,
     )
 
 
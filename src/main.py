@@ -1,33 +1,53 @@
 """FastAPI application entry point."""
 
 import logging
+import secrets
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 import structlog
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from src.classroom.application.event_handlers.completion_rollup_handlers import (
+    handle_course_completed,
+    handle_lesson_completed,
+    handle_lesson_uncompleted,
+    handle_progress_started,
+)
+from src.classroom.application.last_accessed_buffer import last_accessed_buffer
+from src.classroom.domain.events import (
+    CourseCompleted,
+    LessonCompleted,
+    LessonUncompleted,
+    ProgressStarted,
+)
 from src.classroom.interface.api import (
     courses_router,
     lessons_router,
     modules_router,
     progress_router,
 )
+from src.classroom.interface.api.dependencies import open_progress_repository
 from src.community.domain.events import (
     CommentAdded,
+    CommentDeleted,
+    CommentEdited,
     CommentLiked,
     CommentUnliked,
     PostCreated,
+    PostDeleted,
+    PostEdited,
     PostLiked,
     PostUnliked,
 )
+from src.community.infrastructure.persistence import memberships
 from src.community.interface.api import (
     categories_router,
     comments_router,
@@ -44,6 +64,7 @@ from src.gamification.application.event_handlers.community_event_handlers import
     handle_post_created,
     handle_post_liked,
     handle_post_unliked,
+    point_batch_writer,
 )
 from src.gamification.interface.api.gamification_controller import (
     default_router as gamification_default_router,
@@ -51,9 +72,21 @@ from src.gamification.interface.api.gamification_controller import (
 from src.gamification.interface.api.gamification_controller import (
     router as gamification_router,
 )
-from src.identity.domain.exceptions import RateLimitExceededError
-from src.identity.infrastructure.services import limiter
-from src.identity.interface.api import auth_router, user_router
+from src.identity.application.event_handlers import profile_activity_handlers
+from src.identity.domain.exceptions import RateLimitExceededError, ServiceBusyError
+from src.identity.infrastructure.persistence import token_blacklist_filter, user_snapshots
+from src.identity.infrastructure.services import (
+    email_outbox_sender,
+    expired_token_purger,
+    limiter,
+    password_hasher,
+    verified_access_tokens,
+)
+from src.identity.interface.api import auth_router, avatar_router, user_router
+from src.shared.infrastructure.compressed_response_cache import compressed_response_cache
+from src.shared.infrastructure.metrics import metrics
+from src.shared.infrastructure.redis_client import close_redis_client, get_redis_client
+from src.shared.infrastructure.reference_cache import reference_cache
 
 # Configure structlog
 structlog.configure(
@@ -86,7 +119,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("application_startup", env=settings.app_env)
 
     # Register gamification event handlers
-    from src.shared.infrastructure.event_bus import event_bus
+    from src.shared.infrastructure.event_bus import BACKGROUND, event_bus
 
     event_bus.register_handler(PostCreated, handle_post_created)  # type: ignore[arg-type]
     event_bus.register_handler(PostLiked, handle_post_liked)  # type: ignore[arg-type]
@@ -95,7 +128,113 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     event_bus.register_handler(CommentLiked, handle_comment_liked)  # type: ignore[arg-type]
     event_bus.register_handler(CommentUnliked, handle_comment_unliked)  # type: ignore[arg-type]
 
+    # Keep classroom completion rollups current
+    event_bus.register_handler(ProgressStarted, handle_progress_started)  # type: ignore[arg-type]
+    event_bus.register_handler(LessonCompleted, handle_lesson_completed)  # type: ignore[arg-type]
+    event_bus.register_handler(LessonUncompleted, handle_lesson_uncompleted)  # type: ignore[arg-type]
+    event_bus.register_handler(CourseCompleted, handle_course_completed)  # type: ignore[arg-type]
+
+    # Keep profile contribution counters and the activity index current
+    event_bus.register_handler(PostCreated, profile_activity_handlers.handle_post_created)  # type: ignore[arg-type]
+    event_bus.register_handler(PostEdited, profile_activity_handlers.handle_post_edited)  # type: ignore[arg-type]
+    event_bus.register_handler(PostDeleted, profile_activity_handlers.handle_post_deleted)  # type: ignore[arg-type]
+    event_bus.register_handler(CommentAdded, profile_activity_handlers.handle_comment_added)  # type: ignore[arg-type]
+    event_bus.register_handler(CommentEdited, profile_activity_handlers.handle_comment_edited)  # type: ignore[arg-type]
+    event_bus.register_handler(CommentDeleted, profile_activity_handlers.handle_comment_deleted)  # type: ignore[arg-type]
+
+    # Subscribers run off the request path unless configured inline
+    event_bus.configure(
+        mode=settings.event_bus_mode,
+        queue_size=settings.event_bus_queue_size,
+        workers=settings.event_bus_workers,
+        handler_timeout_seconds=settings.event_bus_handler_timeout_seconds,
+        enqueue_timeout_seconds=settings.event_bus_enqueue_timeout_seconds,
+    )
+    point_batch_writer.configure(
+        window_seconds=settings.gamification_batch_window_ms / 1000,
+        max_batch_size=settings.gamification_batch_max_size,
+        detached=settings.event_bus_mode == BACKGROUND,
+    )
+    last_accessed_buffer.configure(
+        flush_interval_seconds=settings.classroom_last_accessed_flush_seconds,
+        max_pending=settings.classroom_last_accessed_max_pending,
+        open_repository=open_progress_repository,
+    )
+    last_accessed_buffer.start()
+    compressed_response_cache.configure(max_bytes=settings.response_cache_max_bytes)
+    password_hasher.configure(
+        workers=settings.password_hash_workers,
+        max_waiting=settings.password_hash_max_waiting,
+    )
+    verified_access_tokens.configure(max_entries=settings.access_token_cache_max_entries)
+    email_outbox_sender.configure(
+        batch_size=settings.email_outbox_batch_size,
+        poll_interval_seconds=settings.email_outbox_poll_seconds,
+        max_attempts=settings.email_outbox_max_attempts,
+        backoff_base_seconds=settings.email_outbox_backoff_base_seconds,
+        backoff_max_seconds=settings.email_outbox_backoff_max_seconds,
+        retention_days=settings.email_outbox_retention_days,
+    )
+    email_outbox_sender.start()
+    if settings.token_purge_enabled:
+        expired_token_purger.configure(
+            batch_size=settings.token_purge_batch_size,
+            interval_seconds=settings.token_purge_interval_seconds,
+        )
+        expired_token_purger.start()
+
+    # Reference data cache: optional cross-process coherence through Redis
+    reference_cache.configure(
+        ttl_seconds=settings.reference_cache_ttl_seconds,
+        redis=get_redis_client() if settings.reference_cache_redis_coherence else None,
+    )
+
+    # Current-user and author lookups: local LRU in front of a shared Redis tier
+    user_snapshots.configure(
+        max_entries=settings.user_cache_max_entries,
+        local_ttl_seconds=settings.user_cache_local_ttl_seconds,
+        redis_ttl_seconds=settings.user_cache_redis_ttl_seconds,
+        redis=get_redis_client() if settings.user_cache_redis_enabled else None,
+    )
+
+    # Membership and role checks behind every community authorization
+    memberships.configure(
+        max_entries=settings.membership_cache_max_entries,
+        ttl_seconds=settings.membership_cache_ttl_seconds,
+    )
+
+    # Refresh token lookups skip Redis for tokens the local filter rules out
+    if settings.token_blacklist_filter_enabled:
+        token_blacklist_filter.configure(
+            capacity=settings.token_blacklist_filter_capacity,
+            rebuild_interval_seconds=settings.token_blacklist_filter_rebuild_seconds,
+        )
+        token_blacklist_filter.start(get_redis_client())
+
+    # Make sure upcoming point_transactions partitions exist; compaction runs as a job
+    from src.gamification.infrastructure.persistence.point_transaction_partitions import (
+        PointTransactionPartitionManager,
+    )
+    from src.identity.interface.api.dependencies import get_database
+
+    try:
+        async with get_database().session() as session:
+            await PointTransactionPartitionManager(session).ensure_partitions()
+    except Exception:
+        logger.exception("point_transaction_partition_maintenance_failed")
+
     yield
+
+    # Finish queued events first: their handlers feed the point batch writer.
+    # Then apply buffered point changes and lesson positions before the process exits
+    await event_bus.close(timeout_seconds=settings.event_bus_drain_timeout_seconds)
+    await point_batch_writer.close()
+    await last_accessed_buffer.close()
+    password_hasher.close()
+    await email_outbox_sender.close()
+    await expired_token_purger.close()
+    await token_blacklist_filter.close()
+    await close_redis_client()
     logger.info("application_shutdown")
 
 
@@ -171,6 +310,16 @@ async def rate_limit_handler(_request: Request, exc: RateLimitExceededError) ->
     )
 
 
+@app.exception_handler(ServiceBusyError)
+async def service_busy_handler(_request: Request, exc: ServiceBusyError) -> JSONResponse:
+    """Handle saturated bounded resources."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"code": exc.code, "message": exc.message},
+        headers={"Retry-After": str(exc.retry_after)} if exc.retry_after else {},
+    )
+
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check() -> dict[str, str]:
@@ -178,9 +327,26 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse, include_in_schema=False)
+async def metrics_endpoint(request: Request) -> str:
+    """Expose in-process metrics in the Prometheus text format.
+
+    Not served unless METRICS_TOKEN is set; scrapers send it as a bearer token.
+    """
+    if not settings.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not secrets.compare_digest(supplied.encode(), settings.metrics_token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, headers={"WWW-Authenticate": "Bearer"}
+        )
+    return metrics.render()
+
+
 # Mount routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(user_router, prefix="/api/v1")
+app.include_router(avatar_router, prefix="/api/v1")
 app.include_router(categories_router, prefix="/api/v1")
 app.include_router(members_router, prefix="/api/v1")
 app.include_router(posts_router, prefix="/api/v1")
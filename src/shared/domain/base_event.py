@@ -1,5 +1,6 @@
 """Base domain event class."""
 
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
@@ -28,3 +29,11 @@ class DomainEvent:
     def event_type(self) -> str:
         """Get the event type name (class name)."""
         return self.__class__.__name__
+
+    @property
+    def aggregate_id(self) -> Hashable | None:
+        """Key of the aggregate the event belongs to, if subscribers depend on its order.
+
+        Events with the same key are handled in the order they were published.
+        """
+        return None
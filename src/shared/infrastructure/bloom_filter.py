@@ -0,0 +1,47 @@
+"""Bloom filter for negative lookups.
+
+A Bloom filter answers "definitely not present" or "maybe present". It is
+used in front of remote sets (e.g. the token blacklist in Redis) so the common
+"not present" case is answered from memory; a "maybe" still goes to the
+source of truth. Items cannot be removed, so owners rebuild the filter
+periodically to shed expired members.
+"""
+
+import hashlib
+import math
+from collections.abc import Iterator
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for ``capacity`` items at ``error_rate``."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Number of items added (including duplicates)."""
+        return self._count
+
+    def add(self, item: bytes) -> None:
+        """Add an item."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, item: bytes) -> bool:
+        """False if the item was definitely never added."""
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def _positions(self, item: bytes) -> Iterator[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hashes):
+            yield (first + i * second) % self._size
@@ -0,0 +1,156 @@
+"""LRU cache of encoded response bodies, keyed by strong ETag.
+
+Large, rarely changing payloads (lesson content) are serialized and
+compressed once per version, then served from memory:
+
+- ``negotiate_encoding`` picks ``br`` (when the optional ``brotli`` package is
+  installed), ``gzip`` or identity from an Accept-Encoding header.
+- ``get_or_build`` returns the body for an ETag in the requested encoding,
+  building the identity body and compressing it off the event loop on a miss.
+- Entries are evicted least-recently-used once their total size exceeds
+  ``max_bytes``. Since keys are content versions, stale entries are never
+  served; they just age out.
+"""
+
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+# Bodies smaller than this are not worth a Content-Encoding header
+MIN_COMPRESS_BYTES = 1024
+
+IDENTITY = "identity"
+
+
+def make_etag(*parts: object) -> str:
+    """A strong ETag derived from the version fields of a representation."""
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip().removeprefix("W/") for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Content codings this process can produce, preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str:
+    """Pick the preferred supported coding the client accepts, else identity."""
+    if not accept_encoding:
+        return IDENTITY
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for coding in supported_encodings():
+        if accepted.get(coding, wildcard) > 0:
+            return coding
+    return IDENTITY
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=11)  # type: ignore[no-any-return]
+    return gzip.compress(body, compresslevel=9)
+
+
+class CompressedResponseCache:
+    """Byte-bounded LRU of encoded bodies per (ETag, content coding)."""
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_MAX_BYTES, registry: MetricsRegistry = metrics
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._registry = registry
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._size = 0
+        registry.register_gauge("compressed_response_cache_bytes", lambda: self._size)
+
+    def configure(self, max_bytes: int) -> None:
+        """Change the size budget, evicting if it shrank."""
+        self._max_bytes = max_bytes
+        self._evict()
+
+    async def get_or_build(
+        self, etag: str, encoding: str, build: Callable[[], Awaitable[bytes]]
+    ) -> tuple[bytes, str]:
+        """Return ``(body, content coding)`` for ``etag``, building it on a miss.
+
+        Small bodies are always returned as identity.
+        """
+        cached = self._get(etag, encoding)
+        if cached is not None:
+            return cached
+
+        self._registry.increment("compressed_response_cache_misses_total")
+        identity = self._entries.get((etag, IDENTITY))
+        if identity is None:
+            identity = await build()
+            self._put((etag, IDENTITY), identity)
+        if encoding == IDENTITY or len(identity) < MIN_COMPRESS_BYTES:
+            return identity, IDENTITY
+
+        encoded = await asyncio.to_thread(_compress, identity, encoding)
+        self._put((etag, encoding), encoded)
+        return encoded, encoding
+
+    def clear(self) -> None:
+        """Drop all entries. Used in tests."""
+        self._entries.clear()
+        self._size = 0
+
+    def _get(self, etag: str, encoding: str) -> tuple[bytes, str] | None:
+        for key in ((etag, encoding), (etag, IDENTITY)):
+            body = self._entries.get(key)
+            if body is None:
+                continue
+            if key[1] == IDENTITY and encoding != IDENTITY and len(body) >= MIN_COMPRESS_BYTES:
+                # Only the identity body is cached so far; compress it on the miss path
+                return None
+            self._entries.move_to_end(key)
+            self._registry.increment("compressed_response_cache_hits_total")
+            return body, key[1]
+        return None
+
+    def _put(self, key: tuple[str, str], body: bytes) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = body
+        self._size += len(body)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._size > self._max_bytes and self._entries:
+            _, body = self._entries.popitem(last=False)
+            self._size -= len(body)
+            self._registry.increment("compressed_response_cache_evictions_total")
+
+
+# Global cache instance
+compressed_response_cache = CompressedResponseCache()
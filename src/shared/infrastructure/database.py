@@ -11,6 +11,8 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
+from src.shared.infrastructure.event_bus import event_bus
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -64,19 +66,23 @@ class Database:
         """
         Create a new database session.
 
+        Domain events published while the session is open reach background
+        subscribers only once it has committed, and never if it rolls back.
+
         Usage:
             async with database.session() as session:
                 # use session
         """
         session = self._session_factory()
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        async with event_bus.deferred():
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
 
     async def close(self) -> None:
         """Close the database engine."""
@@ -1,14 +1,89 @@
-"""Simple in-memory event bus for domain events."""
+"""In-memory event bus for domain events.
 
+Two dispatch modes:
+
+- ``inline`` (the default, used by tests): publish() awaits each subscriber
+  in turn, and a failing subscriber's exception reaches the publisher.
+- ``background`` (what the application runs): publish() hands the event to
+  one of ``workers`` bounded queues and returns. Each queue has a single
+  worker, and an event's queue is chosen by its ``aggregate_id``, so events of
+  the same aggregate (a post created then deleted, a like then an unlike) are
+  handled one after another in publish order. A worker runs all subscribers of
+  an event concurrently; failures are logged and counted, never raised to the
+  publisher. Subscribers run in a copy of the publisher's context, so
+  request-scoped log fields carry over.
+
+Handler deadline: when an event's subscribers are still running after
+``handler_timeout_seconds``, the timeout is logged and counted and the worker
+moves on, so one hung subscriber does not stall every aggregate sharing its
+queue. The overrunning subscribers are not cancelled (that could stop them
+halfway through their writes); later events of the same aggregate wait behind
+them off the worker, so the aggregate's order still holds.
+
+Events published inside ``deferred()`` are held until the block exits and
+dropped if it raises. ``Database.session()`` opens such a block around its
+transaction, so in background mode subscribers only see events of committed
+work.
+
+Backpressure: when a queue is full, publish() waits for room, so a publisher
+slows down rather than losing events or overtaking earlier events of the same
+aggregate. Subscribers themselves wait at most ``enqueue_timeout_seconds`` and
+then dispatch the event themselves, since a worker waiting on its own queue
+would never make room.
+
+close() drains every queue and waits for overrunning events (up to a
+timeout), then stops the workers; events
+published while closing are dispatched by the publisher. The application
+closes the bus on shutdown before the stages its subscribers feed, such as
+the point batch writer.
+
+Events of different aggregates are handled in no guaranteed order.
+Subscribers open their own sessions; the read models they maintain can be
+rebuilt.
+"""
+
+import asyncio
+import contextvars
 from collections import defaultdict
-from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Hashable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import structlog
 
 from src.shared.domain.base_event import DomainEvent
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
 
 EventType = TypeVar("EventType", bound=DomainEvent)
 EventHandler = Callable[[DomainEvent], Awaitable[None]]
 
+INLINE = "inline"
+BACKGROUND = "background"
+
+
+@dataclass(frozen=True)
+class _Delivery:
+    event: DomainEvent
+    context: contextvars.Context
+
+
+def _ordering_key(event: DomainEvent) -> Hashable:
+    key = event.aggregate_id
+    return key if key is not None else event.event_id
+
+
+# Deliveries held by the innermost deferred() block of the current context
+_pending: contextvars.ContextVar[list[_Delivery] | None] = contextvars.ContextVar(
+    "event_bus_pending", default=None
+)
+# Set while subscribers run, so their own publishes never block on a full queue
+_dispatching: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "event_bus_dispatching", default=False
+)
+
 
 class EventBus:
     """
@@ -29,9 +104,38 @@ class EventBus:
         await event_bus.publish(UserRegistered(user_id=user.id, email=user.email))
     """
 
-    def __init__(self) -> None:
-        """Initialize the event bus with empty handlers."""
+    def __init__(self, registry: MetricsRegistry = metrics) -> None:
+        """Initialize the event bus with empty handlers, in inline mode."""
         self._handlers: dict[type[DomainEvent], list[EventHandler]] = defaultdict(list)
+        self._metrics = registry
+        self._mode = INLINE
+        self._queue_size = 1000
+        self._worker_count = 8
+        self._handler_timeout_seconds = 10.0
+        self._enqueue_timeout_seconds = 0.5
+        self._queues: list[asyncio.Queue[_Delivery]] = []
+        self._workers: list[asyncio.Task[None]] = []
+        self._overrunning: dict[Hashable, asyncio.Task[None]] = {}
+        self._gauged = False
+        self._closing = False
+
+    def configure(
+        self,
+        mode: str,
+        queue_size: int,
+        workers: int,
+        handler_timeout_seconds: float,
+        enqueue_timeout_seconds: float,
+    ) -> None:
+        """Choose the dispatch mode and its limits, and (re)open the bus."""
+        if mode not in (INLINE, BACKGROUND):
+            raise ValueError(f"Unknown event bus mode: {mode!r}")
+        self._mode = mode
+        self._queue_size = queue_size
+        self._worker_count = workers
+        self._handler_timeout_seconds = handler_timeout_seconds
+        self._enqueue_timeout_seconds = enqueue_timeout_seconds
+        self._closing = False
 
     def subscribe(
         self, event_type: type[EventType]
@@ -68,14 +172,29 @@ class EventBus:
         """
         Publish an event to all registered handlers.
 
+        Inline mode returns once every handler has run; background mode once
+        the event is queued, or held by the enclosing deferred() block.
+
         Args:
             event: The domain event to publish
         """
-        event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
+        handlers = self._handlers.get(type(event), [])
+        if not handlers:
+            return
 
-        for handler in handlers:
-            await handler(event)
+        if self._mode == INLINE:
+            for handler in handlers:
+                await handler(event)
+            return
+
+        context = contextvars.copy_context()
+        context.run(_pending.set, None)
+        delivery = _Delivery(event=event, context=context)
+        pending = _pending.get()
+        if pending is not None:
+            pending.append(delivery)
+            return
+        await self._deliver(delivery)
 
     async def publish_all(self, events: list[DomainEvent]) -> None:
         """
@@ -87,10 +206,154 @@ class EventBus:
         for event in events:
             await self.publish(event)
 
+    @asynccontextmanager
+    async def deferred(self) -> AsyncIterator[None]:
+        """Hold events published inside the block until it exits; drop them if it raises."""
+        outer = _pending.get()
+        pending: list[_Delivery] = []
+        _pending.set(pending)
+        try:
+            yield
+        finally:
+            _pending.set(outer)
+        for delivery in pending:
+            await self._deliver(delivery)
+
+    async def close(self, timeout_seconds: float | None = None) -> None:
+        """Drain queued and overrunning events, waiting at most ``timeout_seconds``, then stop the workers."""
+        self._closing = True
+        queues = list(self._queues)
+
+        async def drain() -> None:
+            await asyncio.gather(*(queue.join() for queue in queues))
+            while self._overrunning:
+                await asyncio.wait(set(self._overrunning.values()))
+
+        try:
+            await asyncio.wait_for(drain(), timeout_seconds)
+        except TimeoutError:
+            logger.error(
+                "event_bus_drain_timed_out",
+                dropped=sum(queue.qsize() for queue in queues),
+                running=len(self._overrunning),
+            )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+
     def clear(self) -> None:
         """Clear all registered handlers (useful for testing)."""
         self._handlers.clear()
 
+    async def _deliver(self, delivery: _Delivery) -> None:
+        if self._closing:
+            await self._dispatch(delivery)
+            return
+        await self._enqueue(self._queue_for(delivery.event), delivery)
+
+    def _queue_for(self, event: DomainEvent) -> asyncio.Queue[_Delivery]:
+        if not self._queues:
+            loop = asyncio.get_running_loop()
+            self._queues = [
+                asyncio.Queue(maxsize=self._queue_size) for _ in range(self._worker_count)
+            ]
+            self._workers = [loop.create_task(self._work(queue)) for queue in self._queues]
+            if not self._gauged:
+                self._gauged = True
+                self._metrics.register_gauge("event_bus_queue_depth", self._depth)
+        return self._queues[hash(_ordering_key(event)) % len(self._queues)]
+
+    def _depth(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    async def _enqueue(self, queue: asyncio.Queue[_Delivery], delivery: _Delivery) -> None:
+        try:
+            queue.put_nowait(delivery)
+            return
+        except asyncio.QueueFull:
+            self._metrics.increment("event_bus_queue_full_total")
+
+        if not _dispatching.get():
+            await queue.put(delivery)
+            return
+
+        try:
+            await asyncio.wait_for(queue.put(delivery), self._enqueue_timeout_seconds)
+        except TimeoutError:
+            # Still full, and this subscriber may be the worker that would drain it
+            self._metrics.increment("event_bus_dispatched_by_publisher_total")
+            logger.warning("event_bus_queue_full", event_type=delivery.event.event_type)
+            await self._dispatch(delivery)
+
+    async def _work(self, queue: asyncio.Queue[_Delivery]) -> None:
+        while True:
+            delivery = await queue.get()
+            try:
+                await self._handle(delivery)
+            finally:
+                queue.task_done()
+
+    async def _handle(self, delivery: _Delivery) -> None:
+        """Dispatch on the worker until the deadline, then let the event finish off it."""
+        key = _ordering_key(delivery.event)
+        earlier = self._overrunning.get(key)
+        if earlier is not None:
+            self._run_detached(key, self._dispatch_after(earlier, delivery))
+            return
+
+        task = asyncio.ensure_future(self._dispatch(delivery))
+        done, _ = await asyncio.wait({task}, timeout=self._handler_timeout_seconds)
+        if not done:
+            self._run_detached(key, task)
+
+    def _run_detached(
+        self, key: Hashable, work: asyncio.Task[None] | Coroutine[Any, Any, None]
+    ) -> None:
+        task = asyncio.ensure_future(work)
+        self._overrunning[key] = task
+
+        def forget(_: asyncio.Task[None]) -> None:
+            if self._overrunning.get(key) is task:
+                del self._overrunning[key]
+
+        task.add_done_callback(forget)
+
+    async def _dispatch_after(self, earlier: asyncio.Task[None], delivery: _Delivery) -> None:
+        await asyncio.wait({earlier})
+        await self._dispatch(delivery)
+
+    async def _dispatch(self, delivery: _Delivery) -> None:
+        """Run every handler of the event concurrently, in the publisher's context."""
+        handlers = self._handlers.get(type(delivery.event), [])
+        tasks = []
+        for handler in handlers:
+            context = delivery.context.copy()
+            context.run(_dispatching.set, True)
+            tasks.append(
+                asyncio.create_task(self._run_handler(handler, delivery.event), context=context)
+            )
+        await asyncio.gather(*tasks)
+
+    async def _run_handler(self, handler: EventHandler, event: DomainEvent) -> None:
+        name = getattr(handler, "__qualname__", repr(handler))
+        task = asyncio.ensure_future(handler(event))
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self._handler_timeout_seconds)
+            if not done:
+                self._metrics.increment("event_bus_handler_timeouts_total", event=event.event_type)
+                logger.error(
+                    "event_bus_handler_timed_out", event_type=event.event_type, handler=name
+                )
+            await task
+        except Exception:
+            self._metrics.increment("event_bus_handler_errors_total", event=event.event_type)
+            logger.exception("event_bus_handler_failed", event_type=event.event_type, handler=name)
+        else:
+            self._metrics.increment("event_bus_handled_total", event=event.event_type)
+
 
 # Global event bus instance
 event_bus = EventBus()
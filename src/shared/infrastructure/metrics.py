@@ -0,0 +1,70 @@
+"""Minimal in-process metrics registry.
+
+Counters and gauges are kept in memory and rendered in the Prometheus text
+exposition format by the ``/metrics`` endpoint. This keeps instrumentation
+dependency-free; a real collector can scrape the endpoint.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+
+LabelSet = tuple[tuple[str, str], ...]
+GaugeCallback = Callable[[], float]
+
+
+def _label_set(labels: dict[str, str]) -> LabelSet:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(f'{name}="{value}"' for name, value in labels)
+    return "{" + rendered + "}"
+
+
+class MetricsRegistry:
+    """Process-wide registry of counters and callback gauges."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, dict[LabelSet, float]] = defaultdict(lambda: defaultdict(float))
+        self._gauges: dict[str, dict[LabelSet, GaugeCallback]] = defaultdict(dict)
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Increment a counter."""
+        self._counters[name][_label_set(labels)] += value
+
+    def register_gauge(self, name: str, callback: GaugeCallback, **labels: str) -> None:
+        """Register a gauge whose value is read from ``callback`` on collection."""
+        self._gauges[name][_label_set(labels)] = callback
+
+    def counter_value(self, name: str, **labels: str) -> float:
+        """Get the current value of a counter (0 if never incremented)."""
+        series = self._counters.get(name)
+        if series is None:
+            return 0.0
+        return series.get(_label_set(labels), 0.0)
+
+    def collect(self) -> dict[str, float]:
+        """Collect all series as ``name{labels}`` -> value."""
+        samples: dict[str, float] = {}
+        for name, counter_series in sorted(self._counters.items()):
+            for labels, value in sorted(counter_series.items()):
+                samples[f"{name}{_format_labels(labels)}"] = value
+        for name, gauge_series in sorted(self._gauges.items()):
+            for labels, callback in sorted(gauge_series.items(), key=lambda item: item[0]):
+                samples[f"{name}{_format_labels(labels)}"] = float(callback())
+        return samples
+
+    def render(self) -> str:
+        """Render all series in the Prometheus text format."""
+        lines = [f"{series} {value:g}" for series, value in self.collect().items()]
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Reset all counters. Gauges stay registered. Used in tests."""
+        self._counters.clear()
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
@@ -0,0 +1,62 @@
+"""Process-wide Redis client.
+
+The refresh token blacklist, its local filter, reference cache coherence and
+the rate limiter all talk to the same Redis. They share one asyncio client
+whose connection pool is sized and timed out from settings:
+
+- At most ``redis_max_connections`` connections; a caller waits up to
+  ``redis_pool_timeout_seconds`` for a free one instead of opening more.
+- Socket connect/read timeouts bound how long a slow Redis can hold a request.
+- Idle connections are pinged after ``redis_health_check_interval_seconds``
+  before reuse, so connections dropped by the server are replaced quietly.
+
+The rate limiter uses a synchronous client (slowapi storage); it gets the
+same timeouts and pool size through ``limiter_storage_options``.
+"""
+
+from redis.asyncio import BlockingConnectionPool, Connection, Redis
+
+from src.config import settings
+
+_client: Redis | None = None  # type: ignore[type-arg]
+
+
+def _connection_options() -> dict[str, float | int | bool]:
+    return {
+        "socket_timeout": settings.redis_socket_timeout_seconds,
+        "socket_connect_timeout": settings.redis_connect_timeout_seconds,
+        "health_check_interval": settings.redis_health_check_interval_seconds,
+        "retry_on_timeout": True,
+    }
+
+
+def create_redis_client(url: str) -> Redis:  # type: ignore[type-arg]
+    """Create a client with its own pool configured from settings."""
+    pool: BlockingConnectionPool[Connection] = BlockingConnectionPool.from_url(
+        url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout_seconds,
+        **_connection_options(),
+    )
+    return Redis(connection_pool=pool)
+
+
+def get_redis_client() -> Redis:  # type: ignore[type-arg]
+    """Get the shared Redis client (singleton)."""
+    global _client
+    if _client is None:
+        _client = create_redis_client(settings.redis_url)
+    return _client
+
+
+async def close_redis_client() -> None:
+    """Close the shared client and its pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()  # type: ignore[attr-defined]
+        _client = None
+
+
+def limiter_storage_options() -> dict[str, float | int | bool]:
+    """Options for the rate limiter's Redis storage, matching the shared pool."""
+    return {"max_connections": settings.redis_max_connections, **_connection_options()}
@@ -0,0 +1,248 @@
+"""Versioned read-through cache for rarely changing reference data.
+
+Level configurations, categories and course level requirements are read on
+almost every request but change only through a handful of admin actions. This
+cache keeps them in process memory, keyed by ``(namespace, key)``.
+
+Consistency rules:
+- Every key carries a version. ``invalidate`` bumps it, and a load that
+  started before the bump is never stored, so in-flight reads cannot
+  resurrect stale values.
+- Writers call ``invalidate_on_commit`` which invalidates immediately and
+  again once the session commits, closing the window between the write and
+  the commit.
+- With Redis configured, each invalidation also bumps a per-namespace
+  generation counter in Redis. Other processes poll it at most once per
+  ``sync_interval_seconds`` and drop the namespace when it moves.
+- Entries expire after ``ttl_seconds`` as a safety net.
+
+Cached values are deep-copied in and out, so callers may mutate what they get.
+"""
+
+import asyncio
+import copy
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.infrastructure.metrics import MetricsRegistry, metrics
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_SYNC_INTERVAL_SECONDS = 1.0
+REDIS_GENERATION_PREFIX = "reference_cache:generation:"
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    version: tuple[int, int]
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit/miss statistics for one namespace."""
+
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ReferenceDataCache:
+    """In-process versioned read-through cache with optional Redis coherence."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        sync_interval_seconds: float = DEFAULT_SYNC_INTERVAL_SECONDS,
+        registry: MetricsRegistry = metrics,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._sync_interval_seconds = sync_interval_seconds
+        self._registry = registry
+        self._redis: Redis | None = None  # type: ignore[type-arg]
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._key_versions: dict[tuple[str, str], int] = defaultdict(int)
+        self._namespace_epochs: dict[str, int] = defaultdict(int)
+        self._remote_generations: dict[str, int] = {}
+        self._last_sync: dict[str, float] = {}
+        self._hits: dict[str, int] = defaultdict(int)
+        self._misses: dict[str, int] = defaultdict(int)
+        self._invalidations: dict[str, int] = defaultdict(int)
+        self._pending_tasks: set[asyncio.Task[None]] = set()
+        self._gauged_namespaces: set[str] = set()
+
+    def configure(
+        self,
+        ttl_seconds: float | None = None,
+        redis: Redis | None = None,  # type: ignore[type-arg]
+        sync_interval_seconds: float | None = None,
+    ) -> None:
+        """Adjust TTL and attach (or detach) Redis for cross-process coherence."""
+        if ttl_seconds is not None:
+            self._ttl_seconds = ttl_seconds
+        if sync_interval_seconds is not None:
+            self._sync_interval_seconds = sync_interval_seconds
+        self._redis = redis
+        self._remote_generations.clear()
+        self._last_sync.clear()
+
+    async def get_or_load(self, namespace: str, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for ``(namespace, key)``, loading it on a miss."""
+        await self._sync_remote(namespace)
+
+        cache_key = (namespace, key)
+        version = self._current_version(cache_key)
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry.version == version and entry.expires_at > time.monotonic():
+            self._record(namespace, self._hits, "reference_cache_hits_total")
+            return copy.deepcopy(entry.value)  # type: ignore[no-any-return]
+
+        self._record(namespace, self._misses, "reference_cache_misses_total")
+        value = await loader()
+
+        # Only store if nothing invalidated this key while we were loading
+        if self._current_version(cache_key) == version:
+            self._entries[cache_key] = _Entry(
+                value=copy.deepcopy(value),
+                version=version,
+                expires_at=time.monotonic() + self._ttl_seconds,
+            )
+        return value
+
+    async def invalidate(self, namespace: str, key: str | None = None) -> None:
+        """Invalidate one key, or the whole namespace when ``key`` is None."""
+        self._invalidate_local(namespace, key)
+        await self._bump_remote(namespace)
+
+    async def invalidate_on_commit(
+        self, session: AsyncSession | None, namespace: str, key: str | None = None
+    ) -> None:
+        """Invalidate now and again after ``session`` commits."""
+        await self.invalidate(namespace, key)
+        if session is None:
+            return
+
+        def _after_commit(_session: Any) -> None:
+            self._invalidate_local(namespace, key)
+            if self._redis is not None:
+                task = asyncio.get_running_loop().create_task(self._bump_remote(namespace))
+                self._pending_tasks.add(task)
+                task.add_done_callback(self._pending_tasks.discard)
+
+        event.listen(session.sync_session, "after_commit", _after_commit, once=True)
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Per-namespace hit/miss statistics."""
+        namespaces = set(self._hits) | set(self._misses) | set(self._invalidations)
+        return {
+            namespace: CacheStats(
+                hits=self._hits[namespace],
+                misses=self._misses[namespace],
+                invalidations=self._invalidations[namespace],
+                entries=sum(1 for ns, _ in self._entries if ns == namespace),
+            )
+            for namespace in sorted(namespaces)
+        }
+
+    def reset(self) -> None:
+        """Drop all entries and statistics. Used in tests."""
+        self._entries.clear()
+        self._key_versions.clear()
+        self._namespace_epochs.clear()
+        self._remote_generations.clear()
+        self._last_sync.clear()
+        self._hits.clear()
+        self._misses.clear()
+        self._invalidations.clear()
+
+    def _current_version(self, cache_key: tuple[str, str]) -> tuple[int, int]:
+        return self._namespace_epochs[cache_key[0]], self._key_versions[cache_key]
+
+    def _invalidate_local(self, namespace: str, key: str | None) -> None:
+        if key is None:
+            self._drop_namespace(namespace)
+        else:
+            cache_key = (namespace, key)
+            self._key_versions[cache_key] += 1
+            self._entries.pop(cache_key, None)
+        self._record(namespace, self._invalidations, "reference_cache_invalidations_total")
+
+    def _drop_namespace(self, namespace: str) -> None:
+        self._namespace_epochs[namespace] += 1
+        for cache_key in [ck for ck in self._entries if ck[0] == namespace]:
+            del self._entries[cache_key]
+
+    def _record(self, namespace: str, counter: dict[str, int], metric: str) -> None:
+        counter[namespace] += 1
+        self._registry.increment(metric, namespace=namespace)
+        if namespace not in self._gauged_namespaces:
+            self._gauged_namespaces.add(namespace)
+            self._registry.register_gauge(
+                "reference_cache_hit_ratio",
+                lambda: self._hit_rate(namespace),
+                namespace=namespace,
+            )
+
+    def _hit_rate(self, namespace: str) -> float:
+        lookups = self._hits[namespace] + self._misses[namespace]
+        return self._hits[namespace] / lookups if lookups else 0.0
+
+    async def _sync_remote(self, namespace: str) -> None:
+        """Drop the namespace if another process bumped its Redis generation."""
+        if self._redis is None:
+            return
+        now = time.monotonic()
+        if now - self._last_sync.get(namespace, float("-inf")) < self._sync_interval_seconds:
+            return
+        self._last_sync[namespace] = now
+
+        try:
+            raw = await self._redis.get(REDIS_GENERATION_PREFIX + namespace)
+        except RedisError:
+            logger.warning("reference_cache_sync_failed", namespace=namespace)
+            return
+
+        generation = int(raw) if raw is not None else 0
+        known = self._remote_generations.get(namespace)
+        if known is not None and known != generation:
+            self._drop_namespace(namespace)
+        self._remote_generations[namespace] = generation
+
+    async def _bump_remote(self, namespace: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            generation = int(await self._redis.incr(REDIS_GENERATION_PREFIX + namespace))
+        except RedisError:
+            logger.warning("reference_cache_publish_failed", namespace=namespace)
+            return
+
+        known = self._remote_generations.get(namespace)
+        if known is not None and generation != known + 1:
+            # Someone else invalidated in the meantime
+            self._drop_namespace(namespace)
+        self._remote_generations[namespace] = generation
+
+
+# Global reference data cache
+reference_cache = ReferenceDataCache()
@@ -15,11 +15,14 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from src.community.infrastructure.persistence import memberships
 from src.config import settings
+from src.identity.infrastructure.persistence import user_snapshots
 from src.identity.infrastructure.services import Argon2PasswordHasher
 from src.identity.interface.api.dependencies import get_session
 from src.main import app
 from src.shared.infrastructure import Base
+from src.shared.infrastructure.reference_cache import reference_cache
 
 # Test database URL (use separate test database)
 # Use project-specific database name for multi-agent isolation
@@ -111,6 +114,18 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_reference_cache() -> Generator[None, None, None]:
+    """Keep cached reference data and users from leaking across rolled-back tests."""
+    reference_cache.reset()
+    user_snapshots.reset()
+    memberships.reset()
+    yield
+    reference_cache.reset()
+    user_snapshots.reset()
+    memberships.reset()
+
+
 @pytest.fixture
 def password_hasher() -> Argon2PasswordHasher:
     """Get password hasher."""
@@ -119,6 +119,45 @@ Feature: Classroom
       | cover_image_url | not-a-url   |
     Then course creation should fail with "invalid URL format" error
 
+  # =============================================================================
+  # COURSE IMPORT (ADMIN)
+  # =============================================================================
+
+  @happy_path
+  Scenario: Admin imports a course from an NDJSON document
+    Given the user "admin@example.com" is authenticated
+    When the admin imports the course document:
+      """
+      {"type": "course", "title": "Imported Python", "description": "From a document"}
+      {"type": "module", "title": "Getting Started"}
+      {"type": "lesson", "title": "Installing Python", "content_type": "text", "content": "Download it"}
+      {"type": "lesson", "title": "First Program", "content_type": "text", "content": "Say hello"}
+      {"type": "module", "title": "Basics"}
+      {"type": "lesson", "title": "Variables", "content_type": "text", "content": "Names for values"}
+      """
+    Then the course should be imported with 2 modules and 3 lessons
+    And the imported course should have modules "Getting Started, Basics" with "2, 1" lessons
+
+  @error
+  Scenario: Course import reports every invalid line and writes nothing
+    Given the user "admin@example.com" is authenticated
+    When the admin imports the course document:
+      """
+      {"type": "course", "title": "Broken Import"}
+      {"type": "module"}
+      {"type": "lesson", "title": "Bad Type", "content_type": "podcast", "content": "Audio"}
+      not json
+      """
+    Then the import should fail with errors on lines 2, 3, 4
+    And no course should have been created
+
+  @security
+  Scenario: Non-admin cannot import a course
+    Given the user "member@example.com" is authenticated
+    And the user is not an admin
+    When the user attempts to import a course
+    Then the request should fail with "unauthorized" error
+
   # =============================================================================
   # MODULE MANAGEMENT (ADMIN)
   # =============================================================================
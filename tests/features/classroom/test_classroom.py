@@ -6,6 +6,7 @@ Phase 1 scenarios (11 enabled):
 - Course editing (1 happy path)
 - Member views course list (1 happy path)
 - Soft-deleted courses hidden (1 happy path)
+- Course import (1 happy path + 1 validation + 1 security)
 
 Phase 2 scenarios (28 enabled):
 - Module management (6 happy path + 4 validation)
@@ -640,6 +641,29 @@ async def admin_attempts_create_course(
     context["course_response"] = response
 
 
+# ============================================================================
+# WHEN STEPS - COURSE IMPORT
+# ============================================================================
+
+
+@when("the admin imports the course document:")
+async def admin_imports_course_document(
+    client: AsyncClient, context: dict[str, Any], docstring: str
+) -> None:
+    """Import a course from an NDJSON document."""
+    token = context["auth_token"]
+
+    response = await client.post(
+        "/api/v1/courses/import",
+        content=docstring.encode(),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+    context["import_response"] = response
+
+
 # ============================================================================
 # WHEN STEPS - COURSE LISTING
 # ============================================================================
@@ -1168,6 +1192,71 @@ async def instructor_is(client: AsyncClient, email: str, context: dict[str, Any]
     assert instructor_id == expected_id
 
 
+# ============================================================================
+# THEN STEPS - COURSE IMPORT
+# ============================================================================
+
+
+@then(
+    parsers.parse(
+        "the course should be imported with {module_count:d} modules and {lesson_count:d} lessons"
+    )
+)
+async def course_imported(
+    client: AsyncClient, module_count: int, lesson_count: int, context: dict[str, Any]
+) -> None:
+    """Verify the import succeeded with the expected counts."""
+    response = context["import_response"]
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}: {response.text}"
+    data = response.json()
+    assert data["module_count"] == module_count
+    assert data["lesson_count"] == lesson_count
+    context["course_id"] = data["id"]
+
+
+@then(
+    parsers.parse(
+        'the imported course should have modules "{titles}" with "{lesson_counts}" lessons'
+    )
+)
+async def imported_course_has_modules(
+    client: AsyncClient, titles: str, lesson_counts: str, context: dict[str, Any]
+) -> None:
+    """Verify the imported course reads back in document order."""
+    token = context["auth_token"]
+    response = await client.get(
+        f"/api/v1/courses/{context['course_id']}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    modules = response.json()["modules"]
+    assert [m["title"] for m in modules] == [t.strip() for t in titles.split(",")]
+    assert [m["position"] for m in modules] == list(range(1, len(modules) + 1))
+    assert [len(m["lessons"]) for m in modules] == [int(n) for n in lesson_counts.split(",")]
+
+
+@then(parsers.parse("the import should fail with errors on lines {lines}"))
+async def import_fails_on_lines(client: AsyncClient, lines: str, context: dict[str, Any]) -> None:
+    """Verify every invalid line is reported by number."""
+    response = context["import_response"]
+    assert response.status_code == 422, f"Expected 422, got {response.status_code}: {response.text}"
+    errors = response.json()["errors"]
+    assert [error["line"] for error in errors] == [int(n) for n in lines.split(",")]
+    assert all(error["message"] for error in errors)
+
+
+@then("no course should have been created")
+async def no_course_created(client: AsyncClient, context: dict[str, Any]) -> None:
+    """Verify a rejected import wrote nothing."""
+    token = context["auth_token"]
+    response = await client.get(
+        "/api/v1/courses",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+
 # ============================================================================
 # THEN STEPS - COURSE LISTING
 # ============================================================================
@@ -3067,6 +3156,21 @@ async def user_attempts_create_course(client: AsyncClient, context: dict[str, An
     context["security_response"] = response
 
 
+@when("the user attempts to import a course")
+async def user_attempts_import_course(client: AsyncClient, context: dict[str, Any]) -> None:
+    """Non-admin attempts to import a course."""
+    token = context["auth_token"]
+    response = await client.post(
+        "/api/v1/courses/import",
+        content=b'{"type": "course", "title": "Unauthorized Course"}\n',
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+    context["security_response"] = response
+
+
 @when("the user attempts to edit the course")
 async def user_attempts_edit_course(client: AsyncClient, context: dict[str, Any]) -> None:
     """Non-admin attempts to edit course."""
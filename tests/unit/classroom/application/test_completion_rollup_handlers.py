@@ -0,0 +1,58 @@
+"""Tests for the completion rollup event handlers."""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.classroom.application.event_handlers import completion_rollup_handlers
+from src.classroom.domain.events import LessonCompleted, LessonUncompleted
+from src.classroom.domain.repositories import ICompletionAnalyticsRepository
+from src.classroom.domain.value_objects import CourseId, LessonId
+from src.identity.domain.value_objects import UserId
+
+
+@pytest.fixture
+def repo(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    repo = AsyncMock()
+
+    async def apply(
+        _event_name: str, update: Callable[[ICompletionAnalyticsRepository], Awaitable[None]]
+    ) -> None:
+        await update(repo)
+
+    monkeypatch.setattr(completion_rollup_handlers, "_apply", apply)
+    return repo
+
+
+class TestCompletionRollupHandlers:
+    async def test_completion_and_its_removal_use_the_stored_completion_day(
+        self, repo: AsyncMock
+    ) -> None:
+        # Stored just before midnight UTC; the event itself is published a day later
+        completed_at = datetime(2026, 3, 1, 23, 59, tzinfo=UTC)
+        ids = {
+            "user_id": UserId(uuid4()),
+            "course_id": CourseId(value=uuid4()),
+            "lesson_id": LessonId(value=uuid4()),
+        }
+        completed = LessonCompleted(
+            **ids,
+            completed_at=completed_at.astimezone(timezone(timedelta(hours=2))),
+            occurred_at=completed_at + timedelta(days=1),
+        )
+        uncompleted = LessonUncompleted(
+            **ids, completed_at=completed_at, course_was_completed=False
+        )
+
+        await completion_rollup_handlers.handle_lesson_completed(completed)
+        await completion_rollup_handlers.handle_lesson_uncompleted(uncompleted)
+
+        repo.record_lesson_completed.assert_awaited_once_with(
+            ids["course_id"], ids["lesson_id"], date(2026, 3, 1)
+        )
+        repo.record_lesson_uncompleted.assert_awaited_once_with(
+            ids["course_id"], ids["lesson_id"], date(2026, 3, 1), False
+        )
@@ -0,0 +1,130 @@
+"""Tests for GetCourseAnalyticsHandler."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.classroom.application.handlers import GetCourseAnalyticsHandler
+from src.classroom.application.queries import GetCourseAnalyticsQuery
+from src.classroom.domain.exceptions import CourseNotFoundError
+from src.classroom.domain.repositories import (
+    CourseCompletionRollup,
+    CourseOutline,
+    DailyCompletionCount,
+    LessonOutline,
+    ModuleOutline,
+)
+from src.classroom.domain.value_objects import (
+    ContentType,
+    CourseId,
+    CourseTitle,
+    LessonId,
+    LessonTitle,
+    ModuleId,
+    ModuleTitle,
+)
+
+
+def _lesson(position: int, is_deleted: bool = False) -> LessonOutline:
+    return LessonOutline(
+        id=LessonId(value=uuid4()),
+        title=LessonTitle(f"Lesson {position}"),
+        content_type=ContentType.TEXT,
+        position=position,
+        is_deleted=is_deleted,
+        updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+def _module(position: int, *lessons: LessonOutline) -> ModuleOutline:
+    return ModuleOutline(
+        id=ModuleId(value=uuid4()),
+        title=ModuleTitle(f"Module {position}"),
+        position=position,
+        is_deleted=False,
+        all_lessons=lessons,
+    )
+
+
+class TestGetCourseAnalyticsHandler:
+    @pytest.fixture
+    def course_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def analytics_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def handler(
+        self, course_repo: AsyncMock, analytics_repo: AsyncMock
+    ) -> GetCourseAnalyticsHandler:
+        return GetCourseAnalyticsHandler(
+            course_repository=course_repo, analytics_repository=analytics_repo
+        )
+
+    async def test_funnel_follows_reading_order_with_rates_against_starts(
+        self, handler: GetCourseAnalyticsHandler, course_repo: AsyncMock, analytics_repo: AsyncMock
+    ) -> None:
+        first, second, deleted, third = _lesson(1), _lesson(2), _lesson(3, True), _lesson(1)
+        course_id = CourseId(value=uuid4())
+        course_repo.get_outline.return_value = CourseOutline(
+            id=course_id,
+            title=CourseTitle("Python Basics"),
+            is_deleted=False,
+            all_modules=(_module(2, third), _module(1, second, first, deleted)),
+        )
+        analytics_repo.get_course_rollup.return_value = CourseCompletionRollup(
+            course_id=course_id, started_count=4, completed_count=1
+        )
+        analytics_repo.get_lesson_completion_counts.return_value = {
+            first.id: 4,
+            second.id: 2,
+            deleted.id: 3,
+        }
+        daily = [DailyCompletionCount(day=date(2026, 10, 18), completions=6)]
+        analytics_repo.get_daily_completions.return_value = daily
+
+        result = await handler.handle(GetCourseAnalyticsQuery(course_id=course_id.value, days=7))
+
+        assert [(s.lesson_id, s.completed_count) for s in result.funnel] == [
+            (first.id, 4),
+            (second.id, 2),
+            (third.id, 0),
+        ]
+        assert [s.completion_rate for s in result.funnel] == [1.0, 0.5, 0.0]
+        assert result.funnel[2].module_title == "Module 2"
+        assert result.completion_rate == 0.25
+        assert result.daily_completions == daily
+
+    async def test_course_without_starts_has_zero_rates(
+        self, handler: GetCourseAnalyticsHandler, course_repo: AsyncMock, analytics_repo: AsyncMock
+    ) -> None:
+        lesson = _lesson(1)
+        course_id = CourseId(value=uuid4())
+        course_repo.get_outline.return_value = CourseOutline(
+            id=course_id,
+            title=CourseTitle("Python Basics"),
+            is_deleted=False,
+            all_modules=(_module(1, lesson),),
+        )
+        analytics_repo.get_course_rollup.return_value = CourseCompletionRollup(
+            course_id=course_id, started_count=0, completed_count=0
+        )
+        analytics_repo.get_lesson_completion_counts.return_value = {}
+        analytics_repo.get_daily_completions.return_value = []
+
+        result = await handler.handle(GetCourseAnalyticsQuery(course_id=course_id.value))
+
+        assert result.completion_rate == 0.0
+        assert [s.completion_rate for s in result.funnel] == [0.0]
+
+    async def test_missing_course_raises(
+        self, handler: GetCourseAnalyticsHandler, course_repo: AsyncMock
+    ) -> None:
+        course_repo.get_outline.return_value = None
+
+        with pytest.raises(CourseNotFoundError):
+            await handler.handle(GetCourseAnalyticsQuery(course_id=uuid4()))
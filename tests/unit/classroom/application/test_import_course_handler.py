@@ -0,0 +1,113 @@
+"""Tests for ImportCourseHandler."""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.classroom.application.commands import ImportCourseCommand
+from src.classroom.application.handlers import ImportCourseHandler, import_course_handler
+from src.classroom.domain.exceptions import InvalidCourseImportError
+
+
+async def _stream(*records: Any, chunk_size: int = 7) -> AsyncIterator[bytes]:
+    """Serialize records as NDJSON and yield it in small, line-splitting chunks."""
+    body = "\n".join(r if isinstance(r, str) else json.dumps(r) for r in records).encode()
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
+
+
+class TestImportCourseHandler:
+    @pytest.fixture
+    def course_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def handler(
+        self, course_repo: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> ImportCourseHandler:
+        monkeypatch.setattr(import_course_handler, "event_bus", AsyncMock())
+        return ImportCourseHandler(course_repository=course_repo)
+
+    async def test_builds_the_course_and_inserts_it_once(
+        self, handler: ImportCourseHandler, course_repo: AsyncMock
+    ) -> None:
+        result = await handler.handle(
+            ImportCourseCommand(
+                instructor_id=uuid4(),
+                chunks=_stream(
+                    {"type": "course", "title": "Python Basics"},
+                    {"type": "module", "title": "Getting Started"},
+                    {"type": "lesson", "title": "Welcome", "content_type": "text", "content": "Hi"},
+                    "",
+                    {"type": "module", "title": "Next Steps"},
+                    {
+                        "type": "lesson",
+                        "title": "Intro video",
+                        "content_type": "video",
+                        "content": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    },
+                    {"type": "lesson", "title": "Recap", "content_type": "text", "content": "Bye"},
+                ),
+            )
+        )
+
+        course = course_repo.insert_course.call_args[0][0]
+        course_repo.insert_course.assert_awaited_once()
+        assert (result.course_id, result.module_count, result.lesson_count) == (course.id, 2, 3)
+        assert [m.title.value for m in course.modules] == ["Getting Started", "Next Steps"]
+        assert [ls.position for ls in course.modules[1].lessons] == [1, 2]
+
+    async def test_reports_every_invalid_line_and_writes_nothing(
+        self, handler: ImportCourseHandler, course_repo: AsyncMock
+    ) -> None:
+        with pytest.raises(InvalidCourseImportError) as exc_info:
+            await handler.handle(
+                ImportCourseCommand(
+                    instructor_id=uuid4(),
+                    chunks=_stream(
+                        {"type": "course", "title": ""},
+                        "not json",
+                        {"type": "module", "title": "Getting Started"},
+                        {
+                            "type": "lesson",
+                            "title": "Welcome",
+                            "content_type": "pdf",
+                            "content": "x",
+                        },
+                        {"type": "chapter"},
+                    ),
+                )
+            )
+
+        assert [line for line, _ in exc_info.value.errors] == [1, 2, 4, 5]
+        course_repo.insert_course.assert_not_awaited()
+
+    async def test_document_without_course_record_is_rejected(
+        self, handler: ImportCourseHandler
+    ) -> None:
+        with pytest.raises(InvalidCourseImportError) as exc_info:
+            await handler.handle(ImportCourseCommand(instructor_id=uuid4(), chunks=_stream("")))
+
+        assert exc_info.value.errors == [(1, "Document has no course record")]
+
+    async def test_over_long_line_is_reported_without_buffering_it(
+        self, handler: ImportCourseHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(import_course_handler, "MAX_LINE_BYTES", 64)
+
+        with pytest.raises(InvalidCourseImportError) as exc_info:
+            await handler.handle(
+                ImportCourseCommand(
+                    instructor_id=uuid4(),
+                    chunks=_stream(
+                        {"type": "course", "title": "Python Basics"},
+                        {"type": "module", "title": "x" * 200},
+                    ),
+                )
+            )
+
+        assert exc_info.value.errors == [(2, "Line is longer than 64 bytes")]
@@ -0,0 +1,102 @@
+"""Tests for LastAccessedBuffer."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from src.classroom.application.last_accessed_buffer import LastAccessedBuffer
+from src.classroom.domain.repositories.progress_repository import LastAccessedUpdate
+from src.classroom.domain.value_objects.course_id import CourseId
+from src.classroom.domain.value_objects.lesson_id import LessonId
+from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+
+class RecordingWriter:
+    """Progress repository scope that records each bulk update."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[LastAccessedUpdate]] = []
+        self.fail = fail
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator["RecordingWriter"]:
+        yield self
+
+    async def bulk_update_last_accessed(self, updates: list[LastAccessedUpdate]) -> int:
+        self.batches.append(updates)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return len(updates)
+
+
+def _ids() -> tuple[UserId, CourseId]:
+    return UserId(uuid4()), CourseId(value=uuid4())
+
+
+def _lesson() -> LessonId:
+    return LessonId(value=uuid4())
+
+
+class TestLastAccessedBuffer:
+    async def test_keeps_only_latest_access_per_course(self) -> None:
+        writer = RecordingWriter()
+        registry = MetricsRegistry()
+        buffer = LastAccessedBuffer(writer, registry=registry)
+        user_id, course_id = _ids()
+        other_user, other_course = _ids()
+        latest = _lesson()
+
+        buffer.record(user_id, course_id, _lesson())
+        buffer.record(user_id, course_id, latest)
+        buffer.record(other_user, other_course, _lesson())
+        await buffer.flush()
+
+        [batch] = writer.batches
+        assert len(batch) == 2
+        assert batch[0].lesson_id == latest
+        assert buffer.pending_count == 0
+        assert registry.counter_value("classroom_last_accessed_recorded_total") == 3
+        assert registry.counter_value("classroom_last_accessed_rows_written_total") == 2
+
+    async def test_background_loop_flushes_and_close_drains(self) -> None:
+        writer = RecordingWriter()
+        buffer = LastAccessedBuffer(writer, flush_interval_seconds=0.01, registry=MetricsRegistry())
+        buffer.start()
+
+        buffer.record(*_ids(), _lesson())
+        await asyncio.sleep(0.05)
+        buffer.record(*_ids(), _lesson())
+        await buffer.close()
+
+        assert [len(b) for b in writer.batches] == [1, 1]
+
+    async def test_failed_flush_keeps_entries_unless_superseded(self) -> None:
+        writer = RecordingWriter(fail=True)
+        registry = MetricsRegistry()
+        buffer = LastAccessedBuffer(writer, registry=registry)
+        now = datetime.now(UTC)
+        user_id, course_id = _ids()
+        buffer.record(user_id, course_id, _lesson(), accessed_at=now)
+
+        await buffer.flush()
+        newer = _lesson()
+        buffer.record(user_id, course_id, newer, accessed_at=now + timedelta(seconds=1))
+        writer.fail = False
+        await buffer.flush()
+
+        assert registry.counter_value("classroom_last_accessed_flush_failures_total") == 1
+        assert [u.lesson_id for u in writer.batches[-1]] == [newer]
+
+    async def test_unstarted_buffer_is_bounded_and_never_writes(self) -> None:
+        writer = RecordingWriter()
+        buffer = LastAccessedBuffer(writer, max_pending=2, registry=MetricsRegistry())
+
+        for _ in range(5):
+            buffer.record(*_ids(), _lesson())
+        await buffer.close()
+
+        assert buffer.pending_count == 1
+        assert writer.batches == []
@@ -0,0 +1,180 @@
+"""Tests for MarkLessonCompleteHandler and UnmarkLessonHandler."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.classroom.application.commands import MarkLessonCompleteCommand, UnmarkLessonCommand
+from src.classroom.application.handlers import MarkLessonCompleteHandler, UnmarkLessonHandler
+from src.classroom.application.handlers import mark_lesson_complete_handler as mark_module
+from src.classroom.application.handlers import unmark_lesson_handler as unmark_module
+from src.classroom.domain.entities.progress import Progress
+from src.classroom.domain.events import (
+    CourseCompleted,
+    LessonCompleted,
+    LessonUncompleted,
+    ProgressStarted,
+)
+from src.classroom.domain.exceptions import LessonAlreadyCompletedError, LessonNotCompletedError
+from src.classroom.domain.repositories import CourseOutline, LessonOutline, ModuleOutline
+from src.classroom.domain.repositories.progress_repository import CompletionChange
+from src.classroom.domain.value_objects import (
+    ContentType,
+    CourseId,
+    CourseTitle,
+    LessonId,
+    LessonTitle,
+    ModuleId,
+    ModuleTitle,
+)
+from src.identity.domain.value_objects import UserId
+from src.shared.domain.base_event import DomainEvent
+from src.shared.infrastructure.event_bus import EventBus
+
+
+class InMemoryProgressRepository:
+    """Completion rows per (user, course), written the way the SQL statements do."""
+
+    def __init__(self) -> None:
+        self.completions: dict[tuple[UserId, CourseId], dict[LessonId, datetime]] = {}
+
+    async def save(self, progress: Progress) -> None:
+        self.completions[(progress.user_id, progress.course_id)] = {
+            c.lesson_id: c.completed_at for c in progress.completions
+        }
+
+    async def add_completion(
+        self, user_id: UserId, course_id: CourseId, lesson_id: LessonId
+    ) -> CompletionChange:
+        rows = self.completions.get((user_id, course_id))
+        if rows is None:
+            return CompletionChange(progress_exists=False, changed=False, completed_count=0)
+        changed = lesson_id not in rows
+        rows.setdefault(lesson_id, datetime.now(UTC))
+        return CompletionChange(
+            progress_exists=True,
+            changed=changed,
+            completed_count=len(rows),
+            completed_at=rows[lesson_id] if changed else None,
+        )
+
+    async def remove_completion(
+        self, user_id: UserId, course_id: CourseId, lesson_id: LessonId
+    ) -> CompletionChange:
+        rows = self.completions.get((user_id, course_id))
+        if rows is None:
+            return CompletionChange(progress_exists=False, changed=False, completed_count=0)
+        completed_at = rows.pop(lesson_id, None)
+        return CompletionChange(
+            progress_exists=True,
+            changed=completed_at is not None,
+            completed_count=len(rows),
+            completed_at=completed_at,
+        )
+
+
+def _outline(lesson_count: int) -> CourseOutline:
+    lessons = tuple(
+        LessonOutline(
+            id=LessonId(value=uuid4()),
+            title=LessonTitle(f"Lesson {position}"),
+            content_type=ContentType.TEXT,
+            position=position,
+            is_deleted=False,
+            updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+        for position in range(1, lesson_count + 1)
+    )
+    module = ModuleOutline(
+        id=ModuleId(value=uuid4()),
+        title=ModuleTitle("Module 1"),
+        position=1,
+        is_deleted=False,
+        all_lessons=lessons,
+    )
+    return CourseOutline(
+        id=CourseId(value=uuid4()),
+        title=CourseTitle("Course"),
+        is_deleted=False,
+        all_modules=(module,),
+    )
+
+
+class TestLessonCompletionHandlers:
+    @pytest.fixture
+    def published(self, monkeypatch: pytest.MonkeyPatch) -> list[DomainEvent]:
+        events: list[DomainEvent] = []
+        bus = EventBus()
+
+        async def record(event: DomainEvent) -> None:
+            events.append(event)
+
+        for event_type in (ProgressStarted, LessonCompleted, CourseCompleted, LessonUncompleted):
+            bus.register_handler(event_type, record)
+        monkeypatch.setattr(mark_module, "event_bus", bus)
+        monkeypatch.setattr(unmark_module, "event_bus", bus)
+        return events
+
+    @pytest.fixture
+    def outline(self) -> CourseOutline:
+        return _outline(lesson_count=2)
+
+    @pytest.fixture
+    def progress_repo(self) -> InMemoryProgressRepository:
+        return InMemoryProgressRepository()
+
+    @pytest.fixture
+    def course_repo(self, outline: CourseOutline) -> AsyncMock:
+        course_repo = AsyncMock()
+        course_repo.get_outline_by_lesson_id.return_value = outline
+        return course_repo
+
+    async def test_completing_every_lesson_starts_and_completes_the_course(
+        self,
+        outline: CourseOutline,
+        course_repo: AsyncMock,
+        progress_repo: InMemoryProgressRepository,
+        published: list[DomainEvent],
+    ) -> None:
+        user_id: UUID = uuid4()
+        first, second = (lesson.id for lesson in outline.all_modules[0].all_lessons)
+        handler = MarkLessonCompleteHandler(course_repo, progress_repo)  # type: ignore[arg-type]
+
+        await handler.handle(MarkLessonCompleteCommand(user_id=user_id, lesson_id=first.value))
+        await handler.handle(MarkLessonCompleteCommand(user_id=user_id, lesson_id=second.value))
+
+        assert [type(e) for e in published] == [
+            ProgressStarted,
+            LessonCompleted,
+            LessonCompleted,
+            CourseCompleted,
+        ]
+        assert set(progress_repo.completions[(UserId(user_id), outline.id)]) == {first, second}
+
+    async def test_repeat_completion_and_repeat_unmark_change_nothing(
+        self,
+        outline: CourseOutline,
+        course_repo: AsyncMock,
+        progress_repo: InMemoryProgressRepository,
+        published: list[DomainEvent],
+    ) -> None:
+        user_id: UUID = uuid4()
+        lesson_id = outline.all_modules[0].all_lessons[0].id.value
+        mark = MarkLessonCompleteHandler(course_repo, progress_repo)  # type: ignore[arg-type]
+        unmark = UnmarkLessonHandler(course_repo, progress_repo)  # type: ignore[arg-type]
+
+        await mark.handle(MarkLessonCompleteCommand(user_id=user_id, lesson_id=lesson_id))
+        with pytest.raises(LessonAlreadyCompletedError):
+            await mark.handle(MarkLessonCompleteCommand(user_id=user_id, lesson_id=lesson_id))
+        await unmark.handle(UnmarkLessonCommand(user_id=user_id, lesson_id=lesson_id))
+        with pytest.raises(LessonNotCompletedError):
+            await unmark.handle(UnmarkLessonCommand(user_id=user_id, lesson_id=lesson_id))
+
+        assert [type(e) for e in published] == [
+            ProgressStarted,
+            LessonCompleted,
+            LessonUncompleted,
+        ]
+        assert progress_repo.completions[(UserId(user_id), outline.id)] == {}
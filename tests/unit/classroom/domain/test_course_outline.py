@@ -0,0 +1,92 @@
+"""Unit tests for the CourseOutline read model."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from src.classroom.domain.repositories import CourseOutline, LessonOutline, ModuleOutline
+from src.classroom.domain.value_objects import (
+    ContentType,
+    CourseId,
+    CourseTitle,
+    LessonId,
+    LessonTitle,
+    ModuleId,
+    ModuleTitle,
+)
+
+
+def _lesson(position: int, is_deleted: bool = False) -> LessonOutline:
+    """Helper to create a lesson outline."""
+    return LessonOutline(
+        id=LessonId(value=uuid4()),
+        title=LessonTitle(f"Lesson {position}"),
+        content_type=ContentType.TEXT,
+        position=position,
+        is_deleted=is_deleted,
+        updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+def _module(position: int, *lessons: LessonOutline, is_deleted: bool = False) -> ModuleOutline:
+    """Helper to create a module outline."""
+    return ModuleOutline(
+        id=ModuleId(value=uuid4()),
+        title=ModuleTitle(f"Module {position}"),
+        position=position,
+        is_deleted=is_deleted,
+        all_lessons=lessons,
+    )
+
+
+def _course(*modules: ModuleOutline) -> CourseOutline:
+    """Helper to create a course outline."""
+    return CourseOutline(
+        id=CourseId(value=uuid4()),
+        title=CourseTitle("Python Basics"),
+        is_deleted=False,
+        all_modules=modules,
+    )
+
+
+class TestCourseOutline:
+    """Tests for ordering and deleted-filtering rules."""
+
+    def test_ordered_lesson_ids_follow_module_then_lesson_position(self) -> None:
+        first, second, third = _lesson(1), _lesson(2), _lesson(1)
+        course = _course(_module(2, third), _module(1, second, first))
+
+        assert course.ordered_lesson_ids() == [first.id, second.id, third.id]
+
+    def test_deleted_lessons_and_modules_are_skipped(self) -> None:
+        kept, deleted = _lesson(1), _lesson(2, is_deleted=True)
+        hidden = _lesson(1)
+        course = _course(_module(1, kept, deleted), _module(2, hidden, is_deleted=True))
+
+        assert course.ordered_lesson_ids() == [kept.id]
+        assert course.lesson_count == 1
+        assert len(course.modules) == 1
+
+    def test_find_module_for_lesson_includes_deleted_lessons(self) -> None:
+        deleted = _lesson(1, is_deleted=True)
+        module = _module(1, deleted)
+        course = _course(module)
+
+        assert course.find_module_for_lesson(deleted.id) == module
+        assert course.find_module_for_lesson(LessonId(value=uuid4())) is None
+
+    def test_navigation_links_lessons_across_modules(self) -> None:
+        first, second, third = _lesson(1), _lesson(2), _lesson(1)
+        deleted = _lesson(3, is_deleted=True)
+        course = _course(_module(1, first, second, deleted), _module(2, third))
+
+        assert course.navigation(first.id) == (None, second.id)
+        assert course.navigation(second.id) == (first.id, third.id)
+        assert course.navigation(third.id) == (second.id, None)
+        assert course.navigation(deleted.id) == (None, None)
+
+    def test_next_incomplete_lesson_skips_completed(self) -> None:
+        first, second = _lesson(1), _lesson(2)
+        course = _course(_module(1, first, second))
+
+        assert course.next_incomplete_lesson_id({first.id}) == second.id
+        assert course.next_incomplete_lesson_id({first.id, second.id}) is None
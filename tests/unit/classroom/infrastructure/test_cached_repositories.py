@@ -0,0 +1,106 @@
+"""Tests for the cached course outline repository."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.classroom.domain.entities import Course
+from src.classroom.domain.repositories import CourseOutline
+from src.classroom.domain.value_objects import CourseId, CourseTitle, LessonId, ModuleId
+from src.classroom.infrastructure.persistence import CachedCourseRepository
+from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure.metrics import MetricsRegistry
+from src.shared.infrastructure.reference_cache import ReferenceDataCache
+
+
+@pytest.fixture
+def cache() -> ReferenceDataCache:
+    return ReferenceDataCache(registry=MetricsRegistry())
+
+
+def _outline(course_id: CourseId, is_deleted: bool = False) -> CourseOutline:
+    return CourseOutline(
+        id=course_id, title=CourseTitle("Python Basics"), is_deleted=is_deleted, all_modules=()
+    )
+
+
+class TestCachedCourseRepository:
+    async def test_outline_is_shared_across_repository_instances(
+        self, cache: ReferenceDataCache
+    ) -> None:
+        course_id = CourseId(value=uuid4())
+        outline = _outline(course_id)
+        inner = AsyncMock()
+        inner.get_outline.return_value = outline
+
+        first = await CachedCourseRepository(inner, cache=cache).get_outline(course_id)
+        second = await CachedCourseRepository(inner, cache=cache).get_outline(course_id)
+
+        # Immutable outlines are handed out without copying
+        assert first is second is outline
+        inner.get_outline.assert_awaited_once_with(course_id, include_deleted=True)
+
+    async def test_deleted_course_outline_is_hidden_unless_requested(
+        self, cache: ReferenceDataCache
+    ) -> None:
+        course_id = CourseId(value=uuid4())
+        inner = AsyncMock()
+        inner.get_outline.return_value = _outline(course_id, is_deleted=True)
+        repo = CachedCourseRepository(inner, cache=cache)
+
+        assert await repo.get_outline(course_id) is None
+        assert await repo.get_outline(course_id, include_deleted=True) is not None
+        assert inner.get_outline.await_count == 1
+
+    async def test_lesson_lookup_reuses_the_course_outline(self, cache: ReferenceDataCache) -> None:
+        course_id = CourseId(value=uuid4())
+        lesson_a, lesson_b = LessonId(value=uuid4()), LessonId(value=uuid4())
+        outline = _outline(course_id)
+        inner = AsyncMock()
+        inner.get_outline_by_lesson_id.return_value = outline
+        repo = CachedCourseRepository(inner, cache=cache)
+
+        assert await repo.get_outline_by_lesson_id(lesson_a) is outline
+        assert await repo.get_outline_by_lesson_id(lesson_a) is outline
+        assert await repo.get_outline(course_id) is outline
+        assert await repo.get_outline_by_lesson_id(lesson_b) is outline
+
+        assert inner.get_outline_by_lesson_id.await_count == 2
+        inner.get_outline.assert_not_awaited()
+
+    async def test_save_bumps_outline_for_other_readers(self, cache: ReferenceDataCache) -> None:
+        course = Course.create(instructor_id=UserId(uuid4()), title=CourseTitle("Python Basics"))
+        inner = AsyncMock()
+        inner.get_outline.return_value = _outline(course.id)
+        reader = CachedCourseRepository(inner, cache=cache)
+        await reader.get_outline(course.id)
+
+        writer = CachedCourseRepository(inner, cache=cache)
+        await writer.save(course)
+        await writer.get_outline(course.id)
+        await reader.get_outline(course.id)
+
+        inner.save.assert_awaited_once_with(course)
+        # Writer reads straight from its session; the reader reloads the new version
+        assert inner.get_outline.await_count == 3
+
+    async def test_set_based_writes_drop_the_outline(self, cache: ReferenceDataCache) -> None:
+        course_id = CourseId(value=uuid4())
+        module_id = ModuleId(value=uuid4())
+        inner = AsyncMock()
+        inner.get_outline.return_value = _outline(course_id)
+        inner.get_outline_by_module_id.return_value = _outline(course_id)
+        inner.reorder_modules.return_value = True
+        reader = CachedCourseRepository(inner, cache=cache)
+        await reader.get_outline(course_id)
+        await reader.get_outline_by_module_id(module_id)
+
+        assert await CachedCourseRepository(inner, cache=cache).reorder_modules(
+            course_id, [module_id]
+        )
+        await reader.get_outline_by_module_id(module_id)
+
+        # The module-to-course mapping survives; only the outline is reloaded
+        assert inner.get_outline.await_count == 2
+        inner.get_outline_by_module_id.assert_awaited_once_with(module_id)
@@ -0,0 +1,122 @@
+"""Tests for the set-based writes of SqlAlchemyCourseRepository against the database."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.classroom.domain.entities import Course
+from src.classroom.domain.value_objects import (
+    ContentType,
+    CourseDescription,
+    CourseTitle,
+    LessonTitle,
+    ModuleTitle,
+)
+from src.classroom.infrastructure.persistence import SqlAlchemyCourseRepository
+from src.identity.domain.value_objects import UserId
+
+
+@pytest.fixture
+async def course(db_session: AsyncSession) -> Course:
+    course = Course.create(instructor_id=UserId(uuid4()), title=CourseTitle("Python Basics"))
+    for module_title in ("Intro", "Syntax", "Testing"):
+        module = course.add_module(ModuleTitle(module_title))
+        for lesson_title in ("One", "Two"):
+            course.add_lesson_to_module(
+                module.id, LessonTitle(f"{module_title} {lesson_title}"), ContentType.TEXT, "Body"
+            )
+    await SqlAlchemyCourseRepository(db_session).save(course)
+    await db_session.flush()
+    return course
+
+
+class TestSetBasedCourseWrites:
+    async def test_reorder_modules_persists_the_new_order(
+        self, db_session: AsyncSession, course: Course
+    ) -> None:
+        repository = SqlAlchemyCourseRepository(db_session)
+        intro, syntax, testing = (m.id for m in course.modules)
+
+        assert await repository.reorder_modules(course.id, [testing, intro, syntax])
+
+        outline = await repository.get_outline(course.id)
+        assert outline is not None
+        assert [(m.id, m.position) for m in outline.modules] == [
+            (testing, 1),
+            (intro, 2),
+            (syntax, 3),
+        ]
+
+    async def test_reorder_rejects_an_incomplete_ordering_without_writing(
+        self, db_session: AsyncSession, course: Course
+    ) -> None:
+        repository = SqlAlchemyCourseRepository(db_session)
+        module = course.modules[0]
+        first, second = (lesson.id for lesson in module.lessons)
+
+        assert not await repository.reorder_lessons(course.id, module.id, [second])
+
+        outline = await repository.get_outline(course.id)
+        assert outline is not None
+        assert [ls.id for ls in outline.modules[0].lessons] == [first, second]
+
+    async def test_delete_module_cascades_and_renumbers(
+        self, db_session: AsyncSession, course: Course
+    ) -> None:
+        repository = SqlAlchemyCourseRepository(db_session)
+        intro, syntax, testing = course.modules
+
+        await repository.delete_module(course.id, syntax.id)
+
+        outline = await repository.get_outline(course.id)
+        assert outline is not None
+        assert [(m.id, m.position) for m in outline.modules] == [(intro.id, 1), (testing.id, 2)]
+        deleted = next(m for m in outline.all_modules if m.id == syntax.id)
+        assert deleted.is_deleted
+        assert all(lesson.is_deleted for lesson in deleted.all_lessons)
+        assert outline.lesson_count == 4
+
+
+class TestInsertCourse:
+    async def test_imported_course_reads_back_through_the_outline(
+        self, db_session: AsyncSession
+    ) -> None:
+        repository = SqlAlchemyCourseRepository(db_session)
+        course = Course.create(
+            instructor_id=UserId(uuid4()),
+            title=CourseTitle("Imported Course"),
+            description=CourseDescription("Loaded from a document"),
+        )
+        intro = course.add_module(ModuleTitle("Intro"))
+        course.add_lesson_to_module(intro.id, LessonTitle("Welcome"), ContentType.TEXT, "Hello")
+        course.add_lesson_to_module(
+            intro.id,
+            LessonTitle("Tour"),
+            ContentType.VIDEO,
+            "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        )
+        course.add_module(ModuleTitle("Empty"))
+
+        await repository.insert_course(course)
+
+        outline = await repository.get_outline(course.id)
+        assert outline is not None
+        assert outline.title == CourseTitle("Imported Course")
+        assert [(m.id, m.title.value, m.position) for m in outline.modules] == [
+            (intro.id, "Intro", 1),
+            (course.modules[1].id, "Empty", 2),
+        ]
+        assert [
+            (ls.id, ls.title.value, ls.content_type, ls.position)
+            for ls in outline.modules[0].lessons
+        ] == [
+            (intro.lessons[0].id, "Welcome", ContentType.TEXT, 1),
+            (intro.lessons[1].id, "Tour", ContentType.VIDEO, 2),
+        ]
+        assert outline.lesson_count == 2
+
+        loaded = await repository.get_by_id(course.id)
+        assert loaded is not None
+        assert loaded.description == CourseDescription("Loaded from a document")
+        assert loaded.modules[0].lessons[0].content == "Hello"
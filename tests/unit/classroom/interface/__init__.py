@@ -0,0 +1 @@
+"""Interface layer unit tests."""
@@ -0,0 +1,134 @@
+"""Tests for POST /courses/import against the database."""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.classroom.infrastructure.persistence.models import CourseModel, LessonModel, ModuleModel
+from src.community.infrastructure.persistence.models import CommunityMemberModel, CommunityModel
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.persistence.models import UserModel
+from src.identity.infrastructure.services import limiter
+from src.identity.interface.api.dependencies import get_token_generator
+
+VALID_DOCUMENT = b"""\
+{"type": "course", "title": "Imported Python", "description": "From a document"}
+{"type": "module", "title": "Getting Started"}
+{"type": "lesson", "title": "Installing Python", "content_type": "text", "content": "Download it"}
+{"type": "lesson", "title": "First Program", "content_type": "text", "content": "Say hello"}
+{"type": "module", "title": "Basics"}
+{"type": "lesson", "title": "Variables", "content_type": "text", "content": "Names for values"}
+"""
+
+INVALID_DOCUMENT = b"""\
+{"type": "course", "title": "Broken Import"}
+{"type": "module"}
+{"type": "lesson", "title": "Bad Type", "content_type": "podcast", "content": "Audio"}
+not json
+"""
+
+
+@pytest.fixture(autouse=True)
+def _without_rate_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The limiter's storage is Redis; these tests cover the import itself
+    monkeypatch.setattr(limiter, "enabled", False)
+
+
+async def _member_headers(db_session: AsyncSession, role: str) -> dict[str, str]:
+    user_id = uuid4()
+    community = CommunityModel(id=uuid4(), name="Test Community", slug=f"test-{user_id}")
+    db_session.add_all(
+        [
+            UserModel(
+                id=user_id,
+                email=f"{user_id}@example.com",
+                hashed_password="not-used",
+                is_verified=True,
+                is_active=True,
+            ),
+            community,
+        ]
+    )
+    await db_session.flush()
+    db_session.add(CommunityMemberModel(community_id=community.id, user_id=user_id, role=role))
+    await db_session.flush()
+    token = get_token_generator().generate_auth_tokens(UserId(user_id)).access_token
+    return {"Authorization": f"Bearer {token}", "Content-Type": "application/x-ndjson"}
+
+
+async def _count(
+    db_session: AsyncSession, model: type[CourseModel | ModuleModel | LessonModel]
+) -> int:
+    return (await db_session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+class TestImportCourseEndpoint:
+    async def test_valid_document_creates_the_course(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        headers = await _member_headers(db_session, "ADMIN")
+
+        response = await client.post(
+            "/api/v1/courses/import", content=VALID_DOCUMENT, headers=headers
+        )
+
+        assert response.status_code == 201, response.text
+        body = response.json()
+        assert (body["module_count"], body["lesson_count"]) == (2, 3)
+        detail = await client.get(f"/api/v1/courses/{body['id']}", headers=headers)
+        assert detail.status_code == 200
+        course = detail.json()
+        assert course["title"] == "Imported Python"
+        assert course["description"] == "From a document"
+        assert [(m["title"], m["position"]) for m in course["modules"]] == [
+            ("Getting Started", 1),
+            ("Basics", 2),
+        ]
+        assert [
+            [(ls["title"], ls["content_type"], ls["position"]) for ls in m["lessons"]]
+            for m in course["modules"]
+        ] == [
+            [("Installing Python", "text", 1), ("First Program", "text", 2)],
+            [("Variables", "text", 1)],
+        ]
+
+    async def test_invalid_document_reports_each_line_and_writes_nothing(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        headers = await _member_headers(db_session, "ADMIN")
+        before = [await _count(db_session, m) for m in (CourseModel, ModuleModel, LessonModel)]
+
+        response = await client.post(
+            "/api/v1/courses/import", content=INVALID_DOCUMENT, headers=headers
+        )
+
+        assert response.status_code == 422, response.text
+        errors = response.json()["errors"]
+        assert [error["line"] for error in errors] == [2, 3, 4]
+        assert all(error["message"] for error in errors)
+        after = [await _count(db_session, m) for m in (CourseModel, ModuleModel, LessonModel)]
+        assert after == before
+
+    async def test_non_admin_is_forbidden(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        headers = await _member_headers(db_session, "MEMBER")
+
+        response = await client.post(
+            "/api/v1/courses/import", content=VALID_DOCUMENT, headers=headers
+        )
+
+        assert response.status_code == 403
+        assert await _count(db_session, CourseModel) == 0
+
+    async def test_requires_authentication(self, client: AsyncClient) -> None:
+        response = await client.post(
+            "/api/v1/courses/import",
+            content=VALID_DOCUMENT,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 401
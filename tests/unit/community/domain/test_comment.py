@@ -173,6 +173,9 @@ class TestCommentEdit:
         assert isinstance(events[0], CommentEdited)
         assert events[0].comment_id == comment.id
         assert events[0].editor_id == author_id
+        assert events[0].content == "Edited content."
+        # Ordered with the post's other events, e.g. a later PostDeleted
+        assert events[0].aggregate_id == comment.post_id
 
     def test_edit_comment_with_same_content_does_not_publish_event(
         self, comment: Comment, author_id: UserId, content: CommentContent
@@ -272,6 +275,7 @@ class TestCommentDelete:
         assert isinstance(events[0], CommentDeleted)
         assert events[0].comment_id == comment.id
         assert events[0].deleted_by == author_id
+        assert events[0].aggregate_id == comment.post_id
 
     def test_delete_comment_by_non_author_member_raises_error(self, comment: Comment) -> None:
         """Comment.delete() by non-author MEMBER should raise CannotDeleteCommentError."""
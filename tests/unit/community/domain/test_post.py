@@ -423,6 +423,8 @@ class TestPostEdit:
         assert events[0].post_id == post.id
         assert events[0].editor_id == author_id
         assert events[0].changed_fields == changed
+        assert events[0].title == "Edited Title"
+        assert events[0].content == str(post.content)
 
     def test_edit_post_with_no_changes_does_not_publish_event(
         self, post: Post, author_id: UserId
@@ -0,0 +1,160 @@
+"""Unit tests for CachedCategoryRepository and CachedMemberRepository."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.community.domain.entities import Category, CommunityMember
+from src.community.domain.value_objects import CategoryId, CommunityId, MemberRole
+from src.community.infrastructure.persistence.cached_repositories import (
+    CachedCategoryRepository,
+    CachedMemberRepository,
+)
+from src.community.infrastructure.persistence.membership_cache import MembershipCache
+from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure.metrics import MetricsRegistry
+from src.shared.infrastructure.reference_cache import ReferenceDataCache
+
+
+@pytest.fixture
+def cache() -> ReferenceDataCache:
+    return ReferenceDataCache(registry=MetricsRegistry())
+
+
+@pytest.fixture
+def community_id() -> CommunityId:
+    return CommunityId(uuid4())
+
+
+@pytest.fixture
+def category(community_id: CommunityId) -> Category:
+    return Category.create(community_id=community_id, name="General", slug="general", emoji="💬")
+
+
+class TestCachedCategoryRepository:
+    async def test_list_is_served_from_cache(
+        self, cache: ReferenceDataCache, community_id: CommunityId, category: Category
+    ) -> None:
+        inner = AsyncMock()
+        inner.list_by_community.return_value = [category]
+
+        first = await CachedCategoryRepository(inner, cache=cache).list_by_community(community_id)
+        second = await CachedCategoryRepository(inner, cache=cache).list_by_community(community_id)
+
+        assert [c.name for c in first] == [c.name for c in second] == ["General"]
+        inner.list_by_community.assert_awaited_once_with(community_id)
+
+    async def test_save_invalidates_community_list(
+        self, cache: ReferenceDataCache, community_id: CommunityId, category: Category
+    ) -> None:
+        inner = AsyncMock()
+        inner.list_by_community.return_value = []
+        reader = CachedCategoryRepository(inner, cache=cache)
+        await reader.list_by_community(community_id)
+
+        await CachedCategoryRepository(inner, cache=cache).save(category)
+        inner.list_by_community.return_value = [category]
+
+        assert len(await reader.list_by_community(community_id)) == 1
+
+    async def test_delete_invalidates_all_lists(
+        self, cache: ReferenceDataCache, community_id: CommunityId, category: Category
+    ) -> None:
+        inner = AsyncMock()
+        inner.list_by_community.return_value = [category]
+        reader = CachedCategoryRepository(inner, cache=cache)
+        await reader.list_by_community(community_id)
+
+        await CachedCategoryRepository(inner, cache=cache).delete(category.id)
+        inner.list_by_community.return_value = []
+
+        assert await reader.list_by_community(community_id) == []
+
+    async def test_point_lookups_delegate(
+        self, cache: ReferenceDataCache, community_id: CommunityId, category: Category
+    ) -> None:
+        inner = AsyncMock()
+        inner.get_by_id.return_value = category
+        inner.get_by_name.return_value = category
+        inner.get_by_slug.return_value = category
+        inner.exists_by_name.return_value = True
+        repo = CachedCategoryRepository(inner, cache=cache)
+
+        assert await repo.get_by_id(CategoryId(category.id.value)) is category
+        assert await repo.get_by_name(community_id, "General") is category
+        assert await repo.get_by_slug(community_id, "general") is category
+        assert await repo.exists_by_name(community_id, "General") is True
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.sync_session.info = {}
+    return session
+
+
+@pytest.fixture
+def listeners(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Capture session event listeners so tests can end transactions by hand."""
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr(
+        "src.community.infrastructure.persistence.membership_cache.event.listen",
+        lambda _target, name, fn, once: captured.__setitem__(name, fn),  # noqa: ARG005
+    )
+    return captured
+
+
+class TestCachedMemberRepository:
+    @pytest.mark.usefixtures("listeners")
+    async def test_a_request_looks_up_each_membership_once(self, community_id: CommunityId) -> None:
+        user_id = UserId(uuid4())
+        inner = AsyncMock()
+        inner.get_by_user_and_community.return_value = CommunityMember.create(
+            user_id, community_id, MemberRole.ADMIN
+        )
+        cache = MembershipCache(registry=MetricsRegistry())
+        repo = CachedMemberRepository(inner, session=_session(), cache=cache)
+
+        first = await repo.get_by_user_and_community(user_id, community_id)
+        second = await repo.get_by_user_and_community(user_id, community_id)
+        assert await repo.exists(user_id, community_id)
+
+        assert first is not None and second is not None
+        assert first is not second
+        assert second.role == MemberRole.ADMIN
+        inner.get_by_user_and_community.assert_awaited_once()
+
+    @pytest.mark.usefixtures("listeners")
+    async def test_other_requests_share_the_process_tier(self, community_id: CommunityId) -> None:
+        user_id = UserId(uuid4())
+        inner = AsyncMock()
+        inner.get_by_user_and_community.return_value = None
+        cache = MembershipCache(registry=MetricsRegistry())
+
+        for _ in range(3):
+            repo = CachedMemberRepository(inner, session=_session(), cache=cache)
+            assert await repo.get_by_user_and_community(user_id, community_id) is None
+
+        inner.get_by_user_and_community.assert_awaited_once()
+
+    async def test_joining_invalidates_on_commit(
+        self, community_id: CommunityId, listeners: dict[str, Any]
+    ) -> None:
+        user_id = UserId(uuid4())
+        member = CommunityMember.create(user_id, community_id)
+        inner = AsyncMock()
+        inner.get_by_user_and_community.return_value = None
+        cache = MembershipCache(registry=MetricsRegistry())
+        session = _session()
+        repo = CachedMemberRepository(inner, session=session, cache=cache)
+        assert await repo.get_by_user_and_community(user_id, community_id) is None
+
+        await repo.save(member)
+        inner.get_by_user_and_community.return_value = member
+        assert await repo.get_by_user_and_community(user_id, community_id) is not None
+
+        listeners["after_commit"](None)
+        other = CachedMemberRepository(inner, session=_session(), cache=cache)
+        assert await other.get_by_user_and_community(user_id, community_id) is not None
+        assert inner.get_by_user_and_community.await_count == 3
@@ -0,0 +1,163 @@
+"""Tests for ApplyPointBatchHandler."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.gamification.application.commands.apply_point_batch import (
+    ApplyPointBatchCommand,
+    ApplyPointBatchHandler,
+)
+from src.gamification.application.commands.award_points import AwardPointsCommand
+from src.gamification.application.commands.deduct_points import DeductPointsCommand
+from src.gamification.domain.entities.level_configuration import LevelConfiguration
+from src.gamification.domain.events import MemberLeveledUp, PointsAwarded, PointsDeducted
+from src.gamification.domain.value_objects.point_source import PointSource
+
+
+class TestApplyPointBatchHandler:
+    @pytest.fixture
+    def member_points_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def level_config_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def handler(
+        self, member_points_repo: AsyncMock, level_config_repo: AsyncMock
+    ) -> ApplyPointBatchHandler:
+        return ApplyPointBatchHandler(
+            member_points_repo=member_points_repo,
+            level_config_repo=level_config_repo,
+        )
+
+    async def test_coalesces_changes_per_member(
+        self,
+        handler: ApplyPointBatchHandler,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> None:
+        community_id, author_id, other_id, post_id = uuid4(), uuid4(), uuid4(), uuid4()
+        level_config_repo.get_by_community.return_value = LevelConfiguration.create_default(
+            community_id
+        )
+        member_points_repo.get_by_community_and_user.return_value = None
+        likes = [
+            AwardPointsCommand(
+                community_id=community_id,
+                user_id=author_id,
+                source=PointSource.POST_LIKED,
+                source_id=post_id,
+            )
+            for _ in range(10)
+        ]
+        other = AwardPointsCommand(
+            community_id=community_id,
+            user_id=other_id,
+            source=PointSource.POST_CREATED,
+            source_id=uuid4(),
+        )
+
+        events = await handler.handle(ApplyPointBatchCommand(commands=[*likes, other]))
+
+        # One load and one save per member, one level config read per community
+        assert member_points_repo.get_by_community_and_user.await_count == 2
+        assert member_points_repo.save.await_count == 2
+        level_config_repo.get_by_community.assert_awaited_once_with(community_id)
+        author = member_points_repo.save.call_args_list[0][0][0]
+        assert author.total_points == 10
+        assert len(author.transactions) == 10
+        # Every change keeps its own event, plus the level-up crossing 10 points
+        assert sum(isinstance(e, PointsAwarded) for e in events) == 11
+        assert [e.new_level for e in events if isinstance(e, MemberLeveledUp)] == [2]
+
+    async def test_applies_changes_in_order(
+        self,
+        handler: ApplyPointBatchHandler,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> None:
+        community_id, user_id, post_id = uuid4(), uuid4(), uuid4()
+        level_config_repo.get_by_community.return_value = None
+        member_points_repo.get_by_community_and_user.return_value = None
+        unlike_first = DeductPointsCommand(
+            community_id=community_id,
+            user_id=user_id,
+            source=PointSource.POST_LIKED,
+            source_id=post_id,
+        )
+        like = AwardPointsCommand(
+            community_id=community_id,
+            user_id=user_id,
+            source=PointSource.POST_LIKED,
+            source_id=post_id,
+        )
+        unlike = DeductPointsCommand(
+            community_id=community_id,
+            user_id=user_id,
+            source=PointSource.POST_LIKED,
+            source_id=post_id,
+        )
+
+        events = await handler.handle(ApplyPointBatchCommand(commands=[unlike_first, like, unlike]))
+
+        # The leading deduction has no member to apply to and is skipped
+        saved = member_points_repo.save.call_args[0][0]
+        assert [t.points for t in saved.transactions] == [1, -1]
+        assert saved.total_points == 0
+        assert [type(e) for e in events] == [PointsAwarded, PointsDeducted]
+        # Default level config is created lazily because the batch awards points
+        level_config_repo.save.assert_awaited_once()
+
+    async def test_skips_duplicate_lesson_completion(
+        self,
+        handler: ApplyPointBatchHandler,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> None:
+        community_id, user_id, lesson_id = uuid4(), uuid4(), uuid4()
+        level_config_repo.get_by_community.return_value = LevelConfiguration.create_default(
+            community_id
+        )
+        member_points_repo.get_by_community_and_user.return_value = None
+        completion = AwardPointsCommand(
+            community_id=community_id,
+            user_id=user_id,
+            source=PointSource.LESSON_COMPLETED,
+            source_id=lesson_id,
+        )
+
+        events = await handler.handle(ApplyPointBatchCommand(commands=[completion, completion]))
+
+        saved = member_points_repo.save.call_args[0][0]
+        assert saved.total_points == PointSource.LESSON_COMPLETED.points
+        assert sum(isinstance(e, PointsAwarded) for e in events) == 1
+
+    async def test_deduct_only_batch_for_unknown_member_saves_nothing(
+        self,
+        handler: ApplyPointBatchHandler,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> None:
+        level_config_repo.get_by_community.return_value = None
+        member_points_repo.get_by_community_and_user.return_value = None
+
+        events = await handler.handle(
+            ApplyPointBatchCommand(
+                commands=[
+                    DeductPointsCommand(
+                        community_id=uuid4(),
+                        user_id=uuid4(),
+                        source=PointSource.COMMENT_LIKED,
+                        source_id=uuid4(),
+                    )
+                ]
+            )
+        )
+
+        assert events == []
+        member_points_repo.save.assert_not_awaited()
+        level_config_repo.save.assert_not_awaited()
@@ -0,0 +1,143 @@
+"""Tests for CheckCourseAccessBatchHandler."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.gamification.application.queries.check_course_access_batch import (
+    CheckCourseAccessBatchHandler,
+    CheckCourseAccessBatchQuery,
+)
+from src.gamification.domain.entities.course_level_requirement import CourseLevelRequirement
+from src.gamification.domain.entities.level_configuration import LevelConfiguration
+
+
+class TestCheckCourseAccessBatchHandler:
+    @pytest.fixture
+    def course_req_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def member_points_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def level_config_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def handler(
+        self,
+        course_req_repo: AsyncMock,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> CheckCourseAccessBatchHandler:
+        return CheckCourseAccessBatchHandler(
+            course_req_repo=course_req_repo,
+            member_points_repo=member_points_repo,
+            level_config_repo=level_config_repo,
+        )
+
+    async def test_evaluates_all_courses_with_one_lookup_each(
+        self,
+        handler: CheckCourseAccessBatchHandler,
+        course_req_repo: AsyncMock,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> None:
+        community_id, user_id = uuid4(), uuid4()
+        open_course, easy_course, hard_course = uuid4(), uuid4(), uuid4()
+        member_points_repo.get_current_level.return_value = 3
+        course_req_repo.list_by_community_and_courses.return_value = [
+            CourseLevelRequirement.create(
+                community_id=community_id, course_id=easy_course, minimum_level=2
+            ),
+            CourseLevelRequirement.create(
+                community_id=community_id, course_id=hard_course, minimum_level=5
+            ),
+        ]
+        level_config_repo.get_by_community.return_value = LevelConfiguration.create_default(
+            community_id
+        )
+
+        results = await handler.handle(
+            CheckCourseAccessBatchQuery(
+                community_id=community_id,
+                user_id=user_id,
+                course_ids=[open_course, easy_course, hard_course],
+            )
+        )
+
+        assert list(results) == [open_course, easy_course, hard_course]
+        assert results[open_course].has_access is True
+        assert results[open_course].minimum_level is None
+        assert results[easy_course].has_access is True
+        assert results[easy_course].minimum_level_name == "Practitioner"
+        assert results[hard_course].has_access is False
+        assert results[hard_course].minimum_level == 5
+        assert all(r.current_level == 3 for r in results.values())
+        member_points_repo.get_current_level.assert_awaited_once_with(community_id, user_id)
+        course_req_repo.list_by_community_and_courses.assert_awaited_once_with(
+            community_id, [open_course, easy_course, hard_course]
+        )
+        level_config_repo.get_by_community.assert_awaited_once_with(community_id)
+
+    async def test_member_without_points_is_level_one(
+        self,
+        handler: CheckCourseAccessBatchHandler,
+        course_req_repo: AsyncMock,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> None:
+        community_id, course_id = uuid4(), uuid4()
+        member_points_repo.get_current_level.return_value = None
+        course_req_repo.list_by_community_and_courses.return_value = [
+            CourseLevelRequirement.create(
+                community_id=community_id, course_id=course_id, minimum_level=2
+            )
+        ]
+        level_config_repo.get_by_community.return_value = None
+
+        results = await handler.handle(
+            CheckCourseAccessBatchQuery(
+                community_id=community_id, user_id=uuid4(), course_ids=[course_id]
+            )
+        )
+
+        assert results[course_id].current_level == 1
+        assert results[course_id].has_access is False
+        assert results[course_id].minimum_level_name is not None
+
+    async def test_ungated_courses_skip_level_config(
+        self,
+        handler: CheckCourseAccessBatchHandler,
+        course_req_repo: AsyncMock,
+        member_points_repo: AsyncMock,
+        level_config_repo: AsyncMock,
+    ) -> None:
+        member_points_repo.get_current_level.return_value = 1
+        course_req_repo.list_by_community_and_courses.return_value = []
+
+        results = await handler.handle(
+            CheckCourseAccessBatchQuery(
+                community_id=uuid4(), user_id=uuid4(), course_ids=[uuid4(), uuid4()]
+            )
+        )
+
+        assert all(r.has_access for r in results.values())
+        level_config_repo.get_by_community.assert_not_awaited()
+
+    async def test_empty_course_list_does_no_queries(
+        self,
+        handler: CheckCourseAccessBatchHandler,
+        course_req_repo: AsyncMock,
+        member_points_repo: AsyncMock,
+    ) -> None:
+        results = await handler.handle(
+            CheckCourseAccessBatchQuery(community_id=uuid4(), user_id=uuid4(), course_ids=[])
+        )
+
+        assert results == {}
+        member_points_repo.get_current_level.assert_not_awaited()
+        course_req_repo.list_by_community_and_courses.assert_not_awaited()
@@ -119,6 +119,7 @@ class TestCommentLikedHandler:
         event = CommentLiked(
             reaction_id=ReactionId(uuid4()),
             comment_id=CommentId(uuid4()),
+            post_id=PostId(uuid4()),
             community_id=CommunityId(uuid4()),
             user_id=UserId(uuid4()),
             author_id=UserId(uuid4()),
@@ -137,6 +138,7 @@ class TestCommentUnlikedHandler:
     async def test_deducts_1_point_from_comment_author(self, mock_run_deduct: AsyncMock) -> None:
         event = CommentUnliked(
             comment_id=CommentId(uuid4()),
+            post_id=PostId(uuid4()),
             community_id=CommunityId(uuid4()),
             user_id=UserId(uuid4()),
             author_id=UserId(uuid4()),
@@ -0,0 +1,107 @@
+"""Tests for GetPointHistoryHandler."""
+
+import base64
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.gamification.application.queries.get_point_history import (
+    GetPointHistoryHandler,
+    GetPointHistoryQuery,
+    decode_cursor,
+    encode_cursor,
+)
+from src.gamification.domain.repositories.member_points_repository import (
+    PointHistoryCursor,
+    PointHistoryEntry,
+)
+from src.gamification.domain.value_objects.point_source import PointSource
+
+
+def _entries(count: int) -> list[PointHistoryEntry]:
+    now = datetime.now(UTC)
+    return [
+        PointHistoryEntry(
+            id=uuid4(),
+            points=1,
+            source=PointSource.POST_LIKED,
+            source_id=uuid4(),
+            created_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+class TestGetPointHistoryHandler:
+    @pytest.fixture
+    def member_points_repo(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def handler(self, member_points_repo: AsyncMock) -> GetPointHistoryHandler:
+        return GetPointHistoryHandler(member_points_repo=member_points_repo)
+
+    async def test_returns_cursor_to_the_last_entry_when_more_exist(
+        self, handler: GetPointHistoryHandler, member_points_repo: AsyncMock
+    ) -> None:
+        community_id, user_id = uuid4(), uuid4()
+        entries = _entries(3)
+        member_points_repo.list_point_history.return_value = entries
+
+        result = await handler.handle(
+            GetPointHistoryQuery(community_id=community_id, user_id=user_id, limit=2)
+        )
+
+        member_points_repo.list_point_history.assert_awaited_once_with(
+            community_id, user_id, limit=3, before=None
+        )
+        assert result.entries == entries[:2]
+        assert result.has_more is True
+        assert decode_cursor(result.cursor) == PointHistoryCursor(
+            created_at=entries[1].created_at, id=entries[1].id
+        )
+
+    async def test_last_page_has_no_cursor(
+        self, handler: GetPointHistoryHandler, member_points_repo: AsyncMock
+    ) -> None:
+        entries = _entries(2)
+        member_points_repo.list_point_history.return_value = entries
+
+        result = await handler.handle(
+            GetPointHistoryQuery(
+                community_id=uuid4(), user_id=uuid4(), limit=2, cursor=encode_cursor(entries[0])
+            )
+        )
+
+        assert result.has_more is False
+        assert result.cursor is None
+        before = member_points_repo.list_point_history.call_args.kwargs["before"]
+        assert before == PointHistoryCursor(created_at=entries[0].created_at, id=entries[0].id)
+
+    def test_cursor_timestamps_are_utc_aware(self) -> None:
+        entry = _entries(1)[0]
+        naive = PointHistoryEntry(
+            id=entry.id,
+            points=entry.points,
+            source=entry.source,
+            source_id=entry.source_id,
+            created_at=entry.created_at.replace(tzinfo=None),
+        )
+        legacy = base64.urlsafe_b64encode(
+            json.dumps({"created_at": "2026-01-02T03:04:05", "id": str(entry.id)}).encode()
+        ).decode()
+
+        decoded = decode_cursor(encode_cursor(naive))
+        assert decoded is not None
+        assert decoded.created_at == entry.created_at
+        assert decoded.created_at.tzinfo is UTC
+        assert decode_cursor(legacy) == PointHistoryCursor(
+            created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC), id=entry.id
+        )
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24=", "e30="])
+    def test_malformed_cursor_restarts_from_newest(self, cursor: str) -> None:
+        assert decode_cursor(cursor) is None
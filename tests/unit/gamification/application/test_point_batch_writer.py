@@ -0,0 +1,167 @@
+"""Tests for PointBatchWriter."""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.community.domain.events import PostLiked
+from src.community.domain.value_objects import CommunityId, PostId, ReactionId
+from src.gamification.application.commands.apply_point_batch import PointCommand
+from src.gamification.application.commands.award_points import AwardPointsCommand
+from src.gamification.application.event_handlers import community_event_handlers
+from src.gamification.application.event_handlers.point_batch_writer import PointBatchWriter
+from src.gamification.domain.value_objects.point_source import PointSource
+from src.identity.domain.value_objects import UserId
+from src.shared.infrastructure.event_bus import BACKGROUND, EventBus
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+COMMUNITY_ID = uuid4()
+
+
+def _like(user_id: UUID | None = None) -> AwardPointsCommand:
+    return AwardPointsCommand(
+        community_id=COMMUNITY_ID,
+        user_id=user_id or uuid4(),
+        source=PointSource.POST_LIKED,
+        source_id=uuid4(),
+    )
+
+
+class RecordingApply:
+    def __init__(
+        self, fail_on_batches_larger_than: int | None = None, delay_seconds: float = 0
+    ) -> None:
+        self.batches: list[list[PointCommand]] = []
+        self.finished: list[list[PointCommand]] = []
+        self._limit = fail_on_batches_larger_than
+        self._delay_seconds = delay_seconds
+
+    async def __call__(self, commands: list[PointCommand]) -> None:
+        self.batches.append(commands)
+        await asyncio.sleep(self._delay_seconds)
+        self.finished.append(commands)
+        if self._limit is not None and len(commands) > self._limit:
+            raise RuntimeError("batch rejected")
+
+
+class TestPointBatchWriter:
+    async def test_concurrent_submissions_share_one_batch(self) -> None:
+        apply = RecordingApply()
+        registry = MetricsRegistry()
+        writer = PointBatchWriter(apply, window_seconds=0.01, registry=registry)
+        author = uuid4()
+        likes = [_like(author) for _ in range(20)]
+
+        await asyncio.gather(*(writer.submit(like) for like in likes))
+
+        assert apply.batches == [likes]
+        assert registry.counter_value("gamification_point_batches_total") == 1
+        assert registry.counter_value("gamification_point_changes_total") == 20
+
+    async def test_submit_waits_for_its_batch(self) -> None:
+        apply = RecordingApply()
+        writer = PointBatchWriter(apply, window_seconds=0.01, registry=MetricsRegistry())
+
+        await writer.submit(_like())
+
+        assert len(apply.batches) == 1
+
+    async def test_full_buffer_flushes_without_waiting_for_window(self) -> None:
+        apply = RecordingApply()
+        writer = PointBatchWriter(
+            apply, window_seconds=60, max_batch_size=3, registry=MetricsRegistry()
+        )
+
+        await asyncio.wait_for(
+            asyncio.gather(*(writer.submit(_like()) for _ in range(3))), timeout=1
+        )
+
+        assert [len(b) for b in apply.batches] == [3]
+
+    async def test_failed_batch_is_retried_per_member(self) -> None:
+        apply = RecordingApply(fail_on_batches_larger_than=1)
+        registry = MetricsRegistry()
+        writer = PointBatchWriter(apply, window_seconds=0.01, registry=registry)
+
+        await asyncio.gather(writer.submit(_like(uuid4())), writer.submit(_like(uuid4())))
+
+        assert [len(b) for b in apply.batches] == [2, 1, 1]
+        assert registry.counter_value("gamification_point_batch_failures_total") == 1
+
+    async def test_close_flushes_pending_changes(self) -> None:
+        apply = RecordingApply()
+        writer = PointBatchWriter(apply, window_seconds=60, registry=MetricsRegistry())
+        pending = asyncio.create_task(writer.submit(_like()))
+        await asyncio.sleep(0)
+
+        await writer.close()
+
+        assert len(apply.batches) == 1
+        await asyncio.wait_for(pending, timeout=1)
+
+    async def test_closed_or_disabled_writer_applies_immediately(self) -> None:
+        apply = RecordingApply()
+        writer = PointBatchWriter(apply, window_seconds=0, registry=MetricsRegistry())
+
+        await writer.submit(_like())
+        writer.configure(window_seconds=60, max_batch_size=500)
+        await writer.close()
+        await writer.submit(_like())
+
+        assert [len(b) for b in apply.batches] == [1, 1]
+
+    async def test_batches_are_applied_one_at_a_time_in_order(self) -> None:
+        apply = RecordingApply(delay_seconds=0.02)
+        writer = PointBatchWriter(
+            apply, window_seconds=60, max_batch_size=1, registry=MetricsRegistry()
+        )
+        writer.configure(window_seconds=60, max_batch_size=1, detached=True)
+        like, unlike = _like(), _like()
+
+        await writer.submit(like)
+        await writer.submit(unlike)
+        await asyncio.sleep(0.005)
+
+        # The second batch has not started while the first is still applying
+        assert apply.batches == [[like]]
+        await writer.close()
+        assert apply.finished == [[like], [unlike]]
+
+
+class TestBackgroundSubscribers:
+    async def test_likes_on_one_post_share_one_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        apply = RecordingApply()
+        registry = MetricsRegistry()
+        writer = PointBatchWriter(apply, registry=registry)
+        writer.configure(window_seconds=0.01, max_batch_size=500, detached=True)
+        monkeypatch.setattr(community_event_handlers, "point_batch_writer", writer)
+        bus = EventBus(registry=registry)
+        bus.configure(
+            mode=BACKGROUND,
+            queue_size=100,
+            workers=2,
+            handler_timeout_seconds=1,
+            enqueue_timeout_seconds=0.01,
+        )
+        bus.register_handler(PostLiked, community_event_handlers.handle_post_liked)  # type: ignore[arg-type]
+        post_id, community_id, author_id = PostId(uuid4()), CommunityId(uuid4()), UserId(uuid4())
+
+        # Every like lands on the post's queue, handled one after another
+        await bus.publish_all(
+            [
+                PostLiked(
+                    reaction_id=ReactionId(uuid4()),
+                    post_id=post_id,
+                    community_id=community_id,
+                    user_id=UserId(uuid4()),
+                    author_id=author_id,
+                )
+                for _ in range(20)
+            ]
+        )
+        await bus.close(timeout_seconds=1)
+        await writer.close()
+
+        assert [len(batch) for batch in apply.batches] == [20]
+        assert registry.counter_value("gamification_point_batches_total") == 1
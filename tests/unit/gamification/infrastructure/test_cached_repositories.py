@@ -0,0 +1,106 @@
+"""Unit tests for the cached gamification reference-data repositories."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.gamification.domain.entities.course_level_requirement import CourseLevelRequirement
+from src.gamification.domain.entities.level_configuration import LevelConfiguration
+from src.gamification.infrastructure.persistence.cached_repositories import (
+    CachedCourseLevelRequirementRepository,
+    CachedLevelConfigRepository,
+)
+from src.shared.infrastructure.metrics import MetricsRegistry
+from src.shared.infrastructure.reference_cache import ReferenceDataCache
+
+
+@pytest.fixture
+def cache() -> ReferenceDataCache:
+    return ReferenceDataCache(registry=MetricsRegistry())
+
+
+class TestCachedLevelConfigRepository:
+    async def test_reads_are_shared_across_repository_instances(
+        self, cache: ReferenceDataCache
+    ) -> None:
+        community_id = uuid4()
+        config = LevelConfiguration.create_default(community_id)
+        inner = AsyncMock()
+        inner.get_by_community.return_value = config
+
+        first = await CachedLevelConfigRepository(inner, cache=cache).get_by_community(community_id)
+        second = await CachedLevelConfigRepository(inner, cache=cache).get_by_community(
+            community_id
+        )
+
+        assert first is not None and second is not None
+        assert first.levels == second.levels == config.levels
+        inner.get_by_community.assert_awaited_once_with(community_id)
+
+    async def test_save_invalidates_and_bypasses_cache(self, cache: ReferenceDataCache) -> None:
+        community_id = uuid4()
+        config = LevelConfiguration.create_default(community_id)
+        inner = AsyncMock()
+        inner.get_by_community.return_value = config
+        repo = CachedLevelConfigRepository(inner, cache=cache)
+
+        await repo.get_by_community(community_id)
+        await repo.save(config)
+        await repo.get_by_community(community_id)
+        await repo.get_by_community(community_id)
+
+        inner.save.assert_awaited_once_with(config)
+        # Writer reads straight from the session after saving
+        assert inner.get_by_community.await_count == 3
+
+    async def test_save_makes_other_readers_reload(self, cache: ReferenceDataCache) -> None:
+        community_id = uuid4()
+        config = LevelConfiguration.create_default(community_id)
+        inner = AsyncMock()
+        inner.get_by_community.return_value = None
+
+        reader = CachedLevelConfigRepository(inner, cache=cache)
+        assert await reader.get_by_community(community_id) is None
+
+        await CachedLevelConfigRepository(inner, cache=cache).save(config)
+        inner.get_by_community.return_value = config
+
+        assert await reader.get_by_community(community_id) is not None
+
+
+class TestCachedCourseLevelRequirementRepository:
+    async def test_requirement_is_cached_per_course(self, cache: ReferenceDataCache) -> None:
+        community_id, course_a, course_b = uuid4(), uuid4(), uuid4()
+        inner = AsyncMock()
+        inner.get_by_community_and_course.return_value = None
+        repo = CachedCourseLevelRequirementRepository(inner, cache=cache)
+
+        await repo.get_by_community_and_course(community_id, course_a)
+        await repo.get_by_community_and_course(community_id, course_a)
+        await repo.get_by_community_and_course(community_id, course_b)
+
+        assert inner.get_by_community_and_course.await_count == 2
+
+    async def test_save_and_delete_invalidate(self, cache: ReferenceDataCache) -> None:
+        community_id, course_id = uuid4(), uuid4()
+        requirement = CourseLevelRequirement.create(
+            community_id=community_id, course_id=course_id, minimum_level=3
+        )
+        inner = AsyncMock()
+        inner.get_by_community_and_course.return_value = None
+        reader = CachedCourseLevelRequirementRepository(inner, cache=cache)
+        await reader.get_by_community_and_course(community_id, course_id)
+
+        await CachedCourseLevelRequirementRepository(inner, cache=cache).save(requirement)
+        inner.get_by_community_and_course.return_value = requirement
+        cached = await reader.get_by_community_and_course(community_id, course_id)
+        assert cached is not None and cached.minimum_level == 3
+
+        await CachedCourseLevelRequirementRepository(inner, cache=cache).delete(
+            community_id, course_id
+        )
+        inner.get_by_community_and_course.return_value = None
+        assert await reader.get_by_community_and_course(community_id, course_id) is None
+
+        inner.delete.assert_awaited_once_with(community_id, course_id)
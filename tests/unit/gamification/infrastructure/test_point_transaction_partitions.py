@@ -0,0 +1,165 @@
+"""Tests for point_transactions partition helpers and maintenance."""
+
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.gamification.infrastructure.persistence.models import (
+    MemberPointsModel,
+    PointTransactionModel,
+    PointTransactionSummaryModel,
+)
+from src.gamification.infrastructure.persistence.point_transaction_partitions import (
+    DEFAULT_PARTITION,
+    PointTransactionPartitionManager,
+    add_months,
+    compaction_cutoff,
+    longest_leaderboard_window,
+    month_start,
+    partition_name,
+)
+
+# Far enough in the past not to meet partitions created for the current date
+JANUARY_2000 = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+class TestMonthHelpers:
+    def test_month_start_truncates_in_utc(self) -> None:
+        # 00:30 on March 1st in UTC+2 is still February in UTC
+        moment = datetime(2026, 3, 1, 0, 30, tzinfo=timezone(timedelta(hours=2)))
+
+        assert month_start(moment) == datetime(2026, 2, 1, tzinfo=UTC)
+
+    def test_add_months_rolls_over_years(self) -> None:
+        start = datetime(2026, 11, 1, tzinfo=UTC)
+
+        assert add_months(start, 2) == datetime(2027, 1, 1, tzinfo=UTC)
+        assert add_months(start, -11) == datetime(2025, 12, 1, tzinfo=UTC)
+
+    def test_partition_name(self) -> None:
+        assert partition_name(datetime(2026, 3, 1, tzinfo=UTC)) == "point_transactions_2026_03"
+
+
+class TestCompactionCutoff:
+    def test_longest_window_is_thirty_days(self) -> None:
+        assert longest_leaderboard_window() == timedelta(days=30)
+
+    def test_cutoff_keeps_the_leaderboard_window_uncompacted(self) -> None:
+        now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+        cutoff = compaction_cutoff(now)
+
+        assert cutoff == datetime(2026, 9, 1, tzinfo=UTC)
+        assert cutoff <= now - longest_leaderboard_window()
+
+    def test_margin_holds_back_a_month_near_the_boundary(self) -> None:
+        now = datetime(2026, 10, 3, tzinfo=UTC)
+
+        assert compaction_cutoff(now, margin=timedelta(0)) == datetime(2026, 9, 1, tzinfo=UTC)
+        assert compaction_cutoff(now) == datetime(2026, 8, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def member_points_id(db_session: AsyncSession) -> UUID:
+    member = MemberPointsModel(community_id=uuid4(), user_id=uuid4())
+    db_session.add(member)
+    await db_session.flush()
+    return member.id
+
+
+async def _add_transactions(
+    session: AsyncSession, member_points_id: UUID, rows: list[tuple[datetime, str, int]]
+) -> None:
+    session.add_all(
+        PointTransactionModel(
+            member_points_id=member_points_id,
+            points=points,
+            source=source,
+            source_id=uuid4(),
+            created_at=created_at,
+        )
+        for created_at, source, points in rows
+    )
+    await session.flush()
+
+
+async def _count(session: AsyncSession, table: str) -> int:
+    return int((await session.execute(text(f"SELECT count(*) FROM {table}"))).scalar_one())
+
+
+class TestPartitionMaintenance:
+    async def test_ensure_moves_default_rows_into_the_new_month(
+        self, db_session: AsyncSession, member_points_id: UUID
+    ) -> None:
+        february = add_months(JANUARY_2000, 1)
+        await _add_transactions(
+            db_session,
+            member_points_id,
+            [
+                (february + timedelta(days=3), "post_liked", 1),
+                (february + timedelta(days=20), "post_created", 2),
+                (add_months(JANUARY_2000, 5), "post_liked", 1),
+            ],
+        )
+        manager = PointTransactionPartitionManager(db_session)
+
+        created = await manager.ensure_partitions(months_ahead=2, now=JANUARY_2000)
+
+        assert created == [
+            "point_transactions_2000_01",
+            "point_transactions_2000_02",
+            "point_transactions_2000_03",
+        ]
+        assert await _count(db_session, "point_transactions_2000_02") == 2
+        assert await _count(db_session, "point_transactions_2000_01") == 0
+        # June has no partition yet and stays in the DEFAULT partition
+        member_rows = select(func.count()).where(
+            PointTransactionModel.member_points_id == member_points_id
+        )
+        assert (await db_session.execute(member_rows)).scalar_one() == 3
+        assert await manager.ensure_partitions(months_ahead=2, now=JANUARY_2000) == []
+
+    async def test_compact_folds_and_drops_old_months(
+        self, db_session: AsyncSession, member_points_id: UUID
+    ) -> None:
+        february, april = add_months(JANUARY_2000, 1), add_months(JANUARY_2000, 3)
+        rows = [
+            (JANUARY_2000 + timedelta(days=1), "post_liked", 1),
+            (JANUARY_2000 + timedelta(days=9), "post_liked", 1),
+            (JANUARY_2000 + timedelta(days=9), "post_created", 2),
+            (february + timedelta(days=5), "post_liked", 3),
+            (february + timedelta(days=6), "post_liked", -1),
+            # No April partition: this one is folded from the DEFAULT partition
+            (april + timedelta(days=2), "comment_created", 1),
+        ]
+        await _add_transactions(db_session, member_points_id, rows)
+        manager = PointTransactionPartitionManager(db_session)
+        await manager.ensure_partitions(months_ahead=1, now=JANUARY_2000)
+
+        compacted = await manager.compact(now=datetime(2000, 6, 15, tzinfo=UTC))
+
+        assert compacted == ["point_transactions_2000_01", "point_transactions_2000_02"]
+        for name in compacted:
+            regclass = await db_session.execute(text("SELECT to_regclass(:name)"), {"name": name})
+            assert regclass.scalar_one() is None
+        assert await _count(db_session, DEFAULT_PARTITION) == 0
+
+        summaries = (
+            await db_session.execute(
+                select(PointTransactionSummaryModel).where(
+                    PointTransactionSummaryModel.member_points_id == member_points_id
+                )
+            )
+        ).scalars()
+        by_period = {(s.period_start, s.source): (s.points, s.transaction_count) for s in summaries}
+        assert by_period == {
+            (JANUARY_2000, "post_liked"): (2, 2),
+            (JANUARY_2000, "post_created"): (2, 1),
+            (february, "post_liked"): (2, 2),
+            (april, "comment_created"): (1, 1),
+        }
+        assert sum(points for points, _ in by_period.values()) == sum(p for _, _, p in rows)
+        assert sum(count for _, count in by_period.values()) == len(rows)
@@ -0,0 +1,111 @@
+"""Unit tests for GetProfileActivityHandler and GetProfileStatsHandler."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.identity.application.queries import (
+    GetProfileActivityHandler,
+    GetProfileActivityQuery,
+    GetProfileStatsHandler,
+    GetProfileStatsQuery,
+)
+from src.identity.domain.exceptions import ProfileNotFoundError
+from src.identity.domain.repositories import (
+    ActivityCursor,
+    ActivityEntry,
+    ContributionSummary,
+    IProfileActivityRepository,
+)
+
+JOINED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _entry(minutes_ago: int, kind: str = "post") -> ActivityEntry:
+    post_id = uuid4()
+    return ActivityEntry(
+        kind=kind,
+        ref_id=post_id if kind == "post" else uuid4(),
+        post_id=post_id,
+        community_id=uuid4(),
+        title="Hello" if kind == "post" else None,
+        preview="Some content",
+        created_at=datetime.now(UTC) - timedelta(minutes=minutes_ago),
+    )
+
+
+def _repository(entries: list[ActivityEntry]) -> AsyncMock:
+    repository = AsyncMock(spec=IProfileActivityRepository)
+    repository.get_summary.return_value = ContributionSummary(
+        joined_at=JOINED_AT, post_count=3, comment_count=4
+    )
+    repository.list_activity.return_value = entries
+    return repository
+
+
+async def test_stats_sum_posts_and_comments() -> None:
+    handler = GetProfileStatsHandler(activity_repository=_repository([]))
+
+    stats = await handler.handle(GetProfileStatsQuery(user_id=uuid4()))
+
+    assert stats.contribution_count == 7
+    assert stats.joined_at == JOINED_AT
+
+
+async def test_stats_for_unknown_user_raise() -> None:
+    repository = _repository([])
+    repository.get_summary.return_value = None
+
+    with pytest.raises(ProfileNotFoundError):
+        await GetProfileStatsHandler(activity_repository=repository).handle(
+            GetProfileStatsQuery(user_id=uuid4())
+        )
+
+
+async def test_activity_pages_with_a_keyset_cursor() -> None:
+    entries = [_entry(1), _entry(2, kind="comment"), _entry(3)]
+    repository = _repository(entries)
+    handler = GetProfileActivityHandler(activity_repository=repository)
+
+    first = await handler.handle(GetProfileActivityQuery(user_id=uuid4(), limit=2))
+
+    assert [item.id for item in first.items] == [str(e.ref_id) for e in entries[:2]]
+    assert first.items[1].type == "comment"
+    assert first.items[1].title is None
+    assert first.total_count == 7
+    assert first.has_more is True
+    assert repository.list_activity.await_args.args[1] == 3
+
+    repository.list_activity.return_value = entries[2:]
+    second = await handler.handle(
+        GetProfileActivityQuery(user_id=uuid4(), limit=2, cursor=first.cursor)
+    )
+
+    assert repository.list_activity.await_args.kwargs["after"] == ActivityCursor(
+        created_at=entries[1].created_at, ref_id=entries[1].ref_id
+    )
+    assert [item.id for item in second.items] == [str(entries[2].ref_id)]
+    assert second.has_more is False
+    assert second.cursor is None
+
+
+async def test_invalid_cursor_starts_from_the_top() -> None:
+    repository = _repository([])
+    handler = GetProfileActivityHandler(activity_repository=repository)
+
+    await handler.handle(GetProfileActivityQuery(user_id=uuid4(), cursor="not-a-cursor"))
+
+    assert repository.list_activity.await_args.kwargs["after"] is None
+
+
+async def test_activity_for_unknown_user_raises() -> None:
+    repository = _repository([])
+    repository.get_summary.return_value = None
+
+    with pytest.raises(ProfileNotFoundError):
+        await GetProfileActivityHandler(activity_repository=repository).handle(
+            GetProfileActivityQuery(user_id=uuid4())
+        )
+    repository.list_activity.assert_not_awaited()
@@ -30,7 +30,7 @@ def mock_user_repository() -> AsyncMock:
 def mock_avatar_generator() -> Mock:
     """Create a mock avatar generator."""
     mock = Mock()
-    mock.generate_from_initials.return_value = "https://ui-avatars.com/api/?name=JD"
+    mock.generate_from_initials.return_value = "/api/v1/avatars/0123456789abcdef/JD.svg"
     return mock
 
 
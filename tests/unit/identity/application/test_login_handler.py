@@ -14,6 +14,7 @@ from src.identity.domain.exceptions import (
     UserDisabledError,
     UserNotVerifiedError,
 )
+from src.identity.domain.services import IPasswordHasher
 from src.identity.domain.value_objects import AuthTokens, EmailAddress, HashedPassword, UserId
 
 
@@ -24,9 +25,11 @@ def mock_user_repository() -> AsyncMock:
 
 
 @pytest.fixture
-def mock_password_hasher() -> MagicMock:
+def mock_password_hasher() -> AsyncMock:
     """Create a mock password hasher."""
-    return MagicMock()
+    mock = AsyncMock(spec=IPasswordHasher)
+    mock.needs_rehash.return_value = False
+    return mock
 
 
 @pytest.fixture
@@ -45,7 +48,7 @@ def mock_token_generator() -> MagicMock:
 @pytest.fixture
 def handler(
     mock_user_repository: AsyncMock,
-    mock_password_hasher: MagicMock,
+    mock_password_hasher: AsyncMock,
     mock_token_generator: MagicMock,
 ) -> LoginHandler:
     """Create a LoginHandler with mocked dependencies."""
@@ -103,7 +106,7 @@ class TestLoginHandlerSuccess:
         self,
         handler: LoginHandler,
         mock_user_repository: AsyncMock,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
         mock_token_generator: MagicMock,
         verified_active_user: User,
     ) -> None:
@@ -123,7 +126,7 @@ class TestLoginHandlerSuccess:
         self,
         handler: LoginHandler,
         mock_user_repository: AsyncMock,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
         mock_token_generator: MagicMock,
         verified_active_user: User,
     ) -> None:
@@ -146,7 +149,7 @@ class TestLoginHandlerSuccess:
         self,
         handler: LoginHandler,
         mock_user_repository: AsyncMock,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
         verified_active_user: User,
     ) -> None:
         """User should be saved after recording login."""
@@ -158,6 +161,45 @@ class TestLoginHandlerSuccess:
 
         mock_user_repository.save.assert_called_once_with(verified_active_user)
 
+    @pytest.mark.asyncio
+    async def test_login_rehashes_password_with_outdated_parameters(
+        self,
+        handler: LoginHandler,
+        mock_user_repository: AsyncMock,
+        mock_password_hasher: AsyncMock,
+        verified_active_user: User,
+    ) -> None:
+        """A hash made with old parameters is replaced on successful login."""
+        mock_user_repository.get_by_email.return_value = verified_active_user
+        mock_password_hasher.verify.return_value = True
+        mock_password_hasher.needs_rehash.return_value = True
+        upgraded = HashedPassword("$argon2id$v=19$m=131072,t=4,p=4$upgraded")
+        mock_password_hasher.hash.return_value = upgraded
+        command = LoginCommand(email="user@example.com", password="correctpassword")
+
+        await handler.handle(command)
+
+        mock_password_hasher.hash.assert_awaited_once_with("correctpassword")
+        assert verified_active_user.hashed_password == upgraded
+        mock_user_repository.save.assert_called_once_with(verified_active_user)
+
+    @pytest.mark.asyncio
+    async def test_login_keeps_current_hash(
+        self,
+        handler: LoginHandler,
+        mock_user_repository: AsyncMock,
+        mock_password_hasher: AsyncMock,
+        verified_active_user: User,
+    ) -> None:
+        """A hash made with current parameters is left alone."""
+        mock_user_repository.get_by_email.return_value = verified_active_user
+        mock_password_hasher.verify.return_value = True
+        command = LoginCommand(email="user@example.com", password="correctpassword")
+
+        await handler.handle(command)
+
+        mock_password_hasher.hash.assert_not_awaited()
+
 
 class TestLoginHandlerInvalidEmail:
     """Tests for invalid email format scenarios."""
@@ -208,7 +250,7 @@ class TestLoginHandlerWrongPassword:
         self,
         handler: LoginHandler,
         mock_user_repository: AsyncMock,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
         verified_active_user: User,
     ) -> None:
         """Wrong password should raise InvalidCredentialsError."""
@@ -228,7 +270,7 @@ class TestLoginHandlerUnverifiedUser:
         self,
         handler: LoginHandler,
         mock_user_repository: AsyncMock,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
         unverified_user: User,
     ) -> None:
         """Unverified user should raise UserNotVerifiedError (specific error, not generic)."""
@@ -248,7 +290,7 @@ class TestLoginHandlerDisabledUser:
         self,
         handler: LoginHandler,
         mock_user_repository: AsyncMock,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
         disabled_user: User,
     ) -> None:
         """Disabled user should raise UserDisabledError."""
@@ -268,7 +310,7 @@ class TestLoginHandlerSecurityBehavior:
         self,
         handler: LoginHandler,
         mock_user_repository: AsyncMock,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
         verified_active_user: User,
     ) -> None:
         """Both non-existent email and wrong password should raise same error type.
@@ -25,9 +25,9 @@ def mock_verification_token_repository() -> AsyncMock:
 
 
 @pytest.fixture
-def mock_password_hasher() -> MagicMock:
+def mock_password_hasher() -> AsyncMock:
     """Create a mock password hasher."""
-    mock = MagicMock()
+    mock = AsyncMock()
     mock.hash.return_value = HashedPassword("$argon2id$v=19$m=65536,t=3,p=4$hash")
     return mock
 
@@ -51,7 +51,7 @@ def mock_email_service() -> AsyncMock:
 def handler(
     mock_user_repository: AsyncMock,
     mock_verification_token_repository: AsyncMock,
-    mock_password_hasher: MagicMock,
+    mock_password_hasher: AsyncMock,
     mock_token_generator: MagicMock,
     mock_email_service: AsyncMock,
 ) -> RegisterUserHandler:
@@ -104,7 +104,7 @@ class TestRegisterUserHandlerSuccess:
     async def test_registration_hashes_password(
         self,
         handler: RegisterUserHandler,
-        mock_password_hasher: MagicMock,
+        mock_password_hasher: AsyncMock,
     ) -> None:
         """Registration should hash the password."""
         command = RegisterUserCommand(
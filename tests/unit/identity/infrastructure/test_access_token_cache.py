@@ -0,0 +1,111 @@
+"""Unit tests for VerifiedAccessTokenCache."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.services.access_token_cache import VerifiedAccessTokenCache
+from src.identity.infrastructure.services.jwt_service import AccessTokenClaims, JWTService
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def cache(clock: FakeClock, registry: MetricsRegistry) -> VerifiedAccessTokenCache:
+    return VerifiedAccessTokenCache(max_entries=2, registry=registry, clock=clock)
+
+
+def _claims(user_id: UserId, clock: FakeClock, lifetime: int = 1800) -> AccessTokenClaims:
+    return AccessTokenClaims(
+        user_id=user_id, issued_at=int(clock.now), expires_at=int(clock.now) + lifetime
+    )
+
+
+class TestVerifiedAccessTokenCache:
+    def test_returns_cached_user_until_expiry(
+        self, cache: VerifiedAccessTokenCache, clock: FakeClock, registry: MetricsRegistry
+    ) -> None:
+        user_id = UserId(uuid4())
+        cache.put("token", _claims(user_id, clock, lifetime=60))
+
+        assert cache.get("token") == user_id
+        clock.now += 60
+        assert cache.get("token") is None
+        assert registry.counter_value("access_token_cache_hits_total") == 1
+        assert registry.counter_value("access_token_cache_misses_total") == 1
+
+    def test_evicts_least_recently_used(
+        self, cache: VerifiedAccessTokenCache, clock: FakeClock
+    ) -> None:
+        cache.put("a", _claims(UserId(uuid4()), clock))
+        cache.put("b", _claims(UserId(uuid4()), clock))
+        cache.get("a")
+        cache.put("c", _claims(UserId(uuid4()), clock))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_revoke_user_drops_entries_and_rejects_older_tokens(
+        self, cache: VerifiedAccessTokenCache, clock: FakeClock
+    ) -> None:
+        user_id = UserId(uuid4())
+        other = UserId(uuid4())
+        old_claims = _claims(user_id, clock)
+        cache.put("old", old_claims)
+        cache.put("other", _claims(other, clock))
+
+        clock.now += 5
+        cache.revoke_user(user_id, int(clock.now), expires_in_seconds=3600)
+
+        assert cache.get("old") is None
+        assert cache.get("other") == other
+        assert cache.put("old", old_claims) is False
+        # A token issued in the same second as the revocation (login after reset) is accepted
+        assert cache.put("new", _claims(user_id, clock)) is True
+        assert cache.get("new") == user_id
+
+    def test_revocations_are_forgotten_after_they_expire(
+        self, cache: VerifiedAccessTokenCache, clock: FakeClock
+    ) -> None:
+        user_id = UserId(uuid4())
+        old_claims = _claims(user_id, clock)
+        clock.now += 5
+        cache.revoke_user(user_id, int(clock.now), expires_in_seconds=60)
+        clock.now += 61
+        cache.revoke_user(UserId(uuid4()), int(clock.now), expires_in_seconds=60)
+
+        assert cache.is_revoked(old_claims) is False
+
+
+class TestDecodeAccessToken:
+    def test_exposes_issue_and_expiry_times(self) -> None:
+        service = JWTService(secret_key="test-secret-key-that-is-at-least-32-chars")
+        user_id = UserId(uuid4())
+        tokens = service.generate_auth_tokens(user_id)
+
+        claims = service.decode_access_token(tokens.access_token)
+
+        assert claims is not None
+        assert claims.user_id == user_id
+        assert claims.expires_at == int(tokens.expires_at.timestamp())
+        assert claims.expires_at - claims.issued_at == 30 * 60
+        assert service.decode_access_token(tokens.refresh_token) is None
@@ -0,0 +1,81 @@
+"""Unit tests for self-hosted initials avatars."""
+
+from starlette.requests import Request
+
+from src.identity.infrastructure.services.avatar_generator import (
+    AvatarRenderer,
+    InitialsAvatarGenerator,
+    avatar_digest,
+    avatar_path,
+    clean_initials,
+    render_svg,
+)
+from src.identity.interface.api.avatar_controller import get_avatar
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+class TestInitialsAvatarGenerator:
+    def test_urls_are_absolute_and_content_addressed(self) -> None:
+        generator = InitialsAvatarGenerator(base_url="https://api.example.com/")
+
+        url = generator.generate_from_initials("jd")
+
+        assert url == f"https://api.example.com/api/v1/avatars/{avatar_digest('JD')}/JD.svg"
+        assert InitialsAvatarGenerator().generate_from_initials("jd") == avatar_path("JD")
+
+    def test_initials_are_cleaned(self) -> None:
+        assert clean_initials("j.d.k") == "JD"
+        assert clean_initials("é") == "É"
+        assert clean_initials("<>") == "?"
+        assert avatar_path("<>").endswith("/%3F.svg")
+
+    def test_rendering_is_deterministic(self) -> None:
+        assert render_svg("JD") == render_svg("JD")
+        assert b">JD</text>" in render_svg("JD")
+
+
+class TestAvatarRenderer:
+    def test_renders_each_initials_once_while_cached(self) -> None:
+        registry = MetricsRegistry()
+        renderer = AvatarRenderer(max_entries=1, registry=registry)
+
+        renderer.render("JD")
+        renderer.render("JD")
+        renderer.render("AB")
+        renderer.render("JD")
+
+        assert registry.counter_value("avatar_render_cache_hits_total") == 1
+        assert registry.counter_value("avatar_render_cache_misses_total") == 3
+
+
+class TestGetAvatar:
+    async def test_serves_svg_with_immutable_caching(self) -> None:
+        digest = avatar_digest("JD")
+
+        response = await get_avatar(digest, "JD", _request())
+
+        assert response.status_code == 200
+        assert response.media_type == "image/svg+xml"
+        assert response.body == render_svg("JD")
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["etag"] == f'"{digest}"'
+
+    async def test_matching_etag_is_not_modified(self) -> None:
+        digest = avatar_digest("JD")
+
+        response = await get_avatar(digest, "JD", _request({"If-None-Match": f'"{digest}"'}))
+
+        assert response.status_code == 304
+
+    async def test_stale_urls_redirect_to_the_canonical_one(self) -> None:
+        stale = await get_avatar("0" * 16, "JD", _request())
+        lowercase = await get_avatar(avatar_digest("JD"), "jd", _request())
+
+        for response in (stale, lowercase):
+            assert response.status_code == 307
+            assert response.headers["location"] == avatar_path("JD")
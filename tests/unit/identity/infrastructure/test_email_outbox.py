@@ -0,0 +1,201 @@
+"""Unit tests for the email outbox sender and SMTP transport."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.identity.infrastructure.persistence.email_outbox_repository import OutboxEmail
+from src.identity.infrastructure.services import email_outbox
+from src.identity.infrastructure.services.email_outbox import (
+    EmailOutboxSender,
+    OutboxEmailService,
+)
+from src.identity.infrastructure.services.email_templates import OutgoingEmail
+from src.identity.infrastructure.services.email_transport import (
+    EmailTransport,
+    SmtpEmailTransport,
+)
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+
+class SmtpSink:
+    """Minimal local SMTP server that records delivered messages."""
+
+    def __init__(self) -> None:
+        self.messages: list[tuple[list[str], str]] = []
+        self.connections = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        recipients: list[str] = []
+
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        await reply("220 sink ready")
+        while line := (await reader.readline()).decode().strip():
+            command = line.split(" ", 1)[0].upper()
+            if command == "RCPT":
+                recipients.append(line.split(":", 1)[1].strip(" <>"))
+                await reply("250 OK")
+            elif command == "DATA":
+                await reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                while (data := (await reader.readline()).decode()) not in (".\r\n", ""):
+                    body.append(data)
+                self.messages.append((recipients, "".join(body)))
+                recipients = []
+                await reply("250 OK queued")
+            elif command == "QUIT":
+                await reply("221 Bye")
+                break
+            else:
+                await reply("250 OK")
+        writer.close()
+
+
+@pytest.fixture
+async def smtp_sink() -> AsyncIterator[SmtpSink]:
+    sink = SmtpSink()
+    await sink.start()
+    yield sink
+    await sink.stop()
+
+
+def _email(attempts: int = 1) -> OutboxEmail:
+    return OutboxEmail(
+        id=uuid4(), attempts=attempts, recipient="a@example.com", subject="Hi", html="<p>Hi</p>"
+    )
+
+
+class TestSmtpEmailTransport:
+    async def test_sends_a_batch_over_one_connection(self, smtp_sink: SmtpSink) -> None:
+        transport = SmtpEmailTransport("127.0.0.1", smtp_sink.port)
+        messages = [
+            OutgoingEmail(to=f"user{i}@example.com", subject=f"Subject {i}", html="<p>x</p>")
+            for i in range(3)
+        ]
+
+        results = await asyncio.to_thread(transport.send_batch, messages)
+        await asyncio.to_thread(transport.close)
+
+        assert results == [None, None, None]
+        assert smtp_sink.connections == 1
+        assert [rcpt for rcpt, _ in smtp_sink.messages] == [
+            ["user0@example.com"],
+            ["user1@example.com"],
+            ["user2@example.com"],
+        ]
+        assert "Subject: Subject 2" in smtp_sink.messages[2][1]
+
+    async def test_reports_errors_per_message_when_server_is_down(self) -> None:
+        transport = SmtpEmailTransport("127.0.0.1", 1, timeout=1)
+
+        results = await asyncio.to_thread(
+            transport.send_batch, [OutgoingEmail(to="a@example.com", subject="s", html="h")]
+        )
+
+        assert results[0] is not None
+
+
+class TestEmailOutboxSender:
+    @pytest.fixture
+    def repository(self, monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+        repository = AsyncMock()
+        monkeypatch.setattr(
+            email_outbox, "SqlAlchemyEmailOutboxRepository", MagicMock(return_value=repository)
+        )
+        return repository
+
+    @staticmethod
+    def _sender(transport: EmailTransport, registry: MetricsRegistry) -> EmailOutboxSender:
+        @asynccontextmanager
+        async def open_session() -> AsyncIterator[AsyncMock]:
+            yield AsyncMock()
+
+        return EmailOutboxSender(
+            transport_factory=lambda: transport,
+            open_session=open_session,  # type: ignore[arg-type]
+            max_attempts=3,
+            backoff_base_seconds=10,
+            registry=registry,
+        )
+
+    async def test_marks_sent_and_schedules_retries_with_backoff(
+        self, repository: AsyncMock
+    ) -> None:
+        ok, failing = _email(), _email(attempts=2)
+        repository.claim_due.return_value = [ok, failing]
+        transport = MagicMock(spec=EmailTransport)
+        transport.send_batch.return_value = [None, "451 try later"]
+        registry = MetricsRegistry()
+
+        before = datetime.now(UTC)
+        assert await self._sender(transport, registry).send_due() == 2
+
+        repository.mark_sent.assert_awaited_once_with([ok.id])
+        email_id, error, retry_at = repository.mark_failed.await_args.args
+        assert (email_id, error) == (failing.id, "451 try later")
+        # Second attempt failed: 10s * 2
+        assert 19 <= (retry_at - before).total_seconds() <= 21
+        assert registry.counter_value("email_outbox_sent_total") == 1
+
+    async def test_dead_letters_after_max_attempts(self, repository: AsyncMock) -> None:
+        email = _email(attempts=3)
+        repository.claim_due.return_value = [email]
+        transport = MagicMock(spec=EmailTransport)
+        transport.send_batch.return_value = ["550 mailbox unavailable"]
+        registry = MetricsRegistry()
+
+        await self._sender(transport, registry).send_due()
+
+        repository.mark_failed.assert_awaited_once_with(email.id, "550 mailbox unavailable", None)
+        assert registry.counter_value("email_outbox_dead_total") == 1
+
+    async def test_idle_outbox_does_not_open_the_transport(self, repository: AsyncMock) -> None:
+        repository.claim_due.return_value = []
+        factory = MagicMock()
+        sender = self._sender(MagicMock(), MetricsRegistry())
+        sender._transport_factory = factory
+
+        assert await sender.send_due() == 0
+        factory.assert_not_called()
+
+
+class TestOutboxEmailService:
+    async def test_queues_rendered_email_and_wakes_sender_on_commit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        repository = AsyncMock()
+        monkeypatch.setattr(
+            email_outbox, "SqlAlchemyEmailOutboxRepository", MagicMock(return_value=repository)
+        )
+        listen = MagicMock()
+        monkeypatch.setattr(email_outbox.event, "listen", listen)
+        sender = MagicMock()
+        service = OutboxEmailService(MagicMock(), sender=sender)
+
+        await service.send_password_reset_email("a@example.com", "tok")
+
+        to, subject, html = repository.add.await_args.args
+        assert (to, subject) == ("a@example.com", "Reset your Koulu password")
+        assert "reset-password?token=tok" in html
+        listen.call_args.args[2](None)
+        sender.notify.assert_called_once()
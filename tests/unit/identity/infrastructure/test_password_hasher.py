@@ -1,8 +1,20 @@
-"""Unit tests for Argon2PasswordHasher."""
+"""Unit tests for Argon2PasswordHasher and PooledPasswordHasher."""
+
+import asyncio
+import threading
 
 import pytest
 
-from src.identity.infrastructure.services.password_hasher import Argon2PasswordHasher
+from src.identity.domain.exceptions import ServiceBusyError
+from src.identity.domain.value_objects import HashedPassword
+from src.identity.infrastructure.services.password_hasher import (
+    Argon2PasswordHasher,
+    PooledPasswordHasher,
+)
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+# Cheap parameters keep these tests fast
+FAST = {"time_cost": 1, "memory_cost": 8, "parallelism": 1}
 
 
 @pytest.fixture
@@ -71,3 +83,77 @@ class TestArgon2PasswordHasher:
         result = hasher.verify("", hashed)
 
         assert result is False
+
+    def test_needs_rehash_when_parameters_change(self) -> None:
+        """Hashes made with other parameters should be flagged for rehash."""
+        old = Argon2PasswordHasher(**FAST)
+        hashed = old.hash("correctpassword")
+
+        assert old.needs_rehash(hashed) is False
+        assert Argon2PasswordHasher(**{**FAST, "time_cost": 2}).needs_rehash(hashed) is True
+
+    def test_needs_rehash_ignores_unparseable_hash(self, hasher: Argon2PasswordHasher) -> None:
+        """An invalid hash is not reported as needing a rehash."""
+        assert hasher.needs_rehash(HashedPassword("not-a-valid-hash")) is False
+
+
+class _BlockingHasher(Argon2PasswordHasher):
+    """Hashes only once released, to hold pool workers busy."""
+
+    def __init__(self) -> None:
+        super().__init__(**FAST)
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> HashedPassword:
+        self.release.wait(timeout=5)
+        return super().hash(password)
+
+
+class TestPooledPasswordHasher:
+    """Tests for PooledPasswordHasher."""
+
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        return MetricsRegistry()
+
+    async def test_hash_and_verify_run_on_worker_threads(self, registry: MetricsRegistry) -> None:
+        """Hashing happens off the event loop thread and is recorded."""
+        threads: list[str] = []
+
+        class _RecordingHasher(Argon2PasswordHasher):
+            def hash(self, password: str) -> HashedPassword:
+                threads.append(threading.current_thread().name)
+                return super().hash(password)
+
+        pool = PooledPasswordHasher(_RecordingHasher(**FAST), workers=2, registry=registry)
+        try:
+            hashed = await pool.hash("correctpassword")
+
+            assert await pool.verify("correctpassword", hashed) is True
+            assert await pool.verify("wrongpassword", hashed) is False
+            assert threads[0].startswith("password-hash")
+            assert registry.counter_value("password_hash_operations_total", operation="verify") == 2
+            assert registry.counter_value("password_hash_seconds_total", operation="hash") > 0
+        finally:
+            pool.close()
+
+    async def test_calls_beyond_the_wait_bound_are_rejected(
+        self, registry: MetricsRegistry
+    ) -> None:
+        """Once workers and the wait queue are full, calls fail fast."""
+        blocking = _BlockingHasher()
+        pool = PooledPasswordHasher(blocking, workers=1, max_waiting=1, registry=registry)
+        try:
+            running = [asyncio.create_task(pool.hash("p")) for _ in range(2)]
+            await asyncio.sleep(0)
+
+            with pytest.raises(ServiceBusyError):
+                await pool.hash("p")
+
+            blocking.release.set()
+            await asyncio.gather(*running)
+            assert registry.counter_value("password_hash_rejected_total", operation="hash") == 1
+            assert registry.counter_value("password_hash_queue_seconds_total", operation="hash") > 0
+        finally:
+            blocking.release.set()
+            pool.close()
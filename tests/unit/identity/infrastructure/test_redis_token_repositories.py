@@ -0,0 +1,87 @@
+"""Unit tests for the Redis verification and reset token repositories."""
+
+import hashlib
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.persistence.redis_token_repositories import (
+    RedisResetTokenRepository,
+    RedisVerificationTokenRepository,
+)
+
+
+def _digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@pytest.fixture
+def swap_token() -> AsyncMock:
+    return AsyncMock(return_value=None)
+
+
+@pytest.fixture
+def redis(swap_token: AsyncMock) -> MagicMock:
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.getdel = AsyncMock(return_value=None)
+    redis.delete = AsyncMock(return_value=1)
+    redis.register_script.return_value = swap_token
+    return redis
+
+
+class TestRedisTokenRepositories:
+    async def test_save_swaps_the_users_token_in_one_script_call(
+        self, redis: MagicMock, swap_token: AsyncMock
+    ) -> None:
+        user_id = UserId(uuid4())
+
+        await RedisVerificationTokenRepository(redis).save(
+            user_id, "new-token", datetime.now(UTC) + timedelta(hours=24)
+        )
+
+        swap_token.assert_awaited_once()
+        keys = swap_token.await_args.kwargs["keys"]
+        prefix, value, digest, ttl = swap_token.await_args.kwargs["args"]
+        assert keys == [
+            f"verification_token:user:{user_id.value}",
+            f"verification_token:token:{_digest('new-token')}",
+        ]
+        assert (prefix, value, digest) == (
+            "verification_token:token:",
+            str(user_id.value),
+            _digest("new-token"),
+        )
+        assert 24 * 3600 - 5 <= ttl <= 24 * 3600
+        redis.getdel.assert_not_called()
+
+    async def test_expired_tokens_are_not_stored(
+        self, redis: MagicMock, swap_token: AsyncMock
+    ) -> None:
+        await RedisResetTokenRepository(redis).save(
+            UserId(uuid4()), "token", datetime.now(UTC) - timedelta(seconds=1)
+        )
+
+        assert swap_token.await_args.kwargs["args"][3] <= 0
+
+    async def test_consume_uses_getdel(self, redis: MagicMock) -> None:
+        user_id = UserId(uuid4())
+        redis.getdel.return_value = str(user_id.value).encode()
+        repository = RedisResetTokenRepository(redis)
+
+        assert await repository.consume("token") == user_id
+
+        redis.getdel.return_value = None
+        assert await repository.consume("token") is None
+        redis.getdel.assert_awaited_with(f"reset_token:token:{_digest('token')}")
+
+    async def test_delete_by_user_id_drops_the_current_token(self, redis: MagicMock) -> None:
+        user_id = UserId(uuid4())
+        redis.getdel.return_value = b"digest"
+
+        await RedisVerificationTokenRepository(redis).delete_by_user_id(user_id)
+
+        redis.delete.assert_awaited_once_with("verification_token:token:digest")
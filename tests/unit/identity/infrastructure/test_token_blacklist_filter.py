@@ -0,0 +1,189 @@
+"""Unit tests for TokenBlacklistFilter and the filtered RedisRefreshTokenRepository."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.persistence.refresh_token_repository import (
+    RedisRefreshTokenRepository,
+)
+from src.identity.infrastructure.persistence.token_blacklist_filter import (
+    TokenBlacklistFilter,
+    token_message,
+    user_message,
+)
+from src.identity.infrastructure.services.access_token_cache import (
+    VerifiedAccessTokenCache,
+    verified_access_tokens,
+)
+from src.identity.infrastructure.services.jwt_service import AccessTokenClaims
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+
+def _redis(keys: dict[bytes, bytes], messages: list[bytes]) -> MagicMock:
+    """A Redis mock holding ``keys`` whose pub/sub delivers ``messages`` once."""
+
+    async def scan_iter(match: str, count: int) -> AsyncIterator[bytes]:  # noqa: ARG001
+        prefix = match.rstrip("*").encode()
+        for key in keys:
+            if key.startswith(prefix):
+                yield key
+
+    async def get_message(timeout: float) -> dict[str, Any] | None:  # noqa: ARG001
+        await asyncio.sleep(0)
+        return {"data": messages.pop(0)} if messages else None
+
+    pubsub = MagicMock()
+    pubsub.__aenter__ = AsyncMock(return_value=pubsub)
+    pubsub.__aexit__ = AsyncMock(return_value=None)
+    pubsub.subscribe = AsyncMock()
+    pubsub.get_message = get_message
+
+    # Pipelined GET and TTL replies, in the order they were queued
+    replies: list[Any] = []
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.get.side_effect = lambda key: replies.append(keys.get(key))
+    pipe.ttl.side_effect = lambda _key: replies.append(3600)
+
+    async def execute() -> list[Any]:
+        batch = list(replies)
+        replies.clear()
+        return batch
+
+    pipe.execute = execute
+
+    redis = MagicMock()
+    redis.scan_iter = scan_iter
+    redis.pipeline.return_value = pipe
+    redis.pubsub.return_value = pubsub
+    redis.exists = AsyncMock(return_value=1)
+    return redis
+
+
+async def _started(blacklist_filter: TokenBlacklistFilter, redis: MagicMock) -> None:
+    blacklist_filter.start(redis)
+    while not blacklist_filter.ready:
+        await asyncio.sleep(0)
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def blacklist_filter() -> TokenBlacklistFilter:
+    return TokenBlacklistFilter(capacity=1000, registry=MetricsRegistry())
+
+
+class TestTokenBlacklistFilter:
+    async def test_not_ready_filter_rules_nothing_out(
+        self, blacklist_filter: TokenBlacklistFilter
+    ) -> None:
+        assert blacklist_filter.might_contain_token("token") is True
+        assert blacklist_filter.might_contain_user(UserId(uuid4())) is True
+
+    async def test_loads_existing_blacklist_and_follows_channel(
+        self, blacklist_filter: TokenBlacklistFilter
+    ) -> None:
+        user_id = UserId(uuid4())
+        redis = _redis(
+            {b"token_blacklist:old": b"1", f"user_blacklist:{user_id}".encode(): b"1700000000"},
+            [token_message("new")],
+        )
+
+        await _started(blacklist_filter, redis)
+
+        assert blacklist_filter.might_contain_token("old") is True
+        assert blacklist_filter.might_contain_token("new") is True
+        assert blacklist_filter.might_contain_user(user_id) is True
+        assert blacklist_filter.might_contain_token("never-blacklisted") is False
+        # User revocations and their TTLs are read in one pipelined round trip
+        redis.pipeline.assert_called_once_with(transaction=False)
+        redis.pipeline.return_value.ttl.assert_called_once_with(
+            f"user_blacklist:{user_id}".encode()
+        )
+        await blacklist_filter.close()
+        assert blacklist_filter.might_contain_token("never-blacklisted") is True
+
+    async def test_user_message_revokes_cached_access_tokens(
+        self, blacklist_filter: TokenBlacklistFilter
+    ) -> None:
+        user_id = UserId(uuid4())
+        claims = AccessTokenClaims(user_id=user_id, issued_at=1_000, expires_at=2**40)
+        verified_access_tokens.put("access", claims)
+        redis = _redis({}, [user_message(user_id, revoked_at=2_000, expires_in_seconds=60)])
+
+        await _started(blacklist_filter, redis)
+        await blacklist_filter.close()
+
+        assert verified_access_tokens.get("access") is None
+        assert verified_access_tokens.is_revoked(claims) is True
+        verified_access_tokens.clear()
+
+
+class TestRedisRefreshTokenRepository:
+    async def test_ruled_out_lookups_skip_redis(
+        self, blacklist_filter: TokenBlacklistFilter
+    ) -> None:
+        redis = _redis({}, [])
+        await _started(blacklist_filter, redis)
+        repository = RedisRefreshTokenRepository(redis, blacklist_filter)
+
+        assert await repository.is_revoked("token", UserId(uuid4())) is False
+        assert await repository.is_blacklisted("token") is False
+        redis.exists.assert_not_awaited()
+        await blacklist_filter.close()
+
+    async def test_checks_both_blacklists_in_one_call_when_filter_not_ready(
+        self, blacklist_filter: TokenBlacklistFilter
+    ) -> None:
+        redis = _redis({}, [])
+        user_id = UserId(uuid4())
+        repository = RedisRefreshTokenRepository(redis, blacklist_filter)
+
+        assert await repository.is_revoked("token", user_id) is True
+        redis.exists.assert_awaited_once_with("token_blacklist:token", f"user_blacklist:{user_id}")
+
+    async def test_blacklisting_writes_publishes_and_updates_filter(
+        self, blacklist_filter: TokenBlacklistFilter
+    ) -> None:
+        redis = _redis({}, [])
+        await _started(blacklist_filter, redis)
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.execute = AsyncMock()
+        redis.pipeline.return_value = pipe
+        repository = RedisRefreshTokenRepository(redis, blacklist_filter)
+
+        await repository.blacklist("token", 60)
+
+        pipe.setex.assert_called_once_with("token_blacklist:token", 60, "1")
+        pipe.publish.assert_called_once_with("token_blacklist:events", token_message("token"))
+        assert await repository.is_blacklisted("token") is True
+        await blacklist_filter.close()
+
+    async def test_blacklisting_a_user_revokes_the_injected_access_token_cache(
+        self, blacklist_filter: TokenBlacklistFilter
+    ) -> None:
+        redis = _redis({}, [])
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.execute = AsyncMock()
+        redis.pipeline.return_value = pipe
+        cache = VerifiedAccessTokenCache(registry=MetricsRegistry())
+        user_id = UserId(uuid4())
+        claims = AccessTokenClaims(user_id=user_id, issued_at=1_000, expires_at=2**40)
+        cache.put("access", claims)
+        repository = RedisRefreshTokenRepository(redis, blacklist_filter, access_token_cache=cache)
+
+        await repository.blacklist_all_for_user(user_id, 60)
+
+        assert cache.get("access") is None
+        assert cache.is_revoked(claims) is True
@@ -0,0 +1,48 @@
+"""Unit tests for ExpiredTokenPurger."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.identity.infrastructure.persistence.reset_token_repository import (
+    SqlAlchemyResetTokenRepository,
+)
+from src.identity.infrastructure.persistence.verification_token_repository import (
+    SqlAlchemyVerificationTokenRepository,
+)
+from src.identity.infrastructure.services.token_purge import ExpiredTokenPurger
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+
+class TestExpiredTokenPurger:
+    async def test_purges_in_committed_batches_until_clean(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sessions: list[MagicMock] = []
+
+        @asynccontextmanager
+        async def open_session() -> AsyncIterator[AsyncSession]:
+            session = MagicMock()
+            sessions.append(session)
+            yield session
+
+        verification = AsyncMock(side_effect=[100, 100, 7])
+        reset = AsyncMock(side_effect=[0])
+        monkeypatch.setattr(SqlAlchemyVerificationTokenRepository, "delete_expired", verification)
+        monkeypatch.setattr(SqlAlchemyResetTokenRepository, "delete_expired", reset)
+        registry = MetricsRegistry()
+
+        result = await ExpiredTokenPurger(
+            open_session=open_session, batch_size=100, registry=registry
+        ).purge()
+
+        assert (result.verification_tokens, result.reset_tokens) == (207, 0)
+        assert len(sessions) == 4
+        assert all(call.kwargs == {"limit": 100} for call in verification.await_args_list)
+        assert (
+            registry.counter_value("expired_tokens_purged_total", table="verification_tokens")
+            == 207
+        )
@@ -0,0 +1,206 @@
+"""Unit tests for the user snapshot cache and CachedUserRepository."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.identity.domain.value_objects import UserId
+from src.identity.infrastructure.persistence.cached_repositories import CachedUserRepository
+from src.identity.infrastructure.persistence.user_snapshot_cache import (
+    INVALIDATION_SEQUENCE_KEY,
+    SNAPSHOT_KEY_PREFIX,
+    ProfileSnapshot,
+    UserSnapshot,
+    UserSnapshotCache,
+)
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+
+def _snapshot(user_id: UUID | None = None, display_name: str = "Ada") -> UserSnapshot:
+    now = datetime.now(UTC)
+    return UserSnapshot(
+        id=user_id or uuid4(),
+        email="ada@example.com",
+        is_verified=True,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+        profile=ProfileSnapshot(
+            display_name=display_name, avatar_url=None, bio=None, is_complete=True
+        ),
+    )
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.sync_session.info = {}
+    return session
+
+
+def _pipeline(results: list[object]) -> MagicMock:
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock(return_value=results)
+    return pipe
+
+
+@pytest.fixture
+def cache() -> UserSnapshotCache:
+    return UserSnapshotCache(registry=MetricsRegistry())
+
+
+def _loader(cache: UserSnapshotCache, snapshots: list[UserSnapshot]) -> AsyncMock:
+    by_id = {s.id: s for s in snapshots}
+    load = AsyncMock(side_effect=lambda _session, ids: [by_id[i] for i in ids if i in by_id])
+    cache._load = load  # type: ignore[method-assign]
+    return load
+
+
+class TestUserSnapshot:
+    def test_json_round_trip(self) -> None:
+        snapshot = _snapshot()
+
+        assert UserSnapshot.from_json(snapshot.to_json()) == snapshot
+
+
+class TestUserSnapshotCache:
+    async def test_get_many_loads_only_what_is_not_cached(self, cache: UserSnapshotCache) -> None:
+        ada, bob = _snapshot(), _snapshot(display_name="Bob")
+        load = _loader(cache, [ada, bob])
+        session = _session()
+
+        assert await cache.get(session, ada.id) == ada
+        result = await cache.get_many(session, [ada.id, bob.id, ada.id, uuid4()])
+
+        assert result == {ada.id: ada, bob.id: bob}
+        assert [call.args[1] for call in load.await_args_list][0] == [ada.id]
+        assert bob.id in load.await_args_list[1].args[1]
+        assert ada.id not in load.await_args_list[1].args[1]
+
+    async def test_least_recently_used_entries_are_evicted(self) -> None:
+        cache = UserSnapshotCache(max_entries=2, registry=MetricsRegistry())
+        users = [_snapshot() for _ in range(3)]
+        load = _loader(cache, users)
+        session = _session()
+
+        for user in users:
+            await cache.get(session, user.id)
+        await cache.get(session, users[0].id)
+
+        assert load.await_count == 4
+
+    async def test_write_invalidates_and_bypasses_until_commit(
+        self, cache: UserSnapshotCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        user = _snapshot()
+        load = _loader(cache, [user])
+        session = _session()
+        listeners: dict[str, object] = {}
+        monkeypatch.setattr(
+            "src.identity.infrastructure.persistence.user_snapshot_cache.event.listen",
+            lambda _target, name, fn, once: listeners.__setitem__(name, fn),  # noqa: ARG005
+        )
+        await cache.get(session, user.id)
+
+        inner = AsyncMock()
+        await CachedUserRepository(inner, session=session, cache=cache).delete(UserId(user.id))
+        await cache.get(session, user.id)
+        await cache.get(session, user.id)
+        assert load.await_count == 3
+
+        listeners["after_commit"](None)  # type: ignore[operator]
+        await asyncio.sleep(0)
+        await cache.get(session, user.id)
+        await cache.get(session, user.id)
+        assert load.await_count == 4
+        inner.delete.assert_awaited_once()
+
+    async def test_redis_tier_is_read_before_the_database(self, cache: UserSnapshotCache) -> None:
+        shared, fresh = _snapshot(), _snapshot(display_name="Bob")
+        load = _loader(cache, [fresh])
+        store = AsyncMock(return_value=1)
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=b"0")
+        redis.mget = AsyncMock(return_value=[b"4", shared.to_json().encode(), None])
+        redis.register_script.return_value = store
+        cache.configure(redis=redis)
+
+        result = await cache.get_many(_session(), [shared.id, fresh.id])
+
+        assert result == {shared.id: shared, fresh.id: fresh}
+        assert load.await_args.args[1] == [fresh.id]
+        assert redis.mget.await_args.args[0][0] == INVALIDATION_SEQUENCE_KEY
+        keys = store.await_args.kwargs["keys"]
+        sequence, _ttl, value = store.await_args.kwargs["args"]
+        assert keys == [INVALIDATION_SEQUENCE_KEY, SNAPSHOT_KEY_PREFIX + str(fresh.id)]
+        assert sequence == b"4"
+        assert UserSnapshot.from_json(value) == fresh
+
+    async def test_load_straddling_a_remote_invalidation_is_not_shared(self) -> None:
+        registry = MetricsRegistry()
+        cache = UserSnapshotCache(registry=registry)
+        stale = _snapshot()
+        shared: dict[str, bytes] = {INVALIDATION_SEQUENCE_KEY: b"3"}
+
+        async def load(_session: object, _ids: list[UUID]) -> list[UserSnapshot]:
+            # Another process commits an update and publishes it mid-load
+            shared[INVALIDATION_SEQUENCE_KEY] = b"4"
+            return [stale]
+
+        async def store_if_unchanged(keys: list[str], args: list[object]) -> int:
+            # What the script does, atomically in Redis
+            if shared.get(keys[0], b"") != args[0]:
+                return 0
+            shared.update(zip(keys[1:], args[2:], strict=True))  # type: ignore[arg-type]
+            return 1
+
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=b"3")
+        redis.mget = AsyncMock(
+            side_effect=lambda keys: [shared.get(k) for k in keys]  # noqa: ARG005
+        )
+        redis.register_script.return_value = AsyncMock(side_effect=store_if_unchanged)
+        cache.configure(redis=redis)
+        cache._load = AsyncMock(side_effect=load)  # type: ignore[method-assign]
+
+        assert await cache.get(_session(), stale.id) == stale
+
+        assert SNAPSHOT_KEY_PREFIX + str(stale.id) not in shared
+        assert registry.counter_value("user_snapshot_cache_stale_stores_skipped_total") == 1
+
+    async def test_redis_errors_fall_back_to_the_database(self, cache: UserSnapshotCache) -> None:
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        user = _snapshot()
+        _loader(cache, [user])
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=RedisConnectionError())
+        redis.mget = AsyncMock(side_effect=RedisConnectionError())
+        redis.pipeline.side_effect = RedisConnectionError()
+        cache.configure(redis=redis)
+
+        assert await cache.get(_session(), user.id) == user
+
+    async def test_invalidations_from_other_processes_drop_local_entries(self) -> None:
+        cache = UserSnapshotCache(sync_interval_seconds=0, registry=MetricsRegistry())
+        user = _snapshot()
+        load = _loader(cache, [user])
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=b"7")
+        redis.mget = AsyncMock(return_value=[b"7", None])
+        redis.register_script.return_value = AsyncMock(return_value=1)
+        redis.pipeline.return_value = _pipeline([1, [], []])
+        cache.configure(redis=redis)
+        session = _session()
+
+        await cache.get(session, user.id)
+        await cache.get(session, user.id)
+        assert load.await_count == 1
+
+        redis.pipeline.return_value = _pipeline([1, [], [(str(user.id).encode(), 8.0)]])
+        await cache.get(session, user.id)
+        assert load.await_count == 2
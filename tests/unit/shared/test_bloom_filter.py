@@ -0,0 +1,28 @@
+"""Tests for BloomFilter."""
+
+import pytest
+
+from src.shared.infrastructure.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    def test_added_items_are_always_found(self) -> None:
+        bloom = BloomFilter(capacity=1000)
+        items = [f"item-{i}".encode() for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert bloom.count == 1000
+
+    def test_false_positive_rate_stays_near_target_at_capacity(self) -> None:
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"item-{i}".encode())
+
+        false_positives = sum(f"other-{i}".encode() in bloom for i in range(10_000))
+        assert false_positives < 300
+
+    def test_rejects_invalid_sizing(self) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
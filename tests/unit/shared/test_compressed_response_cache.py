@@ -0,0 +1,115 @@
+"""Unit tests for CompressedResponseCache and HTTP caching helpers."""
+
+import gzip
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.shared.infrastructure import compressed_response_cache as module
+from src.shared.infrastructure.compressed_response_cache import (
+    IDENTITY,
+    CompressedResponseCache,
+    etag_matches,
+    make_etag,
+    negotiate_encoding,
+)
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+BODY = b'{"content": "' + b"lorem ipsum " * 500 + b'"}'
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def cache(registry: MetricsRegistry) -> CompressedResponseCache:
+    return CompressedResponseCache(registry=registry)
+
+
+class TestGetOrBuild:
+    async def test_body_is_built_and_compressed_once(
+        self, cache: CompressedResponseCache, registry: MetricsRegistry
+    ) -> None:
+        build = AsyncMock(return_value=BODY)
+
+        first = await cache.get_or_build('"v1"', "gzip", build)
+        second = await cache.get_or_build('"v1"', "gzip", build)
+
+        assert first == second
+        assert first[1] == "gzip"
+        assert gzip.decompress(first[0]) == BODY
+        build.assert_awaited_once()
+        assert registry.counter_value("compressed_response_cache_hits_total") == 1
+
+    async def test_other_encodings_reuse_the_built_body(
+        self, cache: CompressedResponseCache
+    ) -> None:
+        build = AsyncMock(return_value=BODY)
+
+        await cache.get_or_build('"v1"', "gzip", build)
+        body, encoding = await cache.get_or_build('"v1"', IDENTITY, build)
+
+        assert (body, encoding) == (BODY, IDENTITY)
+        build.assert_awaited_once()
+
+    async def test_small_bodies_are_not_compressed(self, cache: CompressedResponseCache) -> None:
+        result = await cache.get_or_build('"v1"', "gzip", AsyncMock(return_value=b"{}"))
+
+        assert result == (b"{}", IDENTITY)
+
+    async def test_least_recently_used_entries_are_evicted(self, registry: MetricsRegistry) -> None:
+        cache = CompressedResponseCache(max_bytes=len(BODY) * 2, registry=registry)
+        build = AsyncMock(return_value=BODY)
+
+        await cache.get_or_build('"a"', IDENTITY, build)
+        await cache.get_or_build('"b"', IDENTITY, build)
+        await cache.get_or_build('"a"', IDENTITY, build)
+        await cache.get_or_build('"c"', IDENTITY, build)
+        await cache.get_or_build('"a"', IDENTITY, build)
+        await cache.get_or_build('"b"', IDENTITY, build)
+
+        assert build.await_count == 4
+        assert registry.counter_value("compressed_response_cache_evictions_total") == 2
+
+
+class TestNegotiation:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, IDENTITY),
+            ("gzip, deflate", "gzip"),
+            ("gzip;q=0, deflate", IDENTITY),
+            ("*", "gzip"),
+            ("deflate", IDENTITY),
+        ],
+    )
+    def test_gzip_without_brotli(
+        self, monkeypatch: pytest.MonkeyPatch, header: str | None, expected: str
+    ) -> None:
+        monkeypatch.setattr(module, "brotli", None)
+
+        assert negotiate_encoding(header) == expected
+
+    def test_brotli_is_preferred_when_available(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(module, "brotli", object())
+
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0") == "gzip"
+
+
+class TestEtags:
+    def test_etag_is_strong_and_changes_with_any_part(self) -> None:
+        etag = make_etag("lesson", "2026-01-01T00:00:00+00:00", True)
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag("lesson", "2026-01-01T00:00:00+00:00", True)
+        assert etag != make_etag("lesson", "2026-01-01T00:00:00+00:00", False)
+
+    def test_if_none_match_lists_and_wildcards(self) -> None:
+        assert etag_matches('"x", "y"', '"y"')
+        assert etag_matches('W/"y"', '"y"')
+        assert etag_matches("*", '"y"')
+        assert not etag_matches('"x"', '"y"')
+        assert not etag_matches(None, '"y"')
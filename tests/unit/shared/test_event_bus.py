@@ -0,0 +1,265 @@
+"""Unit tests for EventBus dispatch modes."""
+
+import asyncio
+import contextvars
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.shared.domain.base_event import DomainEvent
+from src.shared.infrastructure import database as database_module
+from src.shared.infrastructure.database import Database
+from src.shared.infrastructure.event_bus import BACKGROUND, INLINE, EventBus
+from src.shared.infrastructure.metrics import MetricsRegistry
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="-")
+
+
+@dataclass(frozen=True, kw_only=True)
+class Happened(DomainEvent):
+    n: int = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class Changed(DomainEvent):
+    key: str
+    n: int = 0
+
+    @property
+    def aggregate_id(self) -> Hashable:
+        return self.key
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+def _bus(
+    registry: MetricsRegistry,
+    mode: str = BACKGROUND,
+    queue_size: int = 100,
+    workers: int = 2,
+    handler_timeout_seconds: float = 0.05,
+) -> EventBus:
+    bus = EventBus(registry=registry)
+    bus.configure(
+        mode=mode,
+        queue_size=queue_size,
+        workers=workers,
+        handler_timeout_seconds=handler_timeout_seconds,
+        enqueue_timeout_seconds=0.01,
+    )
+    return bus
+
+
+class TestInlineMode:
+    async def test_handlers_run_in_order_and_errors_reach_the_publisher(
+        self, registry: MetricsRegistry
+    ) -> None:
+        bus = _bus(registry, mode=INLINE)
+        seen: list[str] = []
+
+        async def first(_event: DomainEvent) -> None:
+            seen.append("first")
+
+        async def failing(_event: DomainEvent) -> None:
+            raise RuntimeError("boom")
+
+        bus.register_handler(Happened, first)
+        bus.register_handler(Happened, failing)
+
+        with pytest.raises(RuntimeError):
+            await bus.publish(Happened())
+        assert seen == ["first"]
+
+    def test_unknown_mode_is_rejected(self, registry: MetricsRegistry) -> None:
+        with pytest.raises(ValueError, match="mode"):
+            _bus(registry, mode="eventually")
+
+
+class TestBackgroundMode:
+    async def test_publish_returns_before_handlers_and_close_drains(
+        self, registry: MetricsRegistry
+    ) -> None:
+        bus = _bus(registry)
+        release = asyncio.Event()
+        handled: list[int] = []
+
+        async def slow(event: DomainEvent) -> None:
+            await release.wait()
+            handled.append(event.n)  # type: ignore[attr-defined]
+
+        bus.register_handler(Happened, slow)
+
+        await bus.publish_all([Happened(n=1), Happened(n=2)])
+        assert handled == []
+
+        release.set()
+        await bus.close(timeout_seconds=1)
+        assert sorted(handled) == [1, 2]
+
+    async def test_handlers_are_isolated_and_overrunning_ones_are_not_cancelled(
+        self, registry: MetricsRegistry
+    ) -> None:
+        bus = _bus(registry)
+        handled: list[str] = []
+
+        async def failing(_event: DomainEvent) -> None:
+            raise RuntimeError("boom")
+
+        async def slow(_event: DomainEvent) -> None:
+            await asyncio.sleep(0.2)
+            handled.append("slow")
+
+        async def healthy(_event: DomainEvent) -> None:
+            handled.append(request_id.get())
+
+        for handler in (failing, slow, healthy):
+            bus.register_handler(Happened, handler)
+
+        request_id.set("req-1")
+        await bus.publish(Happened())
+        await bus.close(timeout_seconds=1)
+
+        assert handled == ["req-1", "slow"]
+        assert registry.counter_value("event_bus_handler_errors_total", event="Happened") == 1
+        assert registry.counter_value("event_bus_handler_timeouts_total", event="Happened") == 1
+
+    async def test_events_of_one_aggregate_are_handled_in_publish_order(
+        self, registry: MetricsRegistry
+    ) -> None:
+        bus = _bus(registry)
+        handled: list[tuple[str, int]] = []
+
+        async def record(event: DomainEvent) -> None:
+            assert isinstance(event, Changed)
+            # Earlier events take longer, so only the routing keeps them first
+            await asyncio.sleep(0.01 * (5 - event.n))
+            handled.append((event.key, event.n))
+
+        bus.register_handler(Changed, record)
+
+        for n in range(5):
+            await bus.publish_all([Changed(key="a", n=n), Changed(key="b", n=n)])
+        await bus.close(timeout_seconds=1)
+
+        assert [n for key, n in handled if key == "a"] == [0, 1, 2, 3, 4]
+        assert [n for key, n in handled if key == "b"] == [0, 1, 2, 3, 4]
+
+    async def test_hung_handler_does_not_block_other_aggregates_on_its_queue(
+        self, registry: MetricsRegistry
+    ) -> None:
+        bus = _bus(registry, workers=1)
+        release = asyncio.Event()
+        handled: list[tuple[str, int]] = []
+
+        async def record(event: DomainEvent) -> None:
+            assert isinstance(event, Changed)
+            if (event.key, event.n) == ("a", 1):
+                await release.wait()
+            handled.append((event.key, event.n))
+
+        bus.register_handler(Changed, record)
+
+        # One worker: every aggregate shares the queue the hung handler is on
+        await bus.publish_all([Changed(key="a", n=1), Changed(key="b", n=1), Changed(key="a", n=2)])
+        await asyncio.sleep(0.2)
+
+        assert handled == [("b", 1)]
+        assert registry.counter_value("event_bus_handler_timeouts_total", event="Changed") == 1
+
+        release.set()
+        await bus.close(timeout_seconds=1)
+        assert handled == [("b", 1), ("a", 1), ("a", 2)]
+
+    async def test_full_queue_makes_the_publisher_wait(self, registry: MetricsRegistry) -> None:
+        bus = _bus(registry, queue_size=1, handler_timeout_seconds=10)
+        release = asyncio.Event()
+        handled: list[int] = []
+
+        async def blocked(event: DomainEvent) -> None:
+            assert isinstance(event, Changed)
+            if event.n == 1:
+                await release.wait()
+            handled.append(event.n)
+
+        bus.register_handler(Changed, blocked)
+
+        # The worker takes 1, 2 fills the queue, 3 has to wait for room
+        await bus.publish(Changed(key="a", n=1))
+        await asyncio.sleep(0)
+        await bus.publish(Changed(key="a", n=2))
+        third = asyncio.create_task(bus.publish(Changed(key="a", n=3)))
+        await asyncio.sleep(0.05)
+
+        assert not third.done()
+        assert registry.counter_value("event_bus_queue_full_total") == 1
+
+        release.set()
+        await third
+        await bus.close(timeout_seconds=1)
+        assert handled == [1, 2, 3]
+        assert registry.counter_value("event_bus_dispatched_by_publisher_total") == 0
+
+
+class TestDeferredDispatch:
+    async def test_events_wait_for_the_block_and_are_dropped_if_it_raises(
+        self, registry: MetricsRegistry
+    ) -> None:
+        bus = _bus(registry)
+        handled: list[int] = []
+
+        async def record(event: DomainEvent) -> None:
+            handled.append(event.n)  # type: ignore[attr-defined]
+
+        bus.register_handler(Happened, record)
+
+        async with bus.deferred():
+            await bus.publish(Happened(n=1))
+            await asyncio.sleep(0.01)
+            assert handled == []
+        with pytest.raises(RuntimeError):
+            async with bus.deferred():
+                await bus.publish(Happened(n=2))
+                raise RuntimeError("rolled back")
+        await bus.close(timeout_seconds=1)
+
+        assert handled == [1]
+
+    async def test_database_sessions_dispatch_only_after_commit(
+        self,
+        registry: MetricsRegistry,
+        db_engine: AsyncEngine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        bus = _bus(registry)
+        monkeypatch.setattr(database_module, "event_bus", bus)
+        database = Database(db_engine.url.render_as_string(hide_password=False))
+        steps: list[str] = []
+
+        async def record(event: DomainEvent) -> None:
+            steps.append(f"handled {event.n}")  # type: ignore[attr-defined]
+
+        bus.register_handler(Happened, record)
+
+        try:
+            async with database.session() as session:
+                event.listen(
+                    session.sync_session, "after_commit", lambda _s: steps.append("commit")
+                )
+                await session.execute(text("SELECT 1"))
+                await bus.publish(Happened(n=1))
+                await asyncio.sleep(0.01)
+            with pytest.raises(RuntimeError):
+                async with database.session() as session:
+                    await bus.publish(Happened(n=2))
+                    raise RuntimeError("rolled back")
+            await bus.close(timeout_seconds=1)
+        finally:
+            await database.close()
+
+        assert steps == ["commit", "handled 1"]
@@ -0,0 +1,39 @@
+"""Unit tests for the /metrics endpoint guard."""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.config import settings
+from src.main import app
+
+
+@pytest.fixture
+async def plain_client() -> AsyncGenerator[AsyncClient, None]:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestMetricsEndpoint:
+    async def test_not_served_without_a_configured_token(
+        self, plain_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "metrics_token", "")
+
+        response = await plain_client.get("/metrics")
+
+        assert response.status_code == 404
+
+    async def test_requires_the_bearer_token(
+        self, plain_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+
+        missing = await plain_client.get("/metrics")
+        wrong = await plain_client.get("/metrics", headers={"Authorization": "Bearer nope"})
+        ok = await plain_client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+        assert (missing.status_code, wrong.status_code) == (401, 401)
+        assert ok.status_code == 200
+        assert ok.headers["content-type"].startswith("text/plain")
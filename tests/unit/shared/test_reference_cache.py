@@ -0,0 +1,206 @@
+"""Unit tests for ReferenceDataCache and the metrics registry."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from src.shared.infrastructure.metrics import MetricsRegistry
+from src.shared.infrastructure.reference_cache import ReferenceDataCache
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def cache(registry: MetricsRegistry) -> ReferenceDataCache:
+    return ReferenceDataCache(ttl_seconds=60, sync_interval_seconds=0, registry=registry)
+
+
+class TestReadThrough:
+    async def test_second_read_is_served_from_cache(self, cache: ReferenceDataCache) -> None:
+        loader = AsyncMock(return_value={"name": "General"})
+
+        first = await cache.get_or_load("ns", "k", loader)
+        second = await cache.get_or_load("ns", "k", loader)
+
+        assert first == second == {"name": "General"}
+        loader.assert_awaited_once()
+
+    async def test_none_is_cached(self, cache: ReferenceDataCache) -> None:
+        loader = AsyncMock(return_value=None)
+
+        await cache.get_or_load("ns", "k", loader)
+        result = await cache.get_or_load("ns", "k", loader)
+
+        assert result is None
+        loader.assert_awaited_once()
+
+    async def test_returned_values_are_copies(self, cache: ReferenceDataCache) -> None:
+        loader = AsyncMock(return_value={"levels": [1, 2]})
+
+        first = await cache.get_or_load("ns", "k", loader)
+        first["levels"].append(3)
+        second = await cache.get_or_load("ns", "k", loader)
+
+        assert second == {"levels": [1, 2]}
+
+    async def test_expired_entry_is_reloaded(self, registry: MetricsRegistry) -> None:
+        cache = ReferenceDataCache(ttl_seconds=0, registry=registry)
+        loader = AsyncMock(return_value=1)
+
+        await cache.get_or_load("ns", "k", loader)
+        await cache.get_or_load("ns", "k", loader)
+
+        assert loader.await_count == 2
+
+
+class TestInvalidation:
+    async def test_invalidate_key_forces_reload(self, cache: ReferenceDataCache) -> None:
+        loader = AsyncMock(side_effect=[1, 2])
+
+        await cache.get_or_load("ns", "k", loader)
+        await cache.invalidate("ns", "k")
+        result = await cache.get_or_load("ns", "k", loader)
+
+        assert result == 2
+
+    async def test_invalidate_namespace_drops_all_keys(self, cache: ReferenceDataCache) -> None:
+        loader_a = AsyncMock(side_effect=["a1", "a2"])
+        loader_b = AsyncMock(side_effect=["b1", "b2"])
+        other = AsyncMock(return_value="o")
+        await cache.get_or_load("ns", "a", loader_a)
+        await cache.get_or_load("ns", "b", loader_b)
+        await cache.get_or_load("other", "a", other)
+
+        await cache.invalidate("ns")
+
+        assert await cache.get_or_load("ns", "a", loader_a) == "a2"
+        assert await cache.get_or_load("ns", "b", loader_b) == "b2"
+        assert await cache.get_or_load("other", "a", other) == "o"
+        other.assert_awaited_once()
+
+    async def test_load_racing_an_invalidation_is_not_stored(
+        self, cache: ReferenceDataCache
+    ) -> None:
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader() -> str:
+            started.set()
+            await release.wait()
+            return "stale"
+
+        pending = asyncio.create_task(cache.get_or_load("ns", "k", slow_loader))
+        await started.wait()
+        await cache.invalidate("ns", "k")
+        release.set()
+
+        assert await pending == "stale"
+        assert await cache.get_or_load("ns", "k", AsyncMock(return_value="fresh")) == "fresh"
+
+    async def test_invalidate_on_commit_without_session(self, cache: ReferenceDataCache) -> None:
+        loader = AsyncMock(side_effect=[1, 2])
+
+        await cache.get_or_load("ns", "k", loader)
+        await cache.invalidate_on_commit(None, "ns", "k")
+
+        assert await cache.get_or_load("ns", "k", loader) == 2
+
+
+class TestRedisCoherence:
+    async def test_invalidate_bumps_remote_generation(self, cache: ReferenceDataCache) -> None:
+        redis = AsyncMock()
+        redis.incr.return_value = 1
+        cache.configure(redis=redis)
+
+        await cache.invalidate("ns", "k")
+
+        redis.incr.assert_awaited_once_with("reference_cache:generation:ns")
+
+    async def test_remote_generation_change_drops_namespace(
+        self, cache: ReferenceDataCache
+    ) -> None:
+        redis = AsyncMock()
+        redis.get.side_effect = [b"1", b"1", b"2"]
+        cache.configure(redis=redis)
+        loader = AsyncMock(side_effect=["v1", "v2"])
+
+        await cache.get_or_load("ns", "k", loader)
+        assert await cache.get_or_load("ns", "k", loader) == "v1"
+        assert await cache.get_or_load("ns", "k", loader) == "v2"
+
+    async def test_redis_errors_fall_back_to_local_cache(self, cache: ReferenceDataCache) -> None:
+        redis = AsyncMock()
+        redis.get.side_effect = RedisError("down")
+        redis.incr.side_effect = RedisError("down")
+        cache.configure(redis=redis)
+        loader = AsyncMock(side_effect=[1, 2])
+
+        await cache.get_or_load("ns", "k", loader)
+        assert await cache.get_or_load("ns", "k", loader) == 1
+        await cache.invalidate("ns", "k")
+        assert await cache.get_or_load("ns", "k", loader) == 2
+
+
+class TestStatsAndMetrics:
+    async def test_stats_report_hit_rate(self, cache: ReferenceDataCache) -> None:
+        loader = AsyncMock(return_value=1)
+        for _ in range(4):
+            await cache.get_or_load("ns", "k", loader)
+
+        stats = cache.stats()["ns"]
+
+        assert stats.hits == 3
+        assert stats.misses == 1
+        assert stats.entries == 1
+        assert stats.hit_rate == 0.75
+
+    async def test_metrics_are_exported(
+        self, cache: ReferenceDataCache, registry: MetricsRegistry
+    ) -> None:
+        loader = AsyncMock(return_value=1)
+        await cache.get_or_load("ns", "k", loader)
+        await cache.get_or_load("ns", "k", loader)
+        await cache.invalidate("ns", "k")
+
+        samples = registry.collect()
+
+        assert samples['reference_cache_hits_total{namespace="ns"}'] == 1
+        assert samples['reference_cache_misses_total{namespace="ns"}'] == 1
+        assert samples['reference_cache_invalidations_total{namespace="ns"}'] == 1
+        assert samples['reference_cache_hit_ratio{namespace="ns"}'] == 0.5
+        assert 'reference_cache_hits_total{namespace="ns"} 1\n' in registry.render()
+
+    async def test_reset_clears_entries_and_stats(self, cache: ReferenceDataCache) -> None:
+        loader = AsyncMock(return_value=1)
+        await cache.get_or_load("ns", "k", loader)
+
+        cache.reset()
+        await cache.get_or_load("ns", "k", loader)
+
+        assert loader.await_count == 2
+        assert cache.stats()["ns"].misses == 1
+
+
+class TestMetricsRegistry:
+    def test_counter_value_defaults_to_zero(self, registry: MetricsRegistry) -> None:
+        assert registry.counter_value("missing") == 0
+
+    def test_counters_are_tracked_per_label_set(self, registry: MetricsRegistry) -> None:
+        registry.increment("requests_total", route="a")
+        registry.increment("requests_total", 2, route="b")
+
+        assert registry.counter_value("requests_total", route="a") == 1
+        assert registry.counter_value("requests_total", route="b") == 2
+
+    def test_reset_keeps_gauges(self, registry: MetricsRegistry) -> None:
+        registry.increment("requests_total")
+        registry.register_gauge("queue_depth", lambda: 3)
+
+        registry.reset()
+
+        assert registry.collect() == {"queue_depth": 3}